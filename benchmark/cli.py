@@ -245,6 +245,28 @@ def report(output: str = _OUTPUT) -> None:
     typer.echo(f"Wrote {path}")
 
 
+@app.command("figure-encoding")
+def figure_encoding(
+    repeats: int = typer.Option(3, "--repeats", help="Best-of-N timing per path"),
+) -> None:
+    """Compare the old and new figure encode paths in-process (no server needed)."""
+    from benchmark.figure_encoding import format_table, measure
+
+    typer.echo(format_table(measure(repeats=repeats)))
+
+
+@app.command("link-resolvers")
+def link_resolvers(
+    loop_sources: int = typer.Option(
+        20, "--loop-sources", help="Source values the old O(S×T) loops run on before scaling"
+    ),
+) -> None:
+    """Compare the regex/wildcard resolver loops with the prefix index (no server needed)."""
+    from benchmark.link_resolvers import format_table, measure
+
+    typer.echo(format_table(measure(loop_sources=loop_sources)))
+
+
 @app.command("blog-metrics")
 def blog_metrics(output: str = _OUTPUT) -> None:
     """Build blog_metrics.json + BLOG_SNIPPET.md from results.jsonl.
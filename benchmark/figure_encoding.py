@@ -0,0 +1,106 @@
+"""Before/after cost of shipping a rendered figure, without a server.
+
+The render benchmark measures the encode path end to end (``X-Serialize-Ms``,
+``payload_bytes``), but only against whichever server is running. This measures
+both paths side by side in one process, on synthetic figures of the shapes that
+dominate real payloads:
+
+* **before** — ``json.loads(fig.to_json())`` on the worker, then the API's
+  ``custom_jsonable_encoder`` + ``json.dumps``;
+* **after** — ``encode_figure`` once, then ``figure_response_bytes``.
+
+Byte counts are reported raw and gzipped, since the API sits behind
+``GZipMiddleware`` and the wire saving is smaller than the body saving.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+_POINTS = (10_000, 100_000)
+
+
+def _figures(n_points: int) -> dict[str, Any]:
+    import numpy as np
+    import plotly.graph_objects as go
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=n_points)
+    y = x * 2.5 + rng.normal(scale=0.5, size=n_points)
+    counts = rng.integers(0, 500, size=n_points)
+    side = max(2, int(n_points**0.5) // 4)
+    return {
+        "scatter": go.Figure(
+            go.Scattergl(
+                x=x, y=y, mode="markers", customdata=np.arange(n_points), marker={"color": counts}
+            )
+        ),
+        "line_int": go.Figure(go.Scatter(x=np.arange(n_points), y=counts)),
+        "heatmap": go.Figure(go.Heatmap(z=rng.random((side, side)))),
+    }
+
+
+def _time(fn: Callable[[], bytes], repeats: int) -> tuple[float, bytes]:
+    best = float("inf")
+    body = b""
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        body = fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best, body
+
+
+def measure(repeats: int = 3) -> list[dict[str, Any]]:
+    """One row per (figure, size): ms and bytes for both paths."""
+    from depictio.api.v1.json_response import custom_jsonable_encoder
+    from depictio.api.v1.services.figure.encoding import encode_figure, figure_response_bytes
+
+    metadata = {"visu_type": "scatter", "timings": {}}
+    rows: list[dict[str, Any]] = []
+    for n_points in _POINTS:
+        for name, fig in _figures(n_points).items():
+
+            def _before(fig=fig) -> bytes:
+                fig_dict = json.loads(fig.to_json())
+                body = {"figure": fig_dict, "metadata": metadata}
+                return json.dumps(custom_jsonable_encoder(body), separators=(",", ":")).encode()
+
+            def _after(fig=fig) -> bytes:
+                result = {"figure_json": encode_figure(fig), "metadata": metadata}
+                return figure_response_bytes(result)
+
+            before_ms, before_body = _time(_before, repeats)
+            after_ms, after_body = _time(_after, repeats)
+            rows.append(
+                {
+                    "figure": name,
+                    "points": n_points,
+                    "before_ms": round(before_ms, 1),
+                    "after_ms": round(after_ms, 1),
+                    "before_bytes": len(before_body),
+                    "after_bytes": len(after_body),
+                    "before_gzip_bytes": len(gzip.compress(before_body)),
+                    "after_gzip_bytes": len(gzip.compress(after_body)),
+                }
+            )
+    return rows
+
+
+def format_table(rows: list[dict[str, Any]]) -> str:
+    """Markdown table of ``measure`` rows."""
+    lines = [
+        "| figure | points | encode ms (before → after) | body KB | gzip KB |",
+        "|---|---:|---:|---:|---:|",
+    ]
+    for r in rows:
+        lines.append(
+            f"| {r['figure']} | {r['points']:,} "
+            f"| {r['before_ms']} → {r['after_ms']} "
+            f"| {r['before_bytes'] / 1024:.0f} → {r['after_bytes'] / 1024:.0f} "
+            f"| {r['before_gzip_bytes'] / 1024:.0f} → {r['after_gzip_bytes'] / 1024:.0f} |"
+        )
+    return "\n".join(lines)
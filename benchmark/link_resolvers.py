@@ -0,0 +1,100 @@
+"""Regex / wildcard link resolvers: per-value loops vs the sorted prefix index.
+
+The resolvers map S source values (the selected samples) onto T target values
+(a feature index). The old implementations tested every source pattern against
+every target in Python, O(S×T); the current ones sort the targets once and do
+two binary searches per source value. This times both in one process on
+synthetic sample names, up to S×T = 10k × 1M.
+
+At that size the loops would take hours, so they run on the first
+``loop_sources`` source values only and are scaled linearly to S (their cost is
+exactly linear in S). Those cells are marked ``~`` in the table.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import random
+import re
+import time
+from typing import Any
+
+_SIZES = ((1_000, 100_000), (10_000, 1_000_000))
+_SUFFIXES = ("_R1.fastq.gz", "_R2.fastq.gz", "_L001_R1", "_L002_R1", ".bam", ".bam.bai")
+
+
+def _names(n_sources: int, n_targets: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(0)
+    samples = [f"SAMPLE{i:07d}" for i in range(max(n_sources * 4, n_targets // len(_SUFFIXES)))]
+    targets = [f"{rng.choice(samples)}{rng.choice(_SUFFIXES)}" for _ in range(n_targets)]
+    return rng.sample(samples, n_sources), targets
+
+
+def _loop_regex(source: list[str], targets: list[str]) -> int:
+    matched = 0
+    for val in source:
+        compiled = re.compile(f"^{re.escape(val)}.*$")
+        matched += sum(1 for tv in targets if compiled.match(tv))
+    return matched
+
+
+def _loop_wildcard(source: list[str], targets: list[str]) -> int:
+    return sum(len(fnmatch.filter(targets, f"{val}*")) for val in source)
+
+
+def _ms(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def measure(loop_sources: int = 20) -> list[dict[str, Any]]:
+    """One row per (resolver, S, T): loop ms (scaled) and index ms."""
+    from depictio.api.v1.endpoints.links_endpoints.resolvers import (
+        RegexResolver,
+        WildcardResolver,
+    )
+    from depictio.models.models.links import LinkConfig
+
+    cases = (
+        ("regex", RegexResolver(), _loop_regex),
+        ("wildcard", WildcardResolver(), _loop_wildcard),
+    )
+    rows: list[dict[str, Any]] = []
+    for n_sources, n_targets in _SIZES:
+        source, targets = _names(n_sources, n_targets)
+        sampled = source[: min(loop_sources, n_sources)]
+        for name, resolver, loop in cases:
+            config = LinkConfig(resolver=name)
+            resolved: list[str] = []
+            index_ms = _ms(lambda: resolved.extend(resolver.resolve(source, config, targets)[0]))
+            loop_ms = _ms(lambda: loop(sampled, targets)) * n_sources / len(sampled)
+            rows.append(
+                {
+                    "resolver": name,
+                    "sources": n_sources,
+                    "targets": n_targets,
+                    "loop_ms": round(loop_ms, 1),
+                    "loop_scaled": len(sampled) < n_sources,
+                    "index_ms": round(index_ms, 1),
+                    "resolved": len(resolved),
+                }
+            )
+    return rows
+
+
+def format_table(rows: list[dict[str, Any]]) -> str:
+    """Markdown table of ``measure`` rows."""
+    lines = [
+        "| resolver | S × T | loop ms | index ms | speedup | resolved |",
+        "|---|---:|---:|---:|---:|---:|",
+    ]
+    for r in rows:
+        approx = "~" if r["loop_scaled"] else ""
+        speedup = r["loop_ms"] / r["index_ms"] if r["index_ms"] else float("inf")
+        lines.append(
+            f"| {r['resolver']} | {r['sources']:,} × {r['targets']:,} "
+            f"| {approx}{r['loop_ms']:,.0f} | {r['index_ms']:,.1f} "
+            f"| {approx}{speedup:,.0f}× | {r['resolved']:,} |"
+        )
+    return "\n".join(lines)
@@ -74,6 +74,11 @@ class RenderResult:
     rows_loaded: Optional[int] = None  # X-Rows-Loaded: rows materialised (0 if aggregated)
     rows_displayed: Optional[int] = None  # X-Rows-Displayed: marks/rows in the payload
     frame_bytes: Optional[int] = None  # X-Frame-Bytes: in-memory footprint
+    # What the render cost to ship. ``payload_bytes`` is the decoded response
+    # body measured client-side, so it reads the same against a server that
+    # predates typed-array figures — that is the before/after comparison.
+    payload_bytes: Optional[int] = None
+    serialize_ms: Optional[float] = None  # X-Serialize-Ms: figure encode on the server
     aggregated: bool = False  # X-Aggregated: served by a scan-level reduction
     # X-Sampling-Policy: which reduction /advanced_viz/data applied ("hash" |
     # "tail" | "none" | "explicit" | "full"). Two advanced-viz rows with the same
@@ -46,6 +46,8 @@ _RENDER_FIELDS = [
     "rows_loaded",
     "rows_displayed",
     "frame_bytes",
+    "payload_bytes",
+    "serialize_ms",
     "aggregated",
     "cache",
     "peak_rss_mb",
@@ -642,6 +642,8 @@ def _render_component(
         "rows_loaded": _hdr_int("X-Rows-Loaded"),
         "rows_displayed": _hdr_int("X-Rows-Displayed"),
         "frame_bytes": _hdr_int("X-Frame-Bytes"),
+        "payload_bytes": len(resp.content),
+        "serialize_ms": _hdr_float("X-Serialize-Ms"),
         "aggregated": resp.headers.get("X-Aggregated") == "1",
         "sampling_policy": resp.headers.get("X-Sampling-Policy", ""),
         "cache": resp.headers.get("X-Cache", ""),
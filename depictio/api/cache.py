@@ -7,7 +7,10 @@ with fallback to in-memory caching.
 
 import io
 import pickle
+import re
+import threading
 import time
+from collections.abc import Iterable
 from typing import Any, Optional, cast
 
 import polars as pl
@@ -25,6 +28,28 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 
+# Tag index. Every write registers its key in one Redis set per tag, so
+# invalidating a data collection is an SMEMBERS plus batched UNLINKs instead of
+# a ``KEYS`` walk of the whole keyspace — which blocks the server that is also
+# the Celery broker. Tags are the ObjectIds found in the key (DC, workflow,
+# project) plus any the caller passes (the DCs behind a facets response, whose
+# key is a digest). The sets live outside ``cache_key_prefix`` so prefix scans
+# never see them.
+_TAG_KEY_PREFIX = "depictio:cachetag:"
+# Set once every pre-index key has been added to the tag sets (see
+# ``_backfill_tag_index``). Until then indexed invalidation also SCANs.
+_TAG_INDEX_READY_KEY = "depictio:cachetag:__ready__"
+_TAG_INDEX_BACKFILL_LOCK = "depictio:cachetag:__backfill__"
+_UNLINK_BATCH = 500
+_SCAN_COUNT = 1000
+_OBJECT_ID_RE = re.compile(r"(?<![0-9a-f])[0-9a-f]{24}(?![0-9a-f])")
+
+
+def key_tags(key: str) -> set[str]:
+    """Tags derived from a cache key: every ObjectId embedded in it."""
+    return set(_OBJECT_ID_RE.findall(key))
+
+
 class SimpleCache:
     """Simple Redis cache with memory fallback for DataFrames."""
 
@@ -39,6 +64,9 @@ class SimpleCache:
         # Memory fallback
         self._memory_cache = {}
 
+        # Latched once the tag index covers pre-index keys (see delete_pattern)
+        self._tag_index_confirmed = False
+
         # Try to connect to Redis
         self._init_redis()
 
@@ -52,6 +80,8 @@ class SimpleCache:
                 host=self.cache_config.redis_host,
                 port=self.cache_config.redis_port,
                 password=self.cache_config.redis_password,
+                db=self.cache_config.redis_db,
+                ssl=self.cache_config.redis_ssl,
                 decode_responses=False,
             )
             self._redis.ping()
@@ -59,6 +89,107 @@ class SimpleCache:
         except Exception as e:
             logger.warning(f"❌ Redis connection failed: {e}")
             self._redis_available = False
+            return
+
+        self._apply_memory_limit()
+        threading.Thread(
+            target=self._backfill_tag_index, name="cache-tag-backfill", daemon=True
+        ).start()
+
+    def _apply_memory_limit(self) -> None:
+        """Cap Redis memory at ``redis_max_memory_mb`` when set and the server is unbounded.
+
+        Off by default (``0``): this Redis is also the Celery broker and result
+        backend, and the eviction policy is server-wide. Task results expire
+        (``result_expires``), as do the offload supersede/generation keys, so
+        ``volatile-lru`` can evict a finished result before ``offload_or_run``
+        reads it. Prefer sizing Redis in deployment config; opt in here only on
+        a Redis dedicated to the cache. A cap already set on the server is left
+        alone, and a refused ``CONFIG`` (managed services) is logged and ignored.
+        """
+        limit_mb = self.cache_config.redis_max_memory_mb
+        if limit_mb <= 0 or self._redis is None:
+            return
+        try:
+            current = self._redis.config_get("maxmemory")
+            if int(current.get(b"maxmemory", current.get("maxmemory", 0)) or 0) > 0:
+                return
+            self._redis.config_set("maxmemory", f"{limit_mb}mb")
+            policy = self._redis.config_get("maxmemory-policy")
+            value = policy.get(b"maxmemory-policy", policy.get("maxmemory-policy", b""))
+            if value in (b"noeviction", "noeviction"):
+                self._redis.config_set("maxmemory-policy", "volatile-lru")
+            logger.info(f"Redis maxmemory set to {limit_mb} MB (volatile-lru)")
+        except Exception as e:
+            logger.debug(f"Redis maxmemory not applied: {e}")
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{_TAG_KEY_PREFIX}{tag}"
+
+    def _index_tags(self, cache_key: str, tags: Iterable[str], ttl: int) -> None:
+        """Add ``cache_key`` to each tag set, keeping the set alive as long as it.
+
+        ``EXPIRE NX`` gives a new set the entry's TTL and ``EXPIRE GT`` only
+        ever extends it, so a set outlives its longest-lived member and then
+        ages out by itself. Sets are touched on every write, so under
+        ``volatile-lru`` their members go before they do.
+        """
+        tags = set(tags)
+        if not tags or self._redis is None:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, cache_key)
+            pipe.expire(tag_key, ttl, nx=True)
+            pipe.expire(tag_key, ttl, gt=True)
+        pipe.execute()
+
+    def _backfill_tag_index(self) -> None:
+        """Index keys written before the tag index existed, once per Redis.
+
+        One process wins the lock and walks the prefix with ``SCAN`` (never
+        ``KEYS``); after it marks the index ready, invalidation stops scanning.
+        """
+        redis_client = self._redis
+        if redis_client is None:
+            return
+        try:
+            if redis_client.exists(_TAG_INDEX_READY_KEY):
+                return
+            if not redis_client.set(_TAG_INDEX_BACKFILL_LOCK, b"1", nx=True, ex=600):
+                return
+            prefix = self.cache_config.cache_key_prefix
+            indexed = 0
+            for raw in redis_client.scan_iter(match=f"{prefix}*", count=_SCAN_COUNT):
+                cache_key = raw.decode() if isinstance(raw, bytes) else raw
+                tags = key_tags(cache_key[len(prefix) :])
+                if not tags:
+                    continue
+                ttl = redis_client.ttl(cache_key)
+                if isinstance(ttl, int) and ttl > 0:
+                    self._index_tags(cache_key, tags, ttl)
+                    indexed += 1
+            redis_client.set(_TAG_INDEX_READY_KEY, b"1")
+            logger.info(f"Cache tag index backfilled ({indexed} key(s))")
+        except Exception as e:
+            logger.warning(f"Cache tag index backfill failed: {e}")
+
+    def _tag_index_ready(self) -> bool:
+        if self._tag_index_confirmed:
+            return True
+        try:
+            self._tag_index_confirmed = bool(self._redis.exists(_TAG_INDEX_READY_KEY))
+        except Exception:
+            return False
+        return self._tag_index_confirmed
+
+    def _unlink(self, cache_keys: list) -> int:
+        removed = 0
+        for start in range(0, len(cache_keys), _UNLINK_BATCH):
+            batch = cache_keys[start : start + _UNLINK_BATCH]
+            removed += int(self._redis.unlink(*batch) or 0)
+        return removed
 
     # Serialization envelope markers (4 bytes). Pickle protocol >=2 streams
     # always start with 0x80, so these ASCII prefixes can never collide with a
@@ -88,8 +219,19 @@ class SimpleCache:
         # Legacy entry written as plain pickle before the envelope existed.
         return pickle.loads(raw)
 
-    def set(self, key: str, data: Any, ttl: Optional[int] = None) -> bool:
-        """Cache data with optional TTL."""
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Cache data with optional TTL.
+
+        The key is indexed under every ObjectId it contains plus ``tags``
+        (e.g. a project or dashboard id the key doesn't spell out), so
+        ``invalidate_tags`` / ``delete_pattern`` can find it without a scan.
+        """
         if ttl is None:
             ttl = (
                 self.cache_config.dataframe_ttl
@@ -121,9 +263,16 @@ class SimpleCache:
         if self._redis_available:
             try:
                 self._redis.setex(cache_key, ttl, serialized)
-                return True
             except Exception as e:
                 logger.warning(f"❌ Redis cache failed: {key} - {e}")
+            else:
+                try:
+                    self._index_tags(cache_key, key_tags(key) | set(tags or ()), ttl)
+                except Exception as e:
+                    # The value is stored and still expires on its TTL; only
+                    # tag-based invalidation would miss it.
+                    logger.warning(f"Cache tag index write failed: {key} - {e}")
+                return True
 
         # Fallback to memory (store the live object — no serialization needed)
         self._memory_cache[key] = {"data": data, "cached_at": time.time(), "ttl": ttl}
@@ -216,16 +365,35 @@ class SimpleCache:
         Returns the number of keys removed (Redis + memory). Used by the
         realtime-events path to invalidate every filter variant for a DC after
         a ``data_collection_updated`` event.
+
+        A pattern naming an ObjectId (a DC id, ``dc=<id>``) is answered from
+        that id's tag set, filtered by the substring; only a pattern with no id
+        in it, or keys written before the index existed, fall back to ``SCAN``.
         """
-        full_pattern = f"{self.cache_config.cache_key_prefix}*{pattern}*"
+        prefix = self.cache_config.cache_key_prefix
         removed = 0
 
         if self._redis_available and self._redis is not None:
             try:
-                keys_result = self._redis.keys(full_pattern)
-                if isinstance(keys_result, list) and keys_result:
-                    self._redis.delete(*keys_result)
-                    removed += len(keys_result)
+                tags = key_tags(pattern)
+                matched: set = set()
+                if tags:
+                    tag = next(iter(tags))
+                    members = self._redis.smembers(self._tag_key(tag)) or set()
+                    hits = [
+                        m
+                        for m in members
+                        if pattern in (m.decode() if isinstance(m, bytes) else m)[len(prefix) :]
+                    ]
+                    matched.update(hits)
+                    if hits:
+                        self._redis.srem(self._tag_key(tag), *hits)
+                if not tags or not self._tag_index_ready():
+                    matched.update(
+                        self._redis.scan_iter(match=f"{prefix}*{pattern}*", count=_SCAN_COUNT)
+                    )
+                if matched:
+                    removed += self._unlink(list(matched))
             except Exception as e:
                 logger.warning(f"Redis delete_pattern failed: {pattern} - {e}")
 
@@ -235,6 +403,30 @@ class SimpleCache:
 
         return removed
 
+    def invalidate_tags(self, *tags: str) -> int:
+        """Delete every entry indexed under any of ``tags``; returns the count.
+
+        For ids a key doesn't contain (a project, a dashboard) this is the only
+        way to reach its entries. Memory-fallback entries are matched by
+        substring, as they carry no index.
+        """
+        removed = 0
+        if self._redis_available and self._redis is not None:
+            for tag in tags:
+                try:
+                    tag_key = self._tag_key(tag)
+                    members = list(self._redis.smembers(tag_key) or ())
+                    if members:
+                        removed += self._unlink(members)
+                    self._redis.unlink(tag_key)
+                except Exception as e:
+                    logger.warning(f"Redis tag invalidation failed: {tag} - {e}")
+
+        for key in [k for k in self._memory_cache if any(tag in k for tag in tags)]:
+            del self._memory_cache[key]
+            removed += 1
+        return removed
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         cache_key = f"{self.cache_config.cache_key_prefix}{key}"
@@ -290,6 +482,16 @@ def invalidate_dataframe_cache_pattern(pattern: str) -> int:
     return get_cache().delete_pattern(pattern)
 
 
+def invalidate_cache_tags(*tags: str) -> int:
+    """Drop every cached entry indexed under any of ``tags`` (DC or project ids).
+
+    Called by the link and project write paths: link resolutions and facets
+    name their project in the key, and would otherwise outlive an edit by
+    their TTL.
+    """
+    return get_cache().invalidate_tags(*tags)
+
+
 def get_cache_stats() -> dict[str, Any]:
     """Get basic cache stats."""
     cache = get_cache()
@@ -304,15 +506,12 @@ def get_cache_stats() -> dict[str, Any]:
     # Get Redis stats if available
     if cache._redis_available and cache._redis is not None:
         try:
-            # Count Redis keys with our prefix
+            # Count Redis keys with our prefix (SCAN, not KEYS: the broker
+            # shares this server and KEYS would stall it for the whole walk)
             pattern = f"{cache.cache_config.cache_key_prefix}*"
-            keys_result = cache._redis.keys(pattern)
-            # Redis.keys() returns a list synchronously when decode_responses=False
-            # Cast to list for type checker (redis-py returns list, not Awaitable, in sync mode)
-            if isinstance(keys_result, list):
-                stats["redis_keys"] = len(keys_result)
-            else:
-                stats["redis_keys"] = 0
+            stats["redis_keys"] = sum(
+                1 for _ in cache._redis.scan_iter(match=pattern, count=_SCAN_COUNT)
+            )
 
             # Get Redis memory usage
             info = cache._redis.info()
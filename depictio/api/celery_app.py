@@ -967,6 +967,27 @@ if settings.monitoring.enabled:
         )
 
 
+# Completion notices for ``offload_or_run`` (see ``celery_notify``). Unlike the
+# monitoring handlers this is not optional telemetry — it is how the API learns a
+# task has finished — so it is connected regardless of the monitoring flag.
+from depictio.api.v1.celery_notify import install_completion_publisher  # noqa: E402
+
+install_completion_publisher()
+
+
+# Cost-class routing by task name, for the classes a task belongs to whatever
+# its payload: MultiQC builds, and the advanced-viz compute jobs (embeddings and
+# friends), which are dispatched with plain ``apply_async``. Figure renders are
+# classed per call by ``offload_or_run``. Off unless the per-class worker pools
+# are running — see ``CeleryConfig.cost_class_queues``.
+if settings.celery.cost_class_queues:
+    _prefix = settings.celery.cost_class_queue_prefix
+    celery_app.conf.task_routes = {
+        "depictio.multiqc.*": {"queue": f"{_prefix}multiqc"},
+        "depictio.advanced_viz.*": {"queue": f"{_prefix}embedding"},
+    }
+
+
 # Auto-discovery of tasks on app start
 if __name__ == "__main__":
     celery_app.start()
@@ -222,7 +222,18 @@ app.add_middleware(
     allow_origins=_cors_origins,
     allow_credentials=settings.fastapi.cors_allow_credentials and bool(_cors_origins),
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    # If-None-Match / ETag: figure renders revalidate by ETag (render_figure).
+    # X-Render-Session / X-Fetch-Generation: superseded-render revocation.
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "X-Requested-With",
+        "If-None-Match",
+        "X-Render-Session",
+        "X-Fetch-Generation",
+    ],
+    # Retry-After: offload admission control answers 503 with a backoff hint.
+    expose_headers=["ETag", "Retry-After"],
     max_age=600,
 )
 if not _cors_origins:
@@ -8,20 +8,95 @@ Provides different strategies for backing up S3 deltatable data:
 
 This allows data to be copied closer to the server for faster access,
 disaster recovery, and cross-environment migration.
+
+Listings are paginated, copies run on a bounded thread pool as managed
+(multipart) transfers, and an S3-to-S3 snapshot only reads from the source
+what changed since the previous one — see ``_backup_s3_to_s3``.
 """
 
+import asyncio
+import json
+import re
 import shutil
 import tarfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
+from urllib.parse import unquote
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
 
+DELTA_LOG_DIR = "_delta_log"
+SIDECAR_DIR = "_depictio"
+# Per-location record of the last snapshot, next to the snapshots themselves.
+STATE_DIR = "_state"
+# Bump when the state layout changes; an older state then means a full listing.
+BACKUP_STATE_VERSION = 1
+# Parts in flight per multipart transfer; objects in flight are bounded by
+# ``s3_backup_max_concurrency``, so memory stays under their product × part size.
+_PART_CONCURRENCY = 4
+_COMMIT_RE = re.compile(rf"{DELTA_LOG_DIR}/(\d{{20}})\.json")
+
+
+def _list_objects(
+    client, bucket: str, prefix: str, start_after: str | None = None
+) -> Iterator[dict]:
+    """Every object under ``prefix``, following continuation tokens past 1,000 keys."""
+    kwargs = {"Bucket": bucket, "Prefix": prefix}
+    if start_after:
+        kwargs["StartAfter"] = start_after
+    while True:
+        response = client.list_objects_v2(**kwargs)
+        yield from response.get("Contents", [])
+        if not response.get("IsTruncated"):
+            return
+        kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+
+def _commit_version(rel: str) -> int | None:
+    """Version of a Delta commit file (``_delta_log/<20 digits>.json``), else ``None``."""
+    match = _COMMIT_RE.fullmatch(rel)
+    return int(match.group(1)) if match else None
+
+
+def _read_commit(client, bucket: str, key: str) -> tuple[List[str], List[str]]:
+    """Relative paths of the files a Delta commit adds and removes."""
+    body = client.get_object(Bucket=bucket, Key=key)["Body"]
+    adds: List[str] = []
+    removes: List[str] = []
+    for line in body.iter_lines():
+        if not line.strip():
+            continue
+        action = json.loads(line)
+        for kind, paths in (("add", adds), ("remove", removes)):
+            entry = action.get(kind)
+            # Absolute paths point outside the table (shallow clones): not ours to copy.
+            if entry and "://" not in entry["path"]:
+                paths.append(unquote(entry["path"]))
+    return adds, removes
+
+
+def _state_key(backup_prefix: str, location_key: str) -> str:
+    return f"{backup_prefix}/{STATE_DIR}/{location_key}.json"
+
+
+def _same_store(source_config: dict, backup_config: dict | None) -> bool:
+    """Whether the backup client can read the source bucket itself (server-side copy)."""
+    if not backup_config:
+        return False
+    endpoint = (source_config.get("endpoint_url") or "").rstrip("/").lower()
+    backup_endpoint = (backup_config.get("endpoint_url") or "").rstrip("/").lower()
+    return endpoint == backup_endpoint and source_config.get(
+        "aws_access_key_id"
+    ) == backup_config.get("aws_access_key_id")
+
 
 class S3BackupStrategyManager:
     """
@@ -59,8 +134,23 @@ class S3BackupStrategyManager:
             logger.info(f"Initializing backup S3 client with config: {backup_config}")
             self.backup_s3_client = boto3.client("s3", **backup_config)
 
+        self.max_concurrency = self.backup_config.s3_backup_max_concurrency
+        chunk_bytes = self.backup_config.s3_backup_multipart_chunk_mb * 1024 * 1024
+        self.transfer_config = TransferConfig(
+            multipart_threshold=chunk_bytes,
+            multipart_chunksize=chunk_bytes,
+            max_concurrency=_PART_CONCURRENCY,
+        )
+        self.server_side_copy = self.backup_s3_client is not None and _same_store(
+            source_s3_config, self.backup_config.backup_s3_config
+        )
+
     async def backup_deltatable_data(
-        self, deltatable_locations: List[str], backup_prefix: str = "backup", dry_run: bool = False
+        self,
+        deltatable_locations: List[str],
+        backup_prefix: str = "backup",
+        dry_run: bool = False,
+        incremental: bool | None = None,
     ) -> Dict:
         """
         Backup deltatable data using the configured strategy.
@@ -69,12 +159,16 @@ class S3BackupStrategyManager:
             deltatable_locations: List of S3 paths to backup
             backup_prefix: Prefix for backup organization
             dry_run: If True, simulate without actual copying
+            incremental: Follow each table's Delta log from the last S3 snapshot
+                instead of listing it (defaults to ``s3_backup_incremental``)
 
         Returns:
             Dictionary with backup results
         """
         backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         strategy = self.backup_config.s3_backup_strategy
+        if incremental is None:
+            incremental = self.backup_config.s3_backup_incremental
 
         logger.info(f"Starting S3 backup with strategy: {strategy}")
 
@@ -92,7 +186,12 @@ class S3BackupStrategyManager:
         try:
             if strategy == "s3_to_s3":
                 await self._backup_s3_to_s3(
-                    deltatable_locations, backup_prefix, backup_timestamp, dry_run, results
+                    deltatable_locations,
+                    backup_prefix,
+                    backup_timestamp,
+                    dry_run,
+                    results,
+                    incremental,
                 )
             elif strategy == "local":
                 await self._backup_s3_to_local(
@@ -112,6 +211,7 @@ class S3BackupStrategyManager:
                         "success": True,
                         "errors": [],
                     },
+                    incremental,
                 )
                 local_results = await self._backup_s3_to_local(
                     deltatable_locations,
@@ -158,8 +258,18 @@ class S3BackupStrategyManager:
         backup_timestamp: str,
         dry_run: bool,
         results: Dict,
+        incremental: bool = False,
     ) -> Dict:
-        """Backup S3 data to backup S3 bucket."""
+        """Backup S3 data to backup S3 bucket.
+
+        Each location becomes a complete snapshot under
+        ``<prefix>/<timestamp>/<location>``, so retention can drop any snapshot
+        on its own. What a snapshot costs depends on what changed: objects
+        whose ETag and size match the previous snapshot's (recorded in
+        ``<prefix>/_state/``) are copied inside the backup bucket instead of
+        being read from the source, and with ``incremental`` the source table
+        is not even listed — its ``_delta_log`` says which files were added.
+        """
         if not self.backup_s3_client:
             raise ValueError("Backup S3 not configured for s3_to_s3 strategy")
 
@@ -192,64 +302,42 @@ class S3BackupStrategyManager:
 
         for location in deltatable_locations:
             try:
-                location_key = location.strip("/")
-                backup_location = f"{backup_prefix}/{backup_timestamp}/{location_key}"
-
-                # List files in source location
-                response = self.source_client.list_objects_v2(
-                    Bucket=source_bucket, Prefix=location_key
+                # The copies block on the network; keep them off the event loop.
+                outcome = await asyncio.to_thread(
+                    self._backup_location_s3,
+                    location.strip("/"),
+                    source_bucket,
+                    backup_bucket,
+                    backup_prefix,
+                    backup_timestamp,
+                    dry_run,
+                    incremental,
                 )
-
-                if "Contents" not in response:
+                if outcome is None:
                     logger.warning(f"No files found in location: {location}")
                     continue
 
-                files_copied = 0
-                bytes_copied = 0
-
-                for obj in response["Contents"]:
-                    source_key = obj["Key"]
-                    backup_key = source_key.replace(location_key, backup_location, 1)
-
-                    if not dry_run:
-                        # Download from source and upload to backup (cross-service copy)
-                        logger.debug(f"Downloading from source: s3://{source_bucket}/{source_key}")
-                        try:
-                            # Download object from source S3
-                            response = self.source_client.get_object(
-                                Bucket=source_bucket, Key=source_key
-                            )
-                            object_data = response["Body"].read()
-
-                            # Upload to backup S3
-                            logger.debug(f"Uploading to backup: s3://{backup_bucket}/{backup_key}")
-                            self.backup_s3_client.put_object(
-                                Bucket=backup_bucket,
-                                Key=backup_key,
-                                Body=object_data,
-                                ContentType=response.get("ContentType", "application/octet-stream"),
-                            )
-                        except ClientError as copy_error:
-                            logger.error(f"Failed to copy {source_key}: {copy_error}")
-                            raise
-
-                    files_copied += 1
-                    bytes_copied += obj["Size"]
-
-                    logger.debug(
-                        f"{'DRY RUN: Would copy' if dry_run else 'Copied'}: {source_key} -> s3://{backup_bucket}/{backup_key}"
-                    )
-
-                results["backup_locations"][location] = f"s3://{backup_bucket}/{backup_location}"
+                results["backup_locations"][location] = outcome["backup_location"]
                 results["locations_processed"] = results.get("locations_processed", 0) + 1
-                results["total_files"] = results.get("total_files", 0) + files_copied
-                results["total_bytes"] = results.get("total_bytes", 0) + bytes_copied
+                for counter in (
+                    "total_files",
+                    "total_bytes",
+                    "files_transferred",
+                    "bytes_transferred",
+                    "files_reused",
+                ):
+                    results[counter] = results.get(counter, 0) + outcome[counter]
+                if outcome["incremental"]:
+                    results["incremental_locations"] = results.get("incremental_locations", 0) + 1
 
                 logger.info(
-                    f"S3-to-S3 backup: {files_copied} files ({bytes_copied} bytes) from {location}"
+                    f"S3-to-S3 backup{' (dry run)' if dry_run else ''}: "
+                    f"{outcome['total_files']} files ({outcome['total_bytes']} bytes) from "
+                    f"{location}; {outcome['files_transferred']} read from the source, "
+                    f"{outcome['files_reused']} unchanged since the last snapshot"
                 )
 
-            except ClientError as e:
+            except Exception as e:
                 error_msg = f"S3 error backing up {location}: {e}"
                 logger.error(error_msg)
                 results.setdefault("errors", []).append(error_msg)
@@ -257,6 +345,259 @@ class S3BackupStrategyManager:
 
         return results
 
+    def _backup_location_s3(
+        self,
+        location_key: str,
+        source_bucket: str,
+        backup_bucket: str,
+        backup_prefix: str,
+        backup_timestamp: str,
+        dry_run: bool,
+        incremental: bool,
+    ) -> Dict | None:
+        """Snapshot one Delta table location; ``None`` when it holds no objects."""
+        backup_location = f"{backup_prefix}/{backup_timestamp}/{location_key}"
+        state = self._load_state(backup_bucket, backup_prefix, location_key)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="depictio-s3-backup"
+        ) as pool:
+            plan = None
+            if incremental and state is not None:
+                plan = self._plan_from_delta_log(source_bucket, location_key, state, pool)
+                if plan is None:
+                    logger.info(f"Cannot follow the Delta log of {location_key}; listing it")
+            used_log = plan is not None
+            if plan is None:
+                plan = self._plan_from_listing(source_bucket, location_key)
+            objects, delta_version, log_etag = plan
+            if not objects:
+                return None
+
+            previous = state.get("objects", {}) if state else {}
+            previous_location = (
+                f"{backup_prefix}/{state['snapshot']}/{location_key}" if state else None
+            )
+
+            def unchanged(rel: str, etag: str | None, size: int) -> bool:
+                before = previous.get(rel)
+                return bool(etag) and before is not None and list(before) == [etag, size]
+
+            reused = [rel for rel, (etag, size) in objects.items() if unchanged(rel, etag, size)]
+            transferred = [rel for rel in objects if rel not in set(reused)]
+
+            if not dry_run:
+                futures = [
+                    pool.submit(
+                        self._copy_object,
+                        source_bucket,
+                        f"{location_key}/{rel}",
+                        backup_bucket,
+                        f"{backup_location}/{rel}",
+                        objects[rel][1],
+                        None,
+                    )
+                    for rel in transferred
+                ]
+                futures += [
+                    pool.submit(
+                        self._copy_object,
+                        source_bucket,
+                        f"{location_key}/{rel}",
+                        backup_bucket,
+                        f"{backup_location}/{rel}",
+                        objects[rel][1],
+                        f"{previous_location}/{rel}",
+                    )
+                    for rel in reused
+                ]
+                for future in futures:
+                    future.result()  # re-raise the first failed copy
+
+                self._save_state(
+                    backup_bucket,
+                    backup_prefix,
+                    location_key,
+                    {
+                        "snapshot": backup_timestamp,
+                        "delta_version": delta_version,
+                        "log_etag": log_etag,
+                        "objects": {rel: list(entry) for rel, entry in objects.items()},
+                    },
+                )
+
+        return {
+            "backup_location": f"s3://{backup_bucket}/{backup_location}",
+            "total_files": len(objects),
+            "total_bytes": sum(size for _, size in objects.values()),
+            "files_transferred": len(transferred),
+            "bytes_transferred": sum(objects[rel][1] for rel in transferred),
+            "files_reused": len(reused),
+            "incremental": used_log,
+        }
+
+    def _plan_from_listing(
+        self, source_bucket: str, location_key: str
+    ) -> tuple[Dict[str, tuple], int | None, str | None]:
+        """Every object of the location, with the Delta version its log is at."""
+        objects: Dict[str, tuple] = {}
+        delta_version, log_etag = None, None
+        for obj in _list_objects(self.source_client, source_bucket, f"{location_key}/"):
+            rel = obj["Key"][len(location_key) + 1 :]
+            objects[rel] = (obj.get("ETag"), obj["Size"])
+            version = _commit_version(rel)
+            if version is not None and (delta_version is None or version > delta_version):
+                delta_version, log_etag = version, obj.get("ETag")
+        return objects, delta_version, log_etag
+
+    def _plan_from_delta_log(
+        self, source_bucket: str, location_key: str, state: Dict, pool: ThreadPoolExecutor
+    ) -> tuple[Dict[str, tuple], int | None, str | None] | None:
+        """The previous snapshot's objects moved forward by the commits made since.
+
+        Only the log entries newer than the recorded version are listed and
+        read. ``None`` when the log cannot be followed from there: no recorded
+        version, the recorded commit no longer the one we saw (the table was
+        dropped and recreated), or a gap in the new commits.
+        """
+        since = state.get("delta_version")
+        if since is None or not state.get("log_etag"):
+            return None
+        log_prefix = f"{location_key}/{DELTA_LOG_DIR}/"
+        anchor = f"{log_prefix}{since:020d}.json"
+        try:
+            head = self.source_client.head_object(Bucket=source_bucket, Key=anchor)
+        except ClientError:
+            return None
+        if head.get("ETag") != state["log_etag"]:
+            return None
+
+        objects = {rel: tuple(entry) for rel, entry in state["objects"].items()}
+        commits = []
+        for obj in _list_objects(self.source_client, source_bucket, log_prefix, start_after=anchor):
+            rel = obj["Key"][len(location_key) + 1 :]
+            objects[rel] = (obj.get("ETag"), obj["Size"])
+            version = _commit_version(rel)
+            if version is not None:
+                commits.append((version, obj))
+        commits.sort(key=lambda c: c[0])
+        if [v for v, _ in commits] != list(range(since + 1, since + 1 + len(commits))):
+            return None
+
+        added: set[str] = set()
+        for _, obj in commits:
+            adds, removes = _read_commit(self.source_client, source_bucket, obj["Key"])
+            for path in removes:
+                objects.pop(path, None)
+                added.discard(path)
+            added.update(adds)
+
+        # The add actions carry sizes but not ETags; head the new files for both.
+        def head_added(path: str) -> tuple[str, tuple]:
+            meta = self.source_client.head_object(
+                Bucket=source_bucket, Key=f"{location_key}/{path}"
+            )
+            return path, (meta.get("ETag"), meta["ContentLength"])
+
+        objects.update(pool.map(head_added, sorted(added)))
+
+        # Sidecars (column statistics, sort indexes) sit outside the log: list them.
+        sidecars = {
+            obj["Key"][len(location_key) + 1 :]: (obj.get("ETag"), obj["Size"])
+            for obj in _list_objects(
+                self.source_client, source_bucket, f"{location_key}/{SIDECAR_DIR}/"
+            )
+        }
+        objects = {
+            rel: entry for rel, entry in objects.items() if not rel.startswith(f"{SIDECAR_DIR}/")
+        }
+        objects.update(sidecars)
+
+        if commits:
+            return objects, commits[-1][0], commits[-1][1].get("ETag")
+        return objects, since, state["log_etag"]
+
+    def _copy_object(
+        self,
+        source_bucket: str,
+        source_key: str,
+        backup_bucket: str,
+        backup_key: str,
+        size: int,
+        previous_key: str | None,
+    ) -> None:
+        """Copy one object into the snapshot.
+
+        ``previous_key`` is the same, unchanged object in the previous
+        snapshot: it is copied inside the backup store, and the source is only
+        read if that copy is gone (retention may have removed the snapshot).
+        """
+        if previous_key is not None:
+            try:
+                self.backup_s3_client.copy(
+                    {"Bucket": backup_bucket, "Key": previous_key},
+                    backup_bucket,
+                    backup_key,
+                    Config=self.transfer_config,
+                )
+                return
+            except ClientError as e:
+                logger.debug(f"Previous snapshot copy of {source_key} unavailable ({e})")
+
+        if self.server_side_copy:
+            # Same endpoint and credentials: the store copies the bytes itself,
+            # in parts above the multipart threshold.
+            self.backup_s3_client.copy(
+                {"Bucket": source_bucket, "Key": source_key},
+                backup_bucket,
+                backup_key,
+                Config=self.transfer_config,
+            )
+            return
+
+        response = self.source_client.get_object(Bucket=source_bucket, Key=source_key)
+        content_type = response.get("ContentType", "application/octet-stream")
+        if size < self.transfer_config.multipart_threshold:
+            self.backup_s3_client.put_object(
+                Bucket=backup_bucket,
+                Key=backup_key,
+                Body=response["Body"].read(),
+                ContentType=content_type,
+            )
+        else:
+            # Streamed in parts: memory holds a few chunks, never the object.
+            self.backup_s3_client.upload_fileobj(
+                response["Body"],
+                backup_bucket,
+                backup_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=self.transfer_config,
+            )
+        logger.debug(f"Copied: {source_key} -> s3://{backup_bucket}/{backup_key}")
+
+    def _load_state(self, backup_bucket: str, backup_prefix: str, location_key: str) -> Dict | None:
+        """What the last snapshot of ``location_key`` under ``backup_prefix`` holds."""
+        try:
+            response = self.backup_s3_client.get_object(
+                Bucket=backup_bucket, Key=_state_key(backup_prefix, location_key)
+            )
+            state = json.loads(response["Body"].read())
+        except Exception:
+            return None
+        if not isinstance(state, dict) or state.get("version") != BACKUP_STATE_VERSION:
+            return None
+        return state
+
+    def _save_state(
+        self, backup_bucket: str, backup_prefix: str, location_key: str, state: Dict
+    ) -> None:
+        self.backup_s3_client.put_object(
+            Bucket=backup_bucket,
+            Key=_state_key(backup_prefix, location_key),
+            Body=json.dumps({"version": BACKUP_STATE_VERSION, **state}).encode(),
+            ContentType="application/json",
+        )
+
     async def _backup_s3_to_local(
         self,
         deltatable_locations: List[str],
@@ -283,18 +624,16 @@ class S3BackupStrategyManager:
                     local_location.mkdir(parents=True, exist_ok=True)
 
                 # List files in source location
-                response = self.source_client.list_objects_v2(
-                    Bucket=source_bucket, Prefix=location_key
-                )
+                objects = list(_list_objects(self.source_client, source_bucket, f"{location_key}/"))
 
-                if "Contents" not in response:
+                if not objects:
                     logger.warning(f"No files found in location: {location}")
                     continue
 
                 files_downloaded = 0
                 bytes_downloaded = 0
 
-                for obj in response["Contents"]:
+                for obj in objects:
                     source_key = obj["Key"]
                     # Create relative path structure
                     relative_key = source_key.replace(location_key, "", 1).lstrip("/")
@@ -443,7 +782,10 @@ class S3BackupStrategyManager:
 
 
 async def create_backup_with_strategy(
-    deltatable_locations: List[str], backup_prefix: str = "backup", dry_run: bool = False
+    deltatable_locations: List[str],
+    backup_prefix: str = "backup",
+    dry_run: bool = False,
+    incremental: bool | None = None,
 ) -> Dict:
     """
     Convenience function to create backup using configured strategy.
@@ -452,6 +794,7 @@ async def create_backup_with_strategy(
         deltatable_locations: List of S3 paths to backup
         backup_prefix: Prefix for backup organization
         dry_run: If True, simulate without actual copying
+        incremental: Follow Delta logs from the last snapshot (None = setting)
 
     Returns:
         Dictionary with backup results
@@ -466,4 +809,6 @@ async def create_backup_with_strategy(
     }
 
     manager = S3BackupStrategyManager(source_s3_config)
-    return await manager.backup_deltatable_data(deltatable_locations, backup_prefix, dry_run)
+    return await manager.backup_deltatable_data(
+        deltatable_locations, backup_prefix, dry_run, incremental
+    )
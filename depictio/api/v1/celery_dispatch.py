@@ -1,4 +1,4 @@
-"""Dispatch helper that runs Celery tasks via a non-blocking poll loop.
+"""Dispatch helper that runs Celery tasks without blocking the event loop.
 
 Used by FastAPI preview / render endpoints to offload heavy Polars+Plotly work
 to the Celery worker without pinning an API worker thread on `result.get()`.
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import time
+import uuid
 from typing import Any
 
 import anyio.to_thread
@@ -22,6 +23,174 @@ from fastapi import HTTPException
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
 
+# Cost classes for offloaded work. With ``cost_class_queues`` on, each goes to
+# its own queue (``<cost_class_queue_prefix><class>``) consumed by its own worker
+# pool, so a burst of slow code-mode or MultiQC builds can no longer occupy
+# every slot a 200 ms aggregate figure needs. ``None`` is the default queue.
+COST_CLASSES = ("aggregate", "points", "code", "multiqc", "embedding")
+
+# Celery's own default queue, used when routing is off or a task has no class.
+_DEFAULT_QUEUE = "celery"
+
+# What admission assumes a task of each class costs until this process has
+# timed one on an idle queue. Deliberately on the slow side: an optimistic
+# prior admits exactly the work that then times out.
+_PRIOR_RUNTIME_MS: dict[str | None, float] = {
+    "aggregate": 500.0,
+    "points": 3000.0,
+    "code": 5000.0,
+    "multiqc": 10000.0,
+    "embedding": 20000.0,
+    None: 3000.0,
+}
+_RUNTIME_EWMA_ALPHA = 0.2
+# Per-class runtime estimate (ms), learned from tasks that found their queue
+# empty — their elapsed time is service time, not service time plus waiting.
+_runtime_ms: dict[str | None, float] = {}
+
+_broker_client: Any = None
+
+
+def figure_cost_class(metadata: dict, full_load: bool = False) -> str:
+    """Cost class of a ``build_figure_preview`` render.
+
+    Mirrors the task's own branching: code mode runs user code; a reducing plot
+    the aggregation planner accepts is a pushdown that never materialises rows;
+    everything else loads and draws points.
+    """
+    if metadata.get("mode") == "code":
+        return "code"
+    if not full_load:
+        from depictio.api.v1.services.figure.aggregate import plan_aggregation
+
+        try:
+            if plan_aggregation(metadata.get("visu_type"), metadata.get("dict_kwargs") or {}):
+                return "aggregate"
+        except Exception:
+            pass
+    return "points"
+
+
+def cost_class_queue(cost_class: str | None) -> str | None:
+    """Queue a task of ``cost_class`` is routed to, or ``None`` for the default."""
+    if not settings.celery.cost_class_queues or cost_class not in COST_CLASSES:
+        return None
+    return f"{settings.celery.cost_class_queue_prefix}{cost_class}"
+
+
+def _pool_size(cost_class: str | None) -> int:
+    if cost_class_queue(cost_class) is None:
+        return max(1, settings.celery.worker_concurrency)
+    return max(1, settings.celery.queue_pool_sizes().get(str(cost_class), 1))
+
+
+def _queue_depth(queue: str) -> int | None:
+    """Messages waiting in ``queue`` on the Redis broker; ``None`` if unknown.
+
+    The Redis transport keeps each queue as a list named after it, so this is
+    one LLEN. Tasks a worker has already reserved are not counted — with
+    ``prefetch_multiplier=1`` that is at most one per pool slot.
+    """
+    global _broker_client
+    try:
+        if _broker_client is None:
+            import redis
+
+            _broker_client = redis.Redis.from_url(
+                settings.celery.broker_url, socket_timeout=0.25, socket_connect_timeout=0.25
+            )
+        return int(_broker_client.llen(queue))
+    except Exception as e:
+        logger.debug(f"celery_dispatch: queue depth unavailable for {queue}: {e}")
+        return None
+
+
+def _record_runtime(cost_class: str | None, elapsed_ms: float) -> None:
+    previous = _runtime_ms.get(cost_class)
+    _runtime_ms[cost_class] = (
+        elapsed_ms if previous is None else previous + _RUNTIME_EWMA_ALPHA * (elapsed_ms - previous)
+    )
+
+
+def admit(cost_class: str | None, timeout: float) -> int | None:
+    """Refuse work that would sit in its queue past ``timeout``.
+
+    Predicted completion is the number of waves ahead of this task (queue depth
+    over pool size) plus its own, times the class's runtime estimate. Anything
+    predicted to finish after the caller has given up is turned away with a 503
+    and a ``Retry-After`` of roughly how long the backlog takes to drain —
+    cheaper for everyone than queuing it, letting it time out, and leaving the
+    worker to finish it for nobody.
+
+    Returns the queue depth seen (``None`` if unknown; unknown is admitted).
+    """
+    queue = cost_class_queue(cost_class) or _DEFAULT_QUEUE
+    depth = _queue_depth(queue)
+    if depth is None or not settings.celery.admission_control:
+        return depth
+    pool = _pool_size(cost_class)
+    runtime_ms = _runtime_ms.get(cost_class, _PRIOR_RUNTIME_MS.get(cost_class, 3000.0))
+    waves_ahead = depth // pool
+    predicted_ms = (waves_ahead + 1) * runtime_ms
+    # A free slot is always taken: the task's own runtime is not a backlog,
+    # and the runtime estimate is too coarse to refuse work on by itself.
+    if waves_ahead == 0 or predicted_ms <= timeout * 1000:
+        return depth
+    retry_after = max(1, int((depth / pool) * runtime_ms / 1000) + 1)
+    logger.warning(
+        f"celery_dispatch: rejecting {cost_class or 'default'} task — {depth} queued on "
+        f"{queue} for {pool} slots, ~{predicted_ms / 1000:.1f}s predicted > {timeout:.0f}s"
+    )
+    raise HTTPException(
+        status_code=503,
+        detail=f"Render queue '{queue}' is saturated; retry shortly.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def supersede(key: str, generation: int, task_id: str) -> None:
+    """Record ``task_id`` as the live task for ``key``; revoke the one it replaces.
+
+    ``key`` identifies one component as seen by one viewer tab (see
+    ``render_figure_endpoint``) and ``generation`` is that tab's fetch
+    generation, bumped whenever the filter state changes. A task from an older
+    generation is answering a question nobody is asking any more, so it is
+    revoked — terminating it if a worker already started it. A request that is
+    itself older than the recorded one is refused with 409 before dispatch.
+
+    Kept in Redis rather than in-process because consecutive requests from one
+    tab land on different API workers.
+    """
+    from celery.result import AsyncResult
+
+    from depictio.api.cache import get_cache
+
+    cache = get_cache()
+    cache_key = f"render_generation:{key}"
+    try:
+        previous = cache.get(cache_key)
+    except Exception:
+        previous = None
+    if isinstance(previous, dict):
+        prev_gen = int(previous.get("generation", -1))
+        if prev_gen > generation:
+            raise HTTPException(status_code=409, detail="Superseded by a newer render.")
+        prev_task = previous.get("task_id")
+        if prev_gen < generation and prev_task and prev_task != task_id:
+            try:
+                AsyncResult(prev_task).revoke(terminate=True)
+                logger.info(f"celery_dispatch: revoked superseded task {prev_task} ({key})")
+            except Exception as e:
+                logger.debug(f"celery_dispatch: revoke of {prev_task} failed: {e}")
+    try:
+        cache.set(
+            cache_key,
+            {"generation": generation, "task_id": task_id},
+            ttl=int(settings.celery.offload_timeout_seconds * 2) + 1,
+        )
+    except Exception as e:
+        logger.debug(f"celery_dispatch: could not record render generation for {key}: {e}")
+
 
 def should_offload_render(
     *,
@@ -71,6 +240,8 @@ async def offload_or_run(
     offload: bool,
     timeout: float | None = None,
     label: str = "",
+    cost_class: str | None = None,
+    supersede_key: tuple[str, int] | None = None,
 ) -> Any:
     """Run `task` either inline or via Celery, awaiting completion async-safely.
 
@@ -80,21 +251,47 @@ async def offload_or_run(
     Delta-load + Plotly-build — a dashboard's components then render strictly
     one after another and unrelated endpoints (health, auth) stall behind them.
 
-    Offload path dispatches via `apply_async` and polls `AsyncResult.ready()`
-    with `asyncio.sleep` so the FastAPI event loop stays responsive while the
-    worker does the heavy work.
+    Offload path dispatches via `apply_async` and waits for the worker's
+    completion notice (``celery_notify``) — one shared pub/sub listener per
+    process, so the result is picked up within milliseconds of the task
+    finishing and a waiting request doesn't query the result backend in the
+    meantime, beyond a slow fallback check that covers a lost notice. Without
+    the listener (``push_results`` off, Redis pub/sub unreachable) it falls back
+    to polling `AsyncResult.ready()` on a backoff. Either way the deadline is
+    ``offload_timeout_seconds`` and a task that misses it is revoked.
+
+    ``cost_class`` (one of ``COST_CLASSES``) picks the queue and is what the
+    admission check (``admit``) prices the backlog with. ``supersede_key`` is a
+    ``(key, generation)`` pair: dispatching revokes the task an older
+    generation left running for the same key (``supersede``).
     """
     if not offload:
         return await anyio.to_thread.run_sync(functools.partial(task.run, *args))
 
+    from depictio.api.v1.celery_notify import completion_listener
+
     timeout = timeout if timeout is not None else settings.celery.offload_timeout_seconds
-    async_result = task.apply_async(args=list(args))
-    deadline = time.monotonic() + timeout
-    poll = 0.05
+    # Both read and write Redis (and ``supersede`` may revoke a task), so they
+    # run off the event loop like the inline path.
+    depth = await anyio.to_thread.run_sync(admit, cost_class, timeout)
+    # The id is chosen here so the waiter exists before the task can finish.
+    task_id = uuid.uuid4().hex
+    if supersede_key is not None:
+        await anyio.to_thread.run_sync(supersede, supersede_key[0], supersede_key[1], task_id)
+    queue = cost_class_queue(cost_class)
+    notice = await completion_listener.register(task_id)
+    fallback = max(0.05, settings.celery.result_fallback_poll_seconds)
     started = time.monotonic()
+    deadline = started + timeout
+    poll = 0.05
     try:
+        if queue is not None:
+            async_result = task.apply_async(args=list(args), task_id=task_id, queue=queue)
+        else:
+            async_result = task.apply_async(args=list(args), task_id=task_id)
         while not async_result.ready():
-            if time.monotonic() > deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 try:
                     async_result.revoke(terminate=True)
                 except Exception:
@@ -107,9 +304,18 @@ async def offload_or_run(
                     status_code=504,
                     detail=f"Celery task '{task.name}' timed out after {timeout:.1f}s",
                 )
-            await asyncio.sleep(poll)
-            poll = min(poll * 1.5, 0.5)
+            if notice is not None and not notice.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(notice), timeout=min(remaining, fallback))
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(min(poll, remaining))
+                poll = min(poll * 1.5, 0.5)
 
+        if async_result.state == "REVOKED":
+            # A newer render for the same component took over (``supersede``).
+            raise HTTPException(status_code=409, detail="Superseded by a newer render.")
         if async_result.failed():
             tb = async_result.traceback or str(async_result.result)
             logger.error(f"celery_dispatch: task {task.name} ({label}) failed: {tb}")
@@ -121,11 +327,15 @@ async def offload_or_run(
         elapsed_ms = int((time.monotonic() - started) * 1000)
         logger.info(
             f"celery_dispatch: task {task.name} ({label or 'unlabeled'}) "
-            f"completed in {elapsed_ms}ms"
+            f"completed in {elapsed_ms}ms ({'push' if notice is not None else 'poll'})"
         )
+        if depth == 0:
+            _record_runtime(cost_class, elapsed_ms)
         return async_result.get(timeout=1.0)
     except CeleryTimeoutError as e:
         raise HTTPException(
             status_code=504,
             detail=f"Celery task '{task.name}' result fetch timed out: {e}",
         )
+    finally:
+        completion_listener.discard(task_id)
@@ -0,0 +1,173 @@
+"""Push-based completion notices for offloaded Celery tasks.
+
+``offload_or_run`` used to find out a task had finished by polling
+``AsyncResult.ready()`` on a backoff that grew to 500 ms, so an offloaded render
+paid up to half a second on top of its real runtime, and every waiting request
+kept hitting the result backend while it waited.
+
+Instead the worker announces completion and the API waits to be told:
+
+* **Worker side** — a ``task_postrun`` handler PUBLISHes the finished task's id
+  on ``RESULT_CHANNEL``. ``task_postrun`` fires after the tracer has stored the
+  result (success *and* failure), so a waiter that wakes on the notice always
+  finds it in the backend.
+* **API side** — one ``CompletionListener`` per process holds a single
+  SUBSCRIBE connection and resolves the future registered for that task id.
+  Requests never touch Redis while they wait.
+
+Pub/sub is fire-and-forget: a notice published while the listener is
+reconnecting is lost. Waiters therefore still check the backend on a slow
+fallback interval (``celery.result_fallback_poll_seconds``), which bounds the
+cost of a missed notice without bringing back the per-request poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.configs.logging_init import logger
+
+# Pub/sub channels are server-wide (not per DB), so one name serves every
+# worker and API process pointed at the broker.
+RESULT_CHANNEL = "depictio:celery:done"
+
+# Sync publisher client, created lazily in each worker process.
+_publisher: Any = None
+
+
+def _get_publisher() -> Any:
+    global _publisher
+    if _publisher is None:
+        import redis
+
+        _publisher = redis.Redis.from_url(settings.celery.broker_url)
+    return _publisher
+
+
+def publish_task_done(task_id: str) -> None:
+    """Announce that ``task_id`` has finished. Never raises."""
+    try:
+        _get_publisher().publish(RESULT_CHANNEL, task_id)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.debug(f"celery_notify: completion publish failed for {task_id}: {exc}")
+
+
+def _on_task_postrun(task_id=None, **_extra) -> None:
+    if task_id:
+        publish_task_done(task_id)
+
+
+def _on_task_revoked(request=None, **_extra) -> None:
+    # A revoked task never reaches postrun; its waiter (a superseded render,
+    # see ``celery_dispatch.supersede``) should still hear about it promptly.
+    task_id = getattr(request, "id", None)
+    if task_id:
+        publish_task_done(task_id)
+
+
+def install_completion_publisher() -> None:
+    """Connect the completion publishers. Idempotent; called from ``celery_app``."""
+    if not settings.celery.push_results:
+        return
+    from celery.signals import task_postrun, task_revoked
+
+    task_postrun.connect(_on_task_postrun, weak=False, dispatch_uid="depictio_celery_notify")
+    task_revoked.connect(
+        _on_task_revoked, weak=False, dispatch_uid="depictio_celery_notify_revoked"
+    )
+
+
+class CompletionListener:
+    """One SUBSCRIBE connection per API process, fanned out to waiting requests.
+
+    ``register`` hands back a future that resolves when the task's notice
+    arrives. The listener is bound to the event loop that first used it; if a
+    different loop shows up (tests, a reloaded app) it starts over on that one.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, asyncio.Future] = {}
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscribed = asyncio.Event()
+
+    async def register(self, task_id: str) -> asyncio.Future | None:
+        """Future for ``task_id``'s notice, or ``None`` when push is unavailable.
+
+        Must be called *before* the task is sent, so a task that finishes
+        faster than the dispatch returns still finds its waiter.
+        """
+        if not settings.celery.push_results:
+            return None
+        if not await self._ensure_started():
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[task_id] = future
+        return future
+
+    def discard(self, task_id: str) -> None:
+        self._waiters.pop(task_id, None)
+
+    async def _ensure_started(self) -> bool:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            # Running. While it reconnects, requests poll rather than wait on it.
+            return self._subscribed.is_set()
+        if self._loop is not loop:
+            self._waiters.clear()
+        self._loop = loop
+        self._subscribed = asyncio.Event()
+        self._task = loop.create_task(self._listen())
+        try:
+            # Only the request that (re)started the listener waits for it.
+            await asyncio.wait_for(self._subscribed.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _listen(self) -> None:
+        from redis.asyncio import Redis
+
+        while True:
+            client = None
+            try:
+                client = Redis.from_url(settings.celery.broker_url, decode_responses=True)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(RESULT_CHANNEL)
+                self._subscribed.set()
+                logger.info("celery_notify: listening for task completions")
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    future = self._waiters.get(message.get("data"))
+                    if future is not None and not future.done():
+                        future.set_result(None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # Waiters fall back to the slow backend check meanwhile.
+                self._subscribed.clear()
+                logger.warning(f"celery_notify: completion listener dropped ({exc}); retrying")
+                await asyncio.sleep(1.0)
+            finally:
+                if client is not None:
+                    try:
+                        await client.aclose()
+                    except Exception:
+                        pass
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+        self._loop = None
+        self._waiters.clear()
+
+
+completion_listener = CompletionListener()
@@ -52,6 +52,7 @@ def _load_uniform_sample(
     import polars as _pl
 
     from depictio.api.v1.deltatables_utils import open_deltatable_scan
+    from depictio.api.v1.services.sample_tiers import tier_sample
 
     scan = open_deltatable_scan(
         workflow_id=wf_oid,
@@ -65,6 +66,15 @@ def _load_uniform_sample(
         total = int(scan.select(_pl.len()).collect().item())
         if total <= cap:
             return scan.collect()
+        sampled = tier_sample(dc_id, filter_metadata, None, cap)
+        if sampled is not None:
+            render_stats["sampled"] = True
+            render_stats["total_rows"] = total
+            logger.info(
+                f"_load_uniform_sample: dc={dc_id} took {sampled.height} of {total} rows "
+                f"(cap {cap}) from a sample tier"
+            )
+            return sampled
         # Hash the whole row rather than one column: hashing a single column
         # would keep or drop every row sharing a value, which biases exactly the
         # grouped comparisons code-mode figures usually make.
@@ -82,6 +92,31 @@ def _load_uniform_sample(
         return None
 
 
+def _sketch_source(dc_id: str, init_data: dict[str, dict], filter_metadata: list[dict]):
+    """The table and filters behind the aggregation scan, for a persisted sketch.
+
+    ``None`` unless the sketch or the sample tiers are on and the DC is a Delta
+    table with a known data version: a persisted sketch is keyed by the Delta
+    version, and MultiQC DCs are parquet directories. A violin/ECDF subsample
+    reads the same source to find the DC's sample tiers.
+    """
+    performance = settings.performance
+    if performance.figure_sketch_accuracy <= 0 and not performance.sample_tiers_enabled:
+        return None
+    entry = init_data.get(dc_id) or {}
+    location = entry.get("delta_location")
+    if not location or str(entry.get("dc_type") or "").lower() == "multiqc":
+        return None
+
+    from depictio.api.v1.deltatables_utils import _resolve_version_salt
+    from depictio.api.v1.services.figure.sketch import SketchSource
+
+    version_salt = _resolve_version_salt(dc_id, init_data)
+    if version_salt is None:
+        return None
+    return SketchSource(dc_id, location, version_salt, filter_metadata or None)
+
+
 def _ensure_mantine_templates() -> None:
     """Worker-side Plotly template registration. Mirrors the helper in
     `figure_endpoints.routes`. Without this, plotly express raises
@@ -92,7 +127,7 @@ def _ensure_mantine_templates() -> None:
 
 
 @celery_app.task(name="depictio.figure.build_preview", soft_time_limit=120, time_limit=180)
-def build_figure_preview(payload: dict) -> dict:
+def build_figure_preview(payload: dict, planned: dict | None = None) -> dict:
     """Heavy body of figure preview AND figure render — same code path.
 
     Input shape (validated by caller):
@@ -106,14 +141,39 @@ def build_figure_preview(payload: dict) -> dict:
             "selection_column"  (optional, render only),
           },
           "filter_metadata": [...],     # cleaned filters list
-          "theme": "light" | "dark"
+          "theme": "light" | "dark",
+          "init_data": {dc_id: {...}},  # optional, pre-resolved location/version
+          "result_cache_key": str       # optional, see services/figure/result_cache
         }
 
     Returns:
-        {"figure": <plotly fig dict>, "metadata": {"visu_type": str, "filter_applied": bool}}
+        {"figure_json": <plotly fig as JSON text>, "metadata": {"visu_type": str, ...}}
+
+    The figure is pre-serialised (``services/figure/encoding``); endpoints send
+    it with ``figure_response_bytes``, which yields the ``{"figure", "metadata"}``
+    body clients have always received.
+
+    ``planned`` carries answers an inline caller already computed on a fused
+    scan of the same filtered table (``render_all``'s ``ScanPlanner``):
+    ``"first_pass"``, the aggregation's first pass (``aggregate.first_pass``),
+    and ``"row_count"``, the filtered row count. Either may be ``None``. Only
+    ever passed to an inline run — DataFrames don't go through the broker.
     """
     from depictio.api.v1.db import deltatables_collection
     from depictio.api.v1.deltatables_utils import count_deltatable_lite, load_deltatable_lite
+    from depictio.api.v1.services.figure.result_cache import (
+        get_figure_result,
+        set_figure_result,
+    )
+
+    # The endpoint already looked this key up before dispatching; checking again
+    # here catches the render that a concurrent request finished while this one
+    # sat in the queue.
+    result_cache_key = payload.get("result_cache_key")
+    if result_cache_key:
+        cached, _tier = get_figure_result(result_cache_key)
+        if cached is not None:
+            return cached
 
     metadata = payload.get("metadata") or {}
     filter_metadata = payload.get("filter_metadata") or []
@@ -125,13 +185,18 @@ def build_figure_preview(payload: dict) -> dict:
     wf_oid = ObjectId(str(wf_id)) if not isinstance(wf_id, ObjectId) else wf_id
 
     dc_config = metadata.get("dc_config") or {}
-    init_data: dict[str, dict] = {}
+    # A caller that already resolved this DC (``render_all``) hands its
+    # ``init_data`` over, carrying the aggregation version too; otherwise
+    # resolve the location here.
+    init_data: dict[str, dict] = {
+        k: v for k, v in (payload.get("init_data") or {}).items() if k == str(dc_id)
+    }
     delta_loc = dc_config.get("delta_location")
-    if not delta_loc:
+    if not init_data and not delta_loc:
         dt = deltatables_collection.find_one({"data_collection_id": ObjectId(str(dc_id))})
         if dt:
             delta_loc = dt.get("delta_table_location")
-    if delta_loc:
+    if not init_data and delta_loc:
         init_data[str(dc_id)] = {
             "delta_location": delta_loc,
             "dc_type": dc_config.get("type") or "table",
@@ -234,7 +299,14 @@ def build_figure_preview(payload: dict) -> dict:
                 select_columns=select_columns,
             )
             if scan is not None:
-                agg_fig = build_aggregated_figure(scan, agg_plan, theme, render_stats)
+                agg_fig = build_aggregated_figure(
+                    scan,
+                    agg_plan,
+                    theme,
+                    render_stats,
+                    sketch_source=_sketch_source(str(dc_id), init_data, filter_metadata),
+                    prefetched=(planned or {}).get("first_pass"),
+                )
 
     df = None
     if agg_fig is None and code_sample_cap:
@@ -310,16 +382,19 @@ def build_figure_preview(payload: dict) -> dict:
         )
     build_ms = int((time.monotonic() - build_started) * 1000)
 
-    if hasattr(fig, "to_json"):
-        fig_dict = json.loads(fig.to_json())
-    else:
-        fig_dict = fig
-    if isinstance(fig_dict, dict) and "layout" in fig_dict:
-        fig_dict["layout"].setdefault("uirevision", "persistent")
+    # Encoded once, here, to its final JSON text (typed arrays for the trace
+    # data) — the Celery result backend, the result cache and the endpoint all
+    # pass the string through untouched. See ``services/figure/encoding``.
+    from depictio.api.v1.services.figure.encoding import encode_figure
+
+    serialize_started = time.monotonic()
+    figure_json = encode_figure(fig)
+    serialize_ms = int((time.monotonic() - serialize_started) * 1000)
 
     logger.info(
         f"celery_tasks.build_figure_preview wf={wf_id} dc={dc_id} mode={mode} "
         f"visu={visu_type} load_ms={load_ms} build_ms={build_ms} "
+        f"serialize_ms={serialize_ms} payload_bytes={len(figure_json)} "
         f"aggregated={bool(render_stats.get('aggregated'))}"
     )
 
@@ -341,8 +416,11 @@ def build_figure_preview(payload: dict) -> dict:
         # row count to size the subsample), so skip the extra count query.
         total_data_count = max(int(render_stats["total_rows"]), displayed_count)
     elif was_sampled and not full_load:
+        planned_count = (planned or {}).get("row_count")
         total_data_count = max(
-            count_deltatable_lite(
+            planned_count
+            if planned_count is not None
+            else count_deltatable_lite(
                 workflow_id=wf_oid,
                 data_collection_id=str(dc_id),
                 metadata=filter_metadata or None,
@@ -374,6 +452,8 @@ def build_figure_preview(payload: dict) -> dict:
             "rows_displayed": displayed_count,
             "aggregated": bool(render_stats.get("aggregated")),
             "frame_bytes": df.estimated_size() if df is not None else 0,
+            "serialize_ms": serialize_ms,
+            "payload_bytes": len(figure_json),
         },
     }
     if code_error:
@@ -381,7 +461,12 @@ def build_figure_preview(payload: dict) -> dict:
         # alert so it flips to red. The error figure is still in `figure` so
         # the preview pane shows the in-figure annotation as well.
         response_metadata["error"] = code_error
-    return {"figure": fig_dict, "metadata": response_metadata}
+    result = {"figure_json": figure_json, "metadata": response_metadata}
+    # Stored from the task body rather than the endpoint, so a render whose
+    # caller timed out waiting still lands in the cache for the retry.
+    if result_cache_key:
+        set_figure_result(result_cache_key, result)
+    return result
 
 
 @celery_app.task(name="depictio.figure.analyze_code", soft_time_limit=10, time_limit=20)
@@ -616,6 +701,87 @@ def preview_deltatable(payload: dict) -> dict:
     }
 
 
+@celery_app.task(
+    name="depictio.deltatables.build_sort_index", soft_time_limit=1800, time_limit=2400
+)
+def build_sort_index(
+    dc_id: str,
+    delta_table_location: str,
+    delta_version: int,
+    sort_by: str,
+    descending: bool,
+    nulls_last: bool = True,
+) -> dict:
+    """Write the sorted copy of one table for one sort (see `services/sort_index.py`).
+
+    Enqueued by the first table page that asks for a sort with no index yet;
+    pages keep sorting lazily until this lands.
+    """
+    from depictio.api.v1.services.sort_index import build_sort_index as build
+
+    started = time.monotonic()
+    path = build(dc_id, delta_table_location, delta_version, sort_by, descending, nulls_last)
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    logger.info(
+        f"celery_tasks.build_sort_index dc={dc_id} v{delta_version} {sort_by!r} "
+        f"elapsed_ms={elapsed_ms}"
+    )
+    return {"path": path, "elapsed_ms": elapsed_ms}
+
+
+@celery_app.task(name="depictio.figure.build_sketch", soft_time_limit=1800, time_limit=2400)
+def build_sketch(
+    dc_id: str,
+    location: str,
+    delta_version: int,
+    y: str,
+    keys: list[str],
+    partitions: list[str],
+    alpha: float,
+) -> dict:
+    """Write the persisted sketch of one box/violin figure (see `services/figure/sketch.py`).
+
+    Enqueued by the first render that could use it; renders keep scanning
+    until this lands.
+    """
+    from depictio.api.v1.services.figure.sketch import build_sketch as build
+
+    started = time.monotonic()
+    path = build(dc_id, location, delta_version, y, keys, partitions, alpha)
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    logger.info(
+        f"celery_tasks.build_sketch dc={dc_id} v{delta_version} {y!r} by {keys + partitions} "
+        f"elapsed_ms={elapsed_ms} persisted={path is not None}"
+    )
+    return {"path": path, "elapsed_ms": elapsed_ms}
+
+
+def _embedding_result(
+    coords,
+    passthrough: dict[str, list],
+    method: str,
+    params: dict,
+    n_components: int,
+    load_ms: int,
+    compute_ms: int,
+) -> dict:
+    """``compute_embedding``'s response, from the canonical ``embedding`` frame."""
+    result = {
+        "sample_ids": coords["sample_id"].to_list(),
+        "dim_1": coords["dim_1"].to_list(),
+        "dim_2": coords["dim_2"].to_list(),
+        "extras": passthrough,  # {col: [values]} aligned with sample_ids
+        "method": method,
+        "params": params,
+        "row_count": int(coords.height),
+        "load_ms": load_ms,
+        "compute_ms": compute_ms,
+    }
+    if n_components == 3 and "dim_3" in coords.columns:
+        result["dim_3"] = coords["dim_3"].to_list()
+    return result
+
+
 @celery_app.task(
     name="depictio.advanced_viz.compute_embedding",
     soft_time_limit=600,
@@ -627,7 +793,9 @@ def compute_embedding(payload: dict) -> dict:
     Loads a wide sample×feature matrix DC, projects it via run_pca /
     run_umap / run_tsne / run_pcoa from depictio.recipes.lib.dimreduction,
     and returns the 2D coords in the canonical embedding shape (column-
-    oriented dict).
+    oriented dict). With ``embedding_cache_enabled`` the fit is read from (or
+    written to) the DC's persisted embedding instead, and the filters only
+    select its samples — see ``services/embedding_cache.py``.
 
     Input payload (JSON-serialisable):
         {
@@ -680,6 +848,62 @@ def compute_embedding(payload: dict) -> dict:
         }
     }
 
+    # Renderer requests `n_components` (2 or 3) via the params dict; clamped
+    # to [2, 3] because that's what the renderer can plot.
+    n_components = int(params.get("n_components", 2))
+    if n_components not in (2, 3):
+        n_components = 2
+
+    runners = {
+        "pca": (run_pca, {"n_components": n_components, "scale": True}),
+        "umap": (
+            run_umap,
+            {
+                "n_components": n_components,
+                "n_neighbors": int(params.get("n_neighbors", 15)),
+                "min_dist": float(params.get("min_dist", 0.1)),
+                "metric": str(params.get("metric", "euclidean")),
+            },
+        ),
+        "tsne": (
+            run_tsne,
+            {
+                "n_components": n_components,
+                "perplexity": float(params.get("perplexity", 30.0)),
+                "n_iter": int(params.get("n_iter", 1000)),
+                "metric": str(params.get("metric", "euclidean")),
+            },
+        ),
+        "pcoa": (
+            run_pcoa,
+            {"n_components": n_components, "distance": str(params.get("distance", "bray_curtis"))},
+        ),
+    }
+    runner, kwargs = runners[method]
+
+    if settings.performance.embedding_cache_enabled:
+        from depictio.api.v1.services.embedding_cache import cached_embedding
+
+        started = time.monotonic()
+        cache_stats: dict = {}
+        cached = cached_embedding(
+            str(dc_id), method, kwargs, feature_id_col, filter_metadata, extra_cols, cache_stats
+        )
+        if cached is not None:
+            compute_ms = cache_stats["compute_ms"]
+            load_ms = int((time.monotonic() - started) * 1000) - compute_ms
+            logger.info(
+                "compute_embedding[%s]: %d coords from the embedding cache (%s) in %dms",
+                method,
+                cached.height,
+                cache_stats.get("source"),
+                load_ms + compute_ms,
+            )
+            passthrough = {c: cached[c].to_list() for c in extra_cols if c in cached.columns}
+            return _embedding_result(
+                cached, passthrough, method, params, n_components, load_ms, compute_ms
+            )
+
     started = time.monotonic()
     df = load_deltatable_lite(
         workflow_id=ObjectId(str(wf_id)),
@@ -721,39 +945,6 @@ def compute_embedding(payload: dict) -> dict:
         raise ValueError("compute_embedding: no numeric feature columns found in the matrix")
     df = df.select([feature_id_col] + feature_cols)
 
-    # Renderer requests `n_components` (2 or 3) via the params dict; clamped
-    # to [2, 3] because that's what the renderer can plot.
-    n_components = int(params.get("n_components", 2))
-    if n_components not in (2, 3):
-        n_components = 2
-
-    runners = {
-        "pca": (run_pca, {"n_components": n_components, "scale": True}),
-        "umap": (
-            run_umap,
-            {
-                "n_components": n_components,
-                "n_neighbors": int(params.get("n_neighbors", 15)),
-                "min_dist": float(params.get("min_dist", 0.1)),
-                "metric": str(params.get("metric", "euclidean")),
-            },
-        ),
-        "tsne": (
-            run_tsne,
-            {
-                "n_components": n_components,
-                "perplexity": float(params.get("perplexity", 30.0)),
-                "n_iter": int(params.get("n_iter", 1000)),
-                "metric": str(params.get("metric", "euclidean")),
-            },
-        ),
-        "pcoa": (
-            run_pcoa,
-            {"n_components": n_components, "distance": str(params.get("distance", "bray_curtis"))},
-        ),
-    }
-    runner, kwargs = runners[method]
-
     compute_started = time.monotonic()
     if method == "pcoa":
         # PCoA's Bray-Curtis distance requires non-negative values; shift
@@ -774,20 +965,7 @@ def compute_embedding(payload: dict) -> dict:
         params,
     )
 
-    result = {
-        "sample_ids": coords["sample_id"].to_list(),
-        "dim_1": coords["dim_1"].to_list(),
-        "dim_2": coords["dim_2"].to_list(),
-        "extras": passthrough,  # {col: [values]} aligned with sample_ids
-        "method": method,
-        "params": params,
-        "row_count": int(coords.height),
-        "load_ms": load_ms,
-        "compute_ms": compute_ms,
-    }
-    if n_components == 3 and "dim_3" in coords.columns:
-        result["dim_3"] = coords["dim_3"].to_list()
-    return result
+    return _embedding_result(coords, passthrough, method, params, n_components, load_ms, compute_ms)
 
 
 @celery_app.task(
@@ -1730,6 +1908,8 @@ __all__: list[str] = [
     "analyze_figure_code",
     "build_multiqc_preview",
     "preview_deltatable",
+    "build_sort_index",
+    "build_sketch",
     "compute_embedding",
     "compute_complex_heatmap",
     "compute_upset",
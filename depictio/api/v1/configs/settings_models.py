@@ -188,6 +188,9 @@ class MongoDBConfig(ServiceConfig):
         task_events_collection: str = Field(default="task_events")
         ingestion_runs_collection: str = Field(default="ingestion_runs")
         app_logs_collection: str = Field(default="app_logs")
+        # Reverse index (data collection -> dashboards/components) maintained on
+        # dashboard writes; the change-stream watcher reads it to find who to notify.
+        dc_dashboard_index_collection: str = Field(default="dc_dashboard_index")
         # Holds the anonymous installation identity and the per-day send guards.
         # Deliberately its own collection: the wipe path in lifespan.py clears
         # everything except the init lock out of `initialization`, so an identity
@@ -521,7 +524,31 @@ class CacheConfig(BaseSettings):
     max_dataframe_size_mb: int = Field(
         default=100, description="Maximum DataFrame size to cache (MB)"
     )
-    redis_max_memory_mb: int = Field(default=1024, description="Redis max memory limit (MB)")
+    redis_max_memory_mb: int = Field(
+        default=0,
+        description=(
+            "Redis maxmemory (MB) applied at startup with a volatile-lru policy; 0 leaves "
+            "Redis as configured. Only for a Redis not shared with the Celery backend"
+        ),
+    )
+
+    # Rendered-figure result cache (services/figure/result_cache.py). Entries
+    # are keyed on the DC's aggregation version, so an ingest retires them
+    # without an explicit purge; the TTL only bounds how long dead keys linger.
+    figure_result_ttl: int = Field(
+        default=3600, description="Rendered-figure cache TTL in seconds (Redis and disk tiers)"
+    )
+    figure_disk_cache_dir: str = Field(
+        default="/app/cache/figure_cache",
+        description="Directory of the per-host disk tier below Redis for rendered figures",
+    )
+    figure_disk_cache_size_mb: int = Field(
+        default=512,
+        description=(
+            "Size budget of the rendered-figure disk tier; least recently used "
+            "entries are evicted past it. 0 disables the disk tier."
+        ),
+    )
 
     # Cache key settings
     cache_key_prefix: str = Field(default="depictio:df:", description="Prefix for cache keys")
@@ -605,6 +632,63 @@ class CeleryConfig(BaseSettings):
         default=30.0,
         description="Per-request Celery offload timeout (seconds) before HTTP 504",
     )
+    push_results: bool = Field(
+        default=True,
+        description=(
+            "Workers publish task completion on Redis pub/sub and offloaded requests "
+            "wake on that notice instead of polling the result backend. Off = the "
+            "old backoff poll (50 ms growing to 500 ms)."
+        ),
+    )
+    result_fallback_poll_seconds: float = Field(
+        default=1.0,
+        description=(
+            "With push_results on, how often a waiting request still checks the "
+            "result backend itself — the bound on a lost pub/sub notice."
+        ),
+    )
+
+    # Cost-class routing (see ``celery_dispatch.COST_CLASSES``). Off by default
+    # because a queue nobody consumes silently strands every task sent to it:
+    # turn it on together with the per-class worker pools that
+    # ``docker-images/run_celery_worker.sh`` starts from the same variables.
+    cost_class_queues: bool = Field(
+        default=False,
+        description=(
+            "Route offloaded work to one queue per cost class (aggregate, points, "
+            "code, multiqc, embedding), each consumed by its own worker pool."
+        ),
+    )
+    cost_class_queue_prefix: str = Field(
+        default="render.",
+        description="Queue name prefix for cost-class queues (``render.points`` etc.)",
+    )
+    queue_concurrency: str = Field(
+        default="aggregate=2,points=2,code=1,multiqc=1,embedding=1",
+        description=(
+            "Worker pool size per cost class, ``class=n`` comma list. Read by the "
+            "worker start script to size each pool and by admission control to "
+            "price each queue's backlog."
+        ),
+    )
+    admission_control: bool = Field(
+        default=True,
+        description=(
+            "Answer 503 + Retry-After instead of queuing an offloaded render whose "
+            "queue backlog means it cannot finish within offload_timeout_seconds."
+        ),
+    )
+
+    def queue_pool_sizes(self) -> dict[str, int]:
+        """``queue_concurrency`` parsed; malformed entries are skipped."""
+        sizes: dict[str, int] = {}
+        for part in self.queue_concurrency.split(","):
+            name, _, value = part.partition("=")
+            try:
+                sizes[name.strip()] = max(1, int(value))
+            except ValueError:
+                continue
+        return sizes
 
     @computed_field
     @property
@@ -714,6 +798,36 @@ class BackupConfig(BaseSettings):
     backup_s3_secret_key: Optional[str] = Field(default=None, description="Backup S3 secret key")
     backup_s3_region: str = Field(default="us-east-1", description="Backup S3 region")
     compress_local_backups: bool = Field(default=True, description="Compress local S3 data backups")
+    s3_backup_max_concurrency: int = Field(
+        default=8, ge=1, le=64, description="Objects copied in parallel per backed-up location"
+    )
+    s3_backup_multipart_chunk_mb: int = Field(
+        default=16,
+        ge=5,
+        description="Multipart threshold and part size (MiB) of S3 backup copies (S3 minimum: 5)",
+    )
+    s3_backup_incremental: bool = Field(
+        default=False,
+        description=(
+            "Read only the Delta log entries added since each table's last S3-to-S3 "
+            "snapshot instead of listing the table; falls back to a listing when the "
+            "log cannot be followed"
+        ),
+    )
+    mongodb_backup_format: Literal["json", "bson"] = Field(
+        default="json",
+        description=(
+            "Format of new MongoDB backups: 'json' (one pretty-printed file) or 'bson' "
+            "(a directory with one gzip-compressed BSON stream per collection and a "
+            "manifest, written and restored in bounded memory)"
+        ),
+    )
+    mongodb_backup_batch_size: int = Field(
+        default=1000, ge=1, description="Documents per cursor batch / insert_many of BSON backups"
+    )
+    mongodb_backup_workers: int = Field(
+        default=4, ge=1, le=16, description="Collections dumped or restored in parallel (BSON)"
+    )
     backup_file_retention_days: int = Field(default=30, description="Days to retain backup files")
     migration_allowed_s3_endpoints: list[str] | str = Field(
         default_factory=list,
@@ -802,7 +916,28 @@ class EventsConfig(BaseSettings):
         default=60, description="WebSocket connection timeout in seconds"
     )
     debounce_ms: int = Field(
-        default=1000, description="Debounce interval in milliseconds for rapid updates"
+        default=1000,
+        description=(
+            "Debounce interval in milliseconds for rapid updates. Data-collection "
+            "events for one dashboard arriving within this window of each other "
+            "(from this instance or over pub/sub) are delivered once, carrying the "
+            "latest event. 0 delivers every event as it arrives."
+        ),
+    )
+    debounce_max_wait_ms: int = Field(
+        default=5000,
+        description=(
+            "Upper bound on how long a continuous stream of data-collection events "
+            "can hold back a dashboard's refresh"
+        ),
+    )
+    ws_send_queue_size: int = Field(
+        default=64,
+        description=(
+            "Messages buffered per WebSocket client. Each client is written by its "
+            "own task, so a slow client only delays itself; once its buffer is "
+            "full the oldest pending message is dropped"
+        ),
     )
 
     model_config = SettingsConfigDict(env_prefix="DEPICTIO_EVENTS_")
@@ -995,6 +1130,17 @@ class PerformanceConfig(BaseSettings):
             "0 disables the ceiling (unbounded loads)."
         ),
     )
+    embedding_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Persist each embedding fit (PCA, UMAP, t-SNE, PCoA) next to its "
+            "feature matrix, keyed by Delta version, method, parameters and "
+            "features (`services/embedding_cache.py`). Filtered views keep the "
+            "filtered samples of that one map instead of refitting on them, so "
+            "points stay put as filters change; rows appended since a PCA or "
+            "UMAP fit are transformed onto it rather than refitted."
+        ),
+    )
     advanced_viz_tail_p_threshold: float = Field(
         default=0.05,
         description=(
@@ -1040,6 +1186,31 @@ class PerformanceConfig(BaseSettings):
             "costs more than it saves — measured at ~64 groups on a 14M-row frame."
         ),
     )
+    figure_sketch_accuracy: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=0.1,
+        description=(
+            "Relative accuracy of the quantile sketch serving box quartiles and "
+            "violin densities (`services/figure/sketch.py`): each estimate lies "
+            "within this fraction of the true value, e.g. 0.01 for 1%. The "
+            "sketch is a hash aggregation inside the scan, so it replaces the "
+            "quartile sort and the violin's raw-row subsample, and takes "
+            "precedence over `box_sample_rows_per_group`. 0 (the default) keeps "
+            "exact quartiles and subsampled violins. Values below 0.001 are "
+            "raised to it."
+        ),
+    )
+    figure_sketch_index_enabled: bool = Field(
+        default=True,
+        description=(
+            "With the sketch on, persist one per (Delta version, plotted column, "
+            "groups) next to the table, broken down by the dashboard's filter "
+            "columns, so a re-render under another filter merges sketch rows "
+            "instead of scanning. Built on first use; skipped when the groups "
+            "and filter values would make it large."
+        ),
+    )
     figure_max_load_rows: int = Field(
         default=500_000,
         description=(
@@ -1061,6 +1232,103 @@ class PerformanceConfig(BaseSettings):
             "than show unsorted rows under a sorted header. 0 disables the gate."
         ),
     )
+    table_sort_index_enabled: bool = Field(
+        default=True,
+        description=(
+            "Serve sorted pages of large tables (over `table_sort_max_rows`, or "
+            "over the frame memo cap) from a sorted copy written next to the "
+            "Delta table for each sort column and direction "
+            "(`services/sort_index.py`). The first request for a sort enqueues "
+            "the build on the Celery worker and is served the lazy way until it "
+            "lands; later pages are a row-group read. Off: large tables are "
+            "served unsorted past `table_sort_max_rows`, as before."
+        ),
+    )
+    render_all_concurrency: int = Field(
+        default=4,
+        description=(
+            "Components `POST /dashboards/render_all` resolves at once. Each "
+            "in-flight component holds a threadpool worker (or a Celery slot "
+            "when offloaded), so this bounds how much of the API process one "
+            "dashboard load may claim; the rest queue in cost order and stream "
+            "back as they finish."
+        ),
+    )
+    frame_cache_max_mb: int = Field(
+        default=1024,
+        description=(
+            "Byte budget of the per-process DataFrame cache in front of Delta "
+            "(`api/v1/frame_cache.py`), measured with Polars' `estimated_size`. "
+            "Least recently used frames are evicted past it. Each API worker "
+            "process holds its own cache, so the RSS this can pin is this "
+            "figure times the worker count. Also the size above which a table "
+            "is loaded lazily instead of materialised whole."
+        ),
+    )
+    frame_cache_item_max_mb: int = Field(
+        default=256,
+        description=(
+            "Largest single frame the in-process cache will keep. A bigger frame "
+            "is still served (and may live in Redis) but is re-materialised on "
+            "the next miss rather than pushing every smaller, more reused frame "
+            "out of the budget."
+        ),
+    )
+    link_index_enabled: bool = Field(
+        default=True,
+        description=(
+            "Build a link translation index for every enabled project link when "
+            "its source DC is ingested (`links_endpoints/translation_index.py`), "
+            "so a filter on another column of the source DC translates to link "
+            "keys by lookup instead of a scan of the source table."
+        ),
+    )
+    link_index_max_filter_values: int = Field(
+        default=50_000,
+        description=(
+            "Only source columns with at most this many distinct values are "
+            "indexed. Filters are built on categorical columns; a near-unique "
+            "column would make an index as large as the table for no gain."
+        ),
+    )
+    sample_tiers_enabled: bool = Field(
+        default=False,
+        description=(
+            "Materialise fixed stratified samples of every table DC at ingest "
+            "(`services/sample_tiers.py`). Advanced-viz, code-mode and violin/"
+            "ECDF subsamples are then drawn from the smallest tier that still "
+            "holds enough filtered rows, instead of hashing the whole table on "
+            "every render. Costs one extra scan per ingest and the tier files."
+        ),
+    )
+    sample_tier_rows: list[int] = Field(
+        default=[10_000, 100_000, 1_000_000],
+        description=(
+            "Sizes of the sample tiers, in rows. A tier is only built for a "
+            "table larger than it; each smaller tier is a subset of the next."
+        ),
+    )
+    # MultiQC report pool (``services/multiqc/report_pool.py``). Parsed reports
+    # are kept as individually pickled Plot objects rather than one resident
+    # ``multiqc.report``, so a process can serve many reports at once.
+    multiqc_report_pool_workers: int = Field(
+        default=0,
+        description=(
+            "Processes that parse MultiQC reports, so different reports parse in "
+            "parallel. 0 parses in the requesting process under the MultiQC "
+            "lock, one report at a time. Workers are spawned on first use, which "
+            "takes seconds, and each busy one holds a fully parsed report in memory."
+        ),
+    )
+    multiqc_resident_plots_mb: int = Field(
+        default=256,
+        description=(
+            "Memory budget (by pickled size) for the MultiQC Plot objects a "
+            "process keeps unpickled, least recently used evicted first. "
+            "Switching between reports within the budget costs no parse and "
+            "no cache read."
+        ),
+    )
     # Table rows-per-page has no server-side default here: the component model
     # (TableLiteComponent.page_size) already defaults to 100, and the React grid
     # reads that value directly — a settings knob would be dead config.
@@ -63,5 +63,6 @@ multiqc_prerender_collection = db[settings.mongodb.collections.multiqc_prerender
 task_events_collection = db[settings.mongodb.collections.task_events_collection]
 ingestion_runs_collection = db[settings.mongodb.collections.ingestion_runs_collection]
 app_logs_collection = db[settings.mongodb.collections.app_logs_collection]
+dc_dashboard_index_collection = db[settings.mongodb.collections.dc_dashboard_index_collection]
 telemetry_collection = db[settings.mongodb.collections.telemetry_collection]
 test_collection = db[settings.mongodb.collections.test_collection]
@@ -1,17 +1,19 @@
 import hashlib
 import json
 import os
-import sys
 import threading
 import warnings
+from collections.abc import Callable
+from typing import Any
 
 import httpx
 import polars as pl
 from bson import ObjectId
 
-from depictio.api.v1.configs.config import API_BASE_URL
+from depictio.api.v1.configs.config import API_BASE_URL, settings
 from depictio.api.v1.configs.logging_init import logger
 from depictio.api.v1.s3 import polars_s3_config
+from depictio.models.models.deltatables import HIDDEN_COLUMNS
 
 # FEATURE FLAGS
 ENABLE_CACHING = True  # Global toggle for caching system
@@ -34,6 +36,18 @@ DELTA_CACHE_DIR = os.getenv("DEPICTIO_DELTA_CACHE_DIR", "/app/cache/delta_cache"
 _DELTA_SCHEMA_CACHE: dict[tuple[str, str], dict[str, pl.DataType]] = {}
 _DELTA_SCHEMA_CACHE_MAX = 512  # bounded; the version salt churns keys over time
 
+# Base scan cache. ``pl.scan_delta`` reads the Delta log (and, on S3, lists the
+# table) every time it is called, and a dashboard render asks for the same
+# table once per component — a filter round over 30 tiles on one DC set up the
+# same scan 30 times. A scan is a plan pinned to the table version it was opened
+# at, so it is safe to share for as long as the aggregation version it was
+# opened under is current; keyed on that version, an ingest moves every caller
+# to a fresh entry. Unknown versions are never memoised (see
+# ``_get_cached_dtypes`` for the same reasoning).
+_DELTA_SCAN_CACHE: dict[tuple[str, str, str], pl.LazyFrame] = {}
+_DELTA_SCAN_CACHE_MAX = 256
+_DELTA_SCAN_CACHE_LOCK = threading.Lock()
+
 
 def get_local_cache_path(s3_path: str) -> str:
     """
@@ -181,7 +195,8 @@ def _categorical_predicate(column_name: str, values: list, dtype: pl.DataType |
     likely to mean "this dtype doesn't parse from text" than "the user picked
     values this column cannot hold", and guessing wrong empties the component.
     """
-    str_values = [str(v) for v in values]
+    # Python bools render "True"/"False"; Polars casts Boolean to "true"/"false".
+    str_values = [str(v).lower() if isinstance(v, bool) else str(v) for v in values]
     fallback = pl.col(column_name).cast(pl.Utf8, strict=False).is_in(str_values)
 
     if dtype is None:
@@ -222,6 +237,25 @@ def _categorical_predicate(column_name: str, values: list, dtype: pl.DataType |
     return pl.col(column_name).is_in(typed_values)
 
 
+def is_active_filter_value(value) -> bool:
+    """Whether an interactive filter's ``value`` selects anything.
+
+    ``None``, ``""``, an empty list and a reset range (``[None, None]``) mean
+    "no selection"; ``0`` and ``False`` are values a Slider or a boolean Select
+    can hold, so they filter. Mirrors ``isFilterActive`` in the viewer
+    (``depictio-react-core/src/activeFilters.ts``); shared by :func:`add_filter`,
+    cross-DC link resolution and the facets service so all agree on which
+    filters apply.
+    """
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple)):
+        return any(item is not None for item in value)
+    if isinstance(value, str):
+        return len(value) > 0
+    return True
+
+
 def add_filter(
     filter_list: list,
     interactive_component_type: str,
@@ -243,14 +277,14 @@ def add_filter(
         # correct result is no rows.
         #
         # This cannot be expressed as an empty ``is_in`` list, because every
-        # branch below is guarded by ``if value:`` — an empty list falls through
+        # branch below skips an inactive value — an empty list falls through
         # as "no filter at all" and the component renders EVERY row, which reads
         # as "the filter did nothing" rather than "nothing matched". Hence an
         # explicit component type carrying an always-false predicate.
         filter_list.append(pl.lit(False))
 
     elif interactive_component_type in ["Select", "MultiSelect", "SegmentedControl"]:
-        if value:
+        if is_active_filter_value(value):
             # Ensure value is a list for is_in() function
             if not isinstance(value, list):
                 value = [value]
@@ -258,15 +292,15 @@ def add_filter(
             filter_list.append(_categorical_predicate(column_name, value, dtype))
 
     elif interactive_component_type == "TextInput":
-        if value:
+        if is_active_filter_value(value):
             filter_list.append(pl.col(column_name).str.contains(value))
 
     elif interactive_component_type == "Slider":
-        if value:
+        if is_active_filter_value(value):
             filter_list.append(pl.col(column_name) == value)
 
     elif interactive_component_type == "RangeSlider":
-        if value:
+        if is_active_filter_value(value):
             filter_list.append(
                 (pl.col(column_name) >= value[0]) & (pl.col(column_name) <= value[1])
             )
@@ -276,7 +310,7 @@ def add_filter(
             f"[DEBUG] {interactive_component_type} filter: column={column_name}, value={value}, type={type(value)}"
         )
 
-        if value and isinstance(value, list) and len(value) == 2:
+        if isinstance(value, list) and len(value) == 2:
             logger.info(f"[DEBUG] {interactive_component_type} validation passed, applying filter")
             try:
                 from datetime import date as _date
@@ -636,6 +670,33 @@ def _get_aggregation_hash(data_collection_id_str: str) -> str | None:
         return None
 
 
+def _get_aggregation_salts(data_collection_id_str: str) -> tuple[str | None, str | None]:
+    """``(aggregation_version, aggregation_hash)`` from a single Mongo read.
+
+    For callers that carry both in ``init_data`` — the version keys the
+    in-process caches, the hash keys the persistent ones — and would otherwise
+    pay two round-trips for the same document. ``(None, None)`` on failure.
+    """
+    try:
+        from depictio.api.v1.db import deltatables_collection as _dt_coll
+
+        dt = _dt_coll.find_one(
+            {"data_collection_id": ObjectId(data_collection_id_str)},
+            {"aggregation": 1},
+        )
+        agg_list = (dt or {}).get("aggregation") or []
+        if not agg_list:
+            return None, None
+        latest = agg_list[-1]
+        return (
+            str(latest.get("aggregation_version") or ""),
+            str(latest.get("aggregation_hash") or ""),
+        )
+    except Exception as e:
+        logger.debug(f"_get_aggregation_salts({data_collection_id_str}) failed: {e}")
+        return None, None
+
+
 def _get_dc_type_from_db(data_collection_id: ObjectId) -> str | None:
     """
     Fetch data collection type from MongoDB.
@@ -724,17 +785,55 @@ def _get_delta_location(
     return file_id
 
 
-def _create_delta_scan(file_id: str, dc_type: str | None = None) -> pl.LazyFrame:
+def _resolve_version_salt(
+    data_collection_id_str: str, init_data: dict[str, dict] | None
+) -> str | None:
+    """The DC's aggregation version, read from ``init_data`` when the caller has it.
+
+    A caller rendering many components over one DC (``render_all``) reads the
+    version once and carries it in ``init_data``; every loader call for that DC
+    then skips its own Mongo round-trip. Falls back to the lookup otherwise, so
+    callers that never set it behave exactly as before.
+    """
+    entry = (init_data or {}).get(data_collection_id_str) or {}
+    if "aggregation_version" in entry:
+        return entry["aggregation_version"]
+    return _get_aggregation_version(data_collection_id_str)
+
+
+def _create_delta_scan(
+    file_id: str, dc_type: str | None = None, version_salt: str | int | None = None
+) -> pl.LazyFrame:
     """
     Create a Polars LazyFrame scan from Delta table location or parquet files.
 
     Args:
         file_id: S3 path or local path to Delta table or parquet files.
         dc_type: Data collection type (e.g., "MultiQC", "Table"). If "MultiQC", uses parquet scan.
+        version_salt: Aggregation version the scan is opened under. When given,
+            the scan is shared with every later caller asking for the same
+            (location, type, version); ``None`` always opens a fresh one.
 
     Returns:
         Polars LazyFrame for the Delta table or parquet files.
     """
+    if version_salt is None:
+        return _open_delta_scan(file_id, dc_type)
+
+    key = (file_id, str(dc_type or ""), str(version_salt))
+    cached = _DELTA_SCAN_CACHE.get(key)
+    if cached is not None:
+        return cached
+    scan = _open_delta_scan(file_id, dc_type)
+    with _DELTA_SCAN_CACHE_LOCK:
+        if len(_DELTA_SCAN_CACHE) >= _DELTA_SCAN_CACHE_MAX:
+            _DELTA_SCAN_CACHE.clear()
+        _DELTA_SCAN_CACHE[key] = scan
+    return scan
+
+
+def _open_delta_scan(file_id: str, dc_type: str | None = None) -> pl.LazyFrame:
+    """Open a new scan; see ``_create_delta_scan`` for the shared entry point."""
     # MultiQC data is stored as parquet, not delta tables
     # Case-insensitive check for MultiQC type
     if dc_type and dc_type.lower() == "multiqc":
@@ -935,9 +1034,8 @@ def _finalize_dataframe(
     if limit_rows:
         df = df.limit(limit_rows)
 
-    # Drop aggregation time column if exists
-    if "depictio_aggregation_time" in df.columns:
-        df = df.drop("depictio_aggregation_time")
+    # Drop the bookkeeping columns (aggregation time, source hash) if present
+    df = df.drop(HIDDEN_COLUMNS, strict=False)
 
     return df
 
@@ -1004,75 +1102,42 @@ def _check_memory_cache(
     Returns:
         Cached DataFrame if found, None otherwise.
     """
-    import time
+    from depictio.api.v1.frame_cache import frame_cache
 
     # Check filtered cache first if filters exist
-    if filter_hash and filtered_cache_key and filtered_cache_key in _dataframe_memory_cache:
-        update_cache_timestamp(filtered_cache_key)
-        cached_df = _dataframe_memory_cache[filtered_cache_key]
-        return _finalize_dataframe(cached_df, None, True, limit_rows)
+    if filter_hash and filtered_cache_key:
+        cached_df = frame_cache.get(filtered_cache_key)
+        if cached_df is not None:
+            return _finalize_dataframe(cached_df, None, True, limit_rows)
 
     # Check base cache
-    if base_cache_key in _dataframe_memory_cache:
-        update_cache_timestamp(base_cache_key)
-        cached_df = _dataframe_memory_cache[base_cache_key]
-
-        # Apply column projection if needed
-        if select_columns and all(col in cached_df.columns for col in select_columns):
-            cached_df = cached_df.select(select_columns)
-
-        # Apply filters and cache the filtered result
-        if metadata and not load_for_options:
-            cached_df = apply_runtime_filters(cached_df, metadata)
-
-            # Cache filtered result in memory
-            if filter_hash and filtered_cache_key:
-                _dataframe_memory_cache[filtered_cache_key] = cached_df
-                _cache_metadata[filtered_cache_key] = {
-                    "size_bytes": sys.getsizeof(cached_df),
-                    "timestamp": time.time(),
-                }
-
-        return _finalize_dataframe(cached_df, None, True, limit_rows)
-
-    return None
+    cached_df = frame_cache.get(base_cache_key)
+    if cached_df is None:
+        return None
 
+    # Apply column projection if needed
+    if select_columns and all(col in cached_df.columns for col in select_columns):
+        cached_df = cached_df.select(select_columns)
 
-def _cache_dataframe_to_stores(
-    cache_key: str,
-    df: pl.DataFrame,
-    size_bytes: int,
-) -> None:
-    """
-    Cache a DataFrame to both Redis and memory stores.
+    # Apply filters and cache the filtered result
+    if metadata and not load_for_options:
+        cached_df = apply_runtime_filters(cached_df, metadata)
 
-    Args:
-        cache_key: Cache key for the DataFrame.
-        df: DataFrame to cache.
-        size_bytes: Estimated size in bytes.
-    """
-    import time
+        # Cache filtered result in memory
+        if filter_hash and filtered_cache_key:
+            frame_cache.put(filtered_cache_key, cached_df)
 
-    global _total_memory_usage
+    return _finalize_dataframe(cached_df, None, True, limit_rows)
 
-    if size_bytes > MEMORY_THRESHOLD_BYTES:
-        return
 
-    # Try Redis first
+def _cache_dataframe_to_redis(cache_key: str, df: pl.DataFrame) -> bool:
+    """Best-effort write of ``df`` to the shared Redis tier; ``False`` on failure."""
     try:
         from depictio.api.cache import cache_dataframe
 
-        cache_dataframe(cache_key, df)
+        return bool(cache_dataframe(cache_key, df))
     except Exception:
-        pass
-
-    # Also cache in memory
-    _dataframe_memory_cache[cache_key] = df
-    _cache_metadata[cache_key] = {
-        "size_bytes": size_bytes,
-        "timestamp": time.time(),
-    }
-    _total_memory_usage += size_bytes
+        return False
 
 
 def _log_cache_status() -> None:
@@ -1094,6 +1159,10 @@ def _load_and_cache_fresh_data(
     """
     Load DataFrame from storage and cache it.
 
+    The collect goes through ``frame_cache.get_or_load``, so threads missing on
+    the same base key at once share one Delta read instead of each collecting
+    the table (and each briefly holding its own copy).
+
     Args:
         delta_scan: Polars LazyFrame to collect.
         base_cache_key: Cache key for unfiltered data.
@@ -1102,51 +1171,34 @@ def _load_and_cache_fresh_data(
         data_collection_id_str: Data collection ID for logging.
         metadata: Optional filter metadata.
         load_for_options: If True, skip filtering.
-        size_bytes: Expected size for caching decisions (-1 for unknown).
+        size_bytes: Expected size from the DC metadata (-1 for unknown); only
+            used to skip the Redis copy of frames too large to be worth it.
 
     Returns:
         Loaded DataFrame.
     """
-    import time
-
-    global _total_memory_usage
+    from depictio.api.v1.frame_cache import frame_cache
 
-    try:
-        df = delta_scan.collect()
-    except Exception as e:
-        logger.error(f"Error collecting Delta table data: {e}")
-        raise Exception("Error collecting Delta table data") from e
-
-    # Estimate size if unknown
-    if size_bytes == -1:
-        size_bytes = df.height * df.width * 8  # 8 bytes per cell average
+    def _collect() -> pl.DataFrame:
+        try:
+            df = delta_scan.collect()
+        except Exception as e:
+            logger.error(f"Error collecting Delta table data: {e}")
+            raise Exception("Error collecting Delta table data") from e
+        if size_bytes <= MEMORY_THRESHOLD_BYTES:
+            _cache_dataframe_to_redis(base_cache_key, df)
+        return df
 
-    # Cache the base DataFrame
-    _cache_dataframe_to_stores(base_cache_key, df, size_bytes)
+    df = frame_cache.get_or_load(base_cache_key, _collect)
 
     # Apply filters if needed
     if metadata and not load_for_options:
         df = apply_runtime_filters(df, metadata)
 
-        # Cache filtered result
+        # Cache filtered result; memory only when Redis won't take it
         if filter_hash and filtered_cache_key:
-            filtered_size = df.height * df.width * 8
-            try:
-                from depictio.api.cache import cache_dataframe
-
-                if not cache_dataframe(filtered_cache_key, df):
-                    # Fallback to memory cache if Redis fails
-                    _dataframe_memory_cache[filtered_cache_key] = df
-                    _cache_metadata[filtered_cache_key] = {
-                        "size_bytes": filtered_size,
-                        "timestamp": time.time(),
-                    }
-            except Exception:
-                _dataframe_memory_cache[filtered_cache_key] = df
-                _cache_metadata[filtered_cache_key] = {
-                    "size_bytes": filtered_size,
-                    "timestamp": time.time(),
-                }
+            if not _cache_dataframe_to_redis(filtered_cache_key, df):
+                frame_cache.put(filtered_cache_key, df)
 
     return df
 
@@ -1241,7 +1293,7 @@ def _open_sortable_scan(
         else:
             dc_type = _get_dc_type_from_db(ObjectId(data_collection_id_str))
         file_id = _get_delta_location(data_collection_id_str, workflow_id_str, init_data, TOKEN)
-        delta_scan = _create_delta_scan(file_id, dc_type)
+        delta_scan = _create_delta_scan(file_id, dc_type, version_salt)
         delta_scan = _apply_scan_filters(delta_scan, metadata, data_collection_id_str, version_salt)
         delta_scan = _project_scan(delta_scan, effective_cols, data_collection_id_str, version_salt)
         return delta_scan
@@ -1278,7 +1330,7 @@ def open_deltatable_scan(
     frames the cache is sized for (they belong in the result cache instead).
     """
     data_collection_id_str = str(data_collection_id)
-    version_salt = _get_aggregation_version(data_collection_id_str)
+    version_salt = _resolve_version_salt(data_collection_id_str, init_data)
     effective_cols = _effective_projection(select_columns, metadata, False)
     return _open_sortable_scan(
         str(workflow_id),
@@ -1291,6 +1343,146 @@ def open_deltatable_scan(
     )
 
 
+class ScanPlanner:
+    """Fuse the lazy reductions one request aims at the same filtered table.
+
+    A filter round asks one data collection many small questions — every card's
+    aggregations, the row count tables and advanced-viz sampling need, each
+    aggregated figure's first pass — and each used to open its own
+    ``open_deltatable_scan`` and ``collect()`` it, so N components meant N
+    parquet reads of the same filtered rows. Callers register a *builder*
+    (``scan -> LazyFrame``) under a name instead; ``run()`` then opens one scan
+    per ``(dc_id, filter hash, aggregation version)`` group, projected to the
+    union of every member's columns, and evaluates all members with a single
+    ``pl.collect_all``. The plans share an identical source, so Polars' common
+    subplan elimination reads it once.
+
+    Purely an optimisation: ``result()`` returns ``None`` for anything that
+    wasn't planned or failed, and callers keep their own path as the fallback.
+    One bad member never fails its group — a failed ``collect_all`` is retried
+    member by member. Thread-safe; ``run()`` only evaluates what is pending, so
+    it is cheap to call again after late registrations.
+    """
+
+    def __init__(self) -> None:
+        self._groups: dict[tuple[str, str, str], dict] = {}
+        self._results: dict[Any, pl.DataFrame | None] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def group_key(
+        data_collection_id: str,
+        metadata: list[dict] | None,
+        init_data: dict[str, dict] | None,
+    ) -> tuple[str, str, str]:
+        dc = str(data_collection_id)
+        return (dc, _generate_filter_hash(metadata), str(_resolve_version_salt(dc, init_data)))
+
+    def add(
+        self,
+        name: Any,
+        workflow_id: ObjectId | str,
+        data_collection_id: ObjectId | str,
+        build: Callable[[pl.LazyFrame], pl.LazyFrame],
+        columns: set[str] | None = None,
+        metadata: list[dict] | None = None,
+        init_data: dict[str, dict] | None = None,
+    ) -> None:
+        """Register ``build`` under ``name``; a name already planned is ignored.
+
+        ``columns=None`` means the member needs every column, which widens the
+        whole group's projection — pass the columns whenever they are known.
+        ``columns=set()`` declares a member that reads no column (a row count);
+        a group made only of those scans nothing but its filter columns. A
+        ``build`` that returns ``None`` plans nothing, and its result reads
+        ``None``.
+        """
+        key = self.group_key(str(data_collection_id), metadata, init_data)
+        with self._lock:
+            if name in self._results or any(name in g["members"] for g in self._groups.values()):
+                return
+            group = self._groups.setdefault(
+                key,
+                {
+                    "workflow_id": workflow_id,
+                    "metadata": metadata,
+                    "init_data": init_data,
+                    "columns": set(),
+                    "all_columns": False,
+                    "members": {},
+                },
+            )
+            group["members"][name] = build
+            if columns is None:
+                group["all_columns"] = True
+            else:
+                group["columns"] |= set(columns)
+
+    def run(self) -> None:
+        """Evaluate every pending group: one scan and one ``collect_all`` each."""
+        with self._lock:
+            pending, self._groups = self._groups, {}
+        for (dc_id, _fhash, _version), group in pending.items():
+            results = self._run_group(dc_id, group)
+            with self._lock:
+                self._results.update(results)
+
+    def result(self, name: Any) -> pl.DataFrame | None:
+        with self._lock:
+            return self._results.get(name)
+
+    @staticmethod
+    def _run_group(dc_id: str, group: dict) -> dict[Any, pl.DataFrame | None]:
+        members: dict[Any, Callable] = group["members"]
+        results: dict[Any, pl.DataFrame | None] = dict.fromkeys(members)
+        if group["all_columns"]:
+            columns = None
+        elif group["columns"]:
+            columns = sorted(group["columns"])
+        else:
+            # Every member declared ``columns=set()``: the group only counts
+            # rows. ``select_columns=[]`` would read as "no projection" and a
+            # zero-column ``select`` counts zero rows, so the scan is projected
+            # to the filter columns alone — the only ones a ``pl.len()`` over a
+            # filtered table reads. With no filters that is ``None``, which
+            # projection pushdown narrows to no column at all for a bare
+            # ``pl.len()`` (``PROJECT 0/n COLUMNS``).
+            columns = sorted(_filter_columns(group["metadata"])) or None
+        scan = open_deltatable_scan(
+            workflow_id=group["workflow_id"],
+            data_collection_id=dc_id,
+            metadata=group["metadata"] or None,
+            init_data=group["init_data"],
+            select_columns=columns,
+        )
+        if scan is None:
+            return results
+
+        plans: dict[Any, pl.LazyFrame] = {}
+        for name, build in members.items():
+            try:
+                plan = build(scan)
+                if plan is not None:
+                    plans[name] = plan
+            except Exception as e:
+                logger.debug(f"ScanPlanner: could not plan {name!r} on {dc_id}: {e}")
+        if not plans:
+            return results
+
+        try:
+            frames = pl.collect_all(list(plans.values()))
+            results.update(zip(plans.keys(), frames))
+        except Exception as e:
+            logger.debug(f"ScanPlanner: fused collect failed on {dc_id} ({e}); collecting singly")
+            for name, plan in plans.items():
+                try:
+                    results[name] = plan.collect()
+                except Exception as member_error:
+                    logger.debug(f"ScanPlanner: {name!r} on {dc_id} failed: {member_error}")
+        logger.debug(f"ScanPlanner: {len(plans)} plan(s) on {dc_id} in one fused collect")
+        return results
+
+
 def _load_large_dataframe(
     delta_scan: pl.LazyFrame,
     data_collection_id_str: str,
@@ -1484,7 +1676,7 @@ def load_deltatable_lite(
     # one worker that received the event, so without a per-version key the
     # other 3 default workers keep serving the stale dataframe. The version
     # bumps on every CLI rewrite, so the new fetch lands on a new key.
-    version_salt = _get_aggregation_version(data_collection_id_str)
+    version_salt = _resolve_version_salt(data_collection_id_str, init_data)
 
     # Generate cache keys
     base_cache_key, filtered_cache_key, filter_hash = _generate_cache_keys(
@@ -1540,7 +1732,7 @@ def load_deltatable_lite(
 
     # Get delta location and create scan
     file_id = _get_delta_location(data_collection_id_str, workflow_id_str, init_data, TOKEN)
-    delta_scan = _create_delta_scan(file_id, dc_type)
+    delta_scan = _create_delta_scan(file_id, dc_type, version_salt)
 
     # Apply column projection at scan level (schema-guarded; see _project_scan)
     delta_scan = _project_scan(delta_scan, effective_cols, data_collection_id_str, version_salt)
@@ -1587,13 +1779,59 @@ def load_deltatable_lite(
             version_salt,
         )
 
-    # Final cleanup (drop aggregation column)
-    if "depictio_aggregation_time" in df.columns:
-        df = df.drop("depictio_aggregation_time")
+    # Final cleanup (drop the bookkeeping columns)
+    df = df.drop(HIDDEN_COLUMNS, strict=False)
 
     return df
 
 
+def _sort_index_page(
+    workflow_id_str: str,
+    data_collection_id_str: str,
+    init_data: dict[str, dict] | None,
+    version_salt: str | int | None,
+    sort_by: str,
+    descending: bool,
+    nulls_last: bool,
+    metadata: list[dict] | None,
+    columns: list[str] | None,
+    page: tuple[int, int],
+) -> pl.DataFrame | None:
+    """One sorted page from the DC's sort-index sidecar, or ``None`` to sort lazily.
+
+    See ``depictio.api.v1.services.sort_index``. Only Delta-backed DCs with a
+    known data version qualify: the index is keyed by the Delta version.
+    """
+    if not settings.performance.table_sort_index_enabled or version_salt is None:
+        return None
+    try:
+        if init_data and data_collection_id_str in init_data:
+            dc_type = init_data[data_collection_id_str].get("dc_type")
+        else:
+            dc_type = _get_dc_type_from_db(ObjectId(data_collection_id_str))
+        if dc_type and dc_type.lower() == "multiqc":
+            return None
+        location = _get_delta_location(data_collection_id_str, workflow_id_str, init_data, None)
+    except Exception as e:
+        logger.debug(f"sort index: no location for {data_collection_id_str}: {e}")
+        return None
+
+    from depictio.api.v1.services.sort_index import sorted_page
+
+    return sorted_page(
+        data_collection_id_str,
+        location,
+        version_salt,
+        sort_by,
+        descending,
+        nulls_last,
+        metadata,
+        columns,
+        page[0],
+        page[1],
+    )
+
+
 def load_sorted_deltatable_lite(
     workflow_id: ObjectId,
     data_collection_id: ObjectId | str,
@@ -1625,20 +1863,22 @@ def load_sorted_deltatable_lite(
     and sliced at scan level — never fully materialised in memory — trading the
     memo (deep pages re-sort) for bounded memory and a far cheaper first page.
     ``page=None`` returns the whole sorted frame (memoised full-sort path).
+    Before that lazy sort, a large frame is served from its sort-index sidecar
+    (``services/sort_index.py``) when one exists — a missing one is enqueued
+    for the Celery worker — so the sort is paid once per data version, off the
+    request path, instead of once per page.
 
     The key embeds the dc_id and the aggregation ``version_salt`` (via
     ``_generate_cache_keys``), so a realtime ingest that bumps the version — or
     an explicit ``invalidate_data_collection_cache`` (dc_id substring match) —
     busts this entry for free, exactly like the base frame.
     """
-    import time
-
-    global _total_memory_usage
+    from depictio.api.v1.frame_cache import frame_cache
 
     data_collection_id_str = str(data_collection_id)
     workflow_id_str = str(workflow_id)
 
-    version_salt = _get_aggregation_version(data_collection_id_str)
+    version_salt = _resolve_version_salt(data_collection_id_str, init_data)
     effective_cols = _effective_projection(select_columns, metadata, False)
     base_key, filtered_key, _ = _generate_cache_keys(
         workflow_id_str,
@@ -1658,65 +1898,63 @@ def load_sorted_deltatable_lite(
     def _page(frame: pl.DataFrame) -> pl.DataFrame:
         return frame.slice(page[0], page[1]) if page is not None else frame
 
-    cached = _dataframe_memory_cache.get(sort_key)
-    if cached is not None:
-        update_cache_timestamp(sort_key)
-        return _page(cached)
-
-    # Per-key lock: this endpoint is a sync ``def`` (threadpool), and AG Grid's
-    # infinite row model fires the first few blocks for the same (dc, sort) key
-    # near-simultaneously. Without serialising the miss, each of those threads
-    # would run the full load + full-frame sort in parallel (thundering herd on
-    # exactly the first-paint moment we want to be fast) and each would add its
-    # own ``size_bytes`` to the shared budget while overwriting the single
-    # metadata entry — leaking the accounting. One thread computes; the rest wait
-    # and hit the cache via the double-check below.
-    with _sorted_cache_locks_guard:
-        key_lock = _sorted_cache_locks.setdefault(sort_key, threading.Lock())
-
-    with key_lock:
-        cached = _dataframe_memory_cache.get(sort_key)
-        if cached is not None:
-            update_cache_timestamp(sort_key)
-            return _page(cached)
-
-        # Lazy sorted-page path for large frames: estimate the footprint from the
-        # projected scan and, above the per-item memo cap, sort + slice lazily so
-        # we never materialise the whole sorted frame. Only when a page is
-        # requested — a full-frame caller needs every row anyway.
-        if page is not None:
-            scan = _open_sortable_scan(
-                workflow_id_str,
-                data_collection_id_str,
-                init_data,
-                metadata,
-                effective_cols,
-                version_salt,
-            )
-            if scan is not None:
-                est = _estimate_frame_size_bytes(scan)
-                if est == -1 or est > MEMORY_PER_ITEM_MAX_BYTES:
-                    start, limit = page
-                    # ``maintain_order`` keeps tie-breaking deterministic and
-                    # identical to the eager memo path below, so a table that
-                    # sits near the memo cap can't reorder equal-key rows between
-                    # requests (page boundaries stay stable). ~10% sort cost.
-                    page_df = (
-                        scan.sort(
-                            sort_by,
-                            descending=descending,
-                            nulls_last=nulls_last,
-                            maintain_order=True,
-                        )
-                        .slice(start, limit)
-                        .collect()
+    # Lazy sorted-page path for large frames: estimate the footprint from the
+    # projected scan and, above the per-item memo cap, sort + slice lazily so
+    # we never materialise the whole sorted frame. Only when a page is
+    # requested — a full-frame caller needs every row anyway. ``peek`` so a
+    # memoised sort skips the estimate without being counted twice below.
+    if page is not None and frame_cache.peek(sort_key) is None:
+        scan = _open_sortable_scan(
+            workflow_id_str,
+            data_collection_id_str,
+            init_data,
+            metadata,
+            effective_cols,
+            version_salt,
+        )
+        if scan is not None:
+            est = _estimate_frame_size_bytes(scan)
+            if est == -1 or est > MEMORY_PER_ITEM_MAX_BYTES:
+                start, limit = page
+                indexed = _sort_index_page(
+                    workflow_id_str,
+                    data_collection_id_str,
+                    init_data,
+                    version_salt,
+                    sort_by,
+                    descending,
+                    nulls_last,
+                    metadata,
+                    effective_cols,
+                    page,
+                )
+                if indexed is not None:
+                    return indexed
+                # ``maintain_order`` keeps tie-breaking deterministic and
+                # identical to the eager memo path below, so a table that
+                # sits near the memo cap can't reorder equal-key rows between
+                # requests (page boundaries stay stable). ~10% sort cost.
+                page_df = (
+                    scan.sort(
+                        sort_by,
+                        descending=descending,
+                        nulls_last=nulls_last,
+                        maintain_order=True,
                     )
-                    if "depictio_aggregation_time" in page_df.columns:
-                        page_df = page_df.drop("depictio_aggregation_time")
-                    return page_df
+                    .slice(start, limit)
+                    .collect()
+                )
+                return page_df.drop(HIDDEN_COLUMNS, strict=False)
 
-        # Small frame (or full-frame request): full sort once + memoise so later
-        # pages are free slices of the cached frame.
+    # Small frame (or full-frame request): full sort once + memoise so later
+    # pages are free slices of the cached frame. Single-flight: AG Grid's
+    # infinite row model fires the first few blocks for the same (dc, sort) key
+    # near-simultaneously from threadpool threads, and without it each would
+    # run the full load + full-frame sort in parallel at exactly the
+    # first-paint moment we want to be fast. One thread computes; the rest wait
+    # for its frame. The sorted copy is charged against the same byte budget
+    # and per-item cap as a base frame.
+    def _sorted() -> pl.DataFrame:
         df = load_deltatable_lite(
             workflow_id=workflow_id,
             data_collection_id=data_collection_id,
@@ -1724,22 +1962,9 @@ def load_sorted_deltatable_lite(
             init_data=init_data,
             select_columns=select_columns,
         )
-        sorted_df = df.sort(
-            sort_by, descending=descending, nulls_last=nulls_last, maintain_order=True
-        )
-
-        # Reuse the base cache's LRU budget + per-item cap so the sorted copy
-        # can't pin more RAM than a normal frame. ``estimated_size`` is cheap on
-        # an already materialised frame (buffer-size sum, no scan).
-        size_bytes = sorted_df.estimated_size()
-        if size_bytes <= MEMORY_PER_ITEM_MAX_BYTES:
-            while _total_memory_usage + size_bytes > MEMORY_THRESHOLD_BYTES and _cache_metadata:
-                evict_oldest_cached_dataframe()
-            _dataframe_memory_cache[sort_key] = sorted_df
-            _cache_metadata[sort_key] = {"size_bytes": size_bytes, "timestamp": time.time()}
-            _total_memory_usage += size_bytes
+        return df.sort(sort_by, descending=descending, nulls_last=nulls_last, maintain_order=True)
 
-        return _page(sorted_df)
+    return _page(frame_cache.get_or_load(sort_key, _sorted))
 
 
 def count_deltatable_lite(
@@ -1778,9 +2003,9 @@ def count_deltatable_lite(
                 if isinstance(data_collection_id, str)
                 else data_collection_id
             )
-        version_salt = _get_aggregation_version(data_collection_id_str)
+        version_salt = _resolve_version_salt(data_collection_id_str, init_data)
         file_id = _get_delta_location(data_collection_id_str, workflow_id_str, init_data, TOKEN)
-        delta_scan = _create_delta_scan(file_id, dc_type)
+        delta_scan = _create_delta_scan(file_id, dc_type, version_salt)
         delta_scan = _apply_scan_filters(delta_scan, metadata, data_collection_id_str, version_salt)
         result = delta_scan.select(pl.len()).collect()
         return int(result.item()) if result.height else 0
@@ -1816,30 +2041,29 @@ def schema_deltatable_lite(
                 else data_collection_id
             )
         file_id = _get_delta_location(data_collection_id_str, workflow_id_str, init_data, TOKEN)
-        schema = _create_delta_scan(file_id, dc_type).collect_schema()
+        # Share the base scan only when the caller already knows the version —
+        # a schema peek is not worth a Mongo lookup of its own.
+        known_salt = ((init_data or {}).get(data_collection_id_str) or {}).get(
+            "aggregation_version"
+        )
+        schema = _create_delta_scan(file_id, dc_type, known_salt).collect_schema()
         return dict(schema)
     except Exception as e:
         logger.warning(f"schema_deltatable_lite failed for DC {data_collection_id_str}: {e}")
         return {}
 
 
-# Memory management for DataFrames - new adaptive caching system
-_dataframe_memory_cache = {}
-_cache_metadata = {}  # Track size and timestamp for each cached DataFrame
-_total_memory_usage = 0
-# Per-sort-key locks so concurrent AG Grid block fetches for the same
-# (dc, filters, sort) compute the sorted frame once instead of stampeding.
-# ``_sorted_cache_locks_guard`` only protects the tiny setdefault of the
-# per-key lock, never the load/sort itself. See ``load_sorted_deltatable_lite``.
-_sorted_cache_locks: dict[str, threading.Lock] = {}
-_sorted_cache_locks_guard = threading.Lock()
-MEMORY_THRESHOLD_BYTES = 1024 * 1024 * 1024  # 1GB threshold (total in-process cache)
+# The in-process DataFrame cache itself lives in ``frame_cache`` (an LRU
+# bounded by ``performance.frame_cache_max_mb``). Its budget doubles as the
+# adaptive loader's threshold: a table bigger than the whole cache is loaded
+# lazily with filters and limits pushed into the scan rather than materialised.
+MEMORY_THRESHOLD_BYTES = settings.performance.frame_cache_max_mb * 1024 * 1024
 # Per-item cap: a single large DataFrame must not be able to consume most of the
 # in-process cache and evict every smaller, frequently-reused frame. Above this
 # it still lives in Redis (subject to its own cap) but is re-materialised on a
 # process-local miss instead of pinning RAM here. Also bounds per-worker RSS,
 # which matters now that the worker runs multiple prefork processes.
-MEMORY_PER_ITEM_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+MEMORY_PER_ITEM_MAX_BYTES = settings.performance.frame_cache_item_max_mb * 1024 * 1024
 
 
 def get_deltatable_size_from_db(data_collection_id: ObjectId) -> int:
@@ -1869,27 +2093,6 @@ def get_deltatable_size_from_db(data_collection_id: ObjectId) -> int:
         return -1  # Special value to indicate dynamic estimation needed
 
 
-def evict_oldest_cached_dataframe():
-    """
-    Evict the oldest cached DataFrame to free memory.
-    Uses LRU (Least Recently Used) strategy.
-    """
-    global _total_memory_usage
-
-    if not _cache_metadata:
-        return
-
-    # Find oldest cached DataFrame by timestamp
-    oldest_key = min(_cache_metadata.keys(), key=lambda k: _cache_metadata[k]["timestamp"])
-
-    # Remove from cache and update memory usage
-    if oldest_key in _dataframe_memory_cache:
-        size_bytes = _cache_metadata[oldest_key]["size_bytes"]
-        del _dataframe_memory_cache[oldest_key]
-        del _cache_metadata[oldest_key]
-        _total_memory_usage -= size_bytes
-
-
 def load_and_cache_dataframe(cache_key: str, size_bytes: int, delta_scan) -> pl.DataFrame:
     """
     Load DataFrame and cache it in Redis and memory if space allows.
@@ -1902,62 +2105,20 @@ def load_and_cache_dataframe(cache_key: str, size_bytes: int, delta_scan) -> pl.
     Returns:
         Materialized DataFrame
     """
-    global _total_memory_usage
-    import time
-
-    # Evict oldest entries if adding this would exceed threshold
-    while _total_memory_usage + size_bytes > MEMORY_THRESHOLD_BYTES and _cache_metadata:
-        evict_oldest_cached_dataframe()
-
-    # Materialize the DataFrame
-    df = delta_scan.collect()
-
-    # PERFORMANCE: Use fast row count instead of expensive estimated_size() for small datasets
-    # For datasets < 100KB, pickling overhead exceeds recalculation cost - skip Redis entirely
-    row_count = df.height
-    REDIS_SKIP_THRESHOLD_ROWS = 1000  # Skip Redis for datasets < 1000 rows (~100KB)
-
-    if row_count < REDIS_SKIP_THRESHOLD_ROWS:
-        # TINY DATASET: Skip Redis pickling overhead, use memory-only cache
-        actual_size = size_bytes  # Use estimate, avoid expensive df.estimated_size() scan
-
-        # Memory cache only (much faster than Redis for tiny datasets)
-        if _total_memory_usage + actual_size <= MEMORY_THRESHOLD_BYTES:
-            _dataframe_memory_cache[cache_key] = df
-            _cache_metadata[cache_key] = {
-                "size_bytes": actual_size,
-                "timestamp": time.time(),
-            }
-            _total_memory_usage += actual_size
+    from depictio.api.v1.frame_cache import frame_cache
 
-        return df
+    # Datasets under ~1000 rows (~100KB) cost more to pickle than to recollect,
+    # so they stay in memory only; larger ones also go to Redis so they survive
+    # a page refresh landing on another worker.
+    REDIS_SKIP_THRESHOLD_ROWS = 1000
 
-    # LARGER DATASET: Use Redis + memory caching
-    # Use fast estimate (df.estimated_size() scan disabled for performance)
-    actual_size = df.height * df.width * 8  # 8 bytes per cell average
-
-    # Try to cache in Redis first (persistent across page refreshes)
-    try:
-        from depictio.api.cache import cache_dataframe
-
-        cache_dataframe(cache_key, df)
-    except Exception:
-        pass
-
-    # Also cache in memory if it fits the per-item cap AND the total threshold
-    # (faster access during session). Oversized frames stay in Redis only.
-    if (
-        actual_size <= MEMORY_PER_ITEM_MAX_BYTES
-        and _total_memory_usage + actual_size <= MEMORY_THRESHOLD_BYTES
-    ):
-        _dataframe_memory_cache[cache_key] = df
-        _cache_metadata[cache_key] = {
-            "size_bytes": actual_size,
-            "timestamp": time.time(),
-        }
-        _total_memory_usage += actual_size
+    def _collect() -> pl.DataFrame:
+        df = delta_scan.collect()
+        if df.height >= REDIS_SKIP_THRESHOLD_ROWS:
+            _cache_dataframe_to_redis(cache_key, df)
+        return df
 
-    return df
+    return frame_cache.get_or_load(cache_key, _collect)
 
 
 def apply_runtime_filters(df: pl.DataFrame, metadata: list[dict] | None) -> pl.DataFrame:
@@ -2044,48 +2205,24 @@ def apply_runtime_filters(df: pl.DataFrame, metadata: list[dict] | None) -> pl.D
     return df
 
 
-def update_cache_timestamp(cache_key: str):
-    """Update timestamp for LRU cache management."""
-    import time
-
-    if cache_key in _cache_metadata:
-        _cache_metadata[cache_key]["timestamp"] = time.time()
-
-
 def get_memory_cache_stats() -> dict:
     """
     Get current memory cache statistics for monitoring and debugging.
 
     Returns:
-        dict: Cache statistics including total usage, cached DataFrames, etc.
+        dict: Cache statistics including total usage, hit/miss/eviction
+        counters and the cached DataFrames (least recently used first).
     """
-    return {
-        "total_memory_usage_bytes": _total_memory_usage,
-        "total_memory_usage_mb": _total_memory_usage / (1024 * 1024),
-        "memory_threshold_bytes": MEMORY_THRESHOLD_BYTES,
-        "memory_threshold_mb": MEMORY_THRESHOLD_BYTES / (1024 * 1024),
-        "cached_dataframes_count": len(_dataframe_memory_cache),
-        "memory_utilization_percent": (_total_memory_usage / MEMORY_THRESHOLD_BYTES) * 100,
-        "cached_dataframes": [
-            {
-                "cache_key": key,
-                "size_bytes": _cache_metadata[key]["size_bytes"],
-                "size_mb": _cache_metadata[key]["size_bytes"] / (1024 * 1024),
-                "timestamp": _cache_metadata[key]["timestamp"],
-            }
-            for key in _dataframe_memory_cache.keys()
-            if key in _cache_metadata
-        ],
-    }
+    from depictio.api.v1.frame_cache import frame_cache
+
+    return frame_cache.stats()
 
 
 def clear_memory_cache():
     """Clear all cached DataFrames to free memory."""
-    global _total_memory_usage
+    from depictio.api.v1.frame_cache import frame_cache
 
-    _dataframe_memory_cache.clear()
-    _cache_metadata.clear()
-    _total_memory_usage = 0
+    frame_cache.clear()
 
 
 def invalidate_data_collection_cache(data_collection_id: str) -> int:
@@ -2099,14 +2236,9 @@ def invalidate_data_collection_cache(data_collection_id: str) -> int:
     delta. Called from the realtime event path so that a re-fetch after a
     ``data_collection_updated`` event sees the newly written delta rows.
     """
-    global _total_memory_usage
+    from depictio.api.v1.frame_cache import frame_cache
 
-    affected = [k for k in list(_dataframe_memory_cache.keys()) if data_collection_id in k]
-    for key in affected:
-        meta = _cache_metadata.pop(key, None)
-        if meta is not None:
-            _total_memory_usage = max(0, _total_memory_usage - int(meta.get("size_bytes", 0)))
-        _dataframe_memory_cache.pop(key, None)
+    affected = frame_cache.discard_matching(data_collection_id)
 
     redis_dropped = 0
     try:
@@ -2116,7 +2248,7 @@ def invalidate_data_collection_cache(data_collection_id: str) -> int:
     except Exception as e:
         logger.warning(f"Redis cache invalidation failed for dc_id={data_collection_id}: {e}")
 
-    return len(affected) + redis_dropped
+    return affected + redis_dropped
 
 
 def join_deltatables_dev(
@@ -461,6 +461,7 @@ def _load_reduced(
     viz_kind: str | None = None,
     roles: dict[str, str] | None = None,
     tail: dict | None = None,
+    total: int | None = None,
 ) -> tuple[Any | None, int | None, dict | None]:
     """Read the filtered frame, reduced the way ``policy`` allows.
 
@@ -472,12 +473,14 @@ def _load_reduced(
 
     ``total_rows`` is always the count *before* reduction: it is the "of M" half
     of the renderer's badge, and measuring it after would make the badge agree
-    with itself while disagreeing with the table.
+    with itself while disagreeing with the table. A caller that already counted
+    the filtered table passes it as ``total``, which skips the ``pl.len()``.
     """
     import polars as pl
 
     from depictio.api.v1.configs.config import settings
     from depictio.api.v1.deltatables_utils import open_deltatable_scan
+    from depictio.api.v1.services.sample_tiers import tier_sample
 
     # Set when a kind that must not be sampled was sampled anyway, i.e. its
     # renderer's sums and rankings are now estimates. Distinct from `exact`,
@@ -502,7 +505,8 @@ def _load_reduced(
         if scan is None:
             return None, None, None
 
-        total = int(scan.select(pl.len()).collect().item())
+        if total is None:
+            total = int(scan.select(pl.len()).collect().item())
 
         if policy == "none":
             ceiling = settings.performance.advanced_viz_no_sample_max_rows
@@ -531,6 +535,12 @@ def _load_reduced(
             if frame is not None:
                 return _reduced(frame, total, "tail")
 
+        # The ingest-time sample tiers answer without touching the full table;
+        # they are uniform samples too, so the policy is still "hash".
+        frame = tier_sample(str(dc_oid), filter_metadata, projection, cap)
+        if frame is not None:
+            return _reduced(frame, total, "hash", degraded)
+
         frame = _hash_sample(scan, projection, total, cap)
         if frame is None:
             if not degraded:
@@ -610,11 +620,6 @@ def fetch_advanced_viz_data(
     dc_id = payload.get("dc_id")
     columns = payload.get("columns") or []
     filter_metadata = payload.get("filter_metadata") or []
-    limit_rows = payload.get("limit_rows")
-    full_load = bool(payload.get("full_load", False))
-    viz_kind = payload.get("viz_kind")
-    roles = payload.get("roles") or {}
-    tail = payload.get("tail") or None
 
     if not wf_id or not dc_id:
         raise HTTPException(status_code=400, detail="wf_id and dc_id are required")
@@ -633,40 +638,8 @@ def fetch_advanced_viz_data(
         component_type="advanced_viz/data",
     )
 
-    # Row handling — three cases:
-    #   * explicit ``limit_rows`` in the payload → honour it, no sampling (callers
-    #     like the ComplexHeatmap preview ask for a specific bound).
-    #   * ``full_load`` → raise the scan cap to the figure full-load ceiling and
-    #     skip sampling (the user opted into the whole frame via Load-All).
-    #   * default → a scan-level reduction down to ``figure_max_points`` so
-    #     plotly isn't handed a huge client-side frame, of whichever shape the
-    #     kind's renderer can survive (uniform / tail-preserving / none).
-    #
-    # The default path used to set ``limit_rows = 100_000`` and then
-    # ``df.sample()`` the result. That is a *prefix*, not a sample: Polars pushes
-    # the limit into the scan, and Delta scan order is ingest order, so "the
-    # first 100k rows" is the first few samples (or, on a variant table sorted by
-    # position, chromosome 1 alone). Sampling that prefix afterwards dressed a
-    # biased subset up as a random one. The scan-level hash sample below is drawn
-    # across the whole filtered frame instead — the same mechanism the box and
-    # violin figure paths use (``services/figure/aggregate.py``).
-    from depictio.api.v1.configs.config import settings
-    from depictio.models.components.advanced_viz.sampling import policy_for_kind
-
-    display_cap = settings.performance.figure_max_points
-    # None = no scan-level reduction attempted (explicit cap / full load).
-    policy: SamplingPolicy | None = None
-    if limit_rows is not None:
-        limit_rows = int(limit_rows)
-    elif full_load:
-        limit_rows = settings.performance.figure_max_load_rows
-    else:
-        limit_rows = None
-        if display_cap > 0:
-            policy = policy_for_kind(viz_kind)
-
     try:
-        wf_oid = ObjectId(str(wf_id))
+        ObjectId(str(wf_id))  # only validated here; the workflow is not looked up
         dc_oid = ObjectId(str(dc_id))
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Invalid wf_id/dc_id: {exc}")
@@ -677,7 +650,6 @@ def fetch_advanced_viz_data(
     _assert_dc_access(dc_oid, current_user)
 
     from depictio.api.v1.db import deltatables_collection
-    from depictio.api.v1.deltatables_utils import load_deltatable_lite
 
     # Resolve delta-table location directly from MongoDB and hand it to
     # load_deltatable_lite via init_data so it does NOT take the legacy
@@ -699,6 +671,78 @@ def fetch_advanced_viz_data(
             detail="Data collection has no materialised Delta table yet.",
         )
 
+    result, headers = advanced_viz_rows(payload, filter_metadata, init_data)
+    # Additive telemetry for the benchmark harness (clients ignore unknown
+    # headers). load = Delta read; build = column materialisation.
+    response.headers.update(headers)
+    response.headers["X-Total-Ms"] = f"{(_time.perf_counter() - _t0) * 1000:.1f}"
+    return result
+
+
+def advanced_viz_rows(
+    payload: dict,
+    filter_metadata: list[dict],
+    init_data: dict[str, dict],
+    row_count: int | None = None,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Body of ``POST /advanced_viz/data`` once the caller is authorised.
+
+    ``filter_metadata`` must already be link-resolved and ``init_data`` must
+    locate the DC's Delta table: the endpoint does both per request, while
+    ``dashboards/render_all`` resolves them once per DC for a whole dashboard
+    and calls straight in here, along with the table's filtered row count
+    (``row_count``) when its fused scan already produced one. Returns
+    ``(result, telemetry headers)``.
+    """
+    import time as _time
+
+    from depictio.api.v1.deltatables_utils import load_deltatable_lite
+
+    dc_id = payload.get("dc_id")
+    columns = payload.get("columns") or []
+    limit_rows = payload.get("limit_rows")
+    full_load = bool(payload.get("full_load", False))
+    viz_kind = payload.get("viz_kind")
+    roles = payload.get("roles") or {}
+    tail = payload.get("tail") or None
+    try:
+        wf_oid = ObjectId(str(payload.get("wf_id")))
+        dc_oid = ObjectId(str(dc_id))
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid wf_id/dc_id: {exc}")
+
+    # Row handling — three cases:
+    #   * explicit ``limit_rows`` in the payload → honour it, no sampling (callers
+    #     like the ComplexHeatmap preview ask for a specific bound).
+    #   * ``full_load`` → raise the scan cap to the figure full-load ceiling and
+    #     skip sampling (the user opted into the whole frame via Load-All).
+    #   * default → a scan-level reduction down to ``figure_max_points`` so
+    #     plotly isn't handed a huge client-side frame, of whichever shape the
+    #     kind's renderer can survive (uniform / tail-preserving / none).
+    #
+    # The default path used to set ``limit_rows = 100_000`` and then
+    # ``df.sample()`` the result. That is a *prefix*, not a sample: Polars pushes
+    # the limit into the scan, and Delta scan order is ingest order, so "the
+    # first 100k rows" is the first few samples (or, on a variant table sorted by
+    # position, chromosome 1 alone). Sampling that prefix afterwards dressed a
+    # biased subset up as a random one. The scan-level hash sample below is drawn
+    # across the whole filtered frame instead — the same mechanism the box and
+    # violin figure paths use (``services/figure/aggregate.py``).
+    from depictio.api.v1.configs.config import settings
+    from depictio.models.components.advanced_viz.sampling import policy_for_kind
+
+    display_cap = settings.performance.figure_max_points
+    # None = no scan-level reduction attempted (explicit cap / full load).
+    policy: SamplingPolicy | None = None
+    if limit_rows is not None:
+        limit_rows = int(limit_rows)
+    elif full_load:
+        limit_rows = settings.performance.figure_max_load_rows
+    else:
+        limit_rows = None
+        if display_cap > 0:
+            policy = policy_for_kind(viz_kind)
+
     # Merge filter columns into the projection so the scan-level column
     # projection doesn't prune the columns the filters need. Without this,
     # `select_columns=[feature_id, position, category]` would drop `GENE`
@@ -717,6 +761,7 @@ def fetch_advanced_viz_data(
         _scan = _create_delta_scan(
             init_data[str(dc_id)]["delta_location"],
             init_data[str(dc_id)].get("dc_type"),
+            init_data[str(dc_id)].get("aggregation_version"),
         )
         available_cols = set(_scan.collect_schema().names())
     except Exception as _exc:
@@ -777,6 +822,7 @@ def fetch_advanced_viz_data(
             viz_kind=viz_kind,
             roles=roles,
             tail=tail,
+            total=row_count,
         )
     if df is None:
         try:
@@ -854,17 +900,16 @@ def fetch_advanced_viz_data(
         },
         "filter_applied": bool(filter_metadata),
     }
-    # Additive telemetry for the benchmark harness (clients ignore unknown
-    # headers). load = Delta read; build = column materialisation.
-    response.headers["X-Load-Ms"] = str(_load_ms)
-    response.headers["X-Build-Ms"] = str(int((_time.perf_counter() - _t_build) * 1000))
-    response.headers["X-Rows-Loaded"] = str(total_rows)
-    response.headers["X-Rows-Displayed"] = str(int(df.height))
-    response.headers["X-Frame-Bytes"] = str(int(df.estimated_size()))
-    response.headers["X-Aggregated"] = "0"
-    response.headers["X-Sampling-Policy"] = str(sampling["policy"])
-    response.headers["X-Total-Ms"] = f"{(_time.perf_counter() - _t0) * 1000:.1f}"
-    return result
+    headers = {
+        "X-Load-Ms": str(_load_ms),
+        "X-Build-Ms": str(int((_time.perf_counter() - _t_build) * 1000)),
+        "X-Rows-Loaded": str(total_rows),
+        "X-Rows-Displayed": str(int(df.height)),
+        "X-Frame-Bytes": str(int(df.estimated_size())),
+        "X-Aggregated": "0",
+        "X-Sampling-Policy": str(sampling["policy"]),
+    }
+    return result, headers
 
 
 _CACHE_KEY_VERSION = "v3"
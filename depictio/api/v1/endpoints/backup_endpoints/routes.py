@@ -1,10 +1,11 @@
+import asyncio
 import hashlib
 import json
 import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
@@ -47,14 +48,15 @@ def _validate_backup_id(backup_id: str) -> None:
         )
 
 
-def _resolve_backup_path(backup_dir: str, backup_id: str) -> str:
+def _resolve_backup_path(backup_dir: str, backup_id: str, suffix: str = ".json") -> str:
     """Build and validate the backup file path for a (already format-checked) backup_id.
 
     Performs a resolved-path containment check so that even an unexpected
-    ``backup_id`` cannot escape the configured backup directory.
+    ``backup_id`` cannot escape the configured backup directory. ``suffix=""``
+    gives the directory of a streaming (BSON) backup.
     """
     base = Path(backup_dir).resolve()
-    candidate = (base / f"depictio_backup_{backup_id}.json").resolve()
+    candidate = (base / f"depictio_backup_{backup_id}{suffix}").resolve()
     if not candidate.is_relative_to(base):
         # Path escaped the backup directory — treat as a validation error and
         # log internally without echoing the resolved path back to the caller.
@@ -75,6 +77,12 @@ def _compute_file_sha256(file_path: str) -> str:
     return sha256.hexdigest()
 
 
+def _write_checksum_sidecar(path: str) -> None:
+    """Write ``<path>.sha256`` in the ``sha256sum`` convention, once ``path`` is final."""
+    with open(f"{path}.sha256", "w") as checksum_file:
+        checksum_file.write(f"{_compute_file_sha256(path)}  {os.path.basename(path)}\n")
+
+
 def _read_expected_checksum(checksum_path: str) -> str | None:
     """Read the expected SHA-256 digest from a ``.sha256`` sidecar file.
 
@@ -142,6 +150,10 @@ class BackupRequest(BaseModel):
     include_s3_data: bool = False
     s3_backup_prefix: str = "backup"
     dry_run: bool = False
+    # None follows DEPICTIO_BACKUP_S3_BACKUP_INCREMENTAL
+    s3_incremental: bool | None = None
+    # None follows DEPICTIO_BACKUP_MONGODB_BACKUP_FORMAT
+    format: Literal["json", "bson"] | None = None
 
 
 class BackupResponse(BaseModel):
@@ -153,50 +165,51 @@ class BackupResponse(BaseModel):
     collections_backed_up: list = []
     timestamp: str | None = None
     filename: str | None = None
+    format: str = "json"
 
 
-async def _create_mongodb_backup(current_user: User) -> dict:
-    """
-    Create a MongoDB backup with standard exclusions.
+def _collection_map() -> dict[str, Collection[dict[str, Any]]]:
+    """Collections covered by backup and restore.
 
-    Returns a dictionary containing backup data and metadata.
+    Tokens are excluded to avoid circular dependency issues.
     """
-    backup_data = {}
-    total_documents = 0
-    excluded_documents = 0
-    collections_backed_up = []
-
-    # Define collections to backup with their exclusion criteria
-    # NOTE: Tokens excluded from backup/restore to avoid circular dependency issues
-    collections_config = {
-        "users": {"collection": users_collection, "exclude_filter": {"is_temporary": True}},
-        "projects": {"collection": projects_collection, "exclude_filter": {}},
-        "dashboards": {"collection": dashboards_collection, "exclude_filter": {}},
-        "data_collections": {"collection": data_collections_collection, "exclude_filter": {}},
-        "workflows": {"collection": workflows_collection, "exclude_filter": {}},
-        "files": {"collection": files_collection, "exclude_filter": {}},
-        "deltatables": {"collection": deltatables_collection, "exclude_filter": {}},
-        "runs": {"collection": runs_collection, "exclude_filter": {}},
-        "groups": {"collection": groups_collection, "exclude_filter": {}},
+    return {
+        "users": users_collection,
+        "projects": projects_collection,
+        "dashboards": dashboards_collection,
+        "data_collections": data_collections_collection,
+        "workflows": workflows_collection,
+        "files": files_collection,
+        "deltatables": deltatables_collection,
+        "runs": runs_collection,
+        "groups": groups_collection,
     }
 
+
+def _backup_sources() -> tuple[dict[str, tuple[Collection[dict[str, Any]], dict]], int]:
+    """``{name: (collection, query)}`` to back up with standard exclusions, and the
+    number of documents those exclusions leave out.
+    """
+    # Collections with exclusion criteria; every other one is backed up whole.
+    exclude_filters: dict[str, dict[str, Any]] = {"users": {"is_temporary": True}}
+
     # First, get list of temporary user IDs to exclude their resources
     temp_users = list(users_collection.find({"is_temporary": True}, {"_id": 1}))
     temp_user_ids = [user["_id"] for user in temp_users]
 
     logger.info(f"Found {len(temp_user_ids)} temporary users to exclude")
 
-    for collection_name, config in collections_config.items():
-        # Extract collection with proper type for type checker
-        collection = cast(Collection[dict[str, Any]], config["collection"])
-        exclude_filter = cast(dict[str, Any], config["exclude_filter"])
+    sources: dict[str, tuple[Collection[dict[str, Any]], dict]] = {}
+    excluded_documents = 0
+    for collection_name, collection in _collection_map().items():
+        exclude_filter = exclude_filters.get(collection_name, {})
         base_filter = exclude_filter.copy()
 
         # For dashboards, exclude those owned by temporary users
         if collection_name == "dashboards" and temp_user_ids:
             base_filter["permissions.owners._id"] = {"$nin": temp_user_ids}
 
-        # Get all documents (applying exclusions)
+        query: dict[str, Any] = {}
         if base_filter:
             # Count excluded documents
             excluded_count = collection.count_documents(
@@ -212,21 +225,38 @@ async def _create_mongodb_backup(current_user: User) -> dict:
             excluded_documents += excluded_count
 
             if collection_name == "dashboards" and temp_user_ids:
-                documents = list(
-                    collection.find({"permissions.owners._id": {"$nin": temp_user_ids}})
-                )
-            else:
+                query = {"permissions.owners._id": {"$nin": temp_user_ids}}
+            elif exclude_filter:
                 # For other collections, use the normal exclude filter
-                exclude_conditions = []
-                if exclude_filter:
-                    exclude_conditions.append(exclude_filter)
+                query = {"$nor": [exclude_filter]}
+
+        sources[collection_name] = (collection, query)
+
+    return sources, excluded_documents
 
-                if exclude_conditions:
-                    documents = list(collection.find({"$nor": exclude_conditions}))
-                else:
-                    documents = list(collection.find({}))
-        else:
-            documents = list(collection.find({}))
+
+def _backup_metadata(current_user: User, timestamp: datetime) -> dict:
+    return {
+        "timestamp": timestamp.isoformat(),
+        "created_by": current_user.email,
+        "depictio_version": "0.1.0",
+        "backup_id": timestamp.strftime("%Y%m%d_%H%M%S"),
+    }
+
+
+async def _create_mongodb_backup(current_user: User) -> dict:
+    """
+    Create a MongoDB backup with standard exclusions.
+
+    Returns a dictionary containing backup data and metadata.
+    """
+    backup_data = {}
+    total_documents = 0
+    collections_backed_up = []
+
+    sources, excluded_documents = _backup_sources()
+    for collection_name, (collection, query) in sources.items():
+        documents = list(collection.find(query))
 
         # Convert ObjectIds and DBRef objects to strings for JSON serialization
         for i, doc in enumerate(documents):
@@ -236,18 +266,12 @@ async def _create_mongodb_backup(current_user: User) -> dict:
         total_documents += len(documents)
         collections_backed_up.append(collection_name)
 
-    timestamp = datetime.now()
-    backup_id = timestamp.strftime("%Y%m%d_%H%M%S")
-
     mongodb_backup = {
         "backup_metadata": {
-            "timestamp": timestamp.isoformat(),
-            "created_by": current_user.email,
-            "depictio_version": "0.1.0",
+            **_backup_metadata(current_user, datetime.now()),
             "total_documents": total_documents,
             "excluded_documents": excluded_documents,
             "collections": collections_backed_up,
-            "backup_id": backup_id,
         },
         "data": backup_data,
     }
@@ -255,6 +279,71 @@ async def _create_mongodb_backup(current_user: User) -> dict:
     return mongodb_backup
 
 
+async def _create_stream_backup(
+    current_user: User, backup_dir: str, s3_backup_metadata: dict | None
+) -> dict:
+    """Write a streaming (BSON) backup into ``backup_dir``; returns its metadata.
+
+    Unlike ``_create_mongodb_backup`` nothing is accumulated: each collection is
+    streamed from its cursor to ``<name>.bson.gz`` (see ``services.mongo_backup``).
+    The manifest gets the ``.sha256`` sidecar; it records the streams' digests.
+    """
+    from depictio.api.v1.services.mongo_backup import MANIFEST_NAME, write_stream_backup
+
+    sources, excluded_documents = _backup_sources()
+    metadata = {
+        **_backup_metadata(current_user, datetime.now()),
+        "excluded_documents": excluded_documents,
+        "collections": list(sources),
+    }
+    target = os.path.join(backup_dir, f"depictio_backup_{metadata['backup_id']}")
+    manifest = await asyncio.to_thread(
+        write_stream_backup,
+        target,
+        sources,
+        metadata,
+        settings.backup.mongodb_backup_batch_size,
+        settings.backup.mongodb_backup_workers,
+    )
+    if s3_backup_metadata is not None:
+        # Kept next to the manifest: it is not covered by the manifest checksum.
+        with open(os.path.join(target, "s3_backup_metadata.json"), "w") as fh:
+            json.dump(s3_backup_metadata, fh, indent=2, default=str)
+    _write_checksum_sidecar(os.path.join(target, MANIFEST_NAME))
+    return manifest["backup_metadata"]
+
+
+async def _create_s3_backup(request: BackupRequest) -> dict:
+    """Back up the S3 deltatable data of every registered deltatable."""
+    logger.info("Adding S3 deltatable backup")
+    from depictio.api.v1.backup_strategy_manager import (
+        create_backup_with_strategy,
+    )
+
+    # Get deltatable locations from database
+    deltatable_locations = []
+    for deltatable in deltatables_collection.find({}):
+        # Check both possible field names for S3 location
+        location = deltatable.get("delta_table_location") or deltatable.get("location")
+        if location:
+            # Extract the S3 path (remove s3://bucket/ prefix)
+            if location.startswith("s3://"):
+                # Extract just the path part after bucket name
+                parts = location.replace("s3://", "").split("/", 1)
+                if len(parts) > 1:
+                    deltatable_locations.append(parts[1])
+            else:
+                deltatable_locations.append(location)
+
+    # Create S3 backup
+    return await create_backup_with_strategy(
+        deltatable_locations=deltatable_locations,
+        backup_prefix=request.s3_backup_prefix,
+        dry_run=request.dry_run,
+        incremental=request.s3_incremental,
+    )
+
+
 @backup_endpoint_router.post("/create", response_model=BackupResponse)
 async def create_backup(
     request: BackupRequest = BackupRequest(),
@@ -282,61 +371,34 @@ async def create_backup(
     )
 
     try:
-        # Create MongoDB backup
-        mongodb_backup = await _create_mongodb_backup(current_user)
+        backup_format = request.format or settings.backup.mongodb_backup_format
+        backup_dir = settings.backup.backup_path
+        os.makedirs(backup_dir, exist_ok=True)
 
         # Add S3 backup if requested
-        if request.include_s3_data:
-            logger.info("Adding S3 deltatable backup")
-            from depictio.api.v1.backup_strategy_manager import (
-                create_backup_with_strategy,
-            )
-
-            # Get deltatable locations from database
-            deltatable_locations = []
-            for deltatable in deltatables_collection.find({}):
-                # Check both possible field names for S3 location
-                location = deltatable.get("delta_table_location") or deltatable.get("location")
-                if location:
-                    # Extract the S3 path (remove s3://bucket/ prefix)
-                    if location.startswith("s3://"):
-                        # Extract just the path part after bucket name
-                        parts = location.replace("s3://", "").split("/", 1)
-                        if len(parts) > 1:
-                            deltatable_locations.append(parts[1])
-                    else:
-                        deltatable_locations.append(location)
-
-            # Create S3 backup
-            s3_backup_result = await create_backup_with_strategy(
-                deltatable_locations=deltatable_locations,
-                backup_prefix=request.s3_backup_prefix,
-                dry_run=request.dry_run,
-            )
+        s3_backup_result = await _create_s3_backup(request) if request.include_s3_data else None
 
-            # Add S3 backup metadata to the backup
-            enhanced_backup = mongodb_backup.copy()
-            enhanced_backup["s3_backup_metadata"] = s3_backup_result
+        if backup_format == "bson":
+            metadata = await _create_stream_backup(current_user, backup_dir, s3_backup_result)
+            backup_filename = f"depictio_backup_{metadata['backup_id']}"
         else:
-            enhanced_backup = mongodb_backup
+            # Create MongoDB backup
+            mongodb_backup = await _create_mongodb_backup(current_user)
+            metadata = mongodb_backup["backup_metadata"]
+            if s3_backup_result is not None:
+                # Add S3 backup metadata to the backup
+                mongodb_backup["s3_backup_metadata"] = s3_backup_result
 
-        backup_dir = settings.backup.backup_path
-        os.makedirs(backup_dir, exist_ok=True)
+            backup_filename = f"depictio_backup_{metadata['backup_id']}.json"
+            backup_path = os.path.join(backup_dir, backup_filename)
 
-        backup_id_str = mongodb_backup["backup_metadata"]["backup_id"]
-        backup_filename = f"depictio_backup_{backup_id_str}.json"
-        backup_path = os.path.join(backup_dir, backup_filename)
+            with open(backup_path, "w") as backup_file:
+                json.dump(mongodb_backup, backup_file, indent=2, default=str)
 
-        with open(backup_path, "w") as backup_file:
-            json.dump(enhanced_backup, backup_file, indent=2, default=str)
-
-        # Integrity: store a SHA-256 sidecar so restores can verify the backup
-        # file has not been tampered with or truncated. The sidecar is written
-        # after the backup file so the digest reflects the final contents.
-        backup_checksum = _compute_file_sha256(backup_path)
-        checksum_path = f"{backup_path}.sha256"
-        with open(checksum_path, "w") as checksum_file:
-            checksum_file.write(f"{backup_checksum}  {backup_filename}\n")
+            # Integrity: store a SHA-256 sidecar so restores can verify the backup
+            # file has not been tampered with or truncated. The sidecar is written
+            # after the backup file so the digest reflects the final contents.
+            _write_checksum_sidecar(backup_path)
 
         logger.info(f"Backup created successfully: {backup_filename}")
 
@@ -344,17 +406,18 @@ async def create_backup(
             "success": True,
             "message": "Backup created successfully"
             + (" with S3 data" if request.include_s3_data else ""),
-            "backup_id": mongodb_backup["backup_metadata"]["backup_id"],
-            "total_documents": mongodb_backup["backup_metadata"]["total_documents"],
-            "excluded_documents": mongodb_backup["backup_metadata"]["excluded_documents"],
-            "collections_backed_up": mongodb_backup["backup_metadata"]["collections"],
-            "timestamp": mongodb_backup["backup_metadata"]["timestamp"],
+            "backup_id": metadata["backup_id"],
+            "total_documents": metadata["total_documents"],
+            "excluded_documents": metadata["excluded_documents"],
+            "collections_backed_up": metadata["collections"],
+            "timestamp": metadata["timestamp"],
             "filename": backup_filename,
+            "format": backup_format,
         }
 
         # Add S3 metadata to response if included
-        if request.include_s3_data and "s3_backup_metadata" in enhanced_backup:
-            response_data["s3_backup_metadata"] = enhanced_backup["s3_backup_metadata"]
+        if s3_backup_result is not None:
+            response_data["s3_backup_metadata"] = s3_backup_result
 
         return BackupResponse(**response_data)  # type: ignore[misc]
 
@@ -420,7 +483,10 @@ async def list_backups(
 
         backup_files = []
         for filename in os.listdir(backup_dir):
-            if filename.startswith("depictio_backup_") and filename.endswith(".json"):
+            stream_info = _stream_backup_info(backup_dir, filename)
+            if stream_info is not None:
+                backup_files.append(stream_info)
+            elif filename.startswith("depictio_backup_") and filename.endswith(".json"):
                 file_path = os.path.join(backup_dir, filename)
                 file_stat = os.stat(file_path)
 
@@ -441,6 +507,7 @@ async def list_backups(
                         "created_by": metadata.get("created_by", "unknown"),
                         "total_documents": metadata.get("total_documents", 0),
                         "collections": metadata.get("collections", []),
+                        "format": "json",
                     }
                 except Exception:
                     # If can't read metadata, just use file info
@@ -452,6 +519,7 @@ async def list_backups(
                         "created_by": "unknown",
                         "total_documents": 0,
                         "collections": [],
+                        "format": "json",
                     }
 
                 backup_files.append(backup_info)
@@ -484,6 +552,10 @@ async def validate_backup(
 
     try:
         backup_dir = settings.backup.backup_path
+        stream_dir = _resolve_backup_path(backup_dir, request.backup_id, suffix="")
+        if os.path.isdir(stream_dir):
+            return await asyncio.to_thread(_validate_stream_backup, stream_dir)
+
         backup_path = _resolve_backup_path(backup_dir, request.backup_id)
 
         if not os.path.exists(backup_path):
@@ -530,6 +602,166 @@ def _convert_complex_objects_to_strings(obj):
     return obj
 
 
+def _stream_backup_info(backup_dir: str, name: str) -> dict | None:
+    """Listing entry of the streaming backup directory ``name``; ``None`` if it is not one."""
+    from depictio.api.v1.services.mongo_backup import read_manifest
+
+    backup_id = name.removeprefix("depictio_backup_")
+    path = os.path.join(backup_dir, name)
+    if not _BACKUP_ID_PATTERN.fullmatch(backup_id) or not os.path.isdir(path):
+        return None
+    try:
+        manifest = read_manifest(path)
+    except Exception as e:
+        logger.warning(f"Skipping unreadable backup {name}: {e}")
+        return None
+    metadata = manifest["backup_metadata"]
+    size = sum(entry["bytes"] for entry in manifest["collections"].values())
+    return {
+        "backup_id": backup_id,
+        "filename": name,
+        "size_mb": round(size / (1024 * 1024), 2),
+        "created": metadata.get("timestamp", ""),
+        "created_by": metadata.get("created_by", "unknown"),
+        "total_documents": metadata.get("total_documents", 0),
+        "collections": metadata.get("collections", []),
+        "format": "bson",
+    }
+
+
+def _validate_stream_backup(stream_dir: str) -> BackupValidateResponse:
+    """Check a streaming backup against its manifest: digests, then document counts.
+
+    Documents are not validated against the models here (that is what the JSON
+    path does); each stream is read once, a document at a time.
+    """
+    from depictio.api.v1.services.mongo_backup import (
+        MANIFEST_NAME,
+        count_documents,
+        read_manifest,
+        verify_streams,
+    )
+
+    manifest_path = os.path.join(stream_dir, MANIFEST_NAME)
+    expected = _read_expected_checksum(f"{manifest_path}.sha256")
+    if expected is not None and expected != _compute_file_sha256(manifest_path):
+        return BackupValidateResponse(
+            success=True,
+            message="Validation completed",
+            valid=False,
+            errors=["Backup manifest checksum mismatch."],
+        )
+
+    manifest = read_manifest(stream_dir)
+    streams = manifest["collections"]
+    corrupt = set(verify_streams(stream_dir, manifest, streams))
+    errors = [f"Collection '{name}': checksum mismatch or missing stream" for name in corrupt]
+    if expected is None:
+        errors.append("Backup manifest has no checksum sidecar.")
+
+    collections_validated = {}
+    valid_documents = 0
+    for name, entry in streams.items():
+        if name in corrupt:
+            collections_validated[name] = {"count": entry["count"], "valid": False}
+            continue
+        found = count_documents(os.path.join(stream_dir, entry["file"]))
+        if found != entry["count"]:
+            errors.append(f"Collection '{name}': {found} documents, manifest says {entry['count']}")
+        collections_validated[name] = {"count": found, "valid": found == entry["count"]}
+        valid_documents += found if found == entry["count"] else 0
+
+    total = sum(entry["count"] for entry in streams.values())
+    return BackupValidateResponse(
+        success=True,
+        message="Validation completed",
+        valid=not errors,
+        total_documents=total,
+        valid_documents=valid_documents,
+        invalid_documents=total - valid_documents,
+        collections_validated=collections_validated,
+        errors=errors,
+    )
+
+
+async def _restore_stream_backup(
+    stream_dir: str, request: BackupRestoreRequest
+) -> BackupRestoreResponse:
+    """Restore a streaming backup (see ``services.mongo_backup``).
+
+    The manifest passes the same integrity gate as a JSON backup file, and
+    every stream to restore is checked against the manifest's digest before
+    the first collection is emptied.
+    """
+    from depictio.api.v1.services.mongo_backup import (
+        MANIFEST_NAME,
+        read_manifest,
+        restore_stream_backup,
+        verify_streams,
+    )
+
+    _verify_backup_integrity(os.path.join(stream_dir, MANIFEST_NAME), request.allow_unverified)
+    manifest = read_manifest(stream_dir)
+    streams = manifest["collections"]
+    collection_map = _collection_map()
+
+    errors = []
+    names = []
+    for collection_name in request.collections or list(streams):
+        if collection_name not in streams:
+            errors.append(f"Collection '{collection_name}' not found in backup")
+        elif collection_name not in collection_map and not request.dry_run:
+            errors.append(f"Collection '{collection_name}' not recognized")
+        else:
+            names.append(collection_name)
+
+    if request.dry_run:
+        restored_collections = {
+            name: {"count": streams[name]["count"], "status": "would_restore"} for name in names
+        }
+        total = sum(streams[name]["count"] for name in names)
+        return BackupRestoreResponse(
+            success=True,
+            message=f"DRY RUN: Would restore {total} documents",
+            restored_collections=restored_collections,
+            total_restored=total,
+            errors=errors,
+        )
+
+    corrupt = await asyncio.to_thread(verify_streams, stream_dir, manifest, names)
+    if corrupt:
+        logger.error(f"Backup stream checksum mismatch: {', '.join(corrupt)}")
+        raise HTTPException(
+            status_code=400,
+            detail="Backup integrity check failed: checksum mismatch.",
+        )
+
+    restored, failed = await asyncio.to_thread(
+        restore_stream_backup,
+        stream_dir,
+        manifest,
+        {name: collection_map[name] for name in names},
+        settings.backup.mongodb_backup_batch_size,
+        settings.backup.mongodb_backup_workers,
+    )
+    restored_collections: dict[str, dict] = {
+        name: {"count": count, "status": "restored"} for name, count in restored.items()
+    }
+    for name in failed:
+        # Details are logged by the restore; return a sanitized message.
+        errors.append(f"Failed to restore collection '{name}'.")
+        restored_collections[name] = {"count": 0, "status": "failed", "error": "restore failed"}
+
+    total_restored = sum(restored.values())
+    return BackupRestoreResponse(
+        success=len(errors) == 0,
+        message=f"Restored {total_restored} documents from backup",
+        restored_collections=restored_collections,
+        total_restored=total_restored,
+        errors=errors,
+    )
+
+
 @backup_endpoint_router.post("/restore", response_model=BackupRestoreResponse)
 async def restore_backup(
     request: BackupRestoreRequest,
@@ -557,6 +789,10 @@ async def restore_backup(
 
     try:
         backup_dir = settings.backup.backup_path
+        stream_dir = _resolve_backup_path(backup_dir, request.backup_id, suffix="")
+        if os.path.isdir(stream_dir):
+            return await _restore_stream_backup(stream_dir, request)
+
         backup_path = _resolve_backup_path(backup_dir, request.backup_id)
 
         if not os.path.exists(backup_path):
@@ -582,18 +818,7 @@ async def restore_backup(
 
         data_section = backup_data["data"]
 
-        # Tokens excluded to avoid circular dependency
-        collection_map = {
-            "users": users_collection,
-            "projects": projects_collection,
-            "dashboards": dashboards_collection,
-            "data_collections": data_collections_collection,
-            "workflows": workflows_collection,
-            "files": files_collection,
-            "deltatables": deltatables_collection,
-            "runs": runs_collection,
-            "groups": groups_collection,
-        }
+        collection_map = _collection_map()
 
         collections_to_restore = request.collections or list(data_section.keys())
 
@@ -11,11 +11,15 @@ from uuid import UUID
 
 import yaml
 from bson import ObjectId
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse, Response
 
-from depictio.api.v1.celery_dispatch import offload_or_run, should_offload_render
+from depictio.api.v1.celery_dispatch import (
+    figure_cost_class,
+    offload_or_run,
+    should_offload_render,
+)
 from depictio.api.v1.celery_tasks import build_figure_preview as build_figure_preview_task
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
@@ -44,8 +48,10 @@ from depictio.api.v1.services.card_metrics import (
 from depictio.api.v1.services.card_metrics import (
     numeric_layout_payload as _numeric_layout_payload,
 )
+from depictio.api.v1.services.events.dashboard_index import refresh_dashboard_index
 from depictio.models.models.base import PyObjectId, convert_objectid_to_str
 from depictio.models.models.dashboards import DashboardData, DashboardDataLite
+from depictio.models.models.deltatables import HIDDEN_COLUMNS
 from depictio.models.models.users import User
 from depictio.models.timestamps import preserved_creation_time, utc_now_str
 
@@ -675,6 +681,7 @@ async def save_dashboard(
 
         # Convert dashboard_id to string to ensure proper JSON serialization
         dashboard_id_str = str(dashboard_id)
+        refresh_dashboard_index(dashboard_id_str)
 
         # Auto-queue screenshot regeneration so /dashboards and any
         # other listing surface picks up the latest dashboard state.
@@ -755,6 +762,7 @@ async def delete_dashboard(
     result = dashboards_collection.delete_one({"dashboard_id": dashboard_id})
 
     if result.deleted_count > 0:
+        refresh_dashboard_index(dashboard_id)
         message = f"Dashboard with ID '{str(dashboard_id)}' deleted successfully."
         if child_tabs_deleted > 0:
             message += f" Also deleted {child_tabs_deleted} child tabs."
@@ -902,6 +910,7 @@ async def delete_tab(
     result = dashboards_collection.delete_one({"dashboard_id": dashboard_id})
 
     if result.deleted_count > 0:
+        refresh_dashboard_index(dashboard_id)
         return {
             "success": True,
             "message": f"Tab '{tab_title}' deleted successfully.",
@@ -1852,21 +1861,8 @@ def _component_context(
         component_type=component_type,
     )
 
-    dc_config = component.get("dc_config") or {}
-    init_data: dict[str, dict] = {}
-    delta_loc = dc_config.get("delta_location")
-    if not delta_loc:
-        from depictio.api.v1.db import deltatables_collection
-
-        dt = deltatables_collection.find_one({"data_collection_id": ObjectId(str(dc_id))})
-        if dt:
-            delta_loc = dt.get("delta_table_location")
-    if delta_loc:
-        init_data[str(dc_id)] = {
-            "delta_location": delta_loc,
-            "dc_type": dc_config.get("type") or "table",
-            "size_bytes": dc_config.get("size_bytes", 0),
-        }
+    entry = _dc_init_entry(str(dc_id), component.get("dc_config") or {})
+    init_data: dict[str, dict] = {str(dc_id): entry} if entry else {}
 
     return _ComponentContext(
         component=component,
@@ -1878,6 +1874,164 @@ def _component_context(
     )
 
 
+def _dc_init_entry(dc_id: str, dc_config: dict) -> dict | None:
+    """``init_data`` entry for one DC: where its Delta table lives, and its size.
+
+    Reads ``dc_config.delta_location`` when the component carries it and falls
+    back to the ``deltatables`` document otherwise. ``None`` when neither knows
+    the table, which callers treat as "no init data" exactly as before.
+    """
+    delta_loc = dc_config.get("delta_location")
+    if not delta_loc:
+        from depictio.api.v1.db import deltatables_collection
+
+        dt = deltatables_collection.find_one({"data_collection_id": ObjectId(str(dc_id))})
+        if dt:
+            delta_loc = dt.get("delta_table_location")
+    if not delta_loc:
+        return None
+    return {
+        "delta_location": delta_loc,
+        "dc_type": dc_config.get("type") or "table",
+        "size_bytes": dc_config.get("size_bytes", 0),
+    }
+
+
+class _DashboardRenderScope:
+    """Everything a dashboard render needs per *data collection*, computed once.
+
+    A filter round asks every component the same questions — may this user
+    read the project and my DC, which link-resolved filters apply to my DC,
+    where does my DC's Delta table live — and the answers only depend on the
+    DC, not on the component. The per-component endpoints each answer them again;
+    ``render_all`` and ``bulk_compute_cards`` build one scope and share it.
+
+    ``init_data`` entries also carry the DC's ``aggregation_version``, so the
+    loaders downstream skip their own version lookup and reuse the memoised
+    base scan for that version (``deltatables_utils._create_delta_scan``), and
+    its ``aggregation_hash``, which keys the persistent figure result cache.
+
+    ``planner`` collects the lazy reductions components ask of one DC (card
+    aggregations, table row counts) so they run as one ``pl.collect_all``.
+
+    Thread-safe: ``render_all`` resolves components concurrently from a
+    threadpool. Resolution runs outside the lock — ``_resolve_link_filters_cached``
+    already collapses concurrent callers for one key — so the lock only guards
+    the memo dicts.
+    """
+
+    def __init__(
+        self,
+        dashboard_data: dict,
+        project_id: Any,
+        filters: list[dict],
+        access_token: str | None,
+        current_user: User | None = None,
+    ) -> None:
+        self.dashboard_data = dashboard_data
+        self.project_id = project_id
+        self.filters = filters
+        self.access_token = access_token
+        self.current_user = current_user
+        self._merged: dict[str, list[dict]] = {}
+        self._init_data: dict[str, dict | None] = {}
+        self._access: dict[str, HTTPException | None] = {}
+        self._lock = threading.Lock()
+        # Reductions the round's components aim at the same filtered table are
+        # registered here and answered by one fused scan per DC.
+        from depictio.api.v1.deltatables_utils import ScanPlanner
+
+        self.planner = ScanPlanner()
+
+    @classmethod
+    def open(
+        cls,
+        dashboard_id: PyObjectId,
+        filters: list[dict],
+        current_user: User,
+        access_token: str | None,
+    ) -> "_DashboardRenderScope":
+        """Find the dashboard and authorise the caller; raises 404 / 403."""
+        dashboard_data = dashboards_collection.find_one({"dashboard_id": dashboard_id})
+        if not dashboard_data:
+            raise HTTPException(status_code=404, detail=f"Dashboard '{dashboard_id}' not found.")
+
+        project_id = dashboard_data.get("project_id")
+        if not project_id or not check_project_permission(project_id, current_user, "viewer"):
+            raise HTTPException(status_code=403, detail="Permission denied.")
+        return cls(dashboard_data, project_id, filters, access_token, current_user)
+
+    @property
+    def stored_metadata(self) -> list[dict]:
+        return self.dashboard_data.get("stored_metadata") or []
+
+    def dc_access_error(self, dc_id: str) -> HTTPException | None:
+        """The 404 ``/advanced_viz/data`` would raise for ``dc_id``, or ``None``.
+
+        The dashboard's project check does not cover a component bound to a DC
+        of another project, so every DC a round reads is checked on its own,
+        once. Blocking (one Mongo lookup): ``render_all`` runs it for the whole
+        round from a threadpool before queueing any job.
+        """
+        from depictio.api.v1.endpoints.advanced_viz_endpoints.routes import _assert_dc_access
+
+        dc_id = str(dc_id)
+        with self._lock:
+            if dc_id in self._access:
+                return self._access[dc_id]
+        error: HTTPException | None = None
+        try:
+            _assert_dc_access(ObjectId(dc_id), self.current_user)
+        except HTTPException as e:
+            error = e
+        except Exception:
+            error = HTTPException(status_code=400, detail=f"Invalid dc_id: {dc_id}")
+        with self._lock:
+            return self._access.setdefault(dc_id, error)
+
+    def merged_filters(self, dc_id: str) -> list[dict]:
+        """React filters plus the link-resolved filters that target ``dc_id``."""
+        dc_id = str(dc_id)
+        with self._lock:
+            if dc_id in self._merged:
+                return self._merged[dc_id]
+        merged = _resolve_link_filters_cached(
+            filters=self.filters,
+            target_dc_id=dc_id,
+            project_id=self.project_id,
+            access_token=self.access_token,
+            component_type="dashboard",
+        )
+        with self._lock:
+            return self._merged.setdefault(dc_id, merged)
+
+    def filter_metadata(self, dc_id: str) -> list[dict]:
+        return _build_filter_metadata(self.merged_filters(dc_id))
+
+    def init_data(self, dc_id: str, dc_config: dict | None = None) -> dict[str, dict]:
+        """``{dc_id: entry}`` for the loaders, or ``{}`` when the table is unknown."""
+        from depictio.api.v1.deltatables_utils import _get_aggregation_salts
+
+        dc_id = str(dc_id)
+        with self._lock:
+            known = dc_id in self._init_data
+            entry = self._init_data.get(dc_id)
+        if not known:
+            entry = _dc_init_entry(dc_id, dc_config or {})
+            if entry is not None:
+                version, agg_hash = _get_aggregation_salts(dc_id)
+                entry["aggregation_version"] = version
+                entry["aggregation_hash"] = agg_hash
+            with self._lock:
+                entry = self._init_data.setdefault(dc_id, entry)
+        return {dc_id: entry} if entry else {}
+
+    def all_init_data(self) -> dict[str, dict]:
+        """Every DC this scope has resolved so far, in one ``init_data`` mapping."""
+        with self._lock:
+            return {k: v for k, v in self._init_data.items() if v}
+
+
 @dashboards_endpoint_router.post("/bulk_compute_cards/{dashboard_id}")
 def bulk_compute_cards(
     dashboard_id: PyObjectId,
@@ -1923,20 +2077,153 @@ def bulk_compute_cards(
           card_component/callbacks/core.py remains the source of truth for the
           edit path; this endpoint mirrors its math.
     """
-    from depictio.api.v1.deltatables_utils import load_deltatable_lite
-
     filters = request.get("filters") or []
-    requested_ids: list[str] | None = request.get("component_ids")
+    scope = _DashboardRenderScope.open(dashboard_id, filters, current_user, access_token)
+    return _compute_cards(scope, request.get("component_ids"))
 
-    dashboard_data = dashboards_collection.find_one({"dashboard_id": dashboard_id})
-    if not dashboard_data:
-        raise HTTPException(status_code=404, detail=f"Dashboard '{dashboard_id}' not found.")
 
-    project_id = dashboard_data.get("project_id")
-    if not project_id or not check_project_permission(project_id, current_user, "viewer"):
-        raise HTTPException(status_code=403, detail="Permission denied.")
+def _card_cache_key(
+    scope: _DashboardRenderScope, wf_id: Any, dc_id: Any, filter_expr: str | None = None
+) -> tuple:
+    """``(wf_id, dc_id, filter signature, filter_expr)`` — the dedupe key for a
+    card's Delta load. Cards sharing it share one loaded frame (via
+    ``df_cache``), so a projected load must carry the union of their columns.
+
+    ``filter_expr`` is part of the key because the cached frame is stored
+    *after* the expression has been applied: two cards on the same DC with
+    different expressions must not read each other's rows."""
+    card_filters = scope.filter_metadata(str(dc_id))
+    filter_sig = tuple(
+        sorted(
+            (
+                str(fm.get("column_name")),
+                str(fm.get("interactive_component_type")),
+                repr(fm.get("value")),
+            )
+            for fm in card_filters
+        )
+    )
+    return (str(wf_id), str(dc_id), filter_sig, filter_expr or "")
+
+
+def _card_groups(
+    scope: _DashboardRenderScope, cards: list[dict]
+) -> tuple[dict[tuple, list[dict]], dict[tuple, set[str]]]:
+    """Cards grouped by ``_card_cache_key``, and the columns each group reads."""
+    # Column projection (#7) pre-pass: the slow Delta load is shared across
+    # every card with the same (wf_id, dc_id, filter) signature, so the
+    # projected load must carry the union of all sibling cards' referenced
+    # columns — otherwise a sibling reusing the cached frame would find its
+    # column missing and report null. The loader folds in filter columns and
+    # schema-guards the set; over-inclusion only costs a little extra I/O.
+    needed_cols_by_key: dict[tuple, set[str]] = {}
+    for card in cards:
+        wf_id = card.get("wf_id")
+        dc_id = card.get("dc_id")
+        column = card.get("column_name")
+        aggregation = card.get("aggregation")
+        if not (wf_id and dc_id and column and aggregation):
+            continue
+        card_filter_expr = card.get("filter_expr")
+        key_cols = needed_cols_by_key.setdefault(
+            _card_cache_key(scope, wf_id, dc_id, card_filter_expr), set()
+        )
+        key_cols.add(column)
+        key_cols |= _card_payload_columns(card)
+        # The expression is applied to the projected frame, so its columns have
+        # to survive the projection even when no card displays them.
+        key_cols |= _filter_expr_columns(card_filter_expr)
+
+    # Cards sharing a cache key share one Delta read; group them so the pushdown
+    # can answer all of their aggregations in a single query.
+    cards_by_key: dict[tuple, list[dict]] = {}
+    for card in cards:
+        if not (card.get("wf_id") and card.get("dc_id") and card.get("column_name")):
+            continue
+        cards_by_key.setdefault(
+            _card_cache_key(scope, card["wf_id"], card["dc_id"], card.get("filter_expr")), []
+        ).append(card)
+    return cards_by_key, needed_cols_by_key
+
+
+def _card_pushdown_exprs(key_cards: list[dict]) -> tuple[list[Any], list[tuple[str, str]]]:
+    """Every expressible aggregation on ``key_cards``: ``(exprs, aliases)``.
+
+    ``aliases[i]`` is the ``(component_index, aggregation)`` the i-th expression
+    answers. Deterministic for a given card list, so a caller reading a planned
+    result back can rebuild the aliases without keeping them around.
+    """
+    exprs: list[Any] = []
+    aliases: list[tuple[str, str]] = []
+    for card in key_cards:
+        column = card.get("column_name")
+        wanted = [card.get("aggregation")] + list(card.get("aggregations") or [])
+        for agg in wanted:
+            if not agg:
+                continue
+            cidx = str(card.get("index"))
+            if (cidx, agg) in dict.fromkeys(aliases):
+                continue
+            expr = _agg_expr(str(column), str(agg))
+            if expr is None:
+                continue
+            alias = f"c{len(aliases)}"
+            exprs.append(expr.alias(alias))
+            aliases.append((cidx, str(agg)))
+    return exprs, aliases
+
+
+def _plan_card_pushdowns(
+    scope: _DashboardRenderScope,
+    cards_by_key: dict[tuple, list[dict]],
+    needed_cols_by_key: dict[tuple, set[str]],
+    keys: list[tuple],
+) -> None:
+    """Register each key's pushdown query on ``scope.planner`` as ``("card_pushdown", key)``.
+
+    Keys on the same DC and filter state land in one planner group, so they —
+    and anything else the round planned there, like a table's row count — are
+    answered by one fused scan.
+    """
+    from depictio.models.components.filter_expr import build_filter_expr
+
+    for cache_key in keys:
+        wf_id, dc_id, _filter_sig, filter_expr = cache_key
+        key_cards = cards_by_key.get(cache_key) or []
+        exprs, _aliases = _card_pushdown_exprs(key_cards)
+        if not exprs:
+            continue
+
+        def _build(scan, exprs=exprs, filter_expr=filter_expr):
+            # Every card on this key shares the same ``filter_expr`` (it is part
+            # of the key), so narrowing the scan once serves all of them.
+            if filter_expr:
+                scan = scan.filter(build_filter_expr(filter_expr))
+            return scan.select(exprs)
+
+        scope.planner.add(
+            ("card_pushdown", cache_key),
+            ObjectId(wf_id),
+            dc_id,
+            _build,
+            columns=needed_cols_by_key.get(cache_key) or None,
+            metadata=scope.filter_metadata(dc_id) or None,
+            init_data=scope.init_data(dc_id, key_cards[0].get("dc_config") or {}),
+        )
 
-    stored_metadata = dashboard_data.get("stored_metadata") or []
+
+def _compute_cards(scope: _DashboardRenderScope, requested_ids: list[str] | None) -> dict:
+    """Body of ``bulk_compute_cards`` over an already-authorised scope.
+
+    Split out so ``render_all`` can answer a dashboard's cards from the same
+    scope its figures and tables use — link resolution and the Delta location
+    lookup then run once per DC for the whole round, not once per endpoint.
+    """
+    from depictio.api.v1.deltatables_utils import load_deltatable_lite
+
+    filters = scope.filters
+    dashboard_id = scope.dashboard_data.get("dashboard_id")
+    stored_metadata = scope.stored_metadata
 
     # Collect card components (optionally filtered by component_ids)
     requested = set(requested_ids) if requested_ids else None
@@ -1956,21 +2243,7 @@ def bulk_compute_cards(
         dc_id = str(m.get("dc_id"))
         if not dc_id or dc_id in init_data:
             continue
-        dc_config = m.get("dc_config") or {}
-        delta_loc = dc_config.get("delta_location")
-        if not delta_loc:
-            # Fallback: look up via deltatables_collection
-            from depictio.api.v1.db import deltatables_collection
-
-            dt = deltatables_collection.find_one({"data_collection_id": ObjectId(dc_id)})
-            if dt:
-                delta_loc = dt.get("delta_table_location")
-        if delta_loc:
-            init_data[dc_id] = {
-                "delta_location": delta_loc,
-                "dc_type": dc_config.get("type") or "table",
-                "size_bytes": dc_config.get("size_bytes", 0),
-            }
+        init_data.update(scope.init_data(dc_id, m.get("dc_config") or {}))
 
     # Filters are global (applied to any card whose DC contains the filter column).
     # The base list is what the React viewer sent. Per card we additionally
@@ -1995,23 +2268,11 @@ def bulk_compute_cards(
         f"init_data_keys={list(init_data.keys())} filters={len(base_filter_metadata)}"
     )
 
-    # Per-DC link-resolved filter cache so we only call the link API once per
-    # target DC. The result already includes the original React-supplied
-    # filters, so it can be passed straight to load_deltatable_lite.
-    resolved_per_dc: dict[str, list[dict]] = {}
-
+    # Per-DC link-resolved filters, memoised on the scope so the link API is
+    # called once per target DC. The result already includes the original
+    # React-supplied filters, so it can be passed straight to load_deltatable_lite.
     def _resolved_filters_for(dc_id_str: str) -> list[dict]:
-        if dc_id_str in resolved_per_dc:
-            return resolved_per_dc[dc_id_str]
-        merged = _resolve_link_filters_cached(
-            filters=filters,
-            target_dc_id=dc_id_str,
-            project_id=project_id,
-            access_token=access_token,
-            component_type="card",
-        )
-        resolved_per_dc[dc_id_str] = _build_filter_metadata(merged)
-        return resolved_per_dc[dc_id_str]
+        return scope.filter_metadata(dc_id_str)
 
     def _get_specs(dc_id_str: str) -> dict[str, dict]:
         """Return precomputed column aggregations as ``{column_name: specs_dict}``.
@@ -2036,71 +2297,38 @@ def bulk_compute_cards(
         elif isinstance(raw, dict):
             flat = raw  # legacy
 
-        specs_cache[dc_id_str] = flat
-        return flat
-
-    def _card_cache_key(wf_id: Any, dc_id: Any, filter_expr: str | None = None) -> tuple:
-        """``(wf_id, dc_id, filter signature, filter_expr)`` — the dedupe key for a
-        card's Delta load. Cards sharing it share one loaded frame (via
-        ``df_cache``), so a projected load must carry the union of their columns.
+        # Fill what the stored specs lack (API-uploaded tables store none) from
+        # the ingest-time column catalog; stored values win where both exist.
+        from depictio.api.v1.services.column_stats import catalog_specs, column_catalog
 
-        ``filter_expr`` is part of the key because the cached frame is stored
-        *after* the expression has been applied: two cards on the same DC with
-        different expressions must not read each other's rows."""
-        card_filters = _resolved_filters_for(str(dc_id))
-        filter_sig = tuple(
-            sorted(
-                (
-                    str(fm.get("column_name")),
-                    str(fm.get("interactive_component_type")),
-                    repr(fm.get("value")),
-                )
-                for fm in card_filters
-            )
-        )
-        return (str(wf_id), str(dc_id), filter_sig, filter_expr or "")
+        catalog = column_catalog(dc_id_str, dt)
+        if catalog:
+            for name, values in catalog_specs(catalog).items():
+                flat[name] = {**values, **(flat.get(name) or {})}
 
-    # Column projection (#7) pre-pass: the slow Delta load is shared across
-    # every card with the same (wf_id, dc_id, filter) signature, so the
-    # projected load must carry the union of all sibling cards' referenced
-    # columns — otherwise a sibling reusing the cached frame would find its
-    # column missing and report null. The loader folds in filter columns and
-    # schema-guards the set; over-inclusion only costs a little extra I/O.
-    needed_cols_by_key: dict[tuple, set[str]] = {}
-    for card in cards:
-        wf_id = card.get("wf_id")
-        dc_id = card.get("dc_id")
-        column = card.get("column_name")
-        aggregation = card.get("aggregation")
-        if not (wf_id and dc_id and column and aggregation):
-            continue
-        card_filter_expr = card.get("filter_expr")
-        key_cols = needed_cols_by_key.setdefault(
-            _card_cache_key(wf_id, dc_id, card_filter_expr), set()
-        )
-        key_cols.add(column)
-        key_cols |= _card_payload_columns(card)
-        # The expression is applied to the projected frame, so its columns have
-        # to survive the projection even when no card displays them.
-        key_cols |= _filter_expr_columns(card_filter_expr)
+        specs_cache[dc_id_str] = flat
+        return flat
 
-    # Cards sharing a cache key share one Delta read; group them so the pushdown
-    # below can answer all of their aggregations in a single query.
-    cards_by_key: dict[tuple, list[dict]] = {}
-    for card in cards:
-        if not (card.get("wf_id") and card.get("dc_id") and card.get("column_name")):
-            continue
-        cards_by_key.setdefault(
-            _card_cache_key(card["wf_id"], card["dc_id"], card.get("filter_expr")), []
-        ).append(card)
+    cards_by_key, needed_cols_by_key = _card_groups(scope, cards)
 
     # ``(component_index, aggregation) -> value`` filled by the pushdown pass.
     pushdown_values: dict[tuple[str, str], Any] = {}
     pushdown_tried: set[tuple] = set()
 
-    def _try_pushdown(
-        cache_key: tuple, wf_id: Any, dc_id: Any, filter_expr: str | None = None
-    ) -> None:
+    # With filters set (or a card-level expression), the precomputed specs
+    # can't serve those keys, so every one of them is headed for a pushdown.
+    # Plan them all up front: keys on the same DC then share one fused scan
+    # instead of one query each. ``render_all`` has usually planned them already,
+    # fused with its tables' row counts, in which case this is a no-op.
+    _plan_card_pushdowns(
+        scope,
+        cards_by_key,
+        needed_cols_by_key,
+        [key for key in cards_by_key if has_filters or key[3]],
+    )
+    scope.planner.run()
+
+    def _try_pushdown(cache_key: tuple) -> None:
         """Answer every aggregation on ``cache_key``'s cards with one scan query.
 
         This is the path that used to force a full frame load: as soon as any
@@ -2114,50 +2342,16 @@ def bulk_compute_cards(
         are simply left out of ``pushdown_values`` — the main loop then falls back
         to the load for those, exactly as before.
         """
-        from depictio.api.v1.deltatables_utils import open_deltatable_scan
-
-        key_cards = cards_by_key.get(cache_key) or []
-        exprs = []
-        aliases: list[tuple[str, str]] = []  # (component_index, aggregation)
-        for card in key_cards:
-            column = card.get("column_name")
-            wanted = [card.get("aggregation")] + list(card.get("aggregations") or [])
-            for agg in wanted:
-                if not agg:
-                    continue
-                cidx = str(card.get("index"))
-                if (cidx, agg) in dict.fromkeys(aliases):
-                    continue
-                expr = _agg_expr(str(column), str(agg))
-                if expr is None:
-                    continue
-                alias = f"c{len(aliases)}"
-                exprs.append(expr.alias(alias))
-                aliases.append((cidx, str(agg)))
-        if not exprs:
+        # A key planned above is answered from the fused result; one that only
+        # reaches the slow path now (specs miss, no filters) is planned and run
+        # on its own.
+        _plan_card_pushdowns(scope, cards_by_key, needed_cols_by_key, [cache_key])
+        scope.planner.run()
+        frame = scope.planner.result(("card_pushdown", cache_key))
+        if frame is None or frame.height == 0:
             return
-
-        scan = open_deltatable_scan(
-            workflow_id=ObjectId(str(wf_id)) if not isinstance(wf_id, ObjectId) else wf_id,
-            data_collection_id=str(dc_id),
-            metadata=_resolved_filters_for(str(dc_id)) or None,
-            init_data=init_data,
-            select_columns=sorted(needed_cols_by_key.get(cache_key, set())) or None,
-        )
-        if scan is None:
-            return
-        try:
-            # Every card on this key shares the same ``filter_expr`` (it is part
-            # of the key), so narrowing the scan once serves all of them.
-            if filter_expr:
-                from depictio.models.components.filter_expr import build_filter_expr
-
-                scan = scan.filter(build_filter_expr(filter_expr))
-            row = scan.select(exprs).collect().row(0)
-        except Exception as e:
-            logger.warning(f"bulk_compute_cards: pushdown failed for {cache_key}: {e}")
-            return
-        for (cidx, agg), value in zip(aliases, row):
+        _exprs, aliases = _card_pushdown_exprs(cards_by_key.get(cache_key) or [])
+        for (cidx, agg), value in zip(aliases, frame.row(0)):
             pushdown_values[(cidx, agg)] = _coerce_agg_result(value, agg)
         logger.debug(
             f"bulk_compute_cards: pushdown answered {len(aliases)} aggregation(s) "
@@ -2234,7 +2428,7 @@ def bulk_compute_cards(
         # Cache key includes the filter signature so two cards on the same DC
         # with different (link-resolved) filter sets don't collide.
         card_filters = _resolved_filters_for(str(dc_id))
-        cache_key = _card_cache_key(wf_id, dc_id, card_filter_expr)
+        cache_key = _card_cache_key(scope, wf_id, dc_id, card_filter_expr)
 
         # Try the scan-level pushdown once per cache key before considering a
         # load. It answers every expressible aggregation for all cards sharing
@@ -2242,7 +2436,7 @@ def bulk_compute_cards(
         # costs one column scan rather than one full-frame collect.
         if cache_key not in pushdown_tried:
             pushdown_tried.add(cache_key)
-            _try_pushdown(cache_key, wf_id, dc_id, card_filter_expr)
+            _try_pushdown(cache_key)
 
         needs_breakdown_payload = _needs_server_payload(card)
         wanted_aggs = [aggregation] + list(secondary_aggs)
@@ -2356,6 +2550,28 @@ def bulk_compute_cards(
 # ============================================================================
 
 
+def _figure_json_response(response: Response, result: dict) -> Response:
+    """The pre-encoded figure body as a ``Response``, carrying ``response``'s headers.
+
+    Returning a ``Response`` skips FastAPI's recursive encoder, which on a large
+    figure was a full walk of every trace value just to re-serialise text the
+    worker had already produced. FastAPI only merges the injected
+    ``response``'s headers into bodies *it* builds, so they are copied over.
+    """
+    from depictio.api.v1.services.figure.encoding import figure_response_bytes
+
+    headers = {
+        k: v
+        for k, v in response.headers.items()
+        if k.lower() not in ("content-length", "content-type")
+    }
+    return Response(
+        content=figure_response_bytes(result or {}),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 def _emit_timing_headers(response, timings, t0, _time_mod) -> None:
     """Attach the per-render telemetry headers the benchmark harness reads.
 
@@ -2380,6 +2596,8 @@ def _emit_timing_headers(response, timings, t0, _time_mod) -> None:
         ("X-Rows-Loaded", "rows_loaded"),
         ("X-Rows-Displayed", "rows_displayed"),
         ("X-Frame-Bytes", "frame_bytes"),
+        ("X-Serialize-Ms", "serialize_ms"),
+        ("X-Payload-Bytes", "payload_bytes"),
     ):
         if timings.get(key) is not None:
             response.headers[header] = str(int(timings[key]))
@@ -2432,6 +2650,44 @@ def _emit_link_headers(response, merged: list[dict]) -> None:
     )
 
 
+def _row_count_cache_key(dc_id: str, filter_metadata, init_data) -> str:
+    from depictio.api.v1.deltatables_utils import _generate_filter_hash, _resolve_version_salt
+
+    filter_hash = _generate_filter_hash(filter_metadata) if filter_metadata else "nofilter"
+    return f"rowcount_{dc_id}_{filter_hash}_{_resolve_version_salt(dc_id, init_data)}"
+
+
+def _planned_row_count(planner, dc_id: str) -> int | None:
+    """The row count ``_plan_render_round`` fused for ``dc_id``, if it ran."""
+    frame = planner.result(("row_count", dc_id))
+    return int(frame.item()) if frame is not None and frame.height else None
+
+
+def _known_row_count(planner, dc_id: str, filter_metadata, init_data) -> int | None:
+    """The round's row count for ``dc_id`` when it costs no scan: fused, or cached."""
+    count = _planned_row_count(planner, dc_id)
+    if count is not None:
+        return count
+    try:
+        from depictio.api.cache import get_cache
+
+        cached = get_cache().get(_row_count_cache_key(dc_id, filter_metadata, init_data))
+    except Exception:
+        return None
+    return int(cached) if cached is not None else None
+
+
+def _planned_row_counter(planner, dc_id: str):
+    """A ``count_deltatable_lite`` stand-in that reads the planner's fused count first."""
+    from depictio.api.v1.deltatables_utils import count_deltatable_lite
+
+    def _count(**kwargs) -> int:
+        count = _planned_row_count(planner, dc_id)
+        return count if count is not None else count_deltatable_lite(**kwargs)
+
+    return _count
+
+
 def _cached_row_count(wf_oid, dc_id: str, filter_metadata, init_data, count_fn) -> int:
     """Row count for a (dc, filters) pair, memoised until the data version changes.
 
@@ -2444,7 +2700,6 @@ def _cached_row_count(wf_oid, dc_id: str, filter_metadata, init_data, count_fn)
     Falls back to counting directly if the cache is unavailable — this is an
     optimisation, and a wrong total would break the grid's paging.
     """
-    from depictio.api.v1.deltatables_utils import _generate_filter_hash, _get_aggregation_version
 
     def _count() -> int:
         return count_fn(
@@ -2457,8 +2712,7 @@ def _cached_row_count(wf_oid, dc_id: str, filter_metadata, init_data, count_fn)
     try:
         from depictio.api.cache import get_cache
 
-        filter_hash = _generate_filter_hash(filter_metadata) if filter_metadata else "nofilter"
-        key = f"rowcount_{dc_id}_{filter_hash}_{_get_aggregation_version(dc_id)}"
+        key = _row_count_cache_key(dc_id, filter_metadata, init_data)
         cache = get_cache()
         cached = cache.get(key)
         if cached is not None:
@@ -2496,9 +2750,7 @@ def _load_natural_page(
         )
         if scan is not None:
             page = scan.slice(start, limit).collect()
-            if "depictio_aggregation_time" in page.columns:
-                page = page.drop("depictio_aggregation_time")
-            return page
+            return page.drop(HIDDEN_COLUMNS, strict=False)
     except Exception as exc:
         logger.warning(
             f"render_table: scan-level paging failed for {dc_id} ({exc}) — using the row loader"
@@ -2515,6 +2767,67 @@ def _load_natural_page(
     return df.slice(start, limit)
 
 
+def _figure_task_payload(
+    component: dict,
+    filter_metadata: list[dict],
+    theme: str,
+    full_load: bool,
+    init_data: dict[str, dict] | None = None,
+) -> dict:
+    """The ``build_figure_preview`` payload for a stored figure component.
+
+    JSON-safe on purpose: ObjectIds in the component dict are normalized to
+    strings so the Celery JSON serializer doesn't choke; the task body
+    re-coerces wf_id back to ObjectId for ``load_deltatable_lite``.
+
+    ``init_data`` is optional. A caller that has already resolved the DC's
+    location and version (``render_all``) passes it through so the task skips
+    its own ``deltatables`` lookup.
+    """
+    dc_config = component.get("dc_config") or {}
+    metadata = {
+        "wf_id": str(component.get("wf_id")),
+        "dc_id": str(component.get("dc_id")),
+        "dc_config": convert_objectid_to_str(dc_config),
+        "visu_type": component.get("visu_type", "scatter"),
+        "dict_kwargs": component.get("dict_kwargs") or {},
+        "mode": component.get("mode", "ui"),
+        "code_content": component.get("code_content", ""),
+        "selection_enabled": bool(component.get("selection_enabled", False)),
+        "selection_column": component.get("selection_column"),
+        "max_points": component.get("max_points"),
+    }
+    payload = {
+        "metadata": metadata,
+        "filter_metadata": filter_metadata,
+        "theme": theme,
+        "full_load": full_load,
+    }
+    if init_data:
+        payload["init_data"] = init_data
+    return payload
+
+
+def _figure_should_offload(component: dict) -> bool:
+    """Whether this figure renders on Celery; see ``should_offload_render``.
+
+    Offload only when the render is actually heavy. A blanket offload taxes
+    cheap interactive figures with the broker + result-backend round-trip and
+    poll-loop latency for no benefit.
+    """
+    dc_config = component.get("dc_config") or {}
+    try:
+        size_bytes = int(dc_config.get("size_bytes") or 0)
+    except (TypeError, ValueError):
+        size_bytes = 0
+    return should_offload_render(
+        force=settings.celery.offload_rendering,
+        code_mode=(component.get("mode", "ui") == "code"),
+        size_bytes=size_bytes,
+        threshold_bytes=settings.celery.offload_size_threshold_bytes,
+    )
+
+
 @dashboards_endpoint_router.post("/render_figure/{dashboard_id}/{component_id}")
 async def render_figure_endpoint(
     dashboard_id: PyObjectId,
@@ -2523,6 +2836,9 @@ async def render_figure_endpoint(
     response: Response,
     current_user: User = Depends(get_user_or_anonymous),
     access_token: Annotated[str | None, Depends(oauth2_scheme_optional)] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    x_render_session: Annotated[str | None, Header()] = None,
+    x_fetch_generation: Annotated[int | None, Header()] = None,
 ):
     """Render a Plotly figure component as JSON for the React viewer.
 
@@ -2548,7 +2864,27 @@ async def render_figure_endpoint(
 
     Response:
         {"figure": <plotly fig dict>, "metadata": {visu_type, ...}}
+
+    The body is sent exactly as the worker encoded it — numeric trace arrays as
+    Plotly typed arrays (``{"dtype", "bdata"}``) — and never re-encoded here.
+
+    Renders are cached across workers (``services/figure/result_cache``) and
+    carry an ``ETag`` derived from the render inputs plus the DC's aggregation
+    hash; a client resending it as ``If-None-Match`` gets a bodiless 304 before
+    any data is read.
+
+    Offloaded renders go to their cost class's queue and are refused with 503 +
+    ``Retry-After`` when that queue can't get to them in time. A viewer tab
+    that sends ``X-Render-Session`` and ``X-Fetch-Generation`` has the task its
+    previous generation left running for this component revoked.
     """
+    from depictio.api.v1.services.figure.result_cache import (
+        etag_for,
+        etag_matches,
+        figure_cache_key,
+        get_figure_result,
+    )
+
     filters = request.get("filters") or []
     theme = request.get("theme") or "light"
     full_load = bool(request.get("full_load", False))
@@ -2594,47 +2930,34 @@ async def render_figure_endpoint(
     _emit_link_headers(response, merged_filters)
     filter_metadata = _build_filter_metadata(merged_filters)
 
-    # Build a JSON-safe payload for the task. ObjectIds in the component dict
-    # are normalized to strings so the JSON serializer doesn't choke; the task
-    # body re-coerces wf_id back to ObjectId for `load_deltatable_lite`.
-    dc_config = component.get("dc_config") or {}
-    mode = component.get("mode", "ui")
-    metadata = {
-        "wf_id": str(wf_id),
-        "dc_id": str(dc_id),
-        "dc_config": convert_objectid_to_str(dc_config),
-        "visu_type": component.get("visu_type", "scatter"),
-        "dict_kwargs": component.get("dict_kwargs") or {},
-        "mode": mode,
-        "code_content": component.get("code_content", ""),
-        "selection_enabled": bool(component.get("selection_enabled", False)),
-        "selection_column": component.get("selection_column"),
-        "max_points": component.get("max_points"),
-    }
+    payload = _figure_task_payload(component, filter_metadata, theme, full_load)
+    result_cache_key = await run_in_threadpool(figure_cache_key, payload)
+    if result_cache_key:
+        etag = etag_for(result_cache_key)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        cached, tier = await run_in_threadpool(get_figure_result, result_cache_key)
+        response.headers["ETag"] = etag
+        if cached is not None:
+            response.headers["X-Figure-Cache"] = tier or "hit"
+            return _figure_json_response(response, cached)
+        response.headers["X-Figure-Cache"] = "miss"
+        payload["result_cache_key"] = result_cache_key
 
-    # Offload to Celery only when the render is actually heavy. A blanket
-    # offload taxes cheap interactive figures with the broker + result-backend
-    # round-trip and poll-loop latency for no benefit; see should_offload_render.
-    try:
-        size_bytes = int(dc_config.get("size_bytes") or 0)
-    except (TypeError, ValueError):
-        size_bytes = 0
-    offload = should_offload_render(
-        force=settings.celery.offload_rendering,
-        code_mode=(mode == "code"),
-        size_bytes=size_bytes,
-        threshold_bytes=settings.celery.offload_size_threshold_bytes,
-    )
+    offload = _figure_should_offload(component)
     response.headers["X-Celery-Path"] = "offloaded" if offload else "inline"
 
-    payload = {
-        "metadata": metadata,
-        "filter_metadata": filter_metadata,
-        "theme": theme,
-        "full_load": full_load,
-    }
     import time as _time
 
+    supersede_key = None
+    if x_render_session and x_fetch_generation is not None:
+        # Scoped to the user *and* the tab: two viewers of one dashboard must
+        # never revoke each other's renders.
+        supersede_key = (
+            f"{current_user.id}:{x_render_session[:64]}:{dashboard_id}:{component_id}",
+            x_fetch_generation,
+        )
+
     _t0 = _time.perf_counter()
     try:
         result = await offload_or_run(
@@ -2642,6 +2965,8 @@ async def render_figure_endpoint(
             (payload,),
             offload=offload,
             label=f"render_figure cid={component_id} dc={dc_id}",
+            cost_class=figure_cost_class(component, full_load),
+            supersede_key=supersede_key,
         )
     except HTTPException:
         raise
@@ -2649,7 +2974,12 @@ async def render_figure_endpoint(
         logger.error(f"render_figure: build failed for {component_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Figure render failed: {e}")
     _emit_timing_headers(response, (result or {}).get("metadata", {}).get("timings"), _t0, _time)
-    return result
+    if (result or {}).get("metadata", {}).get("error"):
+        # Errored renders aren't cached, so the tag would promise a 304 for a
+        # body the next request can't reproduce.
+        if "ETag" in response.headers:
+            del response.headers["ETag"]
+    return _figure_json_response(response, result)
 
 
 # ============================================================================
@@ -2686,22 +3016,8 @@ def render_table_endpoint(
     """
     import time as _time
 
-    from depictio.api.v1.deltatables_utils import (
-        _get_aggregation_version,
-        count_deltatable_lite,
-        load_sorted_deltatable_lite,
-        schema_deltatable_lite,
-    )
-
     _t0 = _time.perf_counter()
     filters = request.get("filters") or []
-    start = int(request.get("start") or 0)
-    limit = int(request.get("limit") or 100)
-    limit = max(1, min(limit, 500))
-    sort_by = request.get("sort_by")
-    sort_dir = (request.get("sort_dir") or "desc").lower()
-    if sort_dir not in {"asc", "desc"}:
-        sort_dir = "desc"
 
     dashboard_data = dashboards_collection.find_one({"dashboard_id": dashboard_id})
     if not dashboard_data:
@@ -2737,22 +3053,49 @@ def render_table_endpoint(
     _emit_link_headers(response, merged_filters)
     filter_metadata = _build_filter_metadata(merged_filters)
 
-    dc_config = component.get("dc_config") or {}
-    init_data: dict[str, dict] = {}
-    delta_loc = dc_config.get("delta_location")
-    if not delta_loc:
-        from depictio.api.v1.db import deltatables_collection
+    entry = _dc_init_entry(str(dc_id), component.get("dc_config") or {})
+    init_data: dict[str, dict] = {str(dc_id): entry} if entry else {}
 
-        dt = deltatables_collection.find_one({"data_collection_id": ObjectId(str(dc_id))})
-        if dt:
-            delta_loc = dt.get("delta_table_location")
-    if delta_loc:
-        init_data[str(dc_id)] = {
-            "delta_location": delta_loc,
-            "dc_type": dc_config.get("type") or "table",
-            "size_bytes": dc_config.get("size_bytes", 0),
-        }
+    body, timings = _render_table_page(component, filter_metadata, init_data, request)
+    _emit_timing_headers(response, timings, _t0, _time)
+    return body
+
+
+def _render_table_page(
+    component: dict,
+    filter_metadata: list[dict],
+    init_data: dict[str, dict],
+    request: dict,
+    count_fn=None,
+) -> tuple[dict, dict]:
+    """One page of a stored table component: ``(response body, timings)``.
+
+    The part of ``render_table_endpoint`` after authorisation and link
+    resolution, shared with ``render_all``. ``request`` carries the paging and
+    sort keys (``start``, ``limit``, ``sort_by``, ``sort_dir``); ``timings`` is
+    the dict ``_emit_timing_headers`` reads. ``count_fn`` overrides how a
+    row-count cache miss is counted (``render_all`` reads its fused count).
+    """
+    import time as _time
+
+    from depictio.api.v1.deltatables_utils import (
+        _resolve_version_salt,
+        _sort_index_page,
+        count_deltatable_lite,
+        load_sorted_deltatable_lite,
+        schema_deltatable_lite,
+    )
 
+    start = int(request.get("start") or 0)
+    limit = int(request.get("limit") or 100)
+    limit = max(1, min(limit, 500))
+    sort_by = request.get("sort_by")
+    sort_dir = (request.get("sort_dir") or "desc").lower()
+    if sort_dir not in {"asc", "desc"}:
+        sort_dir = "desc"
+
+    wf_id = component.get("wf_id")
+    dc_id = component.get("dc_id")
     wf_oid = ObjectId(str(wf_id)) if not isinstance(wf_id, ObjectId) else wf_id
 
     _t_load = _time.perf_counter()
@@ -2806,7 +3149,7 @@ def render_table_endpoint(
         # whose size can't change between blocks. Memoise it per
         # (dc, filters, data version) so only the first block pays.
         total = _cached_row_count(
-            wf_oid, str(dc_id), filter_metadata, init_data, count_deltatable_lite
+            wf_oid, str(dc_id), filter_metadata, init_data, count_fn or count_deltatable_lite
         )
 
         # Above a threshold, sorting stops being worth what it costs. A sort has
@@ -2827,6 +3170,25 @@ def render_table_endpoint(
         # table, sort away".
         sort_max = int(settings.performance.table_sort_max_rows)
         sort_disabled = bool(sort_max) and (total <= 0 or total > sort_max)
+        indexed = None
+        if sort_disabled and chosen_sort and total > 0:
+            # ...unless the table has a sort index for this column: then a
+            # sorted page is a row-group read whatever the table size, and the
+            # refusal above no longer applies. The first ask only enqueues the
+            # build on the Celery worker, so until it lands this stays unsorted.
+            indexed = _sort_index_page(
+                str(wf_oid),
+                str(dc_id),
+                init_data,
+                _resolve_version_salt(str(dc_id), init_data),
+                chosen_sort,
+                sort_dir == "desc",
+                True,
+                filter_metadata or None,
+                select_columns,
+                (start, limit),
+            )
+            sort_disabled = indexed is None
         if sort_disabled and chosen_sort:
             logger.info(
                 f"render_table: {total} rows exceeds table_sort_max_rows={sort_max} — "
@@ -2834,7 +3196,9 @@ def render_table_endpoint(
             )
             chosen_sort = None
 
-        if chosen_sort:
+        if indexed is not None:
+            sliced = indexed
+        elif chosen_sort:
             # Server-side sort has to see every row. ``load_sorted_deltatable_lite``
             # memoises the sorted frame for small tables (later blocks are free
             # slices) and falls back to a lazy sort+slice for frames over the memo
@@ -2883,22 +3247,17 @@ def render_table_endpoint(
         columns.append({"field": name, "headerName": name, "type": ag_type})
 
     _build_ms = int((_time.perf_counter() - _t_build) * 1000)
-    _emit_timing_headers(
-        response,
-        {
-            "load_ms": _load_ms,
-            "build_ms": _build_ms,
-            # A table page is a bounded slice by construction, so rows_loaded ==
-            # rows_displayed here; both are reported so the harness can compare
-            # component types on the same axes.
-            "rows_loaded": sliced.height,
-            "rows_displayed": sliced.height,
-            "frame_bytes": sliced.estimated_size(),
-            "aggregated": False,
-        },
-        _t0,
-        _time,
-    )
+    timings = {
+        "load_ms": _load_ms,
+        "build_ms": _build_ms,
+        # A table page is a bounded slice by construction, so rows_loaded ==
+        # rows_displayed here; both are reported so the harness can compare
+        # component types on the same axes.
+        "rows_loaded": sliced.height,
+        "rows_displayed": sliced.height,
+        "frame_bytes": sliced.estimated_size(),
+        "aggregated": False,
+    }
     return {
         "columns": columns,
         "rows": rows,
@@ -2914,8 +3273,408 @@ def render_table_endpoint(
         # pages would then shift mid-scroll, silently duplicating and dropping
         # rows in the grid's block cache. Echoing the data version lets the
         # client purge its cache when the underlying order can have changed.
-        "data_version": _get_aggregation_version(str(dc_id)),
-    }
+        "data_version": _resolve_version_salt(str(dc_id), init_data),
+    }, timings
+
+
+# ============================================================================
+# React viewer: whole-dashboard render (one request, streamed per component)
+# ============================================================================
+
+# Cheap components first, so the dashboard fills in progressively instead of
+# the first frame waiting behind a large table page. Only used when the client
+# doesn't send its own order (``component_ids``, e.g. viewport order).
+_RENDER_ALL_COST_ORDER = {"card": 0, "figure": 1, "advanced_viz": 2, "table": 3}
+
+
+def _render_all_components(scope: _DashboardRenderScope, request: dict) -> list[dict]:
+    """The stored components a ``render_all`` request covers, in scheduling order."""
+    requested = [str(c) for c in (request.get("component_ids") or [])]
+    by_id = {str(m.get("index")): m for m in scope.stored_metadata if m.get("index")}
+    if requested:
+        return [by_id[cid] for cid in requested if cid in by_id]
+    return sorted(
+        by_id.values(),
+        key=lambda m: _RENDER_ALL_COST_ORDER.get(m.get("component_type"), 99),
+    )
+
+
+def _authorize_render_round(scope: _DashboardRenderScope, request: dict) -> None:
+    """Check once per DC that the caller may read it, before any job is queued."""
+    for m in _render_all_components(scope, request):
+        if m.get("component_type") in ("figure", "table", "advanced_viz") and m.get("dc_id"):
+            scope.dc_access_error(str(m["dc_id"]))
+
+
+def _plan_render_round(scope: _DashboardRenderScope, request: dict) -> None:
+    """Plan and run the round's fusable reductions before any component starts.
+
+    Everything the components would each ask of the same filtered table is
+    registered on ``scope.planner`` and evaluated together, one scan per DC and
+    filter state, so the components that follow read their answers instead of
+    each scanning that table again:
+
+    * card aggregations (``("card_pushdown", key)``);
+    * the row count (``("row_count", dc_id)``) tables and the advanced-viz
+      sampling probe need, which an inline point figure's "N of M" badge then
+      reads too;
+    * the first pass of each inline aggregated figure (``("figure", cid)``,
+      see ``aggregate.first_pass``). Figures rendered on Celery, code-mode and
+      Load-All figures, and figures the result cache already holds are left
+      alone — they either cannot take a frame from here or never scan.
+
+    Best effort: anything that fails here is simply computed again by its
+    component.
+    """
+    import polars as pl
+
+    try:
+        components = _render_all_components(scope, request)
+        cards = [m for m in components if m.get("component_type") == "card"]
+        if cards:
+            cards_by_key, needed_cols_by_key = _card_groups(scope, cards)
+            has_filters = bool(_build_filter_metadata(scope.filters))
+            _plan_card_pushdowns(
+                scope,
+                cards_by_key,
+                needed_cols_by_key,
+                [key for key in cards_by_key if has_filters or key[3]],
+            )
+
+        from depictio.api.cache import get_cache
+        from depictio.api.v1.services.figure.aggregate import first_pass, plan_aggregation
+        from depictio.api.v1.services.figure.result_cache import (
+            figure_cache_key,
+            get_figure_result,
+        )
+
+        cache = get_cache()
+        theme = request.get("theme") or "light"
+        full_load_ids = {str(c) for c in (request.get("full_load") or [])}
+        viz_requests = request.get("advanced_viz") or {}
+        for m in components:
+            ctype = m.get("component_type")
+            if ctype not in ("table", "advanced_viz", "figure"):
+                continue
+            if not (m.get("wf_id") and m.get("dc_id")):
+                continue
+            cid = str(m.get("index"))
+            dc_id = str(m["dc_id"])
+            if scope.dc_access_error(dc_id) is not None:
+                continue
+            filter_metadata = scope.filter_metadata(dc_id)
+            init_data = scope.init_data(dc_id, m.get("dc_config") or {})
+
+            if ctype == "figure":
+                if (
+                    cid in full_load_ids
+                    or m.get("mode", "ui") == "code"
+                    or _figure_should_offload(m)
+                ):
+                    continue
+                plan = plan_aggregation(m.get("visu_type", "scatter"), m.get("dict_kwargs") or {})
+                if plan is None:
+                    continue
+                payload = _figure_task_payload(
+                    m, filter_metadata, theme, False, init_data=init_data
+                )
+                result_cache_key = figure_cache_key(payload)
+                if result_cache_key and get_figure_result(result_cache_key)[0] is not None:
+                    continue
+                scope.planner.add(
+                    ("figure", cid),
+                    ObjectId(str(m["wf_id"])),
+                    dc_id,
+                    lambda scan, plan=plan: first_pass(scan, plan),
+                    columns=set(plan.needed_columns),
+                    metadata=filter_metadata or None,
+                    init_data=init_data,
+                )
+                continue
+
+            if ctype == "advanced_viz":
+                # Only the sampling path probes the count, and it only runs for
+                # a spec ``render_all`` can serve, with no explicit row cap.
+                spec = viz_requests.get(cid) or {}
+                if (
+                    not spec.get("columns")
+                    or spec.get("limit_rows") is not None
+                    or spec.get("full_load")
+                ):
+                    continue
+            # Scrolling re-requests never reach here, but a repeated filter state
+            # does: skip counts the row-count cache can already answer.
+            if cache.get(_row_count_cache_key(dc_id, filter_metadata, init_data)) is not None:
+                continue
+            scope.planner.add(
+                ("row_count", dc_id),
+                ObjectId(str(m["wf_id"])),
+                dc_id,
+                lambda scan: scan.select(pl.len()),
+                columns=set(),
+                metadata=filter_metadata or None,
+                init_data=init_data,
+            )
+        scope.planner.run()
+    except Exception as e:
+        logger.warning(f"render_all: fused planning skipped: {e}")
+
+
+def _render_all_jobs(
+    scope: _DashboardRenderScope,
+    request: dict,
+) -> list[tuple[str, str, Any]]:
+    """``[(component_id, component_type, run)]`` for one ``render_all`` request.
+
+    ``run`` is a zero-argument coroutine function producing the component's
+    payload — the same body its per-component endpoint returns. Cards collapse
+    into a single job (``_compute_cards`` already dedupes their loads), keyed
+    ``"cards"``; component types ``render_all`` can't serve get ``run=None`` and
+    are reported as unsupported so the client falls back to their endpoints.
+    A component whose DC the caller may not read gets the 404 its own endpoint
+    would answer (``_authorize_render_round`` has checked each DC already).
+    """
+    from depictio.api.v1.services.figure.result_cache import figure_cache_key, get_figure_result
+
+    theme = request.get("theme") or "light"
+    full_load_ids = {str(c) for c in (request.get("full_load") or [])}
+    table_requests = request.get("tables") or {}
+    viz_requests = request.get("advanced_viz") or {}
+    components = _render_all_components(scope, request)
+
+    jobs: list[tuple[str, str, Any]] = []
+    card_ids = [str(m["index"]) for m in components if m.get("component_type") == "card"]
+    if card_ids:
+
+        async def _cards() -> dict:
+            return await run_in_threadpool(_compute_cards, scope, card_ids)
+
+        jobs.append(("cards", "card", _cards))
+
+    for component in components:
+        cid = str(component.get("index"))
+        ctype = component.get("component_type")
+        if ctype == "card":
+            continue
+        dc_id = component.get("dc_id")
+        if (
+            ctype not in ("figure", "table", "advanced_viz")
+            or not component.get("wf_id")
+            or not dc_id
+        ):
+            jobs.append((cid, str(ctype), None))
+            continue
+        dc_id = str(dc_id)
+        dc_config = component.get("dc_config") or {}
+
+        denied = scope.dc_access_error(dc_id)
+        if denied is not None:
+
+            async def _denied(status_code=denied.status_code, detail=denied.detail):
+                raise HTTPException(status_code=status_code, detail=detail)
+
+            jobs.append((cid, ctype, _denied))
+            continue
+
+        if ctype == "figure":
+
+            async def _figure(component=component, cid=cid, dc_id=dc_id, dc_config=dc_config):
+                filter_metadata = await run_in_threadpool(scope.filter_metadata, dc_id)
+                init_data = await run_in_threadpool(scope.init_data, dc_id, dc_config)
+                payload = _figure_task_payload(
+                    component, filter_metadata, theme, cid in full_load_ids, init_data=init_data
+                )
+                result_cache_key = await run_in_threadpool(figure_cache_key, payload)
+                if result_cache_key:
+                    cached, _tier = await run_in_threadpool(get_figure_result, result_cache_key)
+                    if cached is not None:
+                        return cached
+                    payload["result_cache_key"] = result_cache_key
+                offload = _figure_should_offload(component)
+                # An inline render starts from what ``_plan_render_round`` fused;
+                # a Celery one can't be handed frames and scans for itself.
+                planned = None
+                if not offload:
+                    planned = {
+                        "first_pass": scope.planner.result(("figure", cid)),
+                        "row_count": _planned_row_count(scope.planner, dc_id),
+                    }
+                return await offload_or_run(
+                    build_figure_preview_task,
+                    (payload,) if planned is None else (payload, planned),
+                    offload=offload,
+                    label=f"render_all figure cid={cid} dc={dc_id}",
+                    cost_class=figure_cost_class(component, cid in full_load_ids),
+                )
+
+            jobs.append((cid, ctype, _figure))
+
+        elif ctype == "table":
+            page_request = table_requests.get(cid) or {}
+
+            def _table(component=component, dc_id=dc_id, dc_config=dc_config, page=page_request):
+                body, _timings = _render_table_page(
+                    component,
+                    scope.filter_metadata(dc_id),
+                    scope.init_data(dc_id, dc_config),
+                    page,
+                    count_fn=_planned_row_counter(scope.planner, dc_id),
+                )
+                return body
+
+            async def _table_job(fn=_table):
+                return await run_in_threadpool(fn)
+
+            jobs.append((cid, ctype, _table_job))
+
+        else:
+            # The advanced-viz column projection is decided by the renderer, not
+            # stored with the component, so it can only be served when the
+            # client sends it.
+            spec = viz_requests.get(cid)
+            if not spec or not spec.get("columns"):
+                jobs.append((cid, ctype, None))
+                continue
+
+            def _viz(component=component, dc_id=dc_id, dc_config=dc_config, spec=spec):
+                from depictio.api.v1.endpoints.advanced_viz_endpoints.routes import (
+                    advanced_viz_rows,
+                )
+
+                init_data = scope.init_data(dc_id, dc_config)
+                if not init_data:
+                    raise HTTPException(
+                        status_code=404,
+                        detail="Data collection has no materialised Delta table yet.",
+                    )
+                payload = {**spec, "wf_id": str(component.get("wf_id")), "dc_id": dc_id}
+                filter_metadata = scope.filter_metadata(dc_id)
+                result, _headers = advanced_viz_rows(
+                    payload,
+                    filter_metadata,
+                    init_data,
+                    row_count=_known_row_count(scope.planner, dc_id, filter_metadata, init_data),
+                )
+                return result
+
+            async def _viz_job(fn=_viz):
+                return await run_in_threadpool(fn)
+
+            jobs.append((cid, ctype, _viz_job))
+
+    return jobs
+
+
+async def _render_all_frames(jobs: list[tuple[str, str, Any]], concurrency: int):
+    """Run ``jobs`` with at most ``concurrency`` in flight; yield NDJSON lines.
+
+    Lines come out in completion order, not job order — that is the point:
+    a slow table must not hold back the figures that finished before it. The
+    semaphore is FIFO, so jobs still *start* in the order they were given.
+    A failing component becomes an ``error`` frame; it never ends the stream.
+    """
+    import asyncio
+    import time as _time
+
+    from depictio.api.v1.json_response import custom_jsonable_encoder
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(cid: str, ctype: str, run: Any) -> dict:
+        frame: dict[str, Any] = {"component_id": cid, "component_type": ctype}
+        if run is None:
+            frame["status"] = "unsupported"
+            return frame
+        async with semaphore:
+            t0 = _time.perf_counter()
+            try:
+                frame["data"] = await run()
+                frame["status"] = "ok"
+            except HTTPException as e:
+                frame.update(status="error", status_code=e.status_code, detail=e.detail)
+            except Exception as e:
+                logger.error(f"render_all: {ctype} {cid} failed: {e}", exc_info=True)
+                frame.update(status="error", status_code=500, detail=str(e))
+            frame["total_ms"] = round((_time.perf_counter() - t0) * 1000, 1)
+        return frame
+
+    def _line(frame: dict) -> str:
+        data = frame.get("data")
+        if isinstance(data, dict) and "figure_json" in data:
+            # A pre-encoded figure is spliced in as text rather than parsed
+            # back into Python just to be encoded again.
+            from depictio.api.v1.services.figure.encoding import figure_response_bytes
+
+            head = json.dumps(
+                custom_jsonable_encoder({k: v for k, v in frame.items() if k != "data"}),
+                separators=(",", ":"),
+            )
+            return f'{head[:-1]},"data":{figure_response_bytes(data).decode()}}}\n'
+        return json.dumps(custom_jsonable_encoder(frame), separators=(",", ":")) + "\n"
+
+    tasks = [asyncio.ensure_future(_run(*job)) for job in jobs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield _line(await next_done)
+    finally:
+        # Client went away mid-stream: don't keep rendering for nobody.
+        for task in tasks:
+            task.cancel()
+
+
+@dashboards_endpoint_router.post("/render_all/{dashboard_id}")
+async def render_all_endpoint(
+    dashboard_id: PyObjectId,
+    request: dict,
+    current_user: User = Depends(get_user_or_anonymous),
+    access_token: Annotated[str | None, Depends(oauth2_scheme_optional)] = None,
+):
+    """Render every data component of a dashboard in one streamed response.
+
+    The per-component endpoints each redo the same setup — dashboard lookup,
+    permission check, link resolution and Delta location lookup for their DC —
+    so a dashboard of N components pays it N times per filter change, over N
+    HTTP round-trips. Here the setup runs once per *data collection*
+    (``_DashboardRenderScope``) and the components stream back as
+    newline-delimited JSON as soon as each one is ready. Before any component
+    starts, the reductions they would each run against the same filtered table
+    (card aggregations, row counts, figures' first aggregation pass) are fused
+    into one scan per DC (``_plan_render_round``).
+
+    Request body:
+        {"filters": [...], "theme": "light" | "dark",
+         "component_ids": [...],                  # optional; order is kept
+         "full_load": ["<figure id>", ...],       # optional
+         "tables": {"<id>": {"start", "limit", "sort_by", "sort_dir"}},
+         "advanced_viz": {"<id>": {"columns", "viz_kind", "roles", "tail",
+                                   "limit_rows", "full_load"}}}
+
+    Response (``application/x-ndjson``), one line per component:
+        {"component_id", "component_type", "status": "ok", "data", "total_ms"}
+        {..., "status": "error", "status_code", "detail"}
+        {..., "status": "unsupported"}
+
+    ``data`` is exactly what the component's own endpoint returns; all cards
+    arrive together in one ``bulk_compute_cards`` body under
+    ``component_id="cards"``. Unsupported components (images, maps, MultiQC,
+    advanced-viz without a column spec, ...) should be fetched from their own
+    endpoints as before.
+    """
+    from fastapi.responses import StreamingResponse
+
+    filters = request.get("filters") or []
+    scope = await run_in_threadpool(
+        _DashboardRenderScope.open, dashboard_id, filters, current_user, access_token
+    )
+    await run_in_threadpool(_authorize_render_round, scope, request)
+    jobs = _render_all_jobs(scope, request)
+    await run_in_threadpool(_plan_render_round, scope, request)
+    return StreamingResponse(
+        _render_all_frames(jobs, settings.performance.render_all_concurrency),
+        media_type="application/x-ndjson",
+        # Stop proxies (nginx) from buffering the stream into one late blob.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @dashboards_endpoint_router.post("/render_image_paths/{dashboard_id}/{component_id}")
@@ -4979,6 +5738,9 @@ def _import_multi_tab_dashboard(
 
         imported_tabs.append({"title": tab_lite.title, "dashboard_id": str(tab_dashboard_id)})
 
+    # Re-indexes the main dashboard and every tab, dropped tabs included
+    refresh_dashboard_index(main_dashboard_id)
+
     action = "Updated" if is_update else "Imported"
     logger.info(
         f"{action} multi-tab dashboard: {main_dashboard.title} (ID: {main_dashboard_id}) "
@@ -5200,6 +5962,8 @@ async def import_dashboard_from_yaml(
         if not result.inserted_id:
             raise HTTPException(status_code=500, detail="Failed to import dashboard.")
 
+    refresh_dashboard_index(new_dashboard_id)
+
     action = "Updated" if is_update else "Imported"
     logger.info(
         f"{action} dashboard from YAML: {dashboard.title} (ID: {new_dashboard_id}) "
@@ -5849,6 +6613,7 @@ async def import_dashboard_from_json(
     try:
         dashboards_collection.insert_one(new_dashboard)
         logger.info(f"Imported dashboard: {new_dashboard['title']} (ID: {new_dashboard_id})")
+        refresh_dashboard_index(new_dashboard_id)
     except Exception as e:
         logger.error(f"Failed to import dashboard: {e}")
         raise HTTPException(status_code=500, detail="Failed to import dashboard")
@@ -1,7 +1,7 @@
 import asyncio
 
 from bson import ObjectId
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
 
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
@@ -259,6 +259,7 @@ async def delete_data_collection_by_id(
 @datacollections_endpoint_router.post("/{data_collection_id}/append")
 async def append_table_dc(
     data_collection_id: str,
+    background_tasks: BackgroundTasks,
     files: list[UploadFile] = File(...),
     current_user=Depends(get_current_user),
 ):
@@ -270,41 +271,48 @@ async def append_table_dc(
     """
     from depictio.api.v1.endpoints.datacollections_endpoints.table_manage import (
         append_table_uploads,
+        schedule_ingest_refreshes,
     )
     from depictio.api.v1.endpoints.multiqc_endpoints.routes import (
         _read_multiqc_uploads_with_caps,
     )
 
     decoded_files = await _read_multiqc_uploads_with_caps(files)
-    return await asyncio.to_thread(
+    result = await asyncio.to_thread(
         append_table_uploads,
         data_collection_id=data_collection_id,
         decoded_files=decoded_files,
         current_user=current_user,
     )
+    schedule_ingest_refreshes(background_tasks, data_collection_id)
+    return result
 
 
 @datacollections_endpoint_router.post("/{data_collection_id}/replace")
 async def replace_table_dc(
     data_collection_id: str,
+    background_tasks: BackgroundTasks,
     files: list[UploadFile] = File(...),
     current_user=Depends(get_current_user),
 ):
     """Replace all rows of a Table DC with the uploaded files."""
     from depictio.api.v1.endpoints.datacollections_endpoints.table_manage import (
         replace_table_uploads,
+        schedule_ingest_refreshes,
     )
     from depictio.api.v1.endpoints.multiqc_endpoints.routes import (
         _read_multiqc_uploads_with_caps,
     )
 
     decoded_files = await _read_multiqc_uploads_with_caps(files)
-    return await asyncio.to_thread(
+    result = await asyncio.to_thread(
         replace_table_uploads,
         data_collection_id=data_collection_id,
         decoded_files=decoded_files,
         current_user=current_user,
     )
+    schedule_ingest_refreshes(background_tasks, data_collection_id)
+    return result
 
 
 @datacollections_endpoint_router.delete("/{data_collection_id}/data")
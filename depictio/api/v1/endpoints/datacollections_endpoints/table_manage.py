@@ -18,7 +18,7 @@ from typing import Any
 
 import polars as pl
 from bson import ObjectId
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
@@ -26,7 +26,11 @@ from depictio.api.v1.db import deltatables_collection, projects_collection, user
 from depictio.api.v1.endpoints.datacollections_endpoints.utils import _user_can_edit_project
 from depictio.api.v1.s3 import polars_s3_config, s3_client
 from depictio.models.models.base import PyObjectId
-from depictio.models.models.deltatables import Aggregation, DeltaTableAggregated
+from depictio.models.models.deltatables import (
+    SOURCE_HASH_COLUMN,
+    Aggregation,
+    DeltaTableAggregated,
+)
 from depictio.models.models.users import User
 
 _MAX_PER_FILE_BYTES = 50 * 1024 * 1024
@@ -34,7 +38,7 @@ _MAX_TOTAL_BYTES = 500 * 1024 * 1024
 
 # Columns the CLI aggregator adds — strip from existing-delta reads so they
 # don't get duplicated when we re-aggregate and re-add them on write.
-_CLI_AUGMENTED_COLUMNS = {"aggregation_time", "depictio_run_id"}
+_CLI_AUGMENTED_COLUMNS = {"aggregation_time", "depictio_run_id", SOURCE_HASH_COLUMN}
 
 
 def _delta_location_for(dc_id: str) -> str:
@@ -454,6 +458,27 @@ def _write_table_upload(
     }
 
 
+def schedule_ingest_refreshes(background_tasks: BackgroundTasks, data_collection_id: str) -> None:
+    """Queue the per-version sidecars of a fresh upload, as the upsert path does.
+
+    Translation indexes, the column catalog and the sample tiers each re-read
+    the table; run inline they would hold the upload response for three more
+    passes over data the client has just sent. Until they land, readers fall
+    back to scanning.
+    """
+    from depictio.api.v1.endpoints.links_endpoints.translation_index import (
+        refresh_translation_indexes,
+    )
+    from depictio.api.v1.services.column_stats import refresh_column_stats
+    from depictio.api.v1.services.sample_tiers import refresh_sample_tiers
+
+    background_tasks.add_task(refresh_translation_indexes, data_collection_id)
+    # This path records no aggregation specs, so the catalog is what lets the
+    # /specs endpoint and the cards answer without scanning.
+    background_tasks.add_task(refresh_column_stats, data_collection_id)
+    background_tasks.add_task(refresh_sample_tiers, data_collection_id)
+
+
 def append_table_uploads(
     *,
     data_collection_id: str,
@@ -8,12 +8,13 @@ upsert, fetch, batch existence checks, and shape queries.
 import hashlib
 import math
 from datetime import datetime
+from typing import Annotated
 
 import boto3
 import polars as pl
 from botocore.exceptions import ClientError
 from bson import ObjectId
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
 
 from depictio.api.v1.celery_dispatch import offload_or_run
 from depictio.api.v1.celery_tasks import preview_deltatable as preview_deltatable_task
@@ -21,15 +22,21 @@ from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
 from depictio.api.v1.db import deltatables_collection, projects_collection, users_collection
 from depictio.api.v1.endpoints.deltatables_endpoints.utils import precompute_columns_specs
-from depictio.api.v1.endpoints.user_endpoints.routes import get_current_user, get_user_or_anonymous
+from depictio.api.v1.endpoints.user_endpoints.routes import (
+    get_current_user,
+    get_user_or_anonymous,
+    oauth2_scheme_optional,
+)
 from depictio.api.v1.s3 import polars_s3_config
-from depictio.api.v1.services.card_breakdown import compute_breakdown
+from depictio.api.v1.services.card_breakdown import breakdown_from_stats, compute_breakdown
 from depictio.api.v1.services.card_metrics import NUMERIC_LAYOUTS, numeric_layout_payload
 from depictio.api.v1.utils import agg_functions
+from depictio.models.column_stats import value_string
 from depictio.models.models.base import PyObjectId, convert_objectid_to_str
 from depictio.models.models.deltatables import (
     Aggregation,
     DeltaTableAggregated,
+    FacetsRequest,
     UpsertDeltaTableAggregated,
 )
 from depictio.models.models.users import User
@@ -97,6 +104,7 @@ def sanitize_for_json(obj):
 @deltatables_endpoint_router.post("/upsert")
 async def upsert_deltatable(
     payload: UpsertDeltaTableAggregated,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -265,6 +273,25 @@ async def upsert_deltatable(
             )
         deltatables_collection.insert_one(deltatable.mongo())
 
+    if payload.ingest is not None and not is_multiqc:
+        # Kept for the realtime journal: an incremental ingest reports what it
+        # appended and deleted, which says more than the new total does.
+        deltatables_collection.update_one(
+            {"data_collection_id": data_collection_oid, "flexible_metadata": None},
+            {"$set": {"flexible_metadata": {}}},
+        )
+        deltatables_collection.update_one(
+            {"data_collection_id": data_collection_oid},
+            {
+                "$set": {
+                    "flexible_metadata.last_ingest": {
+                        **payload.ingest.model_dump(),
+                        "aggregation_version": version,
+                    }
+                }
+            },
+        )
+
     # The CLI just rewrote the delta — drop every cached DataFrame for this DC
     # so subsequent ``render_*`` calls see fresh rows. Without this the in-process
     # memory cache + Redis cache continue to serve the pre-rewrite DataFrame even
@@ -302,6 +329,22 @@ async def upsert_deltatable(
                 },
             )
 
+    # Rebuild the link translation index against the aggregation just recorded.
+    # It scans the table once, so it runs after the response; until it lands,
+    # lookups see a stale hash and translate by scanning.
+    if not is_multiqc:
+        from depictio.api.v1.endpoints.links_endpoints.translation_index import (
+            refresh_translation_indexes,
+        )
+        from depictio.api.v1.services.column_stats import refresh_column_stats
+        from depictio.api.v1.services.sample_tiers import refresh_sample_tiers
+
+        background_tasks.add_task(refresh_translation_indexes, str(data_collection_oid))
+        # The CLI has normally written the column catalog already; this only
+        # registers it (or builds it, for older clients).
+        background_tasks.add_task(refresh_column_stats, str(data_collection_oid))
+        background_tasks.add_task(refresh_sample_tiers, str(data_collection_oid))
+
     # Broadcast a real-time event so connected dashboards refresh. The change
     # stream watcher only watches data_collections, not the deltatables
     # collection, so an upsert would otherwise complete silently. Mirrors the
@@ -318,6 +361,7 @@ async def _broadcast_dc_update(dc_id: str) -> None:
     from depictio.api.v1.deltatables_utils import invalidate_data_collection_cache
     from depictio.api.v1.endpoints.events_endpoints.routes import _build_event_payload
     from depictio.api.v1.services.events import connection_manager
+    from depictio.api.v1.services.events.dashboard_index import dashboards_for_dc
     from depictio.models.models.realtime import EventMessage, EventSourceType, EventType
 
     dropped = invalidate_data_collection_cache(dc_id)
@@ -338,7 +382,12 @@ async def _broadcast_dc_update(dc_id: str) -> None:
         payload=payload,
     )
 
+    # Only the subscribed dashboards that display this DC, per the reverse
+    # index; everything subscribed if the index cannot be read.
     subscribed = connection_manager.get_all_subscribed_dashboards()
+    affected = dashboards_for_dc(dc_id)
+    if affected is not None:
+        subscribed &= set(affected)
     for dashboard_id in subscribed:
         event_copy = event.model_copy(update={"dashboard_id": dashboard_id})
         await connection_manager.broadcast_to_dashboard(dashboard_id, event_copy)
@@ -527,7 +576,35 @@ async def specs(
             detail=f"No aggregation data found for data collection {data_collection_id}",
         )
 
-    return convert_objectid_to_str(aggregation[-1]["aggregation_columns_specs"])
+    column_specs = aggregation[-1].get("aggregation_columns_specs") or []
+    if not column_specs:
+        # Table DCs uploaded through the API record no specs; the ingest-time
+        # column catalog describes the same data.
+        column_specs = _specs_from_catalog(str(data_collection_id), deltatable_cursor[0])
+    return convert_objectid_to_str(column_specs)
+
+
+def _specs_from_catalog(dc_id: str, deltatable_doc: dict) -> list[dict]:
+    """``aggregation_columns_specs``-shaped entries synthesised from the column catalog."""
+    from depictio.api.v1.services.column_stats import (
+        catalog_specs,
+        catalog_type_name,
+        column_catalog,
+    )
+
+    catalog = column_catalog(dc_id, deltatable_doc)
+    if not catalog:
+        return []
+    values = catalog_specs(catalog)
+    return [
+        {
+            "name": column,
+            "type": catalog_type_name(stats["dtype"]),
+            "description": None,
+            "specs": values[column],
+        }
+        for column, stats in catalog.items()
+    ]
 
 
 @deltatables_endpoint_router.get("/unique_values/{data_collection_id}")
@@ -593,10 +670,12 @@ async def get_unique_values(
         {"workflows.data_collections._id": 1, "workflows.data_collections.config.type": 1},
     )
     dc_doc: dict = {}
+    wf_id = None
     for _wf in (dc_cfg or {}).get("workflows", []):
         for _dc in _wf.get("data_collections", []):
             if str(_dc.get("_id")) == str(data_collection_id):
                 dc_doc = _dc
+                wf_id = _wf.get("_id")
                 break
         if dc_doc:
             break
@@ -645,9 +724,20 @@ async def get_unique_values(
     from depictio.api.v1.deltatables_utils import _get_aggregation_version
 
     dc_id_str = str(data_collection_id)
+
+    # Unfiltered option lists of low-cardinality columns were counted at ingest.
+    if not filter_expr:
+        from depictio.api.v1.services.column_stats import catalog_unique_values, column_catalog
+
+        catalog = column_catalog(dc_id_str, deltatables_list[-1]) or {}
+        values_str = catalog_unique_values(catalog.get(column), limit)
+        if values_str is not None:
+            return {"column": column, "values": values_str}
+
+    aggregation_version = _get_aggregation_version(dc_id_str)
     cache_key = (
         f"unique_values_{dc_id_str}_{column}_{limit}_"
-        f"{filter_expr or 'nofilter'}_{_get_aggregation_version(dc_id_str)}"
+        f"{filter_expr or 'nofilter'}_{aggregation_version}"
     )
     try:
         from depictio.api.cache import get_cache
@@ -660,8 +750,7 @@ async def get_unique_values(
         logger.debug(f"unique_values: cache read failed for {cache_key}: {exc}")
 
     try:
-        lazy = pl.scan_delta(delta_table_location, storage_options=polars_s3_config)
-
+        expr = None
         if filter_expr:
             from depictio.models.components.filter_expr import (
                 build_filter_expr,
@@ -676,19 +765,50 @@ async def get_unique_values(
                     status_code=400,
                     detail=f"Invalid filter_expr: {exc}",
                 )
-            lazy = lazy.filter(expr)
 
-        try:
-            df = lazy.select(column).unique().limit(limit).collect()
-        except pl.exceptions.ColumnNotFoundError:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Column '{column}' not found in data collection {data_collection_id}.",
-            )
+        def _values(scan: pl.LazyFrame) -> pl.LazyFrame:
+            if expr is not None:
+                scan = scan.filter(expr)
+            return scan.select(column).unique().limit(limit)
+
+        # Read through the same planner as the dashboard round: the scan is the
+        # version-keyed shared one (no Delta log re-read per MultiSelect mount)
+        # and projected to the column. ``filter_expr`` may name any column, so
+        # a filtered list leaves the projection to Polars.
+        from depictio.api.v1.deltatables_utils import ScanPlanner
+
+        planner = ScanPlanner()
+        planner.add(
+            "values",
+            wf_id or "",
+            dc_id_str,
+            _values,
+            columns=None if expr is not None else {column},
+            init_data={
+                dc_id_str: {
+                    "delta_location": delta_table_location,
+                    "dc_type": dc_doc.get("config", {}).get("type") or "table",
+                    "aggregation_version": aggregation_version,
+                }
+            },
+        )
+        planner.run()
+        df = planner.result("values")
+        if df is None:
+            # Unplannable (unreadable scan, unknown column): read it directly,
+            # which also reports a missing column as such.
+            try:
+                lazy = pl.scan_delta(delta_table_location, storage_options=polars_s3_config)
+                df = _values(lazy).collect()
+            except pl.exceptions.ColumnNotFoundError:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Column '{column}' not found in data collection {data_collection_id}.",
+                )
 
         values = df[column].drop_nulls().to_list()
         # Stable ordering — MultiSelect UX expects sorted strings.
-        values_str = sorted({str(v) for v in values})
+        values_str = sorted({value_string(v) for v in values})
         try:
             from depictio.api.cache import get_cache
 
@@ -703,6 +823,93 @@ async def get_unique_values(
         raise HTTPException(status_code=500, detail=f"Failed to read unique values: {e}")
 
 
+@deltatables_endpoint_router.post("/facets")
+def get_facets(
+    request: FacetsRequest,
+    current_user: User = Depends(get_user_or_anonymous),
+    access_token: Annotated[str | None, Depends(oauth2_scheme_optional)] = None,
+):
+    """Remaining values and counts of several (DC, column) facets under a filter state.
+
+    Replaces the viewer's per-DC ``/unique_values`` fan-out for greying out
+    filter options: every facet is evaluated under all *other* active filters,
+    cross-DC filters translated through the project's links as the render
+    endpoints translate them, and all facets on one DC share one scan. With
+    ``intersect`` the values present in every non-empty facet come back too,
+    so the browser no longer needs every distinct value of every DC.
+
+    A plain ``def`` on purpose: the scans block, so FastAPI runs it on its
+    threadpool rather than on the event loop.
+
+    Args:
+        request: Project, filter state, facets, per-facet value limit.
+        current_user: Authenticated or anonymous user (permission-checked).
+        access_token: Forwarded to link resolution.
+
+    Returns:
+        ``{"facets": [{dc_id, column, available, values: [{value, count}],
+        total_values, truncated}], "intersection": {values, total_values,
+        truncated} | None}``.
+
+    Raises:
+        HTTPException: 403 without viewer access to the project, 404 if the
+        project is missing or a facet names a DC outside it.
+    """
+    from depictio.api.v1.endpoints.dashboards_endpoints.routes import check_project_permission
+    from depictio.api.v1.services.facets import (
+        FACETS_CACHE_TTL_SECONDS,
+        compute_facets,
+        facets_cache_key,
+        project_data_collections,
+    )
+
+    if not ObjectId.is_valid(request.project_id):
+        raise HTTPException(status_code=404, detail="Project not found.")
+    project = projects_collection.find_one(
+        {"_id": ObjectId(request.project_id)},
+        {
+            "workflows._id": 1,
+            "workflows.data_collections._id": 1,
+            "workflows.data_collections.config.type": 1,
+        },
+    )
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found.")
+    if not check_project_permission(project["_id"], current_user, "viewer"):
+        raise HTTPException(status_code=403, detail="Permission denied.")
+
+    data_collections = project_data_collections(project)
+    outside = sorted({f.dc_id for f in request.facets} - set(data_collections))
+    if outside:
+        raise HTTPException(
+            status_code=404, detail=f"Data collection(s) {outside} not found in project."
+        )
+
+    cache_key = facets_cache_key(request)
+    try:
+        from depictio.api.cache import get_cache
+
+        cached = get_cache().get(cache_key)
+        if cached is not None:
+            return cached
+    except Exception as exc:  # the cache is an optimisation, never a dependency
+        logger.debug(f"facets: cache read failed for {cache_key}: {exc}")
+
+    payload = compute_facets(request, data_collections, access_token)
+    try:
+        from depictio.api.cache import get_cache
+
+        get_cache().set(
+            cache_key,
+            payload,
+            ttl=FACETS_CACHE_TTL_SECONDS,
+            tags={f.dc_id for f in request.facets},
+        )
+    except Exception as exc:
+        logger.debug(f"facets: cache write failed for {cache_key}: {exc}")
+    return payload
+
+
 @deltatables_endpoint_router.get("/breakdown/{data_collection_id}")
 async def get_breakdown(
     data_collection_id: PyObjectId,
@@ -763,6 +970,18 @@ async def get_breakdown(
     from depictio.api.v1.deltatables_utils import _get_aggregation_version
 
     dc_id_str = str(data_collection_id)
+
+    # Row-count breakdowns of a dictionary column are the dictionary itself.
+    from depictio.api.v1.services.column_stats import column_catalog
+
+    catalog = column_catalog(dc_id_str, deltatables_list[-1]) or {}
+    if column in catalog:
+        payload = breakdown_from_stats(
+            catalog.get(breakdown_col), column, breakdown_col, aggregation, top_n_count
+        )
+        if payload is not None:
+            return payload
+
     cache_key = (
         f"breakdown_{dc_id_str}_{column}_{breakdown_col}_{aggregation}_{top_n_count}_"
         f"{_get_aggregation_version(dc_id_str)}"
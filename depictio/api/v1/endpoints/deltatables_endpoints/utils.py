@@ -12,6 +12,7 @@ from depictio.api.v1.configs.logging_init import logger
 from depictio.api.v1.db import files_collection
 from depictio.api.v1.s3 import s3_client
 from depictio.api.v1.utils import numpy_to_python
+from depictio.models.models.deltatables import HIDDEN_COLUMNS
 
 
 def get_s3_folder_size(bucket_name, prefix):
@@ -324,7 +325,9 @@ def precompute_columns_specs(
     dashboard component was built against. Columns never seen before get the
     true polars type.
     """
-    lf = aggregated_df.lazy()
+    # Bookkeeping columns (the CLI's source hash, ...) are not data: no spec,
+    # so no card, filter or column picker ever offers them.
+    lf = aggregated_df.lazy().drop(HIDDEN_COLUMNS, strict=False)
     schema = lf.collect_schema()
     dc_config = dc_data["config"]
     columns_description = dc_config["dc_specific_properties"].get("columns_description") or {}
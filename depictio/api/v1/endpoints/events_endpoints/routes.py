@@ -321,6 +321,13 @@ def _build_event_payload(dc_id: str, operation: str = "update") -> dict[str, Any
             fm = dt.get("flexible_metadata") or {}
             if isinstance(fm, dict) and fm.get("deltatable_size_bytes") is not None:
                 payload["delta_size_bytes"] = fm.get("deltatable_size_bytes")
+            last_ingest = fm.get("last_ingest") if isinstance(fm, dict) else None
+            if last_ingest and last_ingest.get("aggregation_version") == payload.get(
+                "aggregation_version"
+            ):
+                payload["ingest"] = {
+                    k: v for k, v in last_ingest.items() if k != "aggregation_version"
+                }
             delta_location = dt.get("delta_table_location")
     except Exception as e:
         logger.debug(f"_build_event_payload: deltatable lookup failed: {e}")
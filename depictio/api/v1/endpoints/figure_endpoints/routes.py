@@ -17,7 +17,7 @@ import logging
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Response
 
-from depictio.api.v1.celery_dispatch import offload_or_run
+from depictio.api.v1.celery_dispatch import figure_cost_class, offload_or_run
 from depictio.api.v1.celery_tasks import (
     analyze_figure_code as analyze_figure_code_task,
 )
@@ -26,6 +26,7 @@ from depictio.api.v1.celery_tasks import (
 )
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.endpoints.user_endpoints.routes import get_user_or_anonymous
+from depictio.api.v1.services.figure.encoding import figure_response_bytes
 from depictio.models.models.users import User
 
 logger = logging.getLogger(__name__)
@@ -151,17 +152,24 @@ async def preview_figure(
 
     payload = {"metadata": metadata, "filter_metadata": filter_metadata, "theme": theme}
     try:
-        return await offload_or_run(
+        result = await offload_or_run(
             build_figure_preview_task,
             (payload,),
             offload=offload,
             label=f"figure_preview wf={wf_id} dc={dc_id}",
+            cost_class=figure_cost_class(metadata),
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"figure/preview: build failed: {e}", exc_info=True)
         raise HTTPException(status_code=422, detail=f"Figure build failed: {e}")
+    # The task returns the figure already serialised; send it as-is.
+    return Response(
+        content=figure_response_bytes(result or {}),
+        media_type="application/json",
+        headers={"X-Celery-Path": response.headers["X-Celery-Path"]},
+    )
 
 
 @figure_endpoint_router.post("/analyze_code")
@@ -186,4 +194,5 @@ async def analyze_code(
         (code,),
         offload=offload,
         label="figure_analyze_code",
+        cost_class="code",
     )
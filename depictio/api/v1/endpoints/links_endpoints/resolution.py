@@ -0,0 +1,502 @@
+"""In-process link resolution: the library behind ``POST /links/{project}/resolve``.
+
+The render endpoints used to resolve a cross-DC filter by POSTing to their own
+API — one HTTP hop and a re-authentication per link, answered by an
+``async def`` endpoint that ran a blocking Delta scan on the event loop. The
+work now lives here as plain synchronous functions:
+
+* ``filter_links.resolve_link_values`` calls ``resolve_link`` directly, on a
+  bounded thread pool, and shares its results across workers through Redis.
+* The HTTP endpoint is a thin wrapper that checks project access and hands the
+  same call to the threadpool, so the CLI and external callers see no change.
+
+``resolve_link_chain`` adds the multi-hop case: when two or more hops of a path
+have to translate values through their source DC, the whole path is planned as
+one lazy query — each translating hop a semi-join against the previous hop's
+distinct keys — and collected once, instead of materialising every
+intermediate value list into Python and sending it back in as an ``is_in``.
+
+Authorisation is the caller's: the endpoint checks project access before it
+calls in, and the render paths have already authorised the dashboard.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import polars as pl
+from bson import ObjectId
+from fastapi import HTTPException
+
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.db import deltatables_collection, multiqc_collection, projects_collection
+from depictio.api.v1.endpoints.links_endpoints import translation_index
+from depictio.api.v1.endpoints.links_endpoints.resolvers import get_resolver
+from depictio.models.models.links import (
+    DCLink,
+    LinkConfig,
+    LinkResolutionRequest,
+    LinkResolutionResponse,
+)
+
+# Column the fused chain plan carries between hops: the distinct join keys,
+# always as strings (``DirectResolver`` stringifies, so the hop-by-hop path
+# compares strings too).
+_KEY = "__link_key"
+
+
+def _deltatable_doc(dc_id: str) -> dict | None:
+    # Try both string and ObjectId formats for compatibility
+    doc = deltatables_collection.find_one({"data_collection_id": dc_id})
+    if not doc and ObjectId.is_valid(dc_id):
+        doc = deltatables_collection.find_one({"data_collection_id": ObjectId(dc_id)})
+    return doc
+
+
+def _scan_location(delta_table_location: str) -> pl.LazyFrame:
+    from depictio.api.v1.s3 import polars_s3_config
+
+    return pl.scan_delta(delta_table_location, storage_options=polars_s3_config)
+
+
+def _scan_dc(dc_id: str) -> pl.LazyFrame:
+    doc = _deltatable_doc(dc_id)
+    if not doc or "delta_table_location" not in doc:
+        raise LookupError(f"Delta table not found for DC {dc_id}")
+    return _scan_location(doc["delta_table_location"])
+
+
+def filter_predicate(schema: pl.Schema, filter_column: str, filter_values: list[Any]) -> pl.Expr:
+    """The row predicate a source filter translates through.
+
+    A two-element value list on a date/datetime column is a DateRangePicker
+    range; anything else is a MultiSelect/Select membership test.
+    """
+    is_date_range = (
+        isinstance(filter_values, list)
+        and len(filter_values) == 2
+        and schema[filter_column] in [pl.Date, pl.Datetime]
+    )
+
+    if is_date_range:
+        logger.info(
+            f"Detected DateRangePicker filter for column '{filter_column}' "
+            f"with range {filter_values}"
+        )
+        start_date = filter_values[0]
+        end_date = filter_values[1]
+
+        # Convert string dates to appropriate type
+        if isinstance(start_date, str):
+            start_date = pl.lit(start_date).str.strptime(pl.Datetime, "%Y-%m-%d")
+        if isinstance(end_date, str):
+            end_date = pl.lit(end_date).str.strptime(pl.Datetime, "%Y-%m-%d")
+
+        date_col = pl.col(filter_column).cast(pl.Datetime)
+        return (date_col >= start_date) & (date_col <= end_date)
+
+    return pl.col(filter_column).is_in(filter_values)
+
+
+def load_project_links(project_id: str) -> dict | None:
+    """The project document with only its links, or ``None`` if it doesn't exist."""
+    if not ObjectId.is_valid(str(project_id)):
+        return None
+    return projects_collection.find_one({"_id": ObjectId(str(project_id))}, {"links": 1})
+
+
+def find_link_for_resolution(project: dict, source_dc_id: str, target_dc_id: str) -> DCLink | None:
+    """Find a link between source and target DCs.
+
+    Args:
+        project: Project document
+        source_dc_id: Source DC ID
+        target_dc_id: Target DC ID
+
+    Returns:
+        DCLink if found and enabled, None otherwise
+    """
+    links = project.get("links", [])
+    for link_data in links:
+        # Compare as strings — MongoDB stores ObjectId but API receives strings
+        if (
+            str(link_data.get("source_dc_id")) == source_dc_id
+            and str(link_data.get("target_dc_id")) == target_dc_id
+            and link_data.get("enabled", True)
+        ):
+            return DCLink(**link_data)
+    return None
+
+
+def translate_filter_values(
+    source_dc_id: str,
+    filter_column: str,
+    filter_values: list[Any],
+    link_column: str,
+) -> list[Any]:
+    """Translate filter values from one column to another via source DC query.
+
+    When filtering by column A but the link is defined on column B, this function
+    queries the source DC to translate values from column A to column B.
+
+    Example:
+        Filter: habitat IN ["Groundwater", "Riverwater"]
+        Link: sample (habitat -> sample)
+        Query: SELECT sample FROM metadata WHERE habitat IN ["Groundwater", "Riverwater"]
+        Returns: ["SRR10070131", "SRR10070132", "SRR10070133", ...]
+
+    Args:
+        source_dc_id: Data collection ID to query
+        filter_column: Column being filtered (e.g., "habitat")
+        filter_values: Values selected in filter (e.g., ["Groundwater"])
+        link_column: Column used in link definition (e.g., "sample")
+
+    Returns:
+        List of unique values from link_column that match the filter
+
+    Raises:
+        HTTPException: If DC not found, Delta table not accessible, or columns missing
+    """
+    deltatable_doc = _deltatable_doc(source_dc_id)
+    if not deltatable_doc or "delta_table_location" not in deltatable_doc:
+        logger.error(
+            f"Delta table not found for DC {source_dc_id}. "
+            f"Document exists: {deltatable_doc is not None}, "
+            f"Has location: {deltatable_doc and 'delta_table_location' in deltatable_doc}"
+        )
+        raise HTTPException(
+            status_code=404,
+            detail=f"Delta table not found for DC {source_dc_id}",
+        )
+
+    # The ingest-time index answers most translations without touching the
+    # table; it declines (None) for anything it wasn't built to cover.
+    indexed = translation_index.lookup(deltatable_doc, filter_column, filter_values, link_column)
+    if indexed is not None:
+        logger.info(
+            f"Column translation (index): {len(filter_values)} {filter_column} values -> "
+            f"{len(indexed)} {link_column} values"
+        )
+        return indexed
+
+    delta_table_location = deltatable_doc["delta_table_location"]
+    logger.debug(f"Querying Delta table at {delta_table_location}")
+
+    try:
+        # Lazy, projected, filter pushed down. This used to be an eager
+        # ``pl.read_delta``, which materialised every column of the source DC to
+        # read two of them — on a 14M-row collection that is a multi-second load
+        # and gigabytes of RAM, paid again on every filter change. The same
+        # eager-read pattern was removed from the ingestion path in 6558e29c5;
+        # it survived here.
+        lf = _scan_location(delta_table_location)
+
+        schema = lf.collect_schema()
+        available = schema.names()
+        if filter_column not in available:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Filter column '{filter_column}' not found in source DC. "
+                f"Available: {', '.join(available)}",
+            )
+        if link_column not in available:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Link column '{link_column}' not found in source DC. "
+                f"Available: {', '.join(available)}",
+            )
+
+        predicate = filter_predicate(schema, filter_column, filter_values)
+
+        # Project to the two columns that matter BEFORE collecting, and let the
+        # engine count matched rows rather than materialising them: only the
+        # distinct link values are needed downstream.
+        result = (
+            lf.filter(predicate)
+            .select(
+                pl.col(link_column).unique().implode().alias("_values"),
+                pl.len().alias("_matched"),
+            )
+            .collect()
+        )
+        link_values = result["_values"].item().to_list() if result.height else []
+        matched_rows = int(result["_matched"].item()) if result.height else 0
+
+        logger.info(
+            f"Column translation: {len(filter_values)} {filter_column} values -> "
+            f"{len(link_values)} {link_column} values (from {matched_rows} rows)"
+        )
+
+        return link_values
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error querying source DC for column translation: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to query source DC for column translation: {str(e)}",
+        )
+
+
+def multiqc_sample_mappings(target_dc_id: str) -> dict[str, list[str]]:
+    """Fetch and aggregate sample mappings from ALL MultiQC reports for a DC.
+
+    A single MultiQC data collection can have multiple reports (e.g., from different
+    parquet files). Each report may have different samples with their own mappings.
+    This function aggregates all sample_mappings from all reports for the DC.
+
+    When no explicit ``sample_mappings`` are configured (typical for DCs that
+    haven't yet been linked to an external metadata table), we fall back to the
+    raw ``canonical_samples`` parsed out of each report and synthesize a
+    ``{sample: []}`` mapping — variants empty, but the caller (greying /
+    intersection callers) still gets the authoritative set of samples actually
+    present in the MultiQC reports.
+
+    Args:
+        target_dc_id: MultiQC data collection ID
+
+    Returns:
+        Aggregated sample mappings dict — values may be empty lists when only
+        canonical samples are known. Empty dict only when the DC has no reports.
+    """
+    try:
+        # Find ALL reports for this DC, not just the first one
+        aggregated_mappings: dict[str, list[str]] = {}
+
+        cursor = multiqc_collection.find(
+            {"data_collection_id": target_dc_id},
+            # Pull canonical_samples too so we can fall back when no explicit
+            # mapping has been configured yet.
+            {"metadata.sample_mappings": 1, "metadata.canonical_samples": 1},
+        )
+
+        report_count = 0
+        had_explicit_mappings = False
+        for report in cursor:
+            report_count += 1
+            metadata = report.get("metadata") or {}
+            mappings = metadata.get("sample_mappings") or {}
+            if mappings:
+                had_explicit_mappings = True
+                # Merge mappings - if same key exists, combine variant lists
+                for sample_id, variants in mappings.items():
+                    if sample_id in aggregated_mappings:
+                        # Add new variants, avoiding duplicates
+                        existing = set(aggregated_mappings[sample_id])
+                        for v in variants:
+                            if v not in existing:
+                                aggregated_mappings[sample_id].append(v)
+                    else:
+                        aggregated_mappings[sample_id] = list(variants)
+            else:
+                # Fall back to canonical_samples (the raw list of sample names
+                # MultiQC parsed out of this report). Treated as canonical IDs
+                # with no variants — still useful for narrowing filter options
+                # to "samples actually present in the report".
+                for sample_id in metadata.get("canonical_samples") or []:
+                    if sample_id and sample_id not in aggregated_mappings:
+                        aggregated_mappings[sample_id] = []
+
+        if aggregated_mappings:
+            logger.debug(
+                f"Aggregated {len(aggregated_mappings)} sample mappings "
+                f"from {report_count} MultiQC reports for DC {target_dc_id} "
+                f"(explicit_mappings={had_explicit_mappings})"
+            )
+        return aggregated_mappings
+
+    except Exception as e:
+        logger.warning(f"Failed to fetch MultiQC sample mappings for {target_dc_id}: {e}")
+    return {}
+
+
+def resolve_link(project: dict, request: LinkResolutionRequest) -> LinkResolutionResponse:
+    """Resolve filtered values from source DC to target DC via link.
+
+    The resolution process:
+    1. Find the link definition for source_dc -> target_dc
+    2. Translate the filter values to the link column when the filter is on
+       another column of the source DC
+    3. For MultiQC targets with sample_mapping resolver, auto-fetch mappings if not provided
+    4. Resolve source values to target identifiers with the link's resolver
+
+    Raises:
+        HTTPException: 404 if no link found between source and target DCs, 400
+            for an unknown resolver or column, 500 if the source scan fails.
+    """
+    link = find_link_for_resolution(project, request.source_dc_id, request.target_dc_id)
+
+    if link is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No enabled link found from {request.source_dc_id} to {request.target_dc_id}",
+        )
+
+    logger.info(
+        f"Resolving link {link.id}: {request.source_dc_id}:{request.source_column} "
+        f"-> {request.target_dc_id} ({link.target_type})"
+    )
+
+    # Translate filter values if filtering by different column than link column
+    values_to_resolve = request.filter_values
+    if request.source_column != link.source_column:
+        logger.info(
+            f"Filter column '{request.source_column}' differs from link column '{link.source_column}'. "
+            f"Translating filter values via source DC query."
+        )
+        values_to_resolve = translate_filter_values(
+            source_dc_id=request.source_dc_id,
+            filter_column=request.source_column,
+            filter_values=request.filter_values,
+            link_column=link.source_column,
+        )
+        logger.info(
+            f"Translated {len(request.filter_values)} {request.source_column} values "
+            f"to {len(values_to_resolve)} {link.source_column} values"
+        )
+
+    try:
+        resolver = get_resolver(link.link_config.resolver)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Prepare link config - auto-fetch sample mappings for MultiQC if needed
+    effective_config = link.link_config
+
+    if (
+        link.target_type == "multiqc"
+        and link.link_config.resolver == "sample_mapping"
+        and not link.link_config.mappings
+    ):
+        sample_mappings = multiqc_sample_mappings(link.target_dc_id)
+        if sample_mappings:
+            effective_config = LinkConfig(
+                resolver=link.link_config.resolver,
+                mappings=sample_mappings,
+                pattern=link.link_config.pattern,
+                target_field=link.link_config.target_field,
+                case_sensitive=link.link_config.case_sensitive,
+            )
+            logger.info(
+                f"Auto-fetched {len(sample_mappings)} sample mappings for MultiQC DC "
+                f"{link.target_dc_id}"
+            )
+
+    resolved_values, unmapped_values = resolver.resolve(
+        source_values=values_to_resolve,
+        link_config=effective_config,
+        target_known_values=None,  # Could be enhanced to fetch from target DC
+    )
+
+    logger.info(
+        f"Link resolution complete: {len(request.filter_values)} source values "
+        f"-> {len(resolved_values)} resolved values"
+    )
+
+    return LinkResolutionResponse(
+        resolved_values=resolved_values,
+        link_id=str(link.id),
+        resolver_used=link.link_config.resolver,
+        match_count=len(resolved_values),
+        target_type=link.target_type,
+        source_count=len(request.filter_values),
+        unmapped_values=unmapped_values,
+    )
+
+
+def _hop_columns(path: list[dict], origin_column: str) -> list[str] | None:
+    """The column each hop's incoming values are on, or ``None`` if one is unknown.
+
+    Hop 0 receives the user's filter column; every later hop receives the
+    previous link's target column (see ``filter_links._link_target_column``).
+    """
+    columns = [origin_column]
+    for link in path[:-1]:
+        target = (link.get("link_config") or {}).get("target_field") or link.get("source_column")
+        if not target:
+            return None
+        columns.append(target)
+    return columns
+
+
+def fusable_hops(path: list[dict], origin_column: str) -> tuple[list[str], list[int]] | None:
+    """``(incoming column per hop, translating hops)`` if the path can be fused.
+
+    Pure inspection of the link definitions — no I/O — so callers can rule a
+    path out before paying for cache keys or scans.
+    """
+    if len(path) < 2:
+        return None
+    if any((link.get("link_config") or {}).get("resolver", "direct") != "direct" for link in path):
+        return None
+    columns = _hop_columns(path, origin_column)
+    if columns is None:
+        return None
+    translating = [
+        hop for hop, link in enumerate(path) if columns[hop] != link.get("source_column")
+    ]
+    if len(translating) < 2:
+        return None
+    return columns, translating
+
+
+def resolve_link_chain(
+    path: list[dict],
+    origin_column: str,
+    origin_values: list,
+) -> list[str] | None:
+    """Resolve a whole link path as one lazy plan; ``None`` when it doesn't apply.
+
+    Applies to paths of ``direct`` links with at least two hops that translate
+    (an incoming column other than the link's join column). Those are the chains
+    where hop-by-hop resolution pays twice per hop — a full collect of the
+    distinct keys, then the same list shipped back as an ``is_in`` literal. Here
+    each translating hop is a semi-join of its source DC against the previous
+    hop's distinct keys, and only the last hop's keys are collected. Hops whose
+    incoming column already is the join column pass the keys through unchanged,
+    exactly as the hop-by-hop path does.
+
+    Returns the final distinct values as strings (what ``DirectResolver`` would
+    have produced), possibly empty. ``None`` means "resolve hop by hop": a
+    non-direct resolver, a single translating hop (nothing to fuse), or any
+    failure to plan — the hop-by-hop path then produces the proper error.
+    """
+    plan = fusable_hops(path, origin_column)
+    if plan is None:
+        return None
+    columns, translating = plan
+
+    try:
+        keys: pl.LazyFrame | None = None
+        if 0 not in translating:
+            keys = pl.LazyFrame({_KEY: [str(v) for v in origin_values]}, schema={_KEY: pl.String})
+        for hop, link in enumerate(path):
+            if hop not in translating:
+                continue
+            lf = _scan_dc(str(link.get("source_dc_id", "")))
+            schema = lf.collect_schema()
+            join_column = link.get("source_column")
+            if columns[hop] not in schema or join_column not in schema:
+                return None
+            if keys is None:
+                lf = lf.filter(filter_predicate(schema, columns[hop], origin_values))
+            else:
+                lf = lf.join(
+                    keys,
+                    left_on=pl.col(columns[hop]).cast(pl.String),
+                    right_on=_KEY,
+                    how="semi",
+                )
+            keys = lf.select(pl.col(join_column).cast(pl.String).alias(_KEY)).unique()
+
+        values = keys.drop_nulls().collect()[_KEY].to_list()  # type: ignore[union-attr]
+    except Exception as e:
+        logger.info(f"Fused link chain not used ({e}); resolving hop by hop")
+        return None
+
+    logger.info(
+        f"Fused link chain: {len(origin_values)} {origin_column} values -> "
+        f"{len(values)} values over {len(path)} hops ({len(translating)} scans, one collect)"
+    )
+    return values
@@ -11,6 +11,11 @@ to target DCs. Each resolver handles a specific resolution strategy:
 - WildcardResolver: Glob-style matching
 
 Resolvers are stateless and can be used concurrently.
+
+The regex and wildcard resolvers both reduce to "target values starting with a
+source prefix", answered by ``_TargetIndex``: the targets are sorted once and
+every source value becomes two binary searches, instead of a pattern tested
+against every target (O(S×T) in Python).
 """
 
 import fnmatch
@@ -18,9 +23,17 @@ import re
 from abc import ABC, abstractmethod
 from typing import Any
 
+import polars as pl
+
 from depictio.api.v1.configs.logging_init import logger
 from depictio.models.models.links import LinkConfig
 
+# Characters that make a wildcard source value a glob rather than a literal.
+_GLOB_CHARS = re.compile(r"[*?\[]")
+# Sorts after any character a real identifier contains: ``prefix + _PREFIX_END``
+# bounds the block of sorted values that start with ``prefix``.
+_PREFIX_END = "\U0010ffff"
+
 
 class BaseLinkResolver(ABC):
     """Base class for link resolvers.
@@ -58,6 +71,75 @@ class BaseLinkResolver(ABC):
         pass
 
 
+class _TargetIndex:
+    """Target values sorted once, so a prefix lookup is a binary search.
+
+    Polars sorts strings by UTF-8 bytes, i.e. by code point, so every value
+    starting with ``p`` sits in one contiguous block ``[p, p + U+10FFFF)``.
+    ``search_sorted`` finds both ends for all prefixes in one vectorised call,
+    and ``int_ranges`` expands the blocks: the cost is O((S + T) log T) plus the
+    size of the answer, whatever S and T are.
+    """
+
+    def __init__(self, targets: list[str], case_sensitive: bool = True) -> None:
+        self.targets = pl.Series("t", targets, dtype=pl.String, strict=False)
+        self.case_sensitive = case_sensitive
+        frame = (
+            self.targets.to_frame()
+            .with_row_index("row")
+            .drop_nulls("t")
+            .with_columns(self._key(pl.col("t")).alias("key"))
+            .sort("key")
+        )
+        self._keys = frame["key"]
+        self._rows = frame["row"]
+
+    def _key(self, expr: pl.Expr) -> pl.Expr:
+        return expr if self.case_sensitive else expr.str.to_lowercase()
+
+    def prefix_hits(self, prefixes: list[str]) -> pl.DataFrame:
+        """``(src, row)`` for every target row starting with ``prefixes[src]``."""
+        keys = pl.select(self._key(pl.lit(pl.Series(prefixes, dtype=pl.String)))).to_series()
+        spans = pl.DataFrame(
+            {
+                "src": pl.int_range(len(prefixes), eager=True, dtype=pl.UInt32),
+                "lo": self._keys.search_sorted(keys, side="left"),
+                "hi": self._keys.search_sorted(keys + _PREFIX_END, side="left"),
+            }
+        )
+        hits = (
+            spans.filter(pl.col("hi") > pl.col("lo"))
+            .select("src", pl.int_ranges("lo", "hi", dtype=pl.UInt32).alias("pos"))
+            .explode("pos")
+        )
+        return hits.select("src", self._rows.gather(hits["pos"]).alias("row"))
+
+    def glob_hits(self, src: int, pattern: str) -> list[tuple[int, int]]:
+        """``(src, row)`` for targets matching ``pattern`` (case-sensitive glob).
+
+        Only the block sharing the pattern's literal prefix is tested, so a glob
+        costs its candidates, not the whole target list.
+        """
+        literal = _GLOB_CHARS.split(pattern, maxsplit=1)[0]
+        block = self.prefix_hits([literal])["row"]
+        values = self.targets.gather(block).to_list()
+        return [
+            (src, row)
+            for row, value in zip(block.to_list(), values)
+            if fnmatch.fnmatchcase(value, pattern)
+        ]
+
+    def collect(self, hits: pl.DataFrame, source_values: list[Any]) -> tuple[list[str], list[str]]:
+        """Resolved targets (source order, then target order, de-duplicated) and
+        the source values that matched nothing — the order the per-value loops
+        produced."""
+        ordered = hits.sort("src", "row")
+        resolved = self.targets.gather(ordered["row"]).unique(maintain_order=True).to_list()
+        matched = set(ordered["src"].unique().to_list())
+        unmapped = [str(v) for i, v in enumerate(source_values) if i not in matched]
+        return resolved, unmapped
+
+
 class DirectResolver(BaseLinkResolver):
     """Direct 1:1 mapping resolver.
 
@@ -252,36 +334,20 @@ class RegexResolver(BaseLinkResolver):
         link_config: LinkConfig,
         target_known_values: list[str] | None = None,
     ) -> tuple[list[str], list[str]]:
-        """Match target values using regex patterns."""
+        """Match target values using regex patterns.
+
+        The pattern is ``^<escaped value>.*$``: every metacharacter of the
+        value is escaped, so it is a prefix test, and runs as one (optionally
+        case-folded) prefix lookup for all values at once.
+        """
         if not target_known_values:
             logger.warning("RegexResolver: No target values provided, returning source as-is")
             return [str(v) for v in source_values], []
 
-        resolved: list[str] = []
-        unmapped: list[str] = []
-        flags = 0 if link_config.case_sensitive else re.IGNORECASE
-
-        for val in source_values:
-            str_val = str(val)
-            # Build regex pattern - escape special chars and add prefix match
-            pattern = f"^{re.escape(str_val)}.*$"
-
-            try:
-                compiled = re.compile(pattern, flags)
-                matches = [tv for tv in target_known_values if compiled.match(tv)]
-
-                if matches:
-                    resolved.extend(matches)
-                    logger.debug(f"RegexResolver: '{str_val}' matched {len(matches)} values")
-                else:
-                    unmapped.append(str_val)
-                    logger.debug(f"RegexResolver: No matches for '{str_val}'")
-            except re.error as e:
-                logger.warning(f"RegexResolver: Invalid pattern for '{str_val}': {e}")
-                unmapped.append(str_val)
-
-        # Remove duplicates while preserving order
-        resolved = list(dict.fromkeys(resolved))
+        index = _TargetIndex(target_known_values, case_sensitive=bool(link_config.case_sensitive))
+        resolved, unmapped = index.collect(
+            index.prefix_hits([str(v) for v in source_values]), source_values
+        )
 
         logger.info(
             f"RegexResolver: Resolved {len(source_values)} source values "
@@ -312,30 +378,33 @@ class WildcardResolver(BaseLinkResolver):
         link_config: LinkConfig,
         target_known_values: list[str] | None = None,
     ) -> tuple[list[str], list[str]]:
-        """Match target values using glob-style wildcards."""
+        """Match target values using glob-style wildcards.
+
+        The pattern is ``<value>*``. A value with no glob characters of its own
+        is a plain prefix and joins the vectorised prefix lookup; one that has
+        them is checked with ``fnmatch`` against its literal prefix's block only.
+        """
         if not target_known_values:
             logger.warning("WildcardResolver: No target values provided, returning source as-is")
             return [str(v) for v in source_values], []
 
-        resolved: list[str] = []
-        unmapped: list[str] = []
-
-        for val in source_values:
-            str_val = str(val)
-            # Build wildcard pattern
-            pattern = f"{str_val}*"
-
-            matches = fnmatch.filter(target_known_values, pattern)
-
-            if matches:
-                resolved.extend(matches)
-                logger.debug(f"WildcardResolver: '{str_val}' matched {len(matches)} values")
-            else:
-                unmapped.append(str_val)
-                logger.debug(f"WildcardResolver: No matches for '{str_val}'")
-
-        # Remove duplicates while preserving order
-        resolved = list(dict.fromkeys(resolved))
+        # fnmatch.filter (the previous implementation) is case-sensitive on
+        # POSIX whatever the link's case_sensitive flag says; so is this.
+        index = _TargetIndex(target_known_values)
+        values = [str(v) for v in source_values]
+        plain = [i for i, v in enumerate(values) if not _GLOB_CHARS.search(v)]
+        hits = index.prefix_hits([values[i] for i in plain]).with_columns(
+            pl.col("src").replace_strict(list(range(len(plain))), plain, return_dtype=pl.UInt32)
+        )
+        globbed = [
+            pair
+            for i, v in enumerate(values)
+            if _GLOB_CHARS.search(v)
+            for pair in index.glob_hits(i, f"{v}*")
+        ]
+        if globbed:
+            hits = pl.concat([hits, pl.DataFrame(globbed, schema=hits.schema, orient="row")])
+        resolved, unmapped = index.collect(hits, source_values)
 
         logger.info(
             f"WildcardResolver: Resolved {len(source_values)} source values "
@@ -10,19 +10,18 @@ The link resolution endpoint is the primary integration point for Dash callbacks
 to apply cross-DC filtering without pre-computed joins.
 """
 
-from typing import Any
-
-import polars as pl
 from bson import ObjectId
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path
+from fastapi.concurrency import run_in_threadpool
 
+from depictio.api.cache import invalidate_cache_tags
 from depictio.api.v1.configs.logging_init import logger
-from depictio.api.v1.db import (
-    deltatables_collection,
-    multiqc_collection,
-    projects_collection,
+from depictio.api.v1.db import projects_collection
+from depictio.api.v1.endpoints.links_endpoints import resolution
+from depictio.api.v1.endpoints.links_endpoints.resolution import multiqc_sample_mappings
+from depictio.api.v1.endpoints.links_endpoints.translation_index import (
+    refresh_translation_indexes,
 )
-from depictio.api.v1.endpoints.links_endpoints.resolvers import get_resolver
 from depictio.api.v1.endpoints.user_endpoints.routes import (
     get_current_user,
     get_user_or_anonymous,
@@ -30,7 +29,6 @@ from depictio.api.v1.endpoints.user_endpoints.routes import (
 from depictio.models.models.base import PyObjectId
 from depictio.models.models.links import (
     DCLink,
-    LinkConfig,
     LinkCreateRequest,
     LinkResolutionRequest,
     LinkResolutionResponse,
@@ -106,237 +104,6 @@ def _find_link_by_id(project: dict, link_id: str) -> tuple[DCLink | None, int]:
     return None, -1
 
 
-def _find_link_for_resolution(project: dict, source_dc_id: str, target_dc_id: str) -> DCLink | None:
-    """Find a link between source and target DCs.
-
-    Args:
-        project: Project document
-        source_dc_id: Source DC ID
-        target_dc_id: Target DC ID
-
-    Returns:
-        DCLink if found and enabled, None otherwise
-    """
-    links = project.get("links", [])
-    for link_data in links:
-        # Compare as strings — MongoDB stores ObjectId but API receives strings
-        if (
-            str(link_data.get("source_dc_id")) == source_dc_id
-            and str(link_data.get("target_dc_id")) == target_dc_id
-            and link_data.get("enabled", True)
-        ):
-            return DCLink(**link_data)
-    return None
-
-
-async def _translate_filter_values(
-    source_dc_id: str,
-    filter_column: str,
-    filter_values: list[Any],
-    link_column: str,
-) -> list[Any]:
-    """Translate filter values from one column to another via source DC query.
-
-    When filtering by column A but the link is defined on column B, this function
-    queries the source DC to translate values from column A to column B.
-
-    Example:
-        Filter: habitat IN ["Groundwater", "Riverwater"]
-        Link: sample (habitat -> sample)
-        Query: SELECT sample FROM metadata WHERE habitat IN ["Groundwater", "Riverwater"]
-        Returns: ["SRR10070131", "SRR10070132", "SRR10070133", ...]
-
-    Args:
-        source_dc_id: Data collection ID to query
-        filter_column: Column being filtered (e.g., "habitat")
-        filter_values: Values selected in filter (e.g., ["Groundwater"])
-        link_column: Column used in link definition (e.g., "sample")
-
-    Returns:
-        List of unique values from link_column that match the filter
-
-    Raises:
-        HTTPException: If DC not found, Delta table not accessible, or columns missing
-    """
-    # Get Delta table location (try both string and ObjectId formats for compatibility)
-    deltatable_doc = deltatables_collection.find_one({"data_collection_id": source_dc_id})
-    if not deltatable_doc:
-        # Try with ObjectId format
-        deltatable_doc = deltatables_collection.find_one(
-            {"data_collection_id": ObjectId(source_dc_id)}
-        )
-    if not deltatable_doc or "delta_table_location" not in deltatable_doc:
-        logger.error(
-            f"Delta table not found for DC {source_dc_id}. "
-            f"Document exists: {deltatable_doc is not None}, "
-            f"Has location: {deltatable_doc and 'delta_table_location' in deltatable_doc}"
-        )
-        raise HTTPException(
-            status_code=404,
-            detail=f"Delta table not found for DC {source_dc_id}",
-        )
-
-    delta_table_location = deltatable_doc["delta_table_location"]
-    logger.debug(f"Querying Delta table at {delta_table_location}")
-
-    try:
-        # Read Delta table with S3 credentials
-        from depictio.api.v1.s3 import polars_s3_config
-
-        # Lazy, projected, filter pushed down. This used to be an eager
-        # ``pl.read_delta``, which materialised every column of the source DC to
-        # read two of them — on a 14M-row collection that is a multi-second load
-        # and gigabytes of RAM, paid again on every filter change. The same
-        # eager-read pattern was removed from the ingestion path in 6558e29c5;
-        # it survived here.
-        lf = pl.scan_delta(delta_table_location, storage_options=polars_s3_config)
-
-        schema = lf.collect_schema()
-        available = schema.names()
-        if filter_column not in available:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Filter column '{filter_column}' not found in source DC. "
-                f"Available: {', '.join(available)}",
-            )
-        if link_column not in available:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Link column '{link_column}' not found in source DC. "
-                f"Available: {', '.join(available)}",
-            )
-
-        # Filter and extract link column values
-        # Check if this is a DateRangePicker filter (2-element list + date/datetime column)
-        is_date_range = (
-            isinstance(filter_values, list)
-            and len(filter_values) == 2
-            and schema[filter_column] in [pl.Date, pl.Datetime]
-        )
-
-        if is_date_range:
-            # DateRangePicker: Use date range filtering
-            logger.info(
-                f"Detected DateRangePicker filter for column '{filter_column}' "
-                f"with range {filter_values}"
-            )
-            start_date = filter_values[0]
-            end_date = filter_values[1]
-
-            # Convert string dates to appropriate type
-            if isinstance(start_date, str):
-                start_date = pl.lit(start_date).str.strptime(pl.Datetime, "%Y-%m-%d")
-            if isinstance(end_date, str):
-                end_date = pl.lit(end_date).str.strptime(pl.Datetime, "%Y-%m-%d")
-
-            # Apply date range filter
-            date_col = pl.col(filter_column).cast(pl.Datetime)
-            predicate = (date_col >= start_date) & (date_col <= end_date)
-        else:
-            # Standard MultiSelect/Select: Use is_in() filtering
-            predicate = pl.col(filter_column).is_in(filter_values)
-
-        # Project to the two columns that matter BEFORE collecting, and let the
-        # engine count matched rows rather than materialising them: only the
-        # distinct link values are needed downstream.
-        result = (
-            lf.filter(predicate)
-            .select(
-                pl.col(link_column).unique().implode().alias("_values"),
-                pl.len().alias("_matched"),
-            )
-            .collect()
-        )
-        link_values = result["_values"].item().to_list() if result.height else []
-        matched_rows = int(result["_matched"].item()) if result.height else 0
-
-        logger.info(
-            f"Column translation: {len(filter_values)} {filter_column} values -> "
-            f"{len(link_values)} {link_column} values (from {matched_rows} rows)"
-        )
-
-        return link_values
-
-    except Exception as e:
-        logger.error(f"Error querying source DC for column translation: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to query source DC for column translation: {str(e)}",
-        )
-
-
-async def _get_multiqc_sample_mappings(target_dc_id: str) -> dict[str, list[str]]:
-    """Fetch and aggregate sample mappings from ALL MultiQC reports for a DC.
-
-    A single MultiQC data collection can have multiple reports (e.g., from different
-    parquet files). Each report may have different samples with their own mappings.
-    This function aggregates all sample_mappings from all reports for the DC.
-
-    When no explicit ``sample_mappings`` are configured (typical for DCs that
-    haven't yet been linked to an external metadata table), we fall back to the
-    raw ``canonical_samples`` parsed out of each report and synthesize a
-    ``{sample: []}`` mapping — variants empty, but the caller (greying /
-    intersection callers) still gets the authoritative set of samples actually
-    present in the MultiQC reports.
-
-    Args:
-        target_dc_id: MultiQC data collection ID
-
-    Returns:
-        Aggregated sample mappings dict — values may be empty lists when only
-        canonical samples are known. Empty dict only when the DC has no reports.
-    """
-    try:
-        # Find ALL reports for this DC, not just the first one
-        aggregated_mappings: dict[str, list[str]] = {}
-
-        cursor = multiqc_collection.find(
-            {"data_collection_id": target_dc_id},
-            # Pull canonical_samples too so we can fall back when no explicit
-            # mapping has been configured yet.
-            {"metadata.sample_mappings": 1, "metadata.canonical_samples": 1},
-        )
-
-        report_count = 0
-        had_explicit_mappings = False
-        for report in cursor:
-            report_count += 1
-            metadata = report.get("metadata") or {}
-            mappings = metadata.get("sample_mappings") or {}
-            if mappings:
-                had_explicit_mappings = True
-                # Merge mappings - if same key exists, combine variant lists
-                for sample_id, variants in mappings.items():
-                    if sample_id in aggregated_mappings:
-                        # Add new variants, avoiding duplicates
-                        existing = set(aggregated_mappings[sample_id])
-                        for v in variants:
-                            if v not in existing:
-                                aggregated_mappings[sample_id].append(v)
-                    else:
-                        aggregated_mappings[sample_id] = list(variants)
-            else:
-                # Fall back to canonical_samples (the raw list of sample names
-                # MultiQC parsed out of this report). Treated as canonical IDs
-                # with no variants — still useful for narrowing filter options
-                # to "samples actually present in the report".
-                for sample_id in metadata.get("canonical_samples") or []:
-                    if sample_id and sample_id not in aggregated_mappings:
-                        aggregated_mappings[sample_id] = []
-
-        if aggregated_mappings:
-            logger.debug(
-                f"Aggregated {len(aggregated_mappings)} sample mappings "
-                f"from {report_count} MultiQC reports for DC {target_dc_id} "
-                f"(explicit_mappings={had_explicit_mappings})"
-            )
-        return aggregated_mappings
-
-    except Exception as e:
-        logger.warning(f"Failed to fetch MultiQC sample mappings for {target_dc_id}: {e}")
-    return {}
-
-
 # ============================================================================
 # CRUD Endpoints
 # ============================================================================
@@ -457,6 +224,7 @@ async def get_links_by_target_dc(
 )
 async def create_link(
     request: LinkCreateRequest,
+    background_tasks: BackgroundTasks,
     project_id: str = Path(..., description="Project ID"),
     current_user: User = Depends(get_current_user),
 ) -> DCLink:
@@ -508,6 +276,9 @@ async def create_link(
         f"Created link {new_link.id} in project {project_id}: "
         f"{request.source_dc_id} -> {request.target_dc_id}"
     )
+    # Index the new link now rather than at the source DC's next ingest.
+    background_tasks.add_task(refresh_translation_indexes, str(new_link.source_dc_id))
+    invalidate_cache_tags(project_id)
     return new_link
 
 
@@ -518,6 +289,7 @@ async def create_link(
 )
 async def update_link(
     request: LinkUpdateRequest,
+    background_tasks: BackgroundTasks,
     project_id: str = Path(..., description="Project ID"),
     link_id: str = Path(..., description="Link ID to update"),
     current_user: User = Depends(get_current_user),
@@ -580,6 +352,10 @@ async def update_link(
 
     updated_link = DCLink(**link_dict)
     logger.info(f"Updated link {link_id} in project {project_id}")
+    # The join column, source DC or enabled flag may have changed.
+    for dc_id in {str(existing_link.source_dc_id), str(updated_link.source_dc_id)}:
+        background_tasks.add_task(refresh_translation_indexes, dc_id)
+    invalidate_cache_tags(project_id)
     return updated_link
 
 
@@ -629,6 +405,7 @@ async def delete_link(
         )
 
     logger.info(f"Deleted link {link_id} from project {project_id}")
+    invalidate_cache_tags(project_id)
 
 
 # ============================================================================
@@ -650,14 +427,10 @@ async def resolve_link(
 
     This is the primary endpoint for cross-DC filtering. When a filter is
     applied to a source DC, call this endpoint to get the resolved values
-    that should be applied to the target DC.
-
-    The resolution process:
-    1. Find the link definition for source_dc -> target_dc
-    2. Get the appropriate resolver based on link_config.resolver
-    3. For MultiQC targets with sample_mapping resolver, auto-fetch mappings if not provided
-    4. Resolve source values to target identifiers
-    5. Return resolved values with metadata
+    that should be applied to the target DC. The API's own render paths call
+    ``resolution.resolve_link`` in process instead; this is the same function
+    behind an access check, run on the threadpool because translating a filter
+    through the source DC is a blocking Delta scan.
 
     Args:
         request: Resolution request with source DC, column, filter values, and target DC
@@ -671,94 +444,8 @@ async def resolve_link(
         HTTPException: 404 if no link found between source and target DCs
     """
     project = _get_project_or_404(project_id, current_user)
-
-    # Find link between source and target
-    link = _find_link_for_resolution(project, request.source_dc_id, request.target_dc_id)
-
-    if link is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No enabled link found from {request.source_dc_id} to {request.target_dc_id}",
-        )
-
-    logger.info(
-        f"Resolving link {link.id}: {request.source_dc_id}:{request.source_column} "
-        f"-> {request.target_dc_id} ({link.target_type})"
-    )
-
-    # Translate filter values if filtering by different column than link column
-    values_to_resolve = request.filter_values
-    if request.source_column != link.source_column:
-        logger.info(
-            f"Filter column '{request.source_column}' differs from link column '{link.source_column}'. "
-            f"Translating filter values via source DC query."
-        )
-        # Query source DC to translate filter values to link column values
-        translated_values = await _translate_filter_values(
-            source_dc_id=request.source_dc_id,
-            filter_column=request.source_column,
-            filter_values=request.filter_values,
-            link_column=link.source_column,
-        )
-        logger.info(
-            f"Translated {len(request.filter_values)} {request.source_column} values "
-            f"to {len(translated_values)} {link.source_column} values"
-        )
-        values_to_resolve = translated_values
-
-    # Get resolver
-    try:
-        resolver = get_resolver(link.link_config.resolver)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    # Prepare link config - auto-fetch sample mappings for MultiQC if needed
-    effective_config = link.link_config
-
-    if (
-        link.target_type == "multiqc"
-        and link.link_config.resolver == "sample_mapping"
-        and not link.link_config.mappings
-    ):
-        # Auto-fetch sample mappings from MultiQC report
-        sample_mappings = await _get_multiqc_sample_mappings(link.target_dc_id)
-        if sample_mappings:
-            # Create new config with fetched mappings
-            effective_config = LinkConfig(
-                resolver=link.link_config.resolver,
-                mappings=sample_mappings,
-                pattern=link.link_config.pattern,
-                target_field=link.link_config.target_field,
-                case_sensitive=link.link_config.case_sensitive,
-            )
-            logger.info(
-                f"Auto-fetched {len(sample_mappings)} sample mappings for MultiQC DC "
-                f"{link.target_dc_id}"
-            )
-
-    # Resolve values
-    resolved_values, unmapped_values = resolver.resolve(
-        source_values=values_to_resolve,
-        link_config=effective_config,
-        target_known_values=None,  # Could be enhanced to fetch from target DC
-    )
-
-    response = LinkResolutionResponse(
-        resolved_values=resolved_values,
-        link_id=str(link.id),
-        resolver_used=link.link_config.resolver,
-        match_count=len(resolved_values),
-        target_type=link.target_type,
-        source_count=len(request.filter_values),
-        unmapped_values=unmapped_values,
-    )
-
-    logger.info(
-        f"Link resolution complete: {len(request.filter_values)} source values "
-        f"-> {len(resolved_values)} resolved values"
-    )
-
-    return response
+    # Module-qualified: this endpoint's own name shadows the function.
+    return await run_in_threadpool(resolution.resolve_link, project, request)
 
 
 @links_endpoint_router.get(
@@ -815,7 +502,7 @@ async def get_multiqc_sample_mappings(
     _get_project_or_404(project_id, current_user)
 
     # Fetch aggregated sample mappings
-    mappings = await _get_multiqc_sample_mappings(dc_id)
+    mappings = await run_in_threadpool(multiqc_sample_mappings, dc_id)
 
     logger.info(f"Returning {len(mappings)} aggregated sample mappings for MultiQC DC {dc_id}")
 
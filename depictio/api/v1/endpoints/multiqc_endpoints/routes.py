@@ -654,6 +654,7 @@ async def multiqc_preview(
             (payload,),
             offload=offload,
             timeout=120.0,
+            cost_class="multiqc",
             label=f"multiqc_preview dc={dc_id} module={selected_module} plot={selected_plot}",
         )
     except HTTPException:
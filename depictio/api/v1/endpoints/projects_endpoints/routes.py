@@ -3,6 +3,7 @@ from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import ValidationError
 
+from depictio.api.cache import invalidate_cache_tags
 from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
 from depictio.api.v1.db import (
@@ -341,6 +342,9 @@ async def update_project(project: Project, current_user=Depends(get_current_user
     )
     update_payload["last_modified"] = utc_now_str()
     projects_collection.update_one({"_id": project.id}, {"$set": update_payload})
+    # Links and data collections travel with the document; what was resolved
+    # or counted against the old ones must go.
+    invalidate_cache_tags(str(project.id))
 
     return {
         "success": True,
@@ -363,6 +367,7 @@ async def delete_project(project_id: PyObjectId, current_user=Depends(get_curren
         )
 
     _cascade_delete_project(project_id, project.name)
+    invalidate_cache_tags(str(project_id))
 
     return {
         "success": True,
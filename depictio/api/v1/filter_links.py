@@ -10,18 +10,24 @@ keep working unchanged.
 
 from __future__ import annotations
 
-import time
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Dict, Optional
 
 import httpx
 
 from depictio.api.v1.configs.config import API_BASE_URL
 from depictio.api.v1.configs.logging_init import logger
-from depictio.api.v1.deltatables_utils import LINK_NO_MATCH
+from depictio.api.v1.deltatables_utils import LINK_NO_MATCH, is_active_filter_value
 
-# Cache for link resolution results
-_link_resolution_cache: Dict[str, Dict[str, Any]] = {}
+# Link resolutions are cached in Redis (``depictio.api.cache``) so every API
+# worker shares them. Keys are salted with the aggregation hash of each DC the
+# answer reads, so a data change retires them; the TTL only bounds how long a
+# link *definition* edit can go unnoticed.
 LINK_RESOLUTION_CACHE_TTL_SECONDS = 300  # 5 minutes
+_LINK_CACHE_PREFIX = "link_"
 
 # Resolution now scans lazily with the two needed columns projected, so it is far
 # cheaper than the previous eager full-table read — but a translation whose join
@@ -30,6 +36,11 @@ LINK_RESOLUTION_CACHE_TTL_SECONDS = 300  # 5 minutes
 # error the user can act on instead of a request nobody ever answers.
 LINK_RESOLUTION_TIMEOUT_S = 30.0
 
+# Resolutions run in process but on their own small pool, so the timeout above
+# still holds without the HTTP client that used to enforce it. A timed-out scan
+# finishes in the background; the pool size bounds how many can pile up.
+_resolution_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="link-resolve")
+
 
 # How many links a filter may travel before we stop looking. A chain costs one
 # resolution per hop and each hop's output is the next hop's input, so depth is
@@ -148,7 +159,20 @@ def _walk_link_path(
 
     A failed resolution does not return at all — ``resolve_link_values`` raises
     ``LinkResolutionError`` so a timeout can never masquerade as "no filter".
+
+    Chains of ``direct`` links where several hops translate are first tried as
+    a single lazy plan (``resolve_link_chain``); anything it can't plan falls
+    back to the hop-by-hop walk below. Either way an unauthenticated caller
+    resolves nothing, as in ``resolve_link_values``.
     """
+    if not access_token:
+        logger.warning(f"[{component_type}] No token provided for link resolution")
+        return None, []
+
+    fused = _resolve_chain_cached(path, project_id, origin_column, origin_values)
+    if fused is not None:
+        return _link_target_column(path[-1]), fused
+
     column, values = origin_column, origin_values
     for hop, link in enumerate(path):
         source_dc = str(link.get("source_dc_id", ""))
@@ -211,6 +235,74 @@ def _agg_hash(dc_id: str) -> str:
         return "?"
 
 
+def _values_digest(values: list) -> str:
+    # Stable across processes (``hash()`` of a str is salted per interpreter),
+    # since the key is shared through Redis.
+    canonical = json.dumps(sorted(str(v) for v in values), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+def _cache_get(key: str) -> Any:
+    try:
+        from depictio.api.cache import get_cache
+
+        return get_cache().get(key)
+    except Exception as e:
+        logger.debug(f"Link resolution cache read failed for {key}: {e}")
+        return None
+
+
+def _cache_set(key: str, value: Any) -> None:
+    try:
+        from depictio.api.cache import get_cache
+
+        get_cache().set(key, value, ttl=LINK_RESOLUTION_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.debug(f"Link resolution cache write failed for {key}: {e}")
+
+
+def _run_bounded(fn, *args, description: str) -> Any:
+    """Run ``fn`` on the resolution pool, raising ``LinkResolutionError`` on timeout."""
+    future = _resolution_pool.submit(fn, *args)
+    try:
+        return future.result(timeout=LINK_RESOLUTION_TIMEOUT_S)
+    except FutureTimeoutError as e:
+        # Loud. A timeout once returned None, the caller read it as "no link
+        # filters to add", and the component rendered EVERY row — a wrong
+        # answer presented as a normal one.
+        raise LinkResolutionError(
+            f"Link resolution timed out after {LINK_RESOLUTION_TIMEOUT_S:.0f}s for "
+            f"{description}. The source data collection is too large to translate "
+            f"this filter through."
+        ) from e
+
+
+def _resolve_in_process(project_id: str, payload: dict) -> Optional[Dict[str, Any]]:
+    """``POST /links/{project_id}/resolve`` without the HTTP round trip.
+
+    Same status contract as the endpoint: a missing project or link (404) is
+    ``None``; any other failure raises ``HTTPException``.
+    """
+    from fastapi import HTTPException
+
+    from depictio.api.v1.endpoints.links_endpoints.resolution import (
+        load_project_links,
+        resolve_link,
+    )
+    from depictio.models.models.links import LinkResolutionRequest
+
+    project = load_project_links(project_id)
+    if project is None:
+        return None
+    try:
+        response = resolve_link(project, LinkResolutionRequest(**payload))
+    except HTTPException as e:
+        if e.status_code == 404:
+            return None
+        raise
+    return response.model_dump()
+
+
 def resolve_link_values(
     project_id: str,
     source_dc_id: str,
@@ -220,7 +312,14 @@ def resolve_link_values(
     token: str | None,
     use_cache: bool = True,
 ) -> Optional[Dict[str, Any]]:
-    """Resolve filtered values from source DC to target DC via link."""
+    """Resolve filtered values from source DC to target DC via link.
+
+    Runs the link resolver in process (``links_endpoints.resolution``) rather
+    than through the API's own ``/links/{project}/resolve`` endpoint. ``token``
+    is still required — an unauthenticated caller resolves nothing — but it is
+    no longer re-validated here: every caller is an endpoint that has already
+    authorised the request.
+    """
     if not token:
         logger.warning("No token provided for link resolution")
         return None
@@ -235,16 +334,14 @@ def resolve_link_values(
     # simply absent from every linked component — with nothing to indicate it.
     versions = f"{_agg_hash(source_dc_id)}_{_agg_hash(target_dc_id)}"
     cache_key = (
-        f"link_{project_id}_{source_dc_id}_{target_dc_id}_{versions}_"
-        f"{hash(tuple(sorted(str(v) for v in filter_values)))}"
+        f"{_LINK_CACHE_PREFIX}{project_id}_{source_dc_id}_{target_dc_id}_{versions}_"
+        f"{source_column}_{_values_digest(filter_values)}"
     )
 
-    if use_cache and cache_key in _link_resolution_cache:
-        cached = _link_resolution_cache[cache_key]
-        if time.time() - cached.get("timestamp", 0) < LINK_RESOLUTION_CACHE_TTL_SECONDS:
-            return cached.get("data")
-        else:
-            del _link_resolution_cache[cache_key]
+    if use_cache:
+        cached = _cache_get(cache_key)
+        if isinstance(cached, dict):
+            return cached
 
     payload = {
         "source_dc_id": source_dc_id,
@@ -254,50 +351,73 @@ def resolve_link_values(
     }
 
     try:
-        response = httpx.post(
-            f"{API_BASE_URL}/depictio/api/v1/links/{project_id}/resolve",
-            json=payload,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=LINK_RESOLUTION_TIMEOUT_S,
+        result = _run_bounded(
+            _resolve_in_process,
+            project_id,
+            payload,
+            description=f"{source_dc_id} -> {target_dc_id}",
         )
-
-        if response.status_code == 200:
-            result = response.json()
-            if use_cache:
-                _link_resolution_cache[cache_key] = {
-                    "data": result,
-                    "timestamp": time.time(),
-                }
-            return result
-
-        elif response.status_code == 404:
-            # No such link. That is a real answer — there is nothing to resolve
-            # — so it stays a quiet ``None``.
-            return None
-
-        else:
-            raise LinkResolutionError(
-                f"Link resolution failed for {source_dc_id} -> {target_dc_id}: "
-                f"HTTP {response.status_code} {response.text[:200]}"
-            )
-
-    except httpx.TimeoutException as e:
-        # Loud. Previously this returned None, the caller read it as "no link
-        # filters to add", and the component rendered EVERY row — a wrong answer
-        # presented as a normal one. An error the user can see is strictly
-        # better than silently unfiltered data.
-        raise LinkResolutionError(
-            f"Link resolution timed out after {LINK_RESOLUTION_TIMEOUT_S:.0f}s for "
-            f"{source_dc_id} -> {target_dc_id}. The source data collection is too "
-            f"large to translate this filter through."
-        ) from e
     except LinkResolutionError:
         raise
     except Exception as e:
+        status = getattr(e, "status_code", None)
+        detail = getattr(e, "detail", e)
         raise LinkResolutionError(
-            f"Link resolution error for {source_dc_id} -> {target_dc_id}: {e}"
+            f"Link resolution failed for {source_dc_id} -> {target_dc_id}: "
+            f"{f'HTTP {status} ' if status else ''}{str(detail)[:200]}"
         ) from e
 
+    # No such link is a real answer — there is nothing to resolve — so it stays
+    # a quiet ``None``; it isn't cached, so a link added meanwhile shows up.
+    if result is not None and use_cache:
+        _cache_set(cache_key, result)
+    return result
+
+
+def _resolve_chain_cached(
+    path: list[dict],
+    project_id: str,
+    origin_column: str,
+    origin_values: list,
+) -> list | None:
+    """``resolution.resolve_link_chain`` behind the shared Redis cache.
+
+    Keyed on every link on the path and the aggregation hash of every DC it
+    reads, so editing any hop's data retires the entry. ``None`` (not fusable)
+    is not cached: the check is free and the hop-by-hop results are cached on
+    their own.
+    """
+    from depictio.api.v1.endpoints.links_endpoints.resolution import (
+        fusable_hops,
+        resolve_link_chain,
+    )
+
+    if not origin_values or fusable_hops(path, origin_column) is None:
+        return None
+    dcs = [str(path[0].get("source_dc_id", ""))] + [
+        str(link.get("target_dc_id", "")) for link in path
+    ]
+    link_ids = "-".join(str(link.get("id", "?")) for link in path)
+    versions = "_".join(_agg_hash(dc) for dc in dcs)
+    cache_key = (
+        f"{_LINK_CACHE_PREFIX}chain_{project_id}_{link_ids}_{versions}_"
+        f"{origin_column}_{_values_digest(origin_values)}"
+    )
+    cached = _cache_get(cache_key)
+    if isinstance(cached, list):
+        return cached
+
+    values = _run_bounded(
+        resolve_link_chain,
+        path,
+        origin_column,
+        origin_values,
+        description=f"link chain {link_ids}",
+    )
+    if values is not None:
+        _cache_set(cache_key, values)
+    return values
+
 
 def get_multiqc_sample_mappings(
     project_id: str,
@@ -387,11 +507,6 @@ def get_links_for_source_dc(
         return []
 
 
-def clear_link_resolution_cache():
-    """Clear the link resolution cache."""
-    _link_resolution_cache.clear()
-
-
 def extend_filters_via_links(
     target_dc_id: str,
     filters_by_dc: dict,
@@ -443,7 +558,7 @@ def extend_filters_via_links(
             continue  # same DC: the filter already applies natively
 
         active_source_filters = [
-            f for f in source_filters if f.get("value") not in [None, [], "", False]
+            f for f in source_filters if is_active_filter_value(f.get("value"))
         ]
         if not active_source_filters:
             continue
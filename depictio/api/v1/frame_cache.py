@@ -0,0 +1,228 @@
+"""Per-process, byte-budgeted LRU cache of materialised Polars frames.
+
+``deltatables_utils`` used to keep its in-process frames in three module
+globals (the frame dict, a per-key metadata dict and a running byte total).
+Those were mutated from threadpool threads without a lock, eviction was an
+O(n) ``min()`` over timestamps, frames were sized as ``rows × cols × 8`` (an
+order of magnitude off for string columns), and the main load path never
+evicted at all — the "1 GB threshold" was only checked, not enforced.
+
+``FrameCache`` replaces them with one object:
+
+* **LRU in O(1)** — an ``OrderedDict`` in recency order; a hit is a
+  ``move_to_end`` and an eviction a ``popitem(last=False)``.
+* **Byte-accurate budget** — every frame is charged its
+  ``DataFrame.estimated_size()`` (a sum over the Arrow buffers, no scan) and the
+  total is held under ``max_bytes`` on every insert. A frame above
+  ``item_max_bytes`` is returned to the caller but never kept.
+* **Single-flight loads** — ``get_or_load`` runs the loader once per key; other
+  threads missing on the same key wait for that result instead of collecting
+  the same Delta table in parallel.
+* **Counters** — hits, misses, evictions, coalesced waits and oversize
+  rejections, reported by ``stats()``.
+
+One lock guards the bookkeeping only; loaders always run outside it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import polars as pl
+
+from depictio.api.v1.configs.config import settings
+
+_MB = 1024 * 1024
+
+
+def frame_bytes(df: pl.DataFrame) -> int:
+    """Bytes the cache charges for ``df``."""
+    try:
+        return int(df.estimated_size())
+    except Exception:
+        # Not a frame Polars can size (a test double, an exotic object dtype):
+        # fall back to the old per-cell guess rather than admitting it for free.
+        return int(getattr(df, "height", 0)) * int(getattr(df, "width", 0)) * 8
+
+
+class _Flight:
+    """One in-progress load that other threads can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: pl.DataFrame | None = None
+        self.error: BaseException | None = None
+
+
+class FrameCache:
+    """Thread-safe LRU of DataFrames bounded by total and per-item byte size."""
+
+    def __init__(self, max_bytes: int, item_max_bytes: int) -> None:
+        self.max_bytes = int(max_bytes)
+        self.item_max_bytes = min(int(item_max_bytes), self.max_bytes)
+        self._entries: OrderedDict[str, tuple[pl.DataFrame, int, float]] = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        """The cached frame (marking it most recently used), or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: str) -> pl.DataFrame | None:
+        """Like ``get`` but leaves recency and the counters alone."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def put(self, key: str, df: pl.DataFrame, size_bytes: int | None = None) -> bool:
+        """Cache ``df`` under ``key``; ``False`` if it is too large to keep."""
+        size = frame_bytes(df) if size_bytes is None else int(size_bytes)
+        if size > self.item_max_bytes:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (df, size, time.time())
+            self._bytes += size
+            self._evict_locked()
+        return True
+
+    def get_or_load(self, key: str, loader: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Cached frame for ``key``, running ``loader`` at most once per miss.
+
+        Concurrent callers for a key that is already loading block until the
+        leader finishes and share its result (or its exception). The result is
+        returned even when it is too large to cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value  # type: ignore[return-value]
+
+        try:
+            flight.value = loader()
+            self.put(key, flight.value)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def discard(self, key: str) -> bool:
+        with self._lock:
+            return self._pop_locked(key)
+
+    def discard_matching(self, fragment: str) -> int:
+        """Drop every entry whose key contains ``fragment``; returns the count."""
+        with self._lock:
+            keys = [k for k in self._entries if fragment in k]
+            for key in keys:
+                self._pop_locked(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "total_memory_usage_bytes": self._bytes,
+                "total_memory_usage_mb": self._bytes / _MB,
+                "memory_threshold_bytes": self.max_bytes,
+                "memory_threshold_mb": self.max_bytes / _MB,
+                "item_max_bytes": self.item_max_bytes,
+                "cached_dataframes_count": len(self._entries),
+                "memory_utilization_percent": (self._bytes / self.max_bytes) * 100
+                if self.max_bytes
+                else 0.0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "coalesced_loads": self.coalesced,
+                "rejected_oversize": self.rejected,
+                # Least recently used first, i.e. next to go.
+                "cached_dataframes": [
+                    {
+                        "cache_key": key,
+                        "size_bytes": size,
+                        "size_mb": size / _MB,
+                        "timestamp": stored_at,
+                    }
+                    for key, (_df, size, stored_at) in self._entries.items()
+                ],
+            }
+
+    def _pop_locked(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def _evict_locked(self) -> None:
+        # The entry just inserted is last in order and within the item cap,
+        # which is at most the budget, so this never evicts it.
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _key, (_df, size, _t) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+frame_cache = FrameCache(
+    max_bytes=settings.performance.frame_cache_max_mb * _MB,
+    item_max_bytes=settings.performance.frame_cache_item_max_mb * _MB,
+)
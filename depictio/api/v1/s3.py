@@ -16,3 +16,30 @@ s3_client = boto3.client(
     endpoint_url=settings.minio.endpoint_url,
     verify=settings.minio.verify_tls,
 )
+
+
+def storage_options_for(path: str) -> dict | None:
+    """Polars ``storage_options`` for ``path``: the MinIO config for URLs, none locally."""
+    return polars_s3_config if "://" in path else None
+
+
+def remove_paths(paths) -> None:
+    """Best-effort delete of sidecar files, on S3 or the local filesystem.
+
+    Used to drop a superseded ingest-time sidecar once its replacement is
+    recorded. A failure only leaves an unreferenced file behind, so it is
+    logged and swallowed.
+    """
+    import os
+
+    from depictio.api.v1.configs.logging_init import logger
+
+    for path in paths:
+        try:
+            if "://" in path:
+                bucket, _, key = path.split("://", 1)[1].partition("/")
+                s3_client.delete_object(Bucket=bucket, Key=key)
+            elif os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            logger.debug(f"Could not remove stale sidecar {path}: {e}")
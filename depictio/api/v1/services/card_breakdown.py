@@ -8,7 +8,9 @@ two callers cannot disagree about it:
 * :func:`depictio.api.v1.endpoints.dashboards_endpoints.routes.bulk_compute_cards`
   computes it for a *saved* card, against the interactively filtered frame;
 * the ``/deltatables/breakdown`` endpoint computes it for the *builder preview*,
-  against the unfiltered Delta table.
+  against the unfiltered Delta table — or reads it from the ingest-time column
+  statistics when the per-group value is a row count
+  (:func:`breakdown_from_stats`).
 
 Before this module existed the preview had no server call at all: it synthesised
 ``Bucket 1 / Bucket 2 / Bucket 3`` with a uniform 33/33/34 split from the
@@ -116,31 +118,83 @@ def compute_breakdown(
         .sort(["__count__", breakdown_col], descending=[True, False], nulls_last=True)
         .collect()
     )
+    # Summed before truncating: a ``sum`` hero over a float column has
+    # fractional group values, and the total is of those, not of their floors.
     total_raw = grouped["__count__"].sum()
-    total = int(total_raw or 0) if total_raw is not None else 0
-    top_rows = grouped.head(top_n_count)
-    # Nulls are a real category — a column that is 40% unfilled is exactly what
-    # the composition bar should show. ``cast(Utf8)`` maps them to None, so they
-    # get a visible label rather than an empty segment.
-    names = [
-        ("(null)" if n is None else n) for n in top_rows[breakdown_col].cast(pl.Utf8).to_list()
-    ]
-    counts = [int(c) for c in top_rows["__count__"].to_list()]
-    top_share = (sum(counts) / total) if total > 0 else 0.0
+    return _payload(
+        breakdown_col,
+        aggregation,
+        grouped[breakdown_col].cast(pl.Utf8).to_list(),
+        [int(c or 0) for c in grouped["__count__"].to_list()],
+        top_n_count,
+        total=int(total_raw or 0),
+    )
+
+
+def breakdown_from_stats(
+    stats: dict[str, Any] | None,
+    column: str,
+    breakdown_col: str,
+    aggregation: str,
+    top_n_count: int = 3,
+) -> dict[str, Any] | None:
+    """The same payload, from a column's ingest-time statistics, when they can give it.
+
+    ``stats`` is the breakdown column's entry in the column statistics catalog
+    (``depictio.models.column_stats``). Its ``dictionary`` holds the row count
+    of every value, which is the whole answer whenever the per-group reduction
+    is a row count (see :func:`group_expr`). Only String columns qualify: the
+    tie-break sorts names in the column's own order, and for other dtypes that
+    is not the string order the dictionary could reproduce. ``None`` otherwise.
+    """
+    hero = (aggregation or "count").lower()
+    if column != breakdown_col and hero in ("nunique", "unique", "sum"):
+        return None
+    if not stats or stats.get("dictionary") is None or stats.get("dtype") != "String":
+        return None
+    ranked = [(entry["value"], int(entry["count"])) for entry in stats["dictionary"]]
+    if stats.get("null_count"):
+        ranked.append((None, int(stats["null_count"])))
+    # The order compute_breakdown produces: count descending, then name, nulls last.
+    ranked.sort(key=lambda item: (-item[1], item[0] is None, item[0] or ""))
+    return _payload(
+        breakdown_col,
+        aggregation,
+        [name for name, _ in ranked],
+        [count for _, count in ranked],
+        max(1, min(int(top_n_count or 3), MAX_TOP_N)),
+    )
+
+
+def _payload(
+    breakdown_col: str,
+    aggregation: str,
+    names: list[str | None],
+    counts: list[int],
+    top_n_count: int,
+    total: int | None = None,
+) -> dict[str, Any]:
+    """The ``__breakdown__`` dict from every group's name and value, ranked."""
+    total = sum(counts) if total is None else total
+    top = list(zip(names[:top_n_count], counts[:top_n_count]))
+    top_share = (sum(c for _, c in top) / total) if total > 0 else 0.0
 
     return {
         "column": breakdown_col,
         "total": total,
         "top": [
             {
-                "name": names[i],
-                "count": counts[i],
-                "percent": (counts[i] / total) if total > 0 else 0.0,
+                # Nulls are a real category — a column that is 40% unfilled is
+                # exactly what the composition bar should show, so they get a
+                # visible label rather than an empty segment.
+                "name": "(null)" if name is None else name,
+                "count": count,
+                "percent": (count / total) if total > 0 else 0.0,
             }
-            for i in range(len(names))
+            for name, count in top
         ],
         "top_share": top_share,
-        "unique_values": int(grouped.height),
+        "unique_values": len(counts),
         "breakdown_kind": (aggregation or "count").lower(),
-        "evenness": evenness([int(c) for c in grouped["__count__"].to_list()], total),
+        "evenness": evenness(counts, total),
     }
@@ -0,0 +1,150 @@
+"""API side of the column statistics catalog (``depictio.models.column_stats``).
+
+The CLI writes a catalog for every Delta version it produces. After an upsert
+the API registers it on the DC's ``deltatables`` document, or builds it when it
+is missing (the API-side table upload path, an older CLI, a failed CLI write):
+``flexible_metadata.column_stats`` = ``{path, delta_version, aggregation_hash}``.
+
+Readers go through :func:`column_catalog`, which only returns a catalog whose
+recorded ``aggregation_hash`` is the DC's latest, so numbers can never outlive
+the data they describe; ``None`` means "scan as before". Catalog files are
+immutable, so a parsed catalog is kept in process, keyed by its path.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from bson import ObjectId
+
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.db import deltatables_collection
+from depictio.api.v1.services.sidecars import set_record
+from depictio.models.column_stats import read_column_stats, stats_sidecar_path, write_column_stats
+
+
+def _latest_hash(deltatable_doc: dict) -> str | None:
+    aggregations = deltatable_doc.get("aggregation") or []
+    return aggregations[-1].get("aggregation_hash") if aggregations else None
+
+
+def refresh_column_stats(dc_id: str) -> str | None:
+    """Register (building it if needed) the catalog of ``dc_id``'s current version.
+
+    Runs after an ingest has recorded its aggregation. Returns the catalog path,
+    or ``None`` on failure — never raises, readers fall back to scanning.
+    """
+    from deltalake import DeltaTable
+
+    from depictio.api.v1.s3 import remove_paths, storage_options_for
+
+    try:
+        doc = deltatables_collection.find_one({"data_collection_id": ObjectId(dc_id)})
+        if not doc or not doc.get("delta_table_location") or not _latest_hash(doc):
+            return None
+        location = doc["delta_table_location"]
+        options = storage_options_for(location)
+
+        version = DeltaTable(location, storage_options=options).version()
+        path = stats_sidecar_path(location, version)
+        try:
+            _load(path)
+            logger.debug(f"Column stats for DC {dc_id} v{version} found at {path}")
+        except Exception:
+            path = write_column_stats(location, options)
+            logger.info(f"Column stats for DC {dc_id} v{version} built at {path}")
+
+        previous = ((doc.get("flexible_metadata") or {}).get("column_stats") or {}).get("path")
+        set_record(
+            doc["_id"],
+            "column_stats",
+            {"path": path, "delta_version": version, "aggregation_hash": _latest_hash(doc)},
+        )
+        if previous and previous != path:
+            remove_paths([previous])
+        return path
+    except Exception as e:
+        logger.warning(f"Column stats refresh failed for DC {dc_id}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _load(path: str) -> dict[str, dict[str, Any]]:
+    from depictio.api.v1.s3 import storage_options_for
+
+    return read_column_stats(path, storage_options_for(path))
+
+
+def column_catalog(
+    dc_id: str, deltatable_doc: dict | None = None
+) -> dict[str, dict[str, Any]] | None:
+    """``{column: stats}`` for the DC's current data, or ``None`` if there is none.
+
+    The returned mapping is shared between callers; treat it as read-only.
+    """
+    try:
+        doc = deltatable_doc or deltatables_collection.find_one(
+            {"data_collection_id": ObjectId(str(dc_id))}
+        )
+        record = ((doc or {}).get("flexible_metadata") or {}).get("column_stats") or {}
+        if not record.get("path") or record.get("aggregation_hash") != _latest_hash(doc or {}):
+            return None
+        return _load(record["path"])
+    except Exception as e:
+        logger.debug(f"Column stats unavailable for DC {dc_id}: {e}")
+        return None
+
+
+def catalog_unique_values(stats: dict[str, Any] | None, limit: int) -> list[str] | None:
+    """Sorted distinct values of a column, or ``None`` if it has no full dictionary."""
+    dictionary = (stats or {}).get("dictionary")
+    if dictionary is None:
+        return None
+    return sorted(entry["value"] for entry in dictionary)[:limit]
+
+
+def catalog_type_name(dtype: str) -> str:
+    """Spec ``type`` name of a Polars dtype string, as the CLI's specs would record it."""
+    if dtype.startswith(("Int", "UInt")):
+        return "int64"
+    if dtype.startswith("Float"):
+        return "float64"
+    if dtype == "Boolean":
+        return "bool"
+    if dtype.startswith(("Date", "Datetime")):
+        return "datetime"
+    if dtype.startswith("Duration"):
+        return "time"
+    if dtype.startswith(("Categorical", "Enum")):
+        return "category"
+    return "object"
+
+
+def catalog_specs(catalog: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Card-spec values the catalog knows exactly, as ``{column: {aggregation: value}}``.
+
+    The same shape as a column's entry in ``aggregation_columns_specs``, so it
+    can stand in where those were never stored (the API-side upload path) or
+    lack a column: only the card methods ``agg_functions`` lists for the
+    column's type, under that type's name for them (numeric columns record
+    ``unique``, text ones ``nunique``), with integer bounds kept integers.
+    """
+    from depictio.api.v1.utils import agg_functions
+
+    specs: dict[str, dict[str, Any]] = {}
+    for column, stats in catalog.items():
+        type_name = catalog_type_name(stats["dtype"])
+        methods = (agg_functions.get(type_name) or {}).get("card_methods") or {}
+        entry: dict[str, Any] = {"count": stats["count"]}
+        if stats.get("n_unique_exact"):
+            for name in ("unique", "nunique"):
+                if name in methods:
+                    entry[name] = stats["n_unique"]
+        if type_name in ("int64", "float64") and stats.get("min") is not None:
+            # The string bounds are exact; the float ones lose integers past 2**53.
+            cast = int if type_name == "int64" else float
+            entry["min"] = cast(stats["min"])
+            entry["max"] = cast(stats["max"])
+        specs[column] = entry
+    return specs
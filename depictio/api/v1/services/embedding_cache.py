@@ -0,0 +1,322 @@
+"""Persisted embeddings: fit once per Delta version, serve every filter from it.
+
+``compute_embedding`` used to load the whole feature matrix and re-run the
+dimensionality reduction on every request the ``compute_results`` cache missed —
+and that cache is keyed by the full payload, so every new filter combination
+was a new PCA, UMAP, t-SNE or PCoA over the filtered rows.
+
+The fit is now an artifact of the data. It is keyed by (Delta version, method,
+parameters, id column, feature columns) and written once next to the table::
+
+    <delta_table_location>/_depictio/embeddings/v<version>-<digest>.parquet
+    <delta_table_location>/_depictio/embeddings/v<version>-<digest>.model.npz
+
+The parquet holds one row per sample (``sample_id``, ``dim_1``..). The npz holds
+a PCA fit as plain arrays (centring, scaling, axes), read back with
+``allow_pickle=False``: the bucket is writable with CLI credentials, so nothing
+read from it may deserialize into code. A request then only reads the id column
+and the pass-through columns under its filters, and keeps the matching rows of
+the artifact, so a filtered view is a subset of the full map rather than a new
+one. Points keep their place as filters change.
+
+When a new version only appended rows since a recorded PCA fit of the same key,
+the appended files are read on their own and projected onto that fit. The
+earlier samples keep their coordinates. Anything else — an overwrite, a merge,
+UMAP (whose reducer only serializes as a pickle), t-SNE or PCoA — refits.
+Sample ids must be unique, since they are how rows are matched across versions
+and filters; a matrix with duplicate ids is not cached.
+
+Artifacts are recorded on the ``deltatables`` document
+(``flexible_metadata.embeddings``); recording a key's new version deletes the
+files of its older ones. :func:`cached_embedding` returns ``None`` instead of
+raising, and the caller computes the embedding the old way.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import time
+from typing import Any
+
+import numpy as np
+import polars as pl
+from bson import ObjectId
+
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.services.sidecars import SidecarRegistry, replace_entries
+from depictio.models.delta_appends import appended_files
+
+EMBEDDING_DIR = "_depictio/embeddings"
+_NUMERIC = (
+    pl.Float32,
+    pl.Float64,
+    pl.Int8,
+    pl.Int16,
+    pl.Int32,
+    pl.Int64,
+    pl.UInt8,
+    pl.UInt16,
+    pl.UInt32,
+    pl.UInt64,
+)
+
+_registry = SidecarRegistry()
+
+
+def feature_columns(schema: pl.Schema, feature_id_col: str) -> list[str]:
+    """The matrix's numeric columns, in table order, less the id column."""
+    return [c for c, dtype in schema.items() if c != feature_id_col and dtype in _NUMERIC]
+
+
+def embedding_digest(
+    method: str, kwargs: dict[str, Any], feature_id_col: str, features: list[str]
+) -> str:
+    blob = json.dumps(
+        {"m": method, "k": kwargs, "id": feature_id_col, "f": features},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def embedding_path(delta_table_location: str, delta_version: int, digest: str) -> str:
+    """Where the coordinates for one (version, key) live; the model sits beside them."""
+    return (
+        f"{delta_table_location.rstrip('/')}/{EMBEDDING_DIR}/"
+        f"v{int(delta_version):020d}-{digest}.parquet"
+    )
+
+
+def _model_path(path: str) -> str:
+    return path.removesuffix(".parquet") + ".model.npz"
+
+
+def _dump_model(model: Any) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, mean=model.mean, scale=model.scale, components=model.components)
+    return buffer.getvalue()
+
+
+def _load_model(data: bytes) -> Any:
+    from depictio.recipes.lib.dimreduction import PCAModel
+
+    with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+        return PCAModel(arrays["mean"], arrays["scale"], arrays["components"])
+
+
+def _put(path: str, data: bytes) -> None:
+    if "://" in path:
+        from depictio.api.v1.s3 import s3_client
+
+        bucket, _, key = path.split("://", 1)[1].partition("/")
+        s3_client.put_object(Bucket=bucket, Key=key, Body=data)
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+
+def _get(path: str) -> bytes:
+    if "://" in path:
+        from depictio.api.v1.s3 import s3_client
+
+        bucket, _, key = path.split("://", 1)[1].partition("/")
+        return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _read_coords(path: str) -> pl.DataFrame | None:
+    from depictio.api.v1.s3 import storage_options_for
+
+    try:
+        return pl.read_parquet(path, storage_options=storage_options_for(path))
+    except Exception:
+        return None
+
+
+def _matrix(scan: pl.LazyFrame, method: str, feature_id_col: str, features: list[str]):
+    matrix = scan.select([feature_id_col, *features]).collect()
+    if matrix[feature_id_col].n_unique() != matrix.height:
+        raise ValueError(f"duplicate values in {feature_id_col!r}")
+    if method == "pcoa":
+        # Bray-Curtis needs non-negative values; shift the whole matrix into
+        # the positive orthant, as the uncached path does.
+        low = matrix.select(pl.min_horizontal(pl.col(features).min())).item()
+        if low is not None and low < 0:
+            matrix = matrix.with_columns(pl.col(features) - low)
+    return matrix
+
+
+def _fit(method: str, matrix: pl.DataFrame, kwargs: dict[str, Any]):
+    from depictio.recipes.lib.dimreduction import fit_pca, run_pcoa, run_tsne, run_umap
+
+    if method == "pca":
+        return fit_pca(matrix, **kwargs)
+    # Only a PCA fit is kept: a UMAP reducer serializes as nothing but a
+    # pickle, which must not be read back from a bucket the CLI can write to,
+    # so UMAP, like t-SNE and PCoA, refits on a new version of the table.
+    runner = {"umap": run_umap, "tsne": run_tsne}.get(method, run_pcoa)
+    return runner(matrix, **kwargs), None
+
+
+def _extend(
+    record: dict,
+    location: str,
+    options: dict | None,
+    version: int,
+    feature_id_col: str,
+    features: list[str],
+) -> tuple[pl.DataFrame, Any] | None:
+    """The recorded fit's coordinates and model, extended by the samples appended since."""
+    from depictio.recipes.lib.dimreduction import transform_embedding
+
+    files = appended_files(location, int(record["delta_version"]), version, options or {})
+    previous = _read_coords(record["path"])
+    if files is None or previous is None:
+        return None
+    model = _load_model(_get(record["model"]))
+    if not files:
+        return previous, model
+    added = pl.scan_parquet(files, storage_options=options).select([feature_id_col, *features])
+    added = added.collect()
+    ids = added[feature_id_col].cast(pl.Utf8)
+    if ids.n_unique() != added.height or ids.is_in(previous["sample_id"].implode()).any():
+        return None
+    coords = pl.concat([previous, transform_embedding(model, added)], how="vertical_relaxed")
+    return coords, model
+
+
+def _record(doc: dict, digest: str, path: str, model: str | None, version: int) -> None:
+    """Register the artifact on the DC's document; drop this key's older versions."""
+    from depictio.api.v1.s3 import remove_paths
+
+    recorded = (doc.get("flexible_metadata") or {}).get("embeddings") or []
+    stale = [
+        p
+        for e in recorded
+        if e.get("digest") == digest and e.get("delta_version") != version
+        for p in (e.get("path"), e.get("model"))
+        if p
+    ]
+    replace_entries(
+        doc["_id"],
+        "embeddings",
+        {"digest": digest},
+        {"digest": digest, "delta_version": version, "path": path, "model": model},
+    )
+    if stale:
+        remove_paths(stale)
+
+
+def _coordinates(
+    doc: dict,
+    location: str,
+    options: dict | None,
+    version: int,
+    method: str,
+    kwargs: dict[str, Any],
+    feature_id_col: str,
+    stats: dict,
+) -> pl.DataFrame:
+    scan = pl.scan_delta(location, version=version, storage_options=options)
+    features = feature_columns(scan.collect_schema(), feature_id_col)
+    if not features:
+        raise ValueError("no numeric feature columns")
+    digest = embedding_digest(method, kwargs, feature_id_col, features)
+    path = embedding_path(location, version, digest)
+
+    with _registry.lock(path):
+        coords = _read_coords(path)
+        if coords is not None:
+            stats["source"] = "artifact"
+            return coords
+
+        started = time.monotonic()
+        recorded = (doc.get("flexible_metadata") or {}).get("embeddings") or []
+        earlier = [
+            e
+            for e in recorded
+            if e.get("digest") == digest
+            and str(e.get("model") or "").endswith(".npz")
+            and int(e.get("delta_version", version)) < version
+        ]
+        extended = None
+        if earlier:
+            latest = max(earlier, key=lambda e: int(e["delta_version"]))
+            try:
+                extended = _extend(latest, location, options, version, feature_id_col, features)
+            except Exception as e:
+                logger.debug(
+                    f"Embedding {method}-{digest}: cannot extend v{latest['delta_version']}: {e}"
+                )
+        if extended is not None:
+            # The fit is unchanged, so its model is carried over to the new version.
+            coords, model = extended
+            stats["source"] = "appended"
+        else:
+            matrix = _matrix(scan, method, feature_id_col, features)
+            coords, model = _fit(method, matrix, kwargs)
+            stats["source"] = "fitted"
+        stats["compute_ms"] = int((time.monotonic() - started) * 1000)
+
+        model_path = _model_path(path) if model is not None else None
+        if model_path:
+            _put(model_path, _dump_model(model))
+        if "://" not in path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        coords.write_parquet(path, storage_options=options)
+        _record(doc, digest, path, model_path, version)
+        logger.info(
+            f"Embedding {method} v{version}-{digest}: {stats['source']} "
+            f"{coords.height} samples in {stats['compute_ms']}ms"
+        )
+        return coords
+
+
+def cached_embedding(
+    dc_id: str,
+    method: str,
+    kwargs: dict[str, Any],
+    feature_id_col: str,
+    filter_metadata: list[dict] | None,
+    extra_cols: list[str],
+    stats: dict | None = None,
+) -> pl.DataFrame | None:
+    """The DC's embedding restricted to the filtered rows, or ``None`` to compute it inline.
+
+    Columns are ``sample_id``, ``dim_1``.. and the requested ``extra_cols`` the
+    table has, in the filtered table's row order. ``stats`` receives
+    ``source`` (``artifact``, ``appended`` or ``fitted``) and ``compute_ms``.
+    """
+    from deltalake import DeltaTable
+
+    from depictio.api.v1.db import deltatables_collection
+    from depictio.api.v1.deltatables_utils import _apply_scan_filters
+    from depictio.api.v1.s3 import storage_options_for
+
+    stats = {} if stats is None else stats
+    stats.setdefault("compute_ms", 0)
+    try:
+        doc = deltatables_collection.find_one({"data_collection_id": ObjectId(str(dc_id))})
+        if not doc or not doc.get("delta_table_location"):
+            return None
+        location = doc["delta_table_location"]
+        options = storage_options_for(location)
+        version = DeltaTable(location, storage_options=options).version()
+        coords = _coordinates(
+            doc, location, options, version, method, kwargs, feature_id_col, stats
+        )
+
+        scan = pl.scan_delta(location, version=version, storage_options=options)
+        scan = _apply_scan_filters(scan, filter_metadata, str(dc_id))
+        names = scan.collect_schema().names()
+        extras = [c for c in dict.fromkeys(extra_cols) if c in names and c not in coords.columns]
+        rows = scan.select(pl.col(feature_id_col).cast(pl.Utf8).alias("sample_id"), *extras)
+        return rows.collect().join(coords, on="sample_id", how="inner", maintain_order="left")
+    except Exception as e:
+        logger.warning(f"Embedding cache unavailable for DC {dc_id} ({method}): {e}")
+        return None
@@ -2,11 +2,19 @@
 WebSocket connection manager for real-time event broadcasting.
 
 Manages WebSocket connections with Redis pub/sub for multi-instance support.
+
+Every client has its own bounded outbox, drained by its own writer task, so a
+broadcast only queues messages: one slow or stalled client delays nobody else,
+and once its outbox is full its oldest pending message is dropped. Data
+collection events are coalesced per dashboard for ``events.debounce_ms`` before
+they are queued, whichever instance they came from, so a burst of appends is
+one refresh rather than one per append.
 """
 
 import asyncio
 import json
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +25,43 @@ from depictio.api.v1.configs.config import settings
 from depictio.api.v1.configs.logging_init import logger
 from depictio.models.models.realtime import ConnectionStatus, EventMessage, EventType
 
+# Events that only tell a dashboard to refetch; a burst of them is one refresh.
+_COALESCED_EVENTS = {
+    EventType.DATA_COLLECTION_UPDATED.value,
+    EventType.DATA_COLLECTION_CREATED.value,
+}
+# How many delivered message ids are remembered to drop pub/sub echoes.
+_RECENT_MESSAGE_IDS = 1024
+
+
+class _Outbox:
+    """Messages waiting for one client; when full, the oldest is dropped."""
+
+    def __init__(self, size: int) -> None:
+        self.messages: deque[dict[str, Any]] = deque(maxlen=max(1, size))
+        self.ready = asyncio.Event()
+        self.dropped = 0
+        self.task: asyncio.Task | None = None
+
+    def put(self, data: dict[str, Any]) -> bool:
+        """Queue ``data``; returns False if that pushed out an older message."""
+        full = len(self.messages) == self.messages.maxlen
+        if full:
+            self.dropped += 1
+        self.messages.append(data)
+        self.ready.set()
+        return not full
+
+
+class _Pending:
+    """The latest of a run of coalesced events, not yet delivered."""
+
+    def __init__(self, message: dict[str, Any], first: float) -> None:
+        self.message = message
+        self.first = first
+        self.count = 1
+        self.handle: asyncio.TimerHandle | None = None
+
 
 class ConnectionManager:
     """
@@ -39,6 +84,16 @@ class ConnectionManager:
         # Client metadata: client_id -> metadata dict
         self._client_metadata: dict[str, dict[str, Any]] = {}
 
+        # Per-client send queues, each drained by its own writer task
+        self._outboxes: dict[str, _Outbox] = {}
+
+        # Coalesced events awaiting delivery: (dashboard, event type, DC) -> latest
+        self._pending: dict[tuple[str, str, str], _Pending] = {}
+
+        # (dashboard_id, message_id) recently delivered here; a message this
+        # instance publishes comes back over pub/sub and is dropped the 2nd time
+        self._recent: OrderedDict[tuple[str, str], None] = OrderedDict()
+
         # Redis pub/sub client (initialized lazily)
         self._redis: Redis | None = None
         self._pubsub_task: asyncio.Task | None = None
@@ -102,6 +157,11 @@ class ConnectionManager:
                 pass
             self._pubsub_task = None
 
+        for pending in self._pending.values():
+            if pending.handle is not None:
+                pending.handle.cancel()
+        self._pending.clear()
+
         if self._redis:
             await self._redis.close()
             self._redis = None
@@ -142,6 +202,9 @@ class ConnectionManager:
 
         client_id = str(uuid.uuid4())
         self._connections[client_id] = websocket
+        outbox = _Outbox(settings.events.ws_send_queue_size)
+        outbox.task = asyncio.create_task(self._write(client_id, websocket, outbox))
+        self._outboxes[client_id] = outbox
         self._client_metadata[client_id] = {
             "user_id": user_id,
             "connected_at": datetime.utcnow().isoformat(),
@@ -158,7 +221,7 @@ class ConnectionManager:
             client_id=client_id,
             subscriptions=[dashboard_id] if dashboard_id else [],
         )
-        await self._send_to_client(client_id, status.model_dump(mode="json"))
+        self._enqueue(client_id, status.model_dump(mode="json"))
 
         logger.info(
             f"WebSocket connected: client_id={client_id}, "
@@ -184,6 +247,11 @@ class ConnectionManager:
         self._connections.pop(client_id, None)
         self._client_metadata.pop(client_id, None)
 
+        # Stop the client's writer, unless it is the writer disconnecting itself
+        outbox = self._outboxes.pop(client_id, None)
+        if outbox and outbox.task and outbox.task is not asyncio.current_task():
+            outbox.task.cancel()
+
         logger.info(
             f"WebSocket disconnected: client_id={client_id}, total={len(self._connections)}"
         )
@@ -229,6 +297,9 @@ class ConnectionManager:
             dashboard_id: The dashboard ID
             message: The event message to broadcast
         """
+        # The id lets this instance recognise the copy pub/sub hands back to it.
+        if not message.message_id:
+            message = message.model_copy(update={"message_id": uuid.uuid4().hex})
         message_data = message.model_dump(mode="json")
 
         # Publish to Redis for cross-instance delivery
@@ -247,38 +318,84 @@ class ConnectionManager:
         self, dashboard_id: str, message_data: dict[str, Any]
     ) -> None:
         """Broadcast to local WebSocket connections for a dashboard."""
-        client_ids = self._dashboard_subscriptions.get(dashboard_id, set())
-        if not client_ids:
+        message_id = message_data.get("message_id")
+        if message_id:
+            seen = (dashboard_id, str(message_id))
+            if seen in self._recent:
+                return
+            self._recent[seen] = None
+            if len(self._recent) > _RECENT_MESSAGE_IDS:
+                self._recent.popitem(last=False)
+
+        window = settings.events.debounce_ms / 1000
+        event_type = message_data.get("event_type")
+        dc_id = message_data.get("data_collection_id")
+        if window <= 0 or event_type not in _COALESCED_EVENTS or not dc_id:
+            self._deliver(dashboard_id, message_data)
             return
 
-        disconnected = set()
-        for client_id in client_ids:
-            try:
-                await self._send_to_client(client_id, message_data)
-            except Exception as e:
-                logger.warning(f"Failed to send to client {client_id}: {e}")
-                disconnected.add(client_id)
-
-        # Clean up disconnected clients
-        for client_id in disconnected:
+        # Trailing debounce: deliver once no further event arrived for
+        # `window`, or `debounce_max_wait_ms` after the first, with the latest.
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        key = (dashboard_id, str(event_type), str(dc_id))
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _Pending(message_data, now)
+        else:
+            pending.message = message_data
+            pending.count += 1
+            if pending.handle is not None:
+                pending.handle.cancel()
+        max_wait = max(window, settings.events.debounce_max_wait_ms / 1000)
+        pending.handle = loop.call_at(min(now + window, pending.first + max_wait), self._flush, key)
+
+    def _flush(self, key: tuple[str, str, str]) -> None:
+        """Deliver a run of coalesced events as its latest one."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        message = pending.message
+        if pending.count > 1:
+            payload = {**(message.get("payload") or {}), "coalesced_events": pending.count}
+            message = {**message, "payload": payload}
+        self._deliver(key[0], message)
+
+    def _deliver(self, dashboard_id: str, message_data: dict[str, Any]) -> None:
+        """Queue a message for every local client subscribed to the dashboard."""
+        for client_id in list(self._dashboard_subscriptions.get(dashboard_id, ())):
+            self._enqueue(client_id, message_data)
+
+    def _enqueue(self, client_id: str, data: dict[str, Any]) -> None:
+        """Queue data for a specific client; never waits on the socket."""
+        outbox = self._outboxes.get(client_id)
+        if outbox is not None and not outbox.put(data):
+            logger.debug(
+                f"Client {client_id} is not keeping up: dropped its oldest pending "
+                f"message ({outbox.dropped} so far)"
+            )
+
+    async def _write(self, client_id: str, websocket: WebSocket, outbox: _Outbox) -> None:
+        """Send a client's queued messages in order, until it disconnects."""
+        try:
+            while True:
+                await outbox.ready.wait()
+                outbox.ready.clear()
+                while outbox.messages:
+                    await websocket.send_json(outbox.messages.popleft())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to client {client_id}: {e}")
             await self.disconnect(client_id)
 
-    async def _send_to_client(self, client_id: str, data: dict[str, Any]) -> None:
-        """Send data to a specific client."""
-        websocket = self._connections.get(client_id)
-        if websocket:
-            await websocket.send_json(data)
-
     async def send_heartbeat(self, client_id: str) -> None:
-        """Send a heartbeat message to keep the connection alive."""
+        """Queue a heartbeat message to keep the connection alive."""
         message = EventMessage(
             event_type=EventType.HEARTBEAT,
             payload={"server_time": datetime.utcnow().isoformat()},
         )
-        try:
-            await self._send_to_client(client_id, message.model_dump(mode="json"))
-        except Exception as e:
-            logger.debug(f"Heartbeat failed for {client_id}: {e}")
+        self._enqueue(client_id, message.model_dump(mode="json"))
 
     def get_dashboard_subscribers(self, dashboard_id: str) -> set[str]:
         """Get all client IDs subscribed to a dashboard."""
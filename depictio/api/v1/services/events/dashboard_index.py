@@ -0,0 +1,144 @@
+"""Reverse index from data collections to the dashboards that display them.
+
+The change-stream watcher needs, for every changed DC, the dashboards to
+notify. It used to answer that with an ``$objectToArray``/``$unwind``
+aggregation over every dashboard document, per change event. That scan grew
+with the number of dashboards, and it never matched anything either:
+``stored_metadata`` is a list of components, not a mapping, and components
+reference their DC as ``dc_id``, not ``data_collection_id``.
+
+The answer is now kept in its own collection, one document per (DC, dashboard)
+pair::
+
+    {"dc_id": "<dc>", "dashboard_id": "<dashboard>",
+     "parent_dashboard_id": "<main tab>" | None, "component_ids": [...]}
+
+indexed on ``dc_id`` for the watcher and on ``dashboard_id`` /
+``parent_dashboard_id`` for the writers. Tabs are dashboard documents of their
+own and get their own entries. A component counts for every DC it references:
+``dc_id``, ``dc_config._id`` and the secondary ``*_dc_id`` bindings of maps and
+advanced visualisations (``geojson_dc_id``, ``matrix_dc_id``, ...).
+
+The dashboard write paths (save, YAML/JSON import, delete, tab delete, the
+YAML watcher) call :func:`refresh_dashboard_index`, which rewrites the entries
+of a dashboard and its tabs from what is stored now. :func:`rebuild_dashboard_index`
+rebuilds the whole collection at event-service startup; it also picks up
+writes that bypass those paths (project or user deletion, ``db_init``), whose
+stale entries meanwhile only name dashboards that nobody is subscribed to.
+Both run only with the events system enabled, and neither raises.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bson import ObjectId
+from pymongo import ASCENDING, DeleteMany, InsertOne
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.db import dashboards_collection, dc_dashboard_index_collection
+
+_PROJECTION = {"dashboard_id": 1, "parent_dashboard_id": 1, "stored_metadata": 1}
+
+
+def _dc_refs(value: Any, refs: set[str]) -> None:
+    """Collect the DC ids ``value`` (a component, or part of one) references."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "dc_id" or key.endswith("_dc_id"):
+                if item is not None and ObjectId.is_valid(str(item)):
+                    refs.add(str(item))
+            elif key == "dc_config" and isinstance(item, dict):
+                if item.get("_id") is not None and ObjectId.is_valid(str(item["_id"])):
+                    refs.add(str(item["_id"]))
+                _dc_refs(item, refs)
+            else:
+                _dc_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            _dc_refs(item, refs)
+
+
+def dashboard_entries(dashboard: dict[str, Any]) -> list[dict[str, Any]]:
+    """The index entries of one dashboard document."""
+    dashboard_id = str(dashboard.get("dashboard_id") or dashboard["_id"])
+    parent = dashboard.get("parent_dashboard_id")
+    components: dict[str, list[str]] = {}
+    for component in dashboard.get("stored_metadata") or []:
+        if not isinstance(component, dict):
+            continue
+        refs: set[str] = set()
+        _dc_refs(component, refs)
+        for dc_id in refs:
+            components.setdefault(dc_id, []).append(str(component.get("index") or ""))
+    return [
+        {
+            "dc_id": dc_id,
+            "dashboard_id": dashboard_id,
+            "parent_dashboard_id": str(parent) if parent else None,
+            "component_ids": component_ids,
+        }
+        for dc_id, component_ids in sorted(components.items())
+    ]
+
+
+def _ensure_indexes() -> None:
+    dc_dashboard_index_collection.create_index(
+        [("dc_id", ASCENDING), ("dashboard_id", ASCENDING)], unique=True
+    )
+    dc_dashboard_index_collection.create_index("dashboard_id")
+    dc_dashboard_index_collection.create_index("parent_dashboard_id")
+
+
+def rebuild_dashboard_index() -> int:
+    """Rebuild the index from every stored dashboard. Returns the entry count."""
+    if not settings.events.enabled:
+        return 0
+    try:
+        _ensure_indexes()
+        entries = [
+            entry
+            for dashboard in dashboards_collection.find({}, _PROJECTION)
+            for entry in dashboard_entries(dashboard)
+        ]
+        dc_dashboard_index_collection.delete_many({})
+        if entries:
+            dc_dashboard_index_collection.insert_many(entries, ordered=False)
+        logger.info(f"DC->dashboard index rebuilt: {len(entries)} entries")
+        return len(entries)
+    except Exception as e:
+        logger.warning(f"DC->dashboard index rebuild failed: {e}")
+        return 0
+
+
+def refresh_dashboard_index(*dashboard_ids: Any) -> None:
+    """Re-index ``dashboard_ids`` and their tabs from their stored documents.
+
+    A dashboard that no longer exists loses its entries, so this is also the
+    delete hook.
+    """
+    if not settings.events.enabled or not dashboard_ids:
+        return
+    ids = [str(d) for d in dashboard_ids]
+    oids = [ObjectId(d) for d in ids if ObjectId.is_valid(d)]
+    try:
+        dashboards = dashboards_collection.find(
+            {"$or": [{"dashboard_id": {"$in": oids}}, {"parent_dashboard_id": {"$in": oids}}]},
+            _PROJECTION,
+        )
+        inserts = [InsertOne(e) for d in dashboards for e in dashboard_entries(d)]
+        stale = {"$or": [{"dashboard_id": {"$in": ids}}, {"parent_dashboard_id": {"$in": ids}}]}
+        dc_dashboard_index_collection.bulk_write([DeleteMany(stale), *inserts], ordered=True)
+    except Exception as e:
+        logger.warning(f"DC->dashboard index refresh failed for {ids}: {e}")
+
+
+def dashboards_for_dc(dc_id: str) -> list[str] | None:
+    """Dashboards with a component on ``dc_id``; ``None`` when the index is unreadable."""
+    try:
+        cursor = dc_dashboard_index_collection.find({"dc_id": str(dc_id)}, {"dashboard_id": 1})
+        return list(dict.fromkeys(doc["dashboard_id"] for doc in cursor))
+    except Exception as e:
+        logger.warning(f"DC->dashboard index lookup failed for {dc_id}: {e}")
+        return None
@@ -54,6 +54,12 @@ class EventService:
         # Start Redis pub/sub listener for cross-instance messaging
         await self._connection_manager.start_pubsub_listener()
 
+        # The watcher and the upsert broadcast look affected dashboards up in
+        # the DC -> dashboard index; rebuild it from the stored dashboards.
+        from depictio.api.v1.services.events.dashboard_index import rebuild_dashboard_index
+
+        await asyncio.to_thread(rebuild_dashboard_index)
+
         # Start MongoDB change watcher
         if settings.events.mongodb_change_streams_enabled:
             self._mongodb_watcher = MongoDBChangeWatcher(
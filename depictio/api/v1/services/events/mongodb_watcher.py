@@ -9,7 +9,6 @@ from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
-from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
 from pymongo.errors import OperationFailure
 
@@ -209,6 +208,10 @@ class MongoDBChangeWatcher:
         """
         Find all dashboards that have components using a specific data collection.
 
+        Reads the DC -> dashboard reverse index (see ``dashboard_index``), kept
+        up to date by the dashboard write paths, instead of scanning every
+        dashboard's components on each change event.
+
         Args:
             dc_id: The data collection ID
 
@@ -219,36 +222,9 @@ class MongoDBChangeWatcher:
             return []
 
         try:
-            dashboards_collection = self._db[settings.mongodb.collections.dashboards_collection]
-
-            # Query for dashboards where stored_metadata contains this DC ID
-            # The structure is: stored_metadata.{component_id}.data_collection_id
-            # We need to check if any component uses this DC
-
-            # Use aggregation to find dashboards with matching DC in stored_metadata
-            pipeline = [
-                {
-                    "$project": {
-                        "_id": 1,
-                        "stored_metadata_values": {"$objectToArray": "$stored_metadata"},
-                    }
-                },
-                {"$unwind": "$stored_metadata_values"},
-                {
-                    "$match": {
-                        "$or": [
-                            {"stored_metadata_values.v.data_collection_id": dc_id},
-                            {"stored_metadata_values.v.data_collection_id": ObjectId(dc_id)},
-                        ]
-                    }
-                },
-                {"$group": {"_id": "$_id"}},
-            ]
-
-            cursor = dashboards_collection.aggregate(pipeline)
-            dashboard_ids = [str(doc["_id"]) async for doc in cursor]
-
-            return dashboard_ids
+            index = self._db[settings.mongodb.collections.dc_dashboard_index_collection]
+            cursor = index.find({"dc_id": dc_id}, {"dashboard_id": 1, "_id": 0})
+            return list(dict.fromkeys([doc["dashboard_id"] async for doc in cursor]))
 
         except Exception as e:
             logger.error(f"Error finding dashboards for DC {dc_id}: {e}")
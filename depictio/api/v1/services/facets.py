@@ -0,0 +1,270 @@
+"""Faceted "available values" across linked data collections (``POST /deltatables/facets``).
+
+The React viewer greys out filter options that no loaded data collection can
+show. It used to work that out in the browser: one ``/unique_values`` call per
+(filter, DC) — each a full unique scan of the column that shipped every
+distinct value — then a set intersection in JavaScript. It also ignored the
+other filters entirely, so an option stayed "available" after another filter
+had already removed every row carrying it.
+
+Here a single request names the facets it wants and carries the filter state.
+Each facet gets the values and row counts that remain in its DC under every
+*other* filter — its own is left out, or the facet would only ever echo the
+current selection — with cross-DC filters translated through the project's
+links exactly as the render endpoints translate them. All facets on one DC are
+planned on one scan and evaluated with one ``collect_all`` (``ScanPlanner``).
+
+A facet on a MultiQC DC lists the report's sample names (canonical, variants
+and their suffix-stripped bases); those DCs have no rows to count.
+
+Responses are cached in Redis, keyed on the request and the aggregation hash of
+every DC it reads, so an ingest retires them. Link and project edits drop them
+along with the project's link resolutions (``invalidate_cache_tags`` on the
+project id, which both keys carry); the TTL only covers edits made around the
+API.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from typing import Any
+
+import polars as pl
+from bson import ObjectId
+
+from depictio.api.v1.configs.logging_init import logger
+from depictio.models.models.deltatables import FacetsRequest, FacetTarget
+
+FACETS_CACHE_TTL_SECONDS = 300
+
+
+def _filter_ref(f: dict) -> tuple[str, str | None]:
+    meta = f.get("metadata") or {}
+    return str(meta.get("dc_id") or f.get("dc_id") or ""), (
+        meta.get("column_name") or f.get("column_name")
+    )
+
+
+def _is_active(f: dict) -> bool:
+    from depictio.api.v1.deltatables_utils import is_active_filter_value
+
+    return is_active_filter_value(f.get("value"))
+
+
+def _other_filters(filters: list[dict], facet: FacetTarget) -> list[dict]:
+    """Active filters minus the facet's own (same column of ``exclude_dc_id``)."""
+    own = (str(facet.exclude_dc_id or facet.dc_id), facet.column)
+    return [f for f in filters if _is_active(f) and _filter_ref(f) != own]
+
+
+def project_data_collections(project: dict) -> dict[str, dict]:
+    """``{dc_id: {"workflow_id", "type"}}`` for every DC of a project document."""
+    out: dict[str, dict] = {}
+    for wf in project.get("workflows") or []:
+        for dc in wf.get("data_collections") or []:
+            out[str(dc.get("_id"))] = {
+                "workflow_id": str(wf.get("_id")),
+                "type": ((dc.get("config") or {}).get("type") or "table").lower(),
+            }
+    return out
+
+
+def facets_cache_key(request: FacetsRequest) -> str:
+    """Cache key for ``request``: its content plus the data version of every DC it reads."""
+    from depictio.api.v1.filter_links import _agg_hash
+
+    dc_ids = {f.dc_id for f in request.facets} | {
+        dc for dc, _ in map(_filter_ref, request.filters) if dc
+    }
+    canonical = json.dumps(
+        {
+            "request": request.model_dump(),
+            "data": {dc: _agg_hash(dc) for dc in sorted(dc_ids)},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+    return f"facets_{request.project_id}_{digest}"
+
+
+def value_counts_plan(scan: pl.LazyFrame, column: str, metadata: list[dict]) -> pl.LazyFrame:
+    """Values of ``column`` with their row counts under ``metadata``, most frequent first.
+
+    Filters on columns this DC doesn't have are dropped, as the loaders drop
+    them — the link-translated filter on the join column stands in for them.
+    Values are grouped as they are; :func:`_listed` turns them into the strings
+    every value listing ships once the plan has run.
+    """
+    from depictio.api.v1.deltatables_utils import _filter_columns, process_metadata_and_filter
+
+    schema = scan.collect_schema()
+    if column not in schema:
+        raise KeyError(column)
+    usable = [m for m in metadata if _filter_columns([m]) <= set(schema.names())]
+    lf = scan
+    for predicate in process_metadata_and_filter(usable, dict(schema)):
+        lf = lf.filter(predicate)
+    return (
+        lf.select(pl.col(column).alias("value"))
+        .drop_nulls()
+        .group_by("value")
+        .agg(pl.len().cast(pl.Int64).alias("count"))
+        .sort(["count", "value"], descending=[True, False])
+    )
+
+
+def _listed(frame: pl.DataFrame | None) -> pl.DataFrame | None:
+    """``frame`` with its values as ``value_string`` lists them, as the catalog does."""
+    from depictio.models.column_stats import value_string
+
+    if frame is None or frame.schema["value"] in (pl.String, pl.Categorical):
+        return frame
+    values = pl.Series("value", [value_string(v) for v in frame["value"]], dtype=pl.String)
+    return frame.with_columns(values)
+
+
+def _multiqc_values(dc_id: str) -> pl.DataFrame | None:
+    from depictio.api.v1.endpoints.links_endpoints.resolution import multiqc_sample_mappings
+    from depictio.api.v1.endpoints.links_endpoints.resolvers import SampleMappingResolver
+
+    names: set[str] = set()
+    for canonical, variants in multiqc_sample_mappings(dc_id).items():
+        for name in [canonical, *(variants or [])]:
+            names.add(str(name))
+            names.add(SampleMappingResolver._strip_sample_suffix(str(name)))
+    if not names:
+        return None  # no mappings yet: nothing known, rather than "no samples"
+    return pl.DataFrame(
+        {"value": sorted(names), "count": [None] * len(names)},
+        schema={"value": pl.String, "count": pl.Int64},
+    )
+
+
+def _init_entry(dc_id: str, dc_type: str) -> dict | None:
+    from depictio.api.v1.db import deltatables_collection
+    from depictio.api.v1.deltatables_utils import _get_aggregation_salts
+
+    doc = deltatables_collection.find_one(
+        {"data_collection_id": ObjectId(dc_id)}, {"delta_table_location": 1}
+    )
+    if not doc or not doc.get("delta_table_location"):
+        return None
+    version, _hash = _get_aggregation_salts(dc_id)
+    return {
+        "delta_location": doc["delta_table_location"],
+        "dc_type": dc_type,
+        "aggregation_version": version,
+    }
+
+
+def _facet_payload(facet: FacetTarget, frame: pl.DataFrame | None, limit: int) -> dict[str, Any]:
+    if frame is None:
+        return {
+            "dc_id": facet.dc_id,
+            "column": facet.column,
+            "available": False,
+            "values": [],
+            "total_values": 0,
+            "truncated": False,
+        }
+    return {
+        "dc_id": facet.dc_id,
+        "column": facet.column,
+        "available": True,
+        "values": frame.head(limit).to_dicts(),
+        "total_values": frame.height,
+        "truncated": frame.height > limit,
+    }
+
+
+def _intersection(frames: list[pl.DataFrame | None], limit: int) -> dict[str, Any] | None:
+    # A facet that couldn't be answered (column missing, nothing ingested) has
+    # no opinion and must not veto every value. An answered but empty facet
+    # does veto: the other filters have left that DC with nothing to show.
+    sets = [set(f["value"].to_list()) for f in frames if f is not None]
+    if len(sets) < 2:
+        return None
+    common = set.intersection(*sorted(sets, key=len))
+    values = sorted(common)
+    return {"values": values[:limit], "total_values": len(values), "truncated": len(values) > limit}
+
+
+def compute_facets(
+    request: FacetsRequest,
+    data_collections: dict[str, dict],
+    access_token: str | None,
+) -> dict[str, Any]:
+    """Answer ``request``; ``data_collections`` is the project's (see above).
+
+    A facet that can't be answered (no table, column missing, link failure) is
+    returned with ``available: False`` rather than failing its siblings.
+    """
+    from depictio.api.v1.deltatables_utils import ScanPlanner, _filter_columns
+    from depictio.api.v1.endpoints.dashboards_endpoints.routes import (
+        _build_filter_metadata,
+        _resolve_link_filters_cached,
+    )
+
+    planner = ScanPlanner()
+    init_data: dict[str, dict | None] = {}
+    frames: dict[int, pl.DataFrame | None] = {}
+
+    for i, facet in enumerate(request.facets):
+        dc = data_collections[facet.dc_id]
+        if dc["type"] == "multiqc":
+            try:
+                frames[i] = _multiqc_values(facet.dc_id)
+            except Exception as e:
+                logger.warning(f"facets: MultiQC samples unavailable for {facet.dc_id}: {e}")
+                frames[i] = None
+            continue
+
+        if facet.dc_id not in init_data:
+            init_data[facet.dc_id] = _init_entry(facet.dc_id, dc["type"])
+        if init_data[facet.dc_id] is None:
+            frames[i] = None
+            continue
+
+        try:
+            merged = _resolve_link_filters_cached(
+                filters=_other_filters(request.filters, facet),
+                target_dc_id=facet.dc_id,
+                project_id=request.project_id,
+                access_token=access_token,
+                component_type="facets",
+            )
+        except Exception as e:
+            logger.warning(f"facets: link resolution failed for {facet.dc_id}: {e}")
+            frames[i] = None
+            continue
+        metadata = _build_filter_metadata(merged)
+
+        # No metadata on the planner itself: every facet of a DC then lands in
+        # one group — one scan, one collect_all — and applies its own filters.
+        planner.add(
+            name=i,
+            workflow_id=dc["workflow_id"],
+            data_collection_id=facet.dc_id,
+            build=functools.partial(value_counts_plan, column=facet.column, metadata=metadata),
+            columns={facet.column} | _filter_columns(metadata),
+            init_data={facet.dc_id: init_data[facet.dc_id]},  # type: ignore[dict-item]
+        )
+
+    planner.run()
+    for i in range(len(request.facets)):
+        if i not in frames:
+            frames[i] = _listed(planner.result(i))
+
+    ordered = [frames[i] for i in range(len(request.facets))]
+    return {
+        "facets": [
+            _facet_payload(facet, frame, request.limit)
+            for facet, frame in zip(request.facets, ordered)
+        ],
+        "intersection": (
+            _intersection(ordered, request.intersection_limit) if request.intersect else None
+        ),
+    }
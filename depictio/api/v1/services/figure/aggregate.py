@@ -19,8 +19,11 @@ Design rules:
   exact except for its three quartiles on large frames: those are order
   statistics, the only reduction here that forces Polars to sort, so above
   ``box_sample_rows_per_group`` they are computed on a per-group sample while
-  the extremes and counts stay exact. Every approximate path says so via
-  ``render_stats["sampled"]``.
+  the extremes and counts stay exact. With ``figure_sketch_accuracy`` set, box
+  quartiles and violin densities come from a mergeable quantile sketch instead
+  (``sketch.py``): within that relative accuracy of the true values, and for
+  violins a bounded error in place of a raw-row subsample. Every approximate
+  path says so via ``render_stats["sampled"]``.
 - **Bail loudly rather than approximate silently.** ``plan_aggregation`` returns
   ``None`` for anything it can't reproduce faithfully, and the caller falls back
   to the full-load px path. A wrong figure is far worse than a slow one.
@@ -32,11 +35,13 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import polars as pl
 
 from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.services.figure import sketch
 from depictio.api.v1.services.multiqc.themes import get_theme_template
 
 # Reducing visualisations this module can serve. Everything else (the scatter
@@ -124,6 +129,12 @@ _DEFAULT_NBINS_2D = 60
 # applies its own row cap.
 _MAX_GROUPS = 5_000
 
+# Sketch quantiles a sketched violin is drawn from, per group. Each carries
+# 1/_VIOLIN_POINTS of the group's mass, evenly spaced in probability from the
+# minimum to the maximum, so Plotly's KDE over them follows the distribution;
+# the bandwidth is set from the full group (see ``_violin_bandwidth``).
+_VIOLIN_POINTS = 1_024
+
 
 @dataclass
 class AggPlan:
@@ -223,11 +234,79 @@ def plan_aggregation(visu_type: str, dict_kwargs: dict) -> AggPlan | None:
     return plan
 
 
+def _first_pass_query(scan: pl.LazyFrame, plan: AggPlan) -> pl.LazyFrame | None:
+    """The reduction each builder starts with, before it knows anything about the data."""
+    if plan.visu_type == "box":
+        assert plan.y is not None
+        exprs = [
+            pl.col(plan.y).min().alias("_min"),
+            pl.col(plan.y).max().alias("_max"),
+            pl.col(plan.y).mean().alias("_mean"),
+            pl.len().alias("_n"),
+        ]
+        keys = plan.group_keys
+        return scan.group_by(keys).agg(exprs) if keys else scan.select(exprs)
+    if plan.visu_type == "histogram":
+        x = plan.x
+        return scan.select(
+            pl.col(x).min().alias("lo"), pl.col(x).max().alias("hi"), pl.len().alias("n")
+        )
+    if plan.mode == "reduce":
+        return scan.select(
+            pl.col(plan.x).min().alias("xlo"),
+            pl.col(plan.x).max().alias("xhi"),
+            pl.col(plan.y).min().alias("ylo"),
+            pl.col(plan.y).max().alias("yhi"),
+        )
+    if plan.mode == "groupby":
+        if not plan.group_keys:
+            return None
+        agg = pl.col(plan.y).sum().alias(plan.y) if plan.y else pl.len().alias("count")
+        return scan.group_by(plan.group_keys).agg(agg)
+    return scan.select(pl.len())
+
+
+def _first_pass_frame(
+    scan: pl.LazyFrame, plan: AggPlan, prefetched: pl.DataFrame | None
+) -> pl.DataFrame:
+    if prefetched is not None:
+        return prefetched
+    query = _first_pass_query(scan, plan)
+    assert query is not None  # the builders only ask where there is one
+    return query.collect()
+
+
+def first_pass(scan: pl.LazyFrame, plan: AggPlan) -> pl.LazyFrame | None:
+    """``plan``'s first query over ``scan``, for a caller that runs it elsewhere.
+
+    Every builder opens with one reduction over the whole filtered table — the
+    box plot's exact pass, the histogram's and density plot's bounds, the bar
+    chart's group-by (its only pass), the subsample's row count — and only its
+    later passes depend on the answer. ``render_all`` plans it on the round's
+    ``ScanPlanner`` with the cards and tables of the same table and hands the
+    frame back as ``build_aggregated_figure(prefetched=...)``.
+
+    ``None`` where the first read may not be a scan at all, so planning it
+    would only add work: a box or violin under ``figure_sketch_accuracy`` can be
+    served from a persisted sketch instead.
+    """
+    from depictio.api.v1.configs.config import settings
+
+    if float(settings.performance.figure_sketch_accuracy) > 0 and plan.visu_type in (
+        "box",
+        "violin",
+    ):
+        return None
+    return _first_pass_query(scan, plan)
+
+
 def build_aggregated_figure(
     scan: pl.LazyFrame,
     plan: AggPlan,
     theme: str = "light",
     render_stats: dict | None = None,
+    sketch_source: sketch.SketchSource | None = None,
+    prefetched: pl.DataFrame | None = None,
 ) -> go.Figure | None:
     """Execute ``plan`` against ``scan`` and return the figure.
 
@@ -235,6 +314,14 @@ def build_aggregated_figure(
     at the data (missing column, cardinality blow-up); the caller then falls back
     to the px path. Never raises for data reasons — a fallback is always better
     than a failed render.
+
+    ``sketch_source`` names the unfiltered table and the filters behind
+    ``scan``; with it, sketched figures may be served from a persisted sketch
+    and subsampled ones from a sample tier rather than the scan.
+
+    ``prefetched`` is the result of ``first_pass(scan, plan)`` when the caller
+    already ran it (fused with other queries on the same table); the builder
+    then starts from it instead of scanning again.
     """
     from depictio.api.v1.services.figure.mantine_templates import ensure_mantine_templates
 
@@ -254,11 +341,11 @@ def build_aggregated_figure(
 
     try:
         if plan.mode == "reduce":
-            fig = _build_reduce(scan, plan, render_stats)
+            fig = _build_reduce(scan, plan, render_stats, sketch_source, prefetched)
         elif plan.mode == "groupby":
-            fig = _build_groupby(scan, plan, template, render_stats)
+            fig = _build_groupby(scan, plan, template, render_stats, prefetched)
         else:
-            fig = _build_subsample(scan, plan, template, render_stats)
+            fig = _build_subsample(scan, plan, template, render_stats, sketch_source, prefetched)
     except Exception as e:
         logger.warning(
             f"build_aggregated_figure: {plan.visu_type} aggregation failed "
@@ -298,12 +385,18 @@ def build_aggregated_figure(
 # --------------------------------------------------------------------------- #
 
 
-def _build_reduce(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) -> go.Figure | None:
+def _build_reduce(
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    render_stats: dict | None,
+    sketch_source: sketch.SketchSource | None = None,
+    prefetched: pl.DataFrame | None = None,
+) -> go.Figure | None:
     if plan.visu_type == "box":
-        return _build_box(scan, plan, render_stats)
+        return _build_box(scan, plan, render_stats, sketch_source, prefetched)
     if plan.visu_type == "histogram":
-        return _build_histogram(scan, plan, render_stats)
-    return _build_density(scan, plan, render_stats)
+        return _build_histogram(scan, plan, render_stats, prefetched)
+    return _build_density(scan, plan, render_stats, prefetched)
 
 
 def _as_json(value: Any) -> Any:
@@ -455,7 +548,40 @@ def _sampled_quartiles(
     return got.drop("_ns")
 
 
-def _build_box(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) -> go.Figure | None:
+def _persisted_sketch(
+    plan: AggPlan,
+    keys: list[str],
+    alpha: float,
+    sketch_source: sketch.SketchSource | None,
+) -> pl.DataFrame | None:
+    """The persisted sketch for this figure under its filters, when enabled and usable."""
+    from depictio.api.v1.configs.config import settings
+
+    if sketch_source is None or not settings.performance.figure_sketch_index_enabled:
+        return None
+    assert plan.y is not None
+    return sketch.persisted_sketch(sketch_source, plan.y, keys, alpha)
+
+
+def _sketch_quartiles(frame: pl.DataFrame, keys: list[str]) -> pl.DataFrame:
+    """``_q1``/``_med``/``_q3`` per group of a sketch, shaped like the exact pass."""
+    values = sketch.quantiles(frame, keys, (0.25, 0.5, 0.75))
+    groups = list(values) if values or keys else [()]
+    data: dict[str, list] = {k: [g[i] for g in groups] for i, k in enumerate(keys)}
+    for j, name in enumerate(("_q1", "_med", "_q3")):
+        data[name] = [float(values[g][j]) if g in values else None for g in groups]
+    schema = {k: frame.schema[k] for k in keys}
+    schema.update(dict.fromkeys(("_q1", "_med", "_q3"), pl.Float64))
+    return pl.DataFrame(data, schema=schema)
+
+
+def _build_box(
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    render_stats: dict | None,
+    sketch_source: sketch.SketchSource | None = None,
+    prefetched: pl.DataFrame | None = None,
+) -> go.Figure | None:
     """Box plot from precomputed quartiles.
 
     Plotly accepts the five-number summary directly (``q1``/``median``/``q3``/
@@ -474,6 +600,12 @@ def _build_box(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) ->
     minimum of −0.074 on a 14 M-row group, i.e. sampling visibly shortens the
     whiskers, while the quartiles themselves stay within ~3 % of an IQR.
 
+    With ``figure_sketch_accuracy`` set, the second pass is a quantile sketch
+    instead — a hash aggregation, no sort — and the quartiles are within that
+    relative accuracy of the exact ones. A persisted sketch for the table
+    (``sketch.persisted_sketch``) replaces both passes: it carries the exact
+    extremes, mean and count as well.
+
     Fences follow Tukey (1.5·IQR) clipped to the observed min/max, matching what
     px draws for ``boxpoints=False``. Outlier markers are deliberately not
     emitted — they are per-row data, and re-introducing them would re-introduce
@@ -490,16 +622,14 @@ def _build_box(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) ->
     y = plan.y
     assert y is not None  # guaranteed by plan_aggregation
 
+    alpha = float(settings.performance.figure_sketch_accuracy)
+    sketched = _persisted_sketch(plan, keys, alpha, sketch_source) if alpha > 0 else None
+
     # Pass 1 — exact, no sort, and the cardinality gate.
-    base_exprs = [
-        pl.col(y).min().alias("_min"),
-        pl.col(y).max().alias("_max"),
-        pl.col(y).mean().alias("_mean"),
-        pl.len().alias("_n"),
-    ]
-    base = (
-        scan.group_by(keys).agg(base_exprs).collect() if keys else scan.select(base_exprs).collect()
-    )
+    if sketched is not None:
+        base = sketch.group_stats(sketched, keys).select([*keys, "_min", "_max", "_mean", "_n"])
+    else:
+        base = _first_pass_frame(scan, plan, prefetched)
     if base.height == 0:
         return None
     if base.height > _MAX_GROUPS:
@@ -527,7 +657,12 @@ def _build_box(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) ->
     counts = [int(n) for n in base["_n"].to_list()]
     quartiles: pl.DataFrame | None = None
     sampled = False
-    if keys and per_group > 0 and base.height <= max_groups and max(counts) > per_group:
+    if alpha > 0:
+        if sketched is None:
+            sketched = sketch.sketch(scan, y, keys, alpha).collect()
+        quartiles = _sketch_quartiles(sketched, keys)
+        sampled = True
+    elif keys and per_group > 0 and base.height <= max_groups and max(counts) > per_group:
         quartiles = _sampled_quartiles(scan, plan, keys, base, counts, per_group)
         sampled = quartiles is not None
 
@@ -591,7 +726,10 @@ def _build_box(scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None) ->
 
 
 def _build_histogram(
-    scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    render_stats: dict | None,
+    prefetched: pl.DataFrame | None = None,
 ) -> go.Figure | None:
     """Exact histogram: bin edges from a min/max pushdown, counts from a group-by.
 
@@ -603,9 +741,7 @@ def _build_histogram(
     nbins = int(plan.style.get("nbins") or plan.style.get("nbinsx") or _DEFAULT_NBINS)
     nbins = max(1, min(nbins, 1000))
 
-    bounds = scan.select(
-        pl.col(x).min().alias("lo"), pl.col(x).max().alias("hi"), pl.len().alias("n")
-    ).collect()
+    bounds = _first_pass_frame(scan, plan, prefetched)
     lo, hi, total = bounds["lo"][0], bounds["hi"][0], bounds["n"][0]
     if lo is None or hi is None or total == 0:
         return None
@@ -674,7 +810,10 @@ def _build_histogram(
 
 
 def _build_density(
-    scan: pl.LazyFrame, plan: AggPlan, render_stats: dict | None
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    render_stats: dict | None,
+    prefetched: pl.DataFrame | None = None,
 ) -> go.Figure | None:
     """2-D bin counts → heatmap / contour. Exact, and the payload is the grid."""
     x, y = plan.x, plan.y
@@ -682,12 +821,7 @@ def _build_density(
     nx = max(1, min(int(plan.style.get("nbinsx") or _DEFAULT_NBINS_2D), 500))
     ny = max(1, min(int(plan.style.get("nbinsy") or _DEFAULT_NBINS_2D), 500))
 
-    bounds = scan.select(
-        pl.col(x).min().alias("xlo"),
-        pl.col(x).max().alias("xhi"),
-        pl.col(y).min().alias("ylo"),
-        pl.col(y).max().alias("yhi"),
-    ).collect()
+    bounds = _first_pass_frame(scan, plan, prefetched)
     xlo, xhi, ylo, yhi = (bounds[c][0] for c in ("xlo", "xhi", "ylo", "yhi"))
     if None in (xlo, xhi, ylo, yhi):
         return None
@@ -734,7 +868,11 @@ def _build_density(
 
 
 def _build_groupby(
-    scan: pl.LazyFrame, plan: AggPlan, template: str, render_stats: dict | None
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    template: str,
+    render_stats: dict | None,
+    prefetched: pl.DataFrame | None = None,
 ) -> go.Figure | None:
     """``bar``: sum y per group (or count rows when there's no y).
 
@@ -742,11 +880,9 @@ def _build_groupby(
     chart over millions of rows is both enormous and, once sampled, wrong. Doing
     the group-by here gives px exactly the frame a reader assumes it's seeing.
     """
-    keys = plan.group_keys
-    if not keys:
+    if not plan.group_keys:
         return None
-    agg = pl.col(plan.y).sum().alias(plan.y) if plan.y else pl.len().alias("count")
-    frame = scan.group_by(keys).agg(agg).collect()
+    frame = _first_pass_frame(scan, plan, prefetched)
     if frame.height == 0:
         return None
     if frame.height > _MAX_GROUPS:
@@ -772,7 +908,12 @@ def _build_groupby(
 
 
 def _build_subsample(
-    scan: pl.LazyFrame, plan: AggPlan, template: str, render_stats: dict | None
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    template: str,
+    render_stats: dict | None,
+    sketch_source: sketch.SketchSource | None = None,
+    prefetched: pl.DataFrame | None = None,
 ) -> go.Figure | None:
     """``violin`` / ``ecdf``: shapes of a distribution, which need the values.
 
@@ -780,27 +921,36 @@ def _build_subsample(
     scan-level subsample instead of an aggregate — approximate, and flagged as
     sampled so the viewer's reduction badge tells the reader. The sample is drawn
     with a hash filter rather than by collecting and sampling, so the full frame
-    is still never materialised.
+    is still never materialised — or, when the DC has ingest-time sample tiers,
+    taken from the smallest tier that holds enough filtered rows. A violin goes through ``_build_violin`` instead
+    when the quantile sketch is on and the figure is not faceted.
     """
     from depictio.api.v1.configs.config import settings
+    from depictio.api.v1.services.sample_tiers import tier_sample
+
+    alpha = float(settings.performance.figure_sketch_accuracy)
+    if plan.visu_type == "violin" and alpha > 0 and not (plan.facet_row or plan.facet_col):
+        return _build_violin(scan, plan, template, render_stats, alpha, sketch_source)
 
     cap = int(settings.performance.figure_max_points)
-    total = int(scan.select(pl.len()).collect().item())
+    total = int(_first_pass_frame(scan, plan, prefetched).item())
     if total == 0:
         return None
 
-    sampled = False
-    frame_scan = scan
-    if cap > 0 and total > cap:
-        # Hash a struct of the projected columns so the keep/drop decision is
-        # per-row rather than per-value: hashing a single column would keep or
-        # drop *every* row sharing a value, which for a grouped violin would
-        # take whole categories in or out.
-        stride = -(-total // cap)  # ceil
-        frame_scan = scan.filter(pl.struct(plan.needed_columns).hash(seed=0) % stride == 0)
-        sampled = True
-
-    frame = frame_scan.collect()
+    sampled = cap > 0 and total > cap
+    frame = None
+    if sampled and sketch_source is not None:
+        frame = tier_sample(sketch_source.dc_id, sketch_source.metadata, plan.needed_columns, cap)
+    if frame is None:
+        frame_scan = scan
+        if sampled:
+            # Hash a struct of the projected columns so the keep/drop decision
+            # is per-row rather than per-value: hashing a single column would
+            # keep or drop *every* row sharing a value, which for a grouped
+            # violin would take whole categories in or out.
+            stride = -(-total // cap)  # ceil
+            frame_scan = scan.filter(pl.struct(plan.needed_columns).hash(seed=0) % stride == 0)
+        frame = frame_scan.collect()
     if frame.height == 0:
         return None
 
@@ -813,6 +963,112 @@ def _build_subsample(
     return fig
 
 
+def _violin_bandwidth(n: int, std: float, iqr: float, span: float) -> float | None:
+    """The kernel bandwidth plotly.js would pick for the group's *full* data.
+
+    Plotly's default is Silverman's rule over the points it is given, floored
+    at a hundredth of the span. Given sketch quantiles it would count
+    ``_VIOLIN_POINTS`` points rather than ``n`` rows and smooth accordingly, so
+    the rule is applied here to the group's exact count and deviation instead.
+    """
+    if not span:
+        return None
+    spread = min(std, iqr / 1.349)
+    return max(1.059 * spread * n**-0.2, span / 100)
+
+
+def _build_violin(
+    scan: pl.LazyFrame,
+    plan: AggPlan,
+    template: str,
+    render_stats: dict | None,
+    alpha: float,
+    sketch_source: sketch.SketchSource | None,
+) -> go.Figure | None:
+    """Violins drawn from a quantile sketch rather than a subsample of rows.
+
+    Each group ships ``_VIOLIN_POINTS`` quantiles spanning its exact minimum
+    and maximum, each within ``alpha`` of the true one, so the KDE Plotly draws
+    is the group's distribution at a bounded error however many rows it has.
+    Built as one trace per group so each can carry its own bandwidth; the
+    grouping attributes are the ones ``px.violin`` sets per colour, so the
+    layout matches it.
+    """
+    keys = plan.group_keys
+    y = plan.y
+    assert y is not None  # guaranteed by plan_aggregation
+
+    sketched = _persisted_sketch(plan, keys, alpha, sketch_source)
+    if sketched is None:
+        if keys:
+            groups = int(scan.select(pl.struct(keys).n_unique()).collect().item())
+            if groups > _MAX_GROUPS:
+                logger.info(f"_build_violin: {groups} groups exceeds cap {_MAX_GROUPS}")
+                return None
+        sketched = sketch.sketch(scan, y, keys, alpha).collect()
+    if sketched.height == 0:
+        return None
+
+    stats = sketch.group_stats(sketched, keys)
+    if stats.height > _MAX_GROUPS:
+        return None
+    if plan.x:
+        stats = stats.sort(plan.x, nulls_last=True)
+    points = sketch.quantiles(sketched, keys, np.linspace(0.0, 1.0, _VIOLIN_POINTS))
+    quartiles = sketch.quantiles(sketched, keys, (0.25, 0.75))
+
+    rows = list(stats.iter_rows(named=True))
+    names = [str(row[plan.color]) for row in rows] if plan.color else [""]
+    names = list(dict.fromkeys(names))
+    colors = dict(zip(names, _trace_colors(plan, names)))
+
+    fig = go.Figure()
+    shown: set[str] = set()
+    for row in rows:
+        key = tuple(row[k] for k in keys)
+        name = str(row[plan.color]) if plan.color else ""
+        values = points[key]
+        q1, q3 = quartiles[key]
+        fig.add_trace(
+            go.Violin(
+                x=[row[plan.x]] * len(values) if plan.x else None,
+                y=values.tolist(),
+                x0=" ",
+                y0=" ",
+                name=name,
+                legendgroup=name,
+                offsetgroup=name,
+                alignmentgroup="True",
+                scalegroup="True",
+                showlegend=bool(plan.color) and name not in shown,
+                marker_color=colors[name],
+                orientation="v",
+                points=False,
+                bandwidth=_violin_bandwidth(
+                    row["_n"], row["_std"], float(q3 - q1), row["_max"] - row["_min"]
+                ),
+            )
+        )
+        shown.add(name)
+
+    fig.update_layout(
+        template=template,
+        title=plan.style.get("title"),
+        violinmode=plan.style.get("violinmode", "group"),
+        xaxis_title=plan.x or "",
+        yaxis_title=y,
+    )
+    if plan.color:
+        fig.update_layout(legend_title_text=plan.color)
+    if render_stats is not None:
+        total = int(stats["_n"].sum())
+        render_stats["rows_displayed"] = stats.height * _VIOLIN_POINTS
+        render_stats["rows_scanned"] = total
+        render_stats["sampled"] = True
+        render_stats["total_rows"] = total
+    return fig
+
+
 def _px_kwargs(plan: AggPlan, template: str) -> dict[str, Any]:
     """Rebuild the px call from the plan's roles + the passthrough styling."""
     kwargs: dict[str, Any] = {
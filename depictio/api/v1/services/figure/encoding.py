@@ -0,0 +1,283 @@
+"""Wire encoding for rendered figures — serialise once, never re-walk.
+
+The render path used to pay for its output three times over: ``fig.to_json()``
+on the worker, ``json.loads`` straight back into nested Python lists (so the
+Celery result backend could JSON-encode them *again*), and finally FastAPI's
+recursive ``custom_jsonable_encoder`` plus ``json.dumps`` in the API process. On
+a 100k-point scatter the trace arrays are most of the payload, and each of those
+passes touches every number as a Python object.
+
+Here a figure is encoded exactly once, on whichever process built it:
+
+* Numeric trace arrays go out as Plotly typed arrays — ``{"dtype", "bdata"}``,
+  base64 of the raw little-endian buffer, decoded natively by plotly.js ≥ 2.28
+  and by ``plotlyData.ts`` on the React side. Integers take the narrowest dtype
+  that holds them; floats drop to ``f4`` only where that is invisible (see
+  ``_fits_float32``).
+* The result is a JSON *string*, produced by ``orjson`` (which handles numpy
+  natively), that rides through the Celery result backend and both result-cache
+  tiers unchanged and is spliced into the response body as-is
+  (``figure_response_bytes``).
+
+Anything the fast path can't express falls back to Plotly's own ``to_json`` —
+slower, never wrong.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import orjson
+
+from depictio.api.v1.configs.logging_init import logger
+
+# Below this many elements the ``{"dtype", "bdata"}`` wrapper buys nothing over
+# decimal text, and a plain list is easier to read in the network panel.
+_MIN_TYPED_LEN = 64
+
+# A float array drops to float32 when the worst rounding error stays below this
+# fraction of the array's span: under a pixel on a plot ten million pixels
+# wide, i.e. at any zoom a browser can draw. Measured against the span rather
+# than the magnitude on purpose — 1.2e8 ± 500 (a zoomed genomic window) has a
+# tiny relative error in float32 but a span-relative one of ~1%, and keeps f8.
+_F32_SPAN_TOLERANCE = 1e-7
+
+# Trace keys whose values are *identities*, not positions: the selection code
+# reads row ids back out of ``customdata``, so a float there must survive
+# bit-for-bit. Integer narrowing is exact and still applies.
+_EXACT_KEYS = frozenset({"customdata", "ids", "selectedpoints"})
+
+# Plain lists are only packed under keys Plotly declares as data arrays; numpy
+# arrays are packed wherever they appear in a trace, since Plotly's validators
+# only ever produce them for data-array attributes. Aggregated figures
+# (``services/figure/aggregate.py``) build their traces from ``to_list()``, so
+# without this their arrays would stay decimal text.
+_LIST_ARRAY_KEYS = frozenset(
+    {
+        "x",
+        "y",
+        "z",
+        "lat",
+        "lon",
+        "r",
+        "theta",
+        "a",
+        "b",
+        "c",
+        "open",
+        "high",
+        "low",
+        "close",
+        "q1",
+        "median",
+        "q3",
+        "lowerfence",
+        "upperfence",
+        "mean",
+        "sd",
+        "notchspan",
+        "values",
+        "base",
+        "width",
+        "size",
+        "color",
+        "opacity",
+        "array",
+        "arrayminus",
+        "customdata",
+    }
+)
+
+# Narrowest first. At one and two bytes the unsigned view is tried first, so
+# non-negative counts and codes up to 255 still fit a single byte; at four
+# bytes the signed one, which is what an int32 column already is.
+_INT_DTYPES: tuple[tuple[str, Any], ...] = (
+    ("u1", np.uint8),
+    ("i1", np.int8),
+    ("u2", np.uint16),
+    ("i2", np.int16),
+    ("i4", np.int32),
+    ("u4", np.uint32),
+)
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _typed_array(arr: np.ndarray, dtype: str) -> dict[str, str]:
+    spec = {
+        "dtype": dtype,
+        "bdata": base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode("ascii"),
+    }
+    if arr.ndim == 2:
+        spec["shape"] = f"{arr.shape[0]}, {arr.shape[1]}"
+    return spec
+
+
+def _fits_float32(arr: np.ndarray) -> bool:
+    with np.errstate(over="ignore", invalid="ignore"):
+        narrowed = arr.astype("<f4").astype(np.float64)
+    finite = np.isfinite(arr)
+    if not np.array_equal(np.isfinite(narrowed), finite):
+        return False  # overflowed to inf
+    if not finite.any():
+        return True
+    values = arr[finite]
+    error = float(np.max(np.abs(narrowed[finite] - values)))
+    if error == 0.0:
+        return True
+    span = float(values.max() - values.min())
+    return error <= _F32_SPAN_TOLERANCE * span
+
+
+def _pack_array(arr: np.ndarray, key: str) -> Any:
+    """Typed-array spec for ``arr``, or ``arr`` itself when it shouldn't be packed."""
+    if arr.ndim not in (1, 2) or arr.size < _MIN_TYPED_LEN or arr.dtype.kind not in "iuf":
+        return arr
+    if arr.dtype.kind == "f":
+        arr = arr.astype(np.float64, copy=False)
+        finite = np.isfinite(arr)
+        if finite.all() and np.array_equal(arr, np.trunc(arr)):
+            as_int = _narrow_int(arr)
+            if as_int is not None:
+                return as_int
+        if key not in _EXACT_KEYS and _fits_float32(arr):
+            return _typed_array(arr.astype("<f4"), "f4")
+        return _typed_array(arr.astype("<f8"), "f8")
+    packed = _narrow_int(arr)
+    if packed is not None:
+        return packed
+    # int64 beyond the 32-bit range: plotly.js has no 64-bit integer view. Up
+    # to 2**53 a float64 carries it exactly; past that, leave it to orjson.
+    if np.abs(arr).max() <= 2**53:
+        return _typed_array(arr.astype("<f8"), "f8")
+    return arr
+
+
+def _narrow_int(arr: np.ndarray) -> dict[str, str] | None:
+    lo, hi = arr.min(), arr.max()
+    for name, dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return _typed_array(arr.astype(np.dtype(dtype).newbyteorder("<")), name)
+    return None
+
+
+def _pack_list(values: list, key: str) -> Any:
+    # Only lists of plain numbers. Anything else (strings, ``None`` gaps,
+    # ragged rows) would come out as an object array — leave it to orjson.
+    try:
+        arr = np.asarray(values)
+    except (ValueError, TypeError):
+        return values
+    if arr.dtype.kind not in "iuf":
+        return values
+    packed = _pack_array(arr, key)
+    return values if packed is arr else packed
+
+
+def _pack(value: Any, key: str = "") -> Any:
+    if isinstance(value, np.ndarray):
+        return _pack_array(value, key)
+    if isinstance(value, dict):
+        return {k: _pack(v, k) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        # Flat or 2-D (heatmap ``z``, multi-column ``customdata``) numbers.
+        if key in _LIST_ARRAY_KEYS and value and not isinstance(value[0], dict):
+            return _pack_list(list(value), key)
+        if value and not isinstance(value[0], dict | list | tuple | np.ndarray):
+            return value  # e.g. per-point ``text`` — nothing nested to pack
+        return [_pack(v) for v in value]
+    return value
+
+
+def pack_typed_arrays(fig_dict: dict) -> dict:
+    """``fig_dict`` with its numeric trace arrays replaced by typed-array specs.
+
+    Returns a new dict; the input is not modified. Only ``data`` (and animation
+    ``frames``) is walked — layout arrays are small and some layout attributes
+    that look like arrays are not data arrays in Plotly's schema.
+    """
+    out = dict(fig_dict)
+    if isinstance(fig_dict.get("data"), list | tuple):
+        out["data"] = [_pack(trace) for trace in fig_dict["data"]]
+    frames = fig_dict.get("frames")
+    if isinstance(frames, list | tuple):
+        out["frames"] = [
+            {**frame, "data": [_pack(t) for t in frame.get("data") or []]}
+            if isinstance(frame, dict)
+            else frame
+            for frame in frames
+        ]
+    return out
+
+
+def _default(obj: Any) -> Any:
+    """``orjson`` fallback for what it doesn't serialise natively."""
+    if isinstance(obj, np.ndarray):
+        # Object / string arrays, e.g. category labels.
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "isoformat"):  # pandas Timestamp, datetime.time
+        return obj.isoformat()
+    if hasattr(obj, "to_plotly_json"):
+        return obj.to_plotly_json()
+    raise TypeError(f"not JSON serialisable: {type(obj).__name__}")
+
+
+def encode_figure(fig: Any, *, uirevision: str | None = "persistent") -> str:
+    """Serialise a Plotly figure (or figure dict) to its final JSON text.
+
+    ``uirevision`` is defaulted on the layout (an explicit one wins) so zoom and
+    legend state survive a re-render, as the viewer has always relied on.
+    """
+    if hasattr(fig, "to_dict"):
+        fig_dict = fig.to_dict()
+    elif isinstance(fig, dict):
+        fig_dict = fig
+    else:
+        raise TypeError(f"not a figure: {type(fig).__name__}")
+
+    layout = dict(fig_dict.get("layout") or {})
+    if uirevision is not None:
+        layout.setdefault("uirevision", uirevision)
+    fig_dict = {**fig_dict, "layout": layout}
+
+    try:
+        return orjson.dumps(
+            pack_typed_arrays(fig_dict), default=_default, option=_ORJSON_OPTIONS
+        ).decode()
+    except (TypeError, ValueError, orjson.JSONEncodeError) as e:
+        logger.debug(f"figure encoding: fast path failed ({e}); falling back to to_json")
+
+    if hasattr(fig, "to_json"):
+        text = fig.to_json()
+        if uirevision is None:
+            return text
+        # Rare enough (unusual trace payloads) that the extra parse is fine.
+        fallback = json.loads(text)
+        fallback.setdefault("layout", {}).setdefault("uirevision", uirevision)
+        return json.dumps(fallback, separators=(",", ":"))
+    return json.dumps(fig_dict, separators=(",", ":"), default=str)
+
+
+def figure_response_bytes(result: dict) -> bytes:
+    """The JSON body for a ``build_figure_preview`` result.
+
+    The figure text is spliced in verbatim; only the small metadata dict is
+    encoded here. Results from before the encoded format (a ``figure`` dict,
+    e.g. a disk-tier entry written by an older release) are encoded on the way
+    out.
+    """
+    figure_json = result.get("figure_json")
+    if figure_json is None:
+        figure = result.get("figure")
+        figure_json = encode_figure(figure, uirevision=None) if figure is not None else "null"
+    metadata = orjson.dumps(result.get("metadata") or {}, default=_default, option=_ORJSON_OPTIONS)
+    return b'{"figure":' + figure_json.encode() + b',"metadata":' + metadata + b"}"
@@ -0,0 +1,176 @@
+"""Result cache for rendered figures (``build_figure_preview`` output).
+
+A figure render is a pure function of the component's figure spec, the filters,
+the theme, ``full_load`` and the data itself — and the data is pinned by the
+DC's ``aggregation_hash`` (derived from the Delta log, see
+``deltatables_utils._get_aggregation_hash``). Hashing exactly those inputs gives
+a key that is valid until the next ingest, with no invalidation hook needed: a
+new hash means a new key, and the old entry ages out on its TTL.
+
+Two tiers:
+
+* **Redis** (``depictio.api.cache``) — shared by every API worker and every
+  Celery worker, so a figure rendered on a worker is a hit for the API process
+  that asked for it and for every other viewer of the dashboard.
+* **Disk** (``diskcache``) — per host, below Redis, with a size budget and LRU
+  eviction. It survives Redis evictions and restarts; a disk hit is promoted
+  back into Redis.
+
+The same digest doubles as the response ``ETag``. Because it is derived from
+the render's *inputs*, an ``If-None-Match`` can be answered with a 304 before
+anything is loaded, let alone rendered.
+
+Every failure here degrades to a miss — the cache is never allowed to fail a
+render.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.configs.logging_init import logger
+
+# Bumped when the shape of a rendered figure changes in a way old entries would
+# contradict (new metadata fields the viewer relies on, a template fix).
+# "2": figures are stored pre-encoded (``figure_json``, typed-array traces).
+_RESULT_FORMAT = "2"
+
+_disk_cache: Any = None
+_disk_cache_lock = threading.Lock()
+
+
+def figure_cache_key(payload: dict) -> str | None:
+    """Cache key for a ``build_figure_preview`` payload, or ``None`` if uncacheable.
+
+    ``None`` when the DC's aggregation hash can't be resolved: without it
+    nothing would retire the entry after an ingest, and a stale figure is worse
+    than a re-render. Read from ``init_data`` when the caller resolved it
+    (``render_all``), from Mongo otherwise.
+    """
+    from depictio.api.v1.deltatables_utils import _get_aggregation_hash
+
+    metadata = payload.get("metadata") or {}
+    dc_id = str(metadata.get("dc_id"))
+    entry = (payload.get("init_data") or {}).get(dc_id) or {}
+    agg_hash = entry.get("aggregation_hash")
+    if agg_hash is None:
+        agg_hash = _get_aggregation_hash(dc_id)
+    if not agg_hash:
+        return None
+
+    spec = {
+        "format": _RESULT_FORMAT,
+        "wf_id": str(metadata.get("wf_id")),
+        "dc_id": dc_id,
+        "aggregation_hash": str(agg_hash),
+        "visu_type": metadata.get("visu_type"),
+        "dict_kwargs": metadata.get("dict_kwargs") or {},
+        "mode": metadata.get("mode", "ui"),
+        "code_content": metadata.get("code_content") or "",
+        "selection_enabled": bool(metadata.get("selection_enabled", False)),
+        "selection_column": metadata.get("selection_column"),
+        "max_points": metadata.get("max_points"),
+        "filter_metadata": payload.get("filter_metadata") or [],
+        "theme": payload.get("theme") or "light",
+        "full_load": bool(payload.get("full_load", False)),
+    }
+    try:
+        canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"figure result cache: unhashable payload for {dc_id}: {e}")
+        return None
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+    # The DC id leads the digest so a DC's entries can still be found by
+    # pattern (``invalidate_dataframe_cache_pattern``) if ever needed.
+    return f"figure_result_{dc_id}_{digest}"
+
+
+def etag_for(key: str) -> str:
+    """Weak ETag for a cache key. Weak because GZip re-encodes the body in transit."""
+    return f'W/"{key.rsplit("_", 1)[-1]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` semantics: a list of tags or ``*``, compared weakly."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _get_disk_cache() -> Any:
+    """The disk tier, opened on first use; ``None`` when disabled or unavailable."""
+    global _disk_cache
+    size_mb = settings.cache.figure_disk_cache_size_mb
+    if size_mb <= 0:
+        return None
+    if _disk_cache is None:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                try:
+                    import diskcache
+
+                    _disk_cache = diskcache.Cache(
+                        settings.cache.figure_disk_cache_dir,
+                        size_limit=size_mb * 1024 * 1024,
+                        eviction_policy="least-recently-used",
+                    )
+                except Exception as e:
+                    logger.warning(f"figure result cache: disk tier unavailable: {e}")
+                    _disk_cache = False
+    return _disk_cache or None
+
+
+def get_figure_result(key: str) -> tuple[dict | None, str | None]:
+    """``(result, tier)`` for ``key``; ``(None, None)`` on a miss."""
+    from depictio.api.cache import get_cache
+
+    try:
+        cached = get_cache().get(key)
+        if isinstance(cached, dict):
+            return cached, "redis"
+    except Exception as e:
+        logger.debug(f"figure result cache: redis read failed for {key}: {e}")
+
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            cached = disk.get(key)
+        except Exception as e:
+            logger.debug(f"figure result cache: disk read failed for {key}: {e}")
+            cached = None
+        if isinstance(cached, dict):
+            # Promote, so the other workers stop missing on it.
+            try:
+                get_cache().set(key, cached, ttl=settings.cache.figure_result_ttl)
+            except Exception:
+                pass
+            return cached, "disk"
+    return None, None
+
+
+def set_figure_result(key: str, result: dict) -> None:
+    """Store a render in both tiers. Errored renders are not cached."""
+    from depictio.api.cache import get_cache
+
+    if (result.get("metadata") or {}).get("error"):
+        return
+    ttl = settings.cache.figure_result_ttl
+    try:
+        get_cache().set(key, result, ttl=ttl)
+    except Exception as e:
+        logger.debug(f"figure result cache: redis write failed for {key}: {e}")
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            disk.set(key, result, expire=ttl)
+        except Exception as e:
+            logger.debug(f"figure result cache: disk write failed for {key}: {e}")
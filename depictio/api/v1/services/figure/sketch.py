@@ -0,0 +1,343 @@
+"""Mergeable quantile sketches for box and violin figures.
+
+A box plot's quartiles are order statistics, so the exact path sorts every
+group, and ``box_sample_rows_per_group`` only bounds that sort by sampling —
+how far a sampled quartile lands from the true one depends on the data. A
+violin is worse off: it needs the shape of the distribution, so it has been
+served as a hash subsample of raw rows, shipped as points for Plotly to run its
+KDE over.
+
+A sketch answers both with a bounded error and no sort. Values are bucketed on
+a logarithmic grid of ratio ``1 + alpha`` (the DDSketch mapping: buckets
+``((1+a)^(i-1), (1+a)^i]``, mirrored for negative values, zero on its own), so
+a group's sketch is one row per non-empty bucket holding the bucket's count,
+min, max, mean and sum of squared deviations. That is a plain
+``group_by(keys + [bucket])`` — a hash aggregation Polars runs inside the lazy
+plan, streaming — and it is mergeable: two sketches of disjoint rows combine by
+summing counts and taking min of mins, max of maxes. Any quantile is then read
+off the cumulative counts and lands in the same bucket as the true value, i.e.
+within ``alpha`` of it relative to its magnitude; the per-bucket extremes make
+the minimum, the maximum and any bucket holding a single distinct value exact,
+and the moments give the exact mean and standard deviation.
+
+Because sketches merge, they can be persisted per partition: grouped by the
+figure's keys *and* the columns the dashboard filters on, the sketch of the
+whole table answers every later filter on those columns by filtering sketch
+rows and merging them, without reading the table. Those sidecars live next to
+the Delta table (``_depictio/sketches/v<version>-<digest>.parquet``) and are
+recorded on the ``deltatables`` document like the sort indexes
+(``services/sort_index.py``); a new Delta version replaces them. Like those,
+they are built off the request path: the first figure that needs one enqueues
+the ``depictio.figure.build_sketch`` Celery task and scans meanwhile. Everything
+here returns ``None`` instead of raising, so callers keep the scan as the
+fallback.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.services.sidecars import SidecarRegistry, record_version
+
+SKETCH_DIR = "_depictio/sketches"
+BUCKET = "_bucket"
+# Finest accuracy accepted. Bucket indices are offset by ``_OFFSET`` so positive
+# values keep positive ids and negative values negative ones; at this accuracy
+# the whole float64 range (|log x| <= ~745) stays inside the offset.
+MIN_ACCURACY = 0.001
+_OFFSET = 1 << 21
+# A persisted sketch is a row per (group, partition, bucket). Past this many
+# group/partition tuples it is no longer small, and the figure scans instead.
+_MAX_PERSISTED_GROUPS = 50_000
+# How long one API process waits on an enqueued build before asking again — a
+# lost or failed task must not leave a figure on the scan for good.
+_SCHEDULE_RETRY_SECONDS = 600
+
+_registry = SidecarRegistry()
+_refused: set[str] = set()
+_scheduled: dict[str, float] = {}
+_scheduled_guard = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SketchSource:
+    """The table behind a figure and the filters applied to it.
+
+    What a persisted sketch needs on top of the scan: where the unfiltered
+    table lives, which version of it the scan read, and the filters, so they
+    can be applied to the sketch rows instead.
+    """
+
+    dc_id: str
+    location: str
+    version_salt: Any
+    metadata: list[dict] | None = None
+
+
+def _bucket(value: pl.Expr, alpha: float) -> pl.Expr:
+    # Non-strict cast: log(0) is -inf, which only the ``otherwise`` branch keeps.
+    index = (value.abs().log() / math.log1p(alpha)).ceil().cast(pl.Int64, strict=False) + _OFFSET
+    return (
+        pl.when(value > 0)
+        .then(index)
+        .when(value < 0)
+        .then(-index)
+        .otherwise(pl.lit(0, dtype=pl.Int64))
+        .alias(BUCKET)
+    )
+
+
+def sketch(scan: pl.LazyFrame, y: str, keys: Sequence[str], alpha: float) -> pl.LazyFrame:
+    """Sketch of ``y`` per ``keys`` group, one row per non-empty bucket.
+
+    Null and non-finite values are left out, as the exact quantiles leave
+    out nulls.
+    """
+    alpha = max(alpha, MIN_ACCURACY)
+    value = pl.col("_v")
+    return (
+        scan.with_columns(pl.col(y).cast(pl.Float64).alias("_v"))
+        .filter(value.is_finite())
+        .with_columns(_bucket(value, alpha))
+        .group_by([*keys, BUCKET])
+        .agg(
+            pl.len().alias("_n"),
+            value.min().alias("_min"),
+            value.max().alias("_max"),
+            value.mean().alias("_mean"),
+            ((value - value.mean()) ** 2).sum().alias("_m2"),
+        )
+    )
+
+
+def _combined() -> list[pl.Expr]:
+    """Aggregations combining sketch rows: counts add, extremes and moments merge."""
+    n = pl.col("_n")
+    mean = (n * pl.col("_mean")).sum() / n.sum()
+    return [
+        n.sum().alias("_n"),
+        pl.col("_min").min().alias("_min"),
+        pl.col("_max").max().alias("_max"),
+        mean.alias("_mean"),
+        # Chan et al.'s pairwise update, for any number of parts at once.
+        (pl.col("_m2").sum() + (n * (pl.col("_mean") - mean) ** 2).sum()).alias("_m2"),
+    ]
+
+
+def merge(frame: pl.LazyFrame, keys: Sequence[str]) -> pl.LazyFrame:
+    """Combine the rows of ``frame`` that share ``keys`` and a bucket."""
+    return frame.group_by([*keys, BUCKET]).agg(_combined())
+
+
+def group_stats(frame: pl.DataFrame, keys: Sequence[str]) -> pl.DataFrame:
+    """Exact ``_n``/``_min``/``_max``/``_mean``/``_std`` per group of a sketch."""
+    lazy = frame.lazy()
+    merged = lazy.group_by(list(keys)).agg(_combined()) if keys else lazy.select(_combined())
+    std = (pl.col("_m2") / (pl.col("_n") - 1)).sqrt()
+    return merged.with_columns(
+        pl.when(pl.col("_n") > 1).then(std).otherwise(0.0).alias("_std")
+    ).collect()
+
+
+def quantiles(
+    frame: pl.DataFrame, keys: Sequence[str], probs: Sequence[float]
+) -> dict[tuple, np.ndarray]:
+    """``{group: values at probs}`` read off a sketch.
+
+    Ranks are interpolated linearly, as Polars' ``interpolation="linear"`` and
+    numpy's default do; within a bucket the values are taken as evenly spread
+    between its min and max.
+    """
+    ps = np.asarray(probs, dtype=np.float64)
+    parts = frame.partition_by(list(keys), as_dict=True) if keys else {(): frame}
+    out: dict[tuple, np.ndarray] = {}
+    for key, part in parts.items():
+        if part.height == 0:
+            continue
+        part = part.sort(BUCKET)
+        counts = part["_n"].to_numpy().astype(np.int64)
+        lows = part["_min"].to_numpy()
+        highs = part["_max"].to_numpy()
+        ends = np.cumsum(counts)
+
+        def at(rank: np.ndarray) -> np.ndarray:
+            i = np.searchsorted(ends, rank, side="right")
+            within = rank - (ends[i] - counts[i])
+            return lows[i] + (highs[i] - lows[i]) * within / np.maximum(counts[i] - 1, 1)
+
+        ranks = ps * (ends[-1] - 1)
+        below = np.floor(ranks).astype(np.int64)
+        low, high = at(below), at(np.ceil(ranks).astype(np.int64))
+        out[tuple(key)] = low + (high - low) * (ranks - below)
+    return out
+
+
+# --------------------------------------------------------------------------- #
+# Persisted per-partition sketches
+# --------------------------------------------------------------------------- #
+
+
+def sketch_path(
+    delta_table_location: str,
+    delta_version: int,
+    y: str,
+    keys: Sequence[str],
+    partitions: Sequence[str],
+    alpha: float,
+) -> str:
+    """Where the sketch of ``y`` by ``keys`` and ``partitions`` for one version lives."""
+    spec = f"{y}|{','.join(keys)}|{','.join(partitions)}|{alpha:g}"
+    digest = hashlib.sha256(spec.encode()).hexdigest()[:16]
+    return (
+        f"{delta_table_location.rstrip('/')}/{SKETCH_DIR}/"
+        f"v{int(delta_version):020d}-{digest}.parquet"
+    )
+
+
+def _build(table: pl.LazyFrame, path: str, y: str, cols: list[str], alpha: float) -> bool:
+    """Write the sketch of ``table``; ``False`` when it would not be small."""
+    import os
+
+    from depictio.api.v1.s3 import storage_options_for
+
+    if cols:
+        groups = table.select(pl.struct(cols).n_unique()).collect().item()
+        if groups > _MAX_PERSISTED_GROUPS:
+            logger.info(f"sketch: {groups} groups over {cols} — not persisting")
+            return False
+    if "://" not in path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    sketch(table, y, cols, alpha).sink_parquet(path, storage_options=storage_options_for(path))
+    return True
+
+
+def build_sketch(
+    dc_id: str,
+    location: str,
+    delta_version: int,
+    y: str,
+    keys: list[str],
+    partitions: list[str],
+    alpha: float,
+) -> str | None:
+    """Write and record the sketch for this figure; the Celery task's body.
+
+    Single-flight per path within a process, and a no-op when the sketch is
+    already there. ``None`` when it would not be small; that answer is
+    remembered, so duplicate enqueues don't count the groups again.
+    """
+    from depictio.api.v1.s3 import storage_options_for
+
+    path = sketch_path(location, delta_version, y, keys, partitions, alpha)
+    with _registry.lock(path):
+        if _registry.exists(path):
+            return path
+        if path in _refused:
+            return None
+        table = pl.scan_delta(
+            location, version=delta_version, storage_options=storage_options_for(location)
+        )
+        logger.info(f"sketch: building {y!r} by {keys + partitions} for DC {dc_id}")
+        if not _build(table, path, y, keys + partitions, alpha):
+            _refused.add(path)
+            return None
+        _registry.add(path)
+    record_version(dc_id, "sketches", path, delta_version, _registry)
+    return path
+
+
+def _schedule_build(
+    dc_id: str,
+    location: str,
+    delta_version: int,
+    path: str,
+    y: str,
+    keys: list[str],
+    partitions: list[str],
+    alpha: float,
+) -> None:
+    """Enqueue the build of ``path`` unless this process recently did."""
+    import time
+
+    now = time.monotonic()
+    with _scheduled_guard:
+        if now - _scheduled.get(path, float("-inf")) < _SCHEDULE_RETRY_SECONDS:
+            return
+        _scheduled[path] = now
+    try:
+        from depictio.api.v1.celery_tasks import build_sketch as build_task
+
+        build_task.delay(str(dc_id), location, int(delta_version), y, keys, partitions, alpha)
+        logger.info(f"sketch: enqueued build of {y!r} by {keys + partitions} for DC {dc_id}")
+    except Exception as e:
+        logger.warning(f"sketch: enqueue failed for {dc_id} on {y!r} (non-fatal): {e}")
+
+
+def _ensure(source: SketchSource, y: str, keys: list[str], alpha: float) -> str | None:
+    """Path of the persisted sketch for this figure, or ``None`` while there is none.
+
+    Never builds in the caller: a missing sketch is enqueued for the Celery
+    worker and the figure keeps scanning until it lands.
+    """
+    from depictio.api.v1.deltatables_utils import _filter_columns
+    from depictio.api.v1.s3 import storage_options_for
+    from depictio.api.v1.services.sort_index import _delta_version
+
+    version = _delta_version(source.location, str(source.version_salt))
+    table = pl.scan_delta(
+        source.location, version=version, storage_options=storage_options_for(source.location)
+    )
+    names = set(table.collect_schema().names())
+    if y not in names or not set(keys) <= names:
+        return None
+    # Filters on columns the table lacks are skipped by the scan too.
+    partitions = sorted((_filter_columns(source.metadata) & names) - set(keys))
+    if y in partitions:
+        # A filter on the plotted column itself cuts through buckets.
+        return None
+
+    path = sketch_path(source.location, version, y, keys, partitions, alpha)
+    if path in _refused:
+        return None
+    if _registry.exists(path):
+        return path
+    _schedule_build(source.dc_id, source.location, version, path, y, keys, partitions, alpha)
+    return None
+
+
+def persisted_sketch(
+    source: SketchSource, y: str, keys: Sequence[str], alpha: float
+) -> pl.DataFrame | None:
+    """Sketch of the filtered rows, merged from the persisted one; ``None`` to scan."""
+    from depictio.api.v1.deltatables_utils import process_metadata_and_filter
+    from depictio.api.v1.s3 import storage_options_for
+
+    if source.version_salt is None:
+        return None
+    alpha = max(alpha, MIN_ACCURACY)
+    try:
+        path = _ensure(source, y, list(keys), alpha)
+        if path is None:
+            return None
+        lf = pl.scan_parquet(path, storage_options=storage_options_for(path))
+        schema = lf.collect_schema()
+        usable = []
+        for component in source.metadata or []:
+            meta = component.get("metadata") or {}
+            if (component.get("column_name") or meta.get("column_name")) in schema:
+                usable.append(component)
+        for predicate in process_metadata_and_filter(usable, dict(schema)) if usable else []:
+            lf = lf.filter(predicate)
+        return merge(lf, keys).collect()
+    except Exception as e:
+        logger.warning(f"sketch: unavailable for DC {source.dc_id} on {y!r}: {e}")
+        return None
@@ -346,5 +346,8 @@ async def lifespan(_app: FastAPI):
     yield
 
     # Shutdown
+    from depictio.api.v1.celery_notify import completion_listener
+
+    await completion_listener.stop()
     await stop_event_services()
     stop_background_services(background_task, should_initialize)
@@ -0,0 +1,245 @@
+"""Streaming MongoDB backups: one gzip-compressed BSON stream per collection.
+
+The JSON backup (``depictio_backup_<id>.json``) materialises every collection
+as a list, converts it to JSON-safe types and pretty-prints the lot with
+``json.dump(indent=2)``, so a large ``dashboards`` collection sits in API
+memory several times over; restoring reads the whole file back with
+``json.load`` before the first insert.
+
+A stream backup is a directory ``depictio_backup_<id>/`` holding, per
+collection, ``<name>.bson.gz`` — the documents' BSON concatenated and gzipped,
+the layout ``mongodump --gzip`` writes — and a ``manifest.json`` with the
+backup metadata and each stream's document count, size and SHA-256. Documents
+go to disk as the cursor yields them, so a dump holds one cursor batch per
+collection in flight; BSON keeps ObjectIds, DBRefs and datetimes as they are.
+
+Restore checks every stream against the manifest before touching the
+database, then reads each back in batches into ``insert_many(ordered=False)``,
+collections in parallel.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from depictio.api.v1.configs.logging_init import logger
+
+MANIFEST_NAME = "manifest.json"
+STREAM_SUFFIX = ".bson.gz"
+# Bump when the directory layout or manifest changes.
+STREAM_FORMAT_VERSION = 1
+# A restore batch is flushed at ``batch_size`` documents or this many BSON
+# bytes, whichever comes first: a few huge dashboards must not pile up.
+_MAX_BATCH_BYTES = 16 * 1024 * 1024
+
+
+class _HashingWriter:
+    """Write-through file wrapper hashing the (compressed) bytes it is given."""
+
+    def __init__(self, fh):
+        self._fh = fh
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._fh.write(data)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+
+def file_sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _raw_documents(collection):
+    """``collection`` yielding raw BSON, so a dump skips the decode/re-encode round trip."""
+    try:
+        return collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    except Exception:
+        # Test doubles (mongomock) without custom document classes.
+        return collection
+
+
+def _encode(document: Any) -> bytes:
+    raw = getattr(document, "raw", None)
+    return raw if isinstance(raw, bytes) else bson.encode(document)
+
+
+def dump_collection(collection, query: dict, path: str, batch_size: int) -> dict:
+    """Stream the documents of ``collection`` matching ``query`` to ``path``."""
+    count = 0
+    with open(path, "wb") as fh:
+        writer = _HashingWriter(fh)
+        # mtime=0: the same documents always give the same stream and checksum.
+        with gzip.GzipFile(fileobj=writer, mode="wb", mtime=0) as out:  # type: ignore[arg-type]
+            for document in _raw_documents(collection).find(query, batch_size=batch_size):
+                out.write(_encode(document))
+                count += 1
+    return {
+        "file": os.path.basename(path),
+        "count": count,
+        "bytes": writer.size,
+        "sha256": writer.sha256.hexdigest(),
+    }
+
+
+def write_stream_backup(
+    target_dir: str,
+    sources: dict[str, tuple[Any, dict]],
+    metadata: dict,
+    batch_size: int,
+    workers: int,
+) -> dict:
+    """Dump ``{name: (collection, query)}`` into ``target_dir``; returns the manifest.
+
+    The backup is assembled in ``<target_dir>.partial`` and renamed into place
+    once the manifest is written, so a failed dump never looks like a backup.
+    """
+    partial = f"{target_dir}.partial"
+    shutil.rmtree(partial, ignore_errors=True)
+    os.makedirs(partial)
+    try:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="depictio-mongo-backup"
+        ) as pool:
+            futures = {
+                name: pool.submit(
+                    dump_collection,
+                    collection,
+                    query,
+                    os.path.join(partial, f"{name}{STREAM_SUFFIX}"),
+                    batch_size,
+                )
+                for name, (collection, query) in sources.items()
+            }
+            streams = {name: future.result() for name, future in futures.items()}
+
+        metadata = {**metadata, "total_documents": sum(s["count"] for s in streams.values())}
+        manifest = {
+            "format": "bson",
+            "format_version": STREAM_FORMAT_VERSION,
+            "backup_metadata": metadata,
+            "collections": streams,
+        }
+        with open(os.path.join(partial, MANIFEST_NAME), "w") as fh:
+            json.dump(manifest, fh, indent=2, default=str)
+        os.replace(partial, target_dir)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+    return manifest
+
+
+def read_manifest(backup_dir: str) -> dict:
+    with open(os.path.join(backup_dir, MANIFEST_NAME)) as fh:
+        manifest = json.load(fh)
+    if manifest.get("format") != "bson" or manifest.get("format_version") != STREAM_FORMAT_VERSION:
+        raise ValueError(f"Unsupported backup manifest in {os.path.basename(backup_dir)}")
+    return manifest
+
+
+def verify_streams(backup_dir: str, manifest: dict, names: Iterable[str]) -> list[str]:
+    """Names of the streams that are missing or whose SHA-256 is not the manifest's."""
+    bad = []
+    for name in names:
+        entry = manifest["collections"][name]
+        path = os.path.join(backup_dir, entry["file"])
+        if not os.path.isfile(path) or file_sha256(path) != entry["sha256"]:
+            bad.append(name)
+    return bad
+
+
+def _iter_raw(fh) -> Iterator[bytes]:
+    """Raw BSON documents of a stream (each is length-prefixed)."""
+    while True:
+        head = fh.read(4)
+        if not head:
+            return
+        size = int.from_bytes(head, "little")
+        body = fh.read(size - 4) if len(head) == 4 else b""
+        if size < 5 or len(body) != size - 4:
+            raise ValueError("Truncated BSON stream")
+        yield head + body
+
+
+def iter_batches(path: str, batch_size: int) -> Iterator[list[dict]]:
+    """Documents of the stream at ``path``, decoded a batch at a time."""
+    batch: list[dict] = []
+    batch_bytes = 0
+    with gzip.open(path, "rb") as fh:
+        for raw in _iter_raw(fh):
+            batch.append(bson.decode(raw))
+            batch_bytes += len(raw)
+            if len(batch) >= batch_size or batch_bytes >= _MAX_BATCH_BYTES:
+                yield batch
+                batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+def count_documents(path: str) -> int:
+    with gzip.open(path, "rb") as fh:
+        return sum(1 for _ in _iter_raw(fh))
+
+
+def restore_collection(collection, path: str, batch_size: int) -> int:
+    """Replace the contents of ``collection`` with the stream at ``path``."""
+    collection.delete_many({})
+    restored = 0
+    for batch in iter_batches(path, batch_size):
+        collection.insert_many(batch, ordered=False)
+        restored += len(batch)
+    return restored
+
+
+def restore_stream_backup(
+    backup_dir: str,
+    manifest: dict,
+    targets: dict[str, Any],
+    batch_size: int,
+    workers: int,
+) -> tuple[dict[str, int], dict[str, Exception]]:
+    """Restore ``{name: collection}`` from the backup, collections in parallel.
+
+    Returns the documents restored per collection and the error of each
+    collection that failed; one failure does not stop the others.
+    """
+    restored: dict[str, int] = {}
+    failed: dict[str, Exception] = {}
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="depictio-mongo-restore"
+    ) as pool:
+        futures = {
+            name: pool.submit(
+                restore_collection,
+                collection,
+                os.path.join(backup_dir, manifest["collections"][name]["file"]),
+                batch_size,
+            )
+            for name, collection in targets.items()
+        }
+        for name, future in futures.items():
+            try:
+                restored[name] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to restore {name}: {e}")
+                failed[name] = e
+    return restored, failed
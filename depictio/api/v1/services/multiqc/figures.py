@@ -4,11 +4,10 @@ Pure data processing — produces Plotly figure dicts the React viewer renders
 client-side. No Dash UI dependencies.
 """
 
-import hashlib
+import contextlib
 import os
 import tempfile
 import threading
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -24,22 +23,13 @@ from depictio.api.v1.configs.logging_init import logger
 # byte-identical figures and byte-identical keys (key equality is what lets the
 # server resolve a CLI-uploaded figure).
 from depictio.cli.cli.utils.multiqc_figures import (
-    build_multiqc_figure,
+    build_figure_from_plot,
     multiqc_figure_cache_key,
 )
 
 # Global lock to prevent concurrent MultiQC operations (MultiQC global state is not thread-safe)
 _multiqc_lock = threading.RLock()
 
-
-# Tracks which DC's report (keyed by ``_generate_cache_key(s3_locations)``) is
-# currently resident in this process's ``multiqc.report`` global. Lets
-# ``_get_or_parse_multiqc_logs`` skip the Redis fetch + full ``cloudpickle.loads``
-# of the entire report when it's already loaded — the dominant per-combo cost in
-# the prewarm fan-out (build one DC's 80+ plot/theme combos with a single
-# deserialize instead of one per combo). Mutated only under ``_multiqc_lock``.
-_resident_report_key: str | None = None
-
 # Multi-day TTL: explicit `_invalidate_multiqc_caches_for_dc` on append/replace
 # is the source of truth for staleness. The previous 2 h TTL caused silent
 # re-parses every two hours under no real change, which masked the prewarm
@@ -203,14 +193,6 @@ def get_multiqc_datasets(metadata_plots: dict, module: str, plot: str) -> List[s
         return []
 
 
-def _generate_cache_key(s3_locations: List[str]) -> str:
-    """Generate deterministic cache key from S3 locations."""
-    sorted_locations = sorted(s3_locations)
-    locations_str = "|".join(sorted_locations)
-    hash_digest = hashlib.sha256(locations_str.encode()).hexdigest()[:16]
-    return f"multiqc:state:{hash_digest}"
-
-
 # Figure cache key — the shared implementation, exposed under the two names this
 # module has always published. Both the API render path and the CLI offline
 # prerender must hash identical keys: the server can only resolve a CLI-uploaded
@@ -224,172 +206,6 @@ _generate_figure_cache_key = multiqc_figure_cache_key
 generate_figure_cache_key = multiqc_figure_cache_key
 
 
-def _get_or_parse_multiqc_logs(s3_locations: List[str], use_s3_cache: bool = True) -> bool:
-    """Get cached MultiQC report or parse logs and cache the result.
-
-    Thread-safe: uses global lock since MultiQC global state is not thread-safe.
-    """
-    import multiqc
-
-    global _resident_report_key
-
-    cache_key = _generate_cache_key(s3_locations)
-    cache = get_cache()
-
-    def _restore_from_cache_value(value: Any) -> bool:
-        """Restore multiqc.report from a cache hit. Handles both the legacy
-        in-memory shape (raw report object) and the new cloudpickle envelope
-        produced below — `{"__cloudpickle__": <bytes>}`.
-        """
-        global _resident_report_key
-        try:
-            if isinstance(value, dict) and "__cloudpickle__" in value:
-                import cloudpickle  # noqa: PLC0415
-
-                multiqc.report = cloudpickle.loads(value["__cloudpickle__"])
-            else:
-                multiqc.report = value
-            _resident_report_key = cache_key
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to restore cached multiqc.report: {e}")
-            return False
-
-    # Fast path: the report for these s3_locations is already resident in this
-    # process (e.g. the previous plot in a prewarm loop, or a sibling component
-    # on the same DC). Skip the Redis GET + full cloudpickle.loads of the entire
-    # report — that round-trip costs ~1-3s for a many-report DC and was being
-    # paid once per plot/theme combo. Callers hold the reentrant ``_multiqc_lock``
-    # across parse+get_plot, and every mutation of ``multiqc.report`` below
-    # updates ``_resident_report_key``, so this marker is authoritative.
-    if _resident_report_key == cache_key and getattr(multiqc, "report", None) is not None:
-        return True
-
-    cached_report = cache.get(cache_key)
-    if cached_report is not None:
-        with _multiqc_lock:
-            if _resident_report_key == cache_key and getattr(multiqc, "report", None) is not None:
-                return True
-            if _restore_from_cache_value(cached_report):
-                return True
-
-    with _multiqc_lock:
-        # Double-check inside lock (another thread may have parsed while we waited)
-        if _resident_report_key == cache_key and getattr(multiqc, "report", None) is not None:
-            return True
-        cached_report = cache.get(cache_key)
-        if cached_report is not None and _restore_from_cache_value(cached_report):
-            return True
-
-        multiqc.reset()
-        _resident_report_key = None
-
-        parsed_files = 0
-        for s3_location in s3_locations:
-            try:
-                local_file = _get_local_path_for_s3(s3_location, use_cache=use_s3_cache)
-                multiqc.parse_logs(local_file)
-                parsed_files += 1
-            except Exception as e:
-                logger.warning(f"Error parsing {s3_location}: {e}")
-                continue
-
-        if parsed_files == 0:
-            logger.error("No files could be parsed")
-            return False
-
-        # Freshly parsed report is now resident — mark it so sibling combos skip
-        # the cache restore.
-        _resident_report_key = cache_key
-
-        # Try to persist `multiqc.report` to Redis (or whatever backend
-        # cache.set() points at) via cloudpickle, which tolerates the module
-        # references that plain pickle chokes on. This lets the parsed report
-        # survive uvicorn dev-mode reloads and worker restarts. Fall back to
-        # the in-process memory dict if cloudpickle is unavailable or fails
-        # for an unforeseen reason — same behaviour as before this change.
-        cached_via_cloudpickle = False
-        try:
-            import cloudpickle  # noqa: PLC0415
-
-            payload = cloudpickle.dumps(multiqc.report)
-            cache.set(cache_key, {"__cloudpickle__": payload}, ttl=MULTIQC_CACHE_TTL_SECONDS)
-            cached_via_cloudpickle = True
-        except Exception as e:
-            logger.info(
-                f"multiqc.report cloudpickle persist skipped ({e!r}); "
-                f"falling back to in-process memory cache"
-            )
-
-        if not cached_via_cloudpickle:
-            try:
-                cache._memory_cache[cache_key] = {
-                    "data": multiqc.report,
-                    "cached_at": time.time(),
-                    "ttl": MULTIQC_CACHE_TTL_SECONDS,
-                }
-            except Exception as e:
-                logger.warning(f"Failed to cache report: {e}")
-
-    return True
-
-
-def _force_reparse(
-    s3_locations: List[str],
-    use_s3_cache: bool = True,
-    ve: Optional[Exception] = None,
-) -> None:
-    """Drop the cached ``multiqc.report`` for ``s3_locations`` and re-parse
-    from scratch, then write the fresh report back to cache so subsequent
-    requests don't re-trigger the same expensive re-parse.
-
-    Caller MUST hold ``_multiqc_lock``. Used by ``create_multiqc_plot`` when
-    ``multiqc.get_plot`` raises "Module X is not found" against a restored
-    report — the cloudpickle round-trip can land a report with
-    ``report.modules`` silently empty.
-    """
-    import multiqc
-
-    global _resident_report_key
-
-    cache = get_cache()
-    state_cache_key = _generate_cache_key(s3_locations)
-    try:
-        cache.delete(state_cache_key)
-    except Exception as del_err:
-        logger.debug(f"cache.delete failed (non-fatal): {del_err}")
-    multiqc.reset()
-    # The resident report is being torn down — invalidate the marker so the
-    # fast-path guard in ``_get_or_parse_multiqc_logs`` can't return a stale hit.
-    _resident_report_key = None
-    parsed = 0
-    for loc in s3_locations:
-        try:
-            local_file = _get_local_path_for_s3(loc, use_cache=use_s3_cache)
-            multiqc.parse_logs(local_file)
-            parsed += 1
-        except Exception as e:
-            logger.warning(f"Re-parse error for {loc}: {e}")
-    if parsed == 0:
-        raise ValueError("Failed to parse any MultiQC data files") from ve
-    # Freshly re-parsed report is now resident.
-    _resident_report_key = state_cache_key
-    # Persist the freshly parsed report under the same cache key the original
-    # parse used, so the next request lands a hit. Without this, every request
-    # for this DC re-takes the lock and re-parses until the underlying
-    # cloudpickle issue resolves on its own.
-    try:
-        import cloudpickle
-
-        payload = cloudpickle.dumps(multiqc.report)
-        cache.set(state_cache_key, {"__cloudpickle__": payload}, ttl=MULTIQC_CACHE_TTL_SECONDS)
-    except Exception as e:
-        logger.info(
-            f"_force_reparse: cloudpickle persist after retry skipped ({e!r}); "
-            f"in-process state still good"
-        )
-
-
 def create_multiqc_plot(
     s3_locations: List[str],
     module: str,
@@ -401,18 +217,18 @@ def create_multiqc_plot(
 ) -> go.Figure:
     """Create a Plotly figure from MultiQC data with figure-level Redis caching.
 
-    Cache layers: Redis figure cache -> in-memory report cache -> full parse.
+    Cache layers: Redis figure cache -> resident Plot objects -> per-plot
+    cache artifacts -> full parse (see ``report_pool``).
 
     Filter-aware caching is layered on top by callers via
     :func:`generate_figure_cache_key` — this helper only caches the unfiltered
     baseline.
     """
-    # ``multiqc`` is needed for the reparse-retry diagnostics below.
     # Template registration is handled by ``get_theme_template`` itself, so it
     # holds on the cached return below too — which never reaches
-    # ``build_multiqc_figure``, and whose figure a caller may re-template for the
-    # other theme.
-    import multiqc
+    # ``build_figure_from_plot``, and whose figure a caller may re-template for
+    # the other theme.
+    from depictio.api.v1.services.multiqc import report_pool
 
     cache = get_cache()
 
@@ -438,47 +254,28 @@ def create_multiqc_plot(
     if cached_fig_dict is not None:
         return go.Figure(cached_fig_dict)
 
-    # Hold _multiqc_lock across BOTH parse and get_plot so concurrent renders
-    # of different DCs don't trample each other's `multiqc.report` global
-    # state. _get_or_parse_multiqc_logs uses an RLock so the inner acquire is
-    # a no-op recursive lock. Without this, three multiqc components added in
-    # the same dashboard render in parallel: the parse-lock releases, another
-    # thread restores its own cached report, and the first thread's
-    # multiqc.get_plot then sees the wrong report → "Module X is not found".
-    with _multiqc_lock:
-        parse_success = _get_or_parse_multiqc_logs(s3_locations, use_s3_cache=use_s3_cache)
-
-        if not parse_success:
-            raise ValueError("Failed to parse any MultiQC data files")
-
-        # Cloudpickle round-trips the parsed `multiqc.report` for cross-worker
-        # reuse, but the restored object can come back without populated
-        # `report.modules` (silent loss of `Module` instances). When that
-        # happens, get_plot (inside build_multiqc_figure) raises "Module X is
-        # not found" even though the underlying parquet contains the module.
-        # Detect, drop the bad cache entry, force a fresh parse, and retry once.
-        try:
-            fig = build_multiqc_figure(module, plot, dataset_id, theme)
-        except ValueError as ve:
-            if "is not found" not in str(ve):
-                raise
-            logger.warning(
-                f"create_multiqc_plot: get_plot('{module}','{plot}') failed "
-                f"after parse — invalidating cached multiqc.report and re-parsing"
-            )
-            _force_reparse(s3_locations, use_s3_cache=use_s3_cache, ve=ve)
-            try:
-                fig = build_multiqc_figure(module, plot, dataset_id, theme)
-            except ValueError as retry_err:
-                available: list[str] = []
-                try:
-                    available = multiqc.list_modules()
-                except Exception:
-                    pass
-                raise ValueError(
-                    f"MultiQC module '{module}' not in parsed report after re-parse. "
-                    f"s3_locations={s3_locations}, available_modules={available}"
-                ) from retry_err
+    # The Plot object is this report's own, not ``multiqc.report``'s, so
+    # renders of different DCs no longer need to take turns on the global
+    # report. ``resident_plot`` re-parses once itself when the cached index
+    # lacks the module.
+    try:
+        plot_obj = report_pool.resident_plot(
+            s3_locations, module, plot, use_s3_cache=use_s3_cache, dc_id=dc_id
+        )
+    except ValueError as e:
+        if "is not found" not in str(e):
+            raise
+        available = report_pool.resident_modules(s3_locations, dc_id)
+        raise ValueError(
+            f"MultiQC module '{module}' not in parsed report after re-parse. "
+            f"s3_locations={s3_locations}, available_modules={available}"
+        ) from e
+
+    # Building reads only the Plot, but an in-process parse resets MultiQC's
+    # config under the lock — stay out of its way when parses happen here.
+    in_process = report_pool.parses_in_process()
+    with _multiqc_lock if in_process else contextlib.nullcontext():
+        fig = build_figure_from_plot(plot_obj, module, plot, dataset_id, theme)
 
     try:
         cache.set(fig_cache_key, fig.to_dict(), ttl=MULTIQC_CACHE_TTL_SECONDS)
@@ -488,70 +285,18 @@ def create_multiqc_plot(
     return fig
 
 
-def _filter_heatmap_trace(trace, samples_set: set) -> None:
-    """Filter heatmap trace to show only matching samples."""
-    x_data = list(trace.x) if trace.x is not None else []
-    y_data = list(trace.y) if trace.y is not None else []
-    z_data = list(trace.z) if trace.z is not None else []
-
-    x_matches = [i for i, x in enumerate(x_data) if str(x) in samples_set]
-    y_matches = [i for i, y in enumerate(y_data) if str(y) in samples_set]
-
-    if y_matches and len(y_matches) >= len(x_matches):
-        trace.y = [y_data[i] for i in y_matches]
-        if z_data:
-            trace.z = [z_data[i] for i in y_matches if i < len(z_data)]
-    elif x_matches:
-        trace.x = [x_data[i] for i in x_matches]
-        if z_data:
-            trace.z = [[row[i] for i in x_matches if i < len(row)] for row in z_data]
-
-
-def _filter_categorical_trace(trace, samples_set: set) -> None:
-    """Filter bar/box/violin trace to show only matching samples."""
-    if hasattr(trace, "name") and trace.name:
-        trace.visible = trace.name in samples_set
-        return
-
-    orientation = getattr(trace, "orientation", "v")
-    is_horizontal = orientation == "h"
-
-    sample_axis = list(trace.y if is_horizontal else trace.x) or []
-    value_axis = list(trace.x if is_horizontal else trace.y) or []
-
-    indices = [i for i, s in enumerate(sample_axis) if str(s) in samples_set]
-    if not indices:
-        return
-
-    filtered_samples = [sample_axis[i] for i in indices]
-    filtered_values = [value_axis[i] for i in indices if i < len(value_axis)]
-
-    if is_horizontal:
-        trace.y = filtered_samples
-        trace.x = filtered_values
-    else:
-        trace.x = filtered_samples
-        trace.y = filtered_values
-
-
 def filter_samples_in_plot(fig: go.Figure, samples_to_show: List[str]) -> go.Figure:
-    """Filter which samples are visible in a MultiQC plot."""
-    try:
-        samples_set = set(str(s) for s in samples_to_show)
-
-        for trace in fig.data:
-            trace_type = getattr(trace, "type", "").lower()
+    """Filter which samples are visible in a MultiQC plot.
 
-            if trace_type == "heatmap":
-                _filter_heatmap_trace(trace, samples_set)
-            elif trace_type in ["bar", "box", "violin"]:
-                _filter_categorical_trace(trace, samples_set)
-            elif hasattr(trace, "name") and trace.name:
-                trace.visible = trace.name in samples_set
-            else:
-                trace.visible = True
+    Runs the figure through :func:`patching.patch_multiqc_figures`, the same
+    vectorized filter the render endpoint applies to cached figure dicts, so
+    a ``go.Figure`` and its dict form filter identically.
+    """
+    from depictio.api.v1.services.multiqc.patching import patch_multiqc_figures
 
-        return fig
+    try:
+        patched = patch_multiqc_figures([fig.to_dict()], [str(s) for s in samples_to_show])
+        return go.Figure(patched[0])
 
     except Exception as e:
         logger.error(f"Error filtering samples in plot: {e}", exc_info=True)
@@ -8,10 +8,10 @@ stay in the dash/ tree and die with it.
 """
 
 import json
+import math
 import re
 from typing import Any
 
-import pandas as pd
 import plotly.colors as pc
 import plotly.graph_objects as go
 import polars as pl
@@ -114,7 +114,29 @@ def _extract_metadata_from_parquet(
 # ---------------------------------------------------------------------------
 
 
-def _detect_sample_groups(samples: list[str], df_metrics: pd.DataFrame) -> dict | None:
+def _pivot(df_metrics: pl.DataFrame) -> pl.DataFrame:
+    """One row per sample, one column per metric, holding the first ``val_mod`` present.
+
+    Missing values are skipped before taking the first, so a metric with no value
+    anywhere gets no column and a sample with none gets no row. Rows are sorted
+    by sample and columns by metric name — the shape the pandas ``pivot_table``
+    this replaced produced, which the table's row and column order rely on.
+    """
+    present = df_metrics.filter(pl.col("val_mod").is_not_null())
+    if present.is_empty():
+        return pl.DataFrame(schema={"sample": pl.Utf8})
+    wide = present.pivot(on="metric", index="sample", values="val_mod", aggregate_function="first")
+    metrics = sorted(c for c in wide.columns if c != "sample")
+    return wide.select("sample", *metrics).sort("sample")
+
+
+def _in_canonical_order(df_pivot: pl.DataFrame, canonical_order: list[str]) -> pl.DataFrame:
+    ordered = [c for c in canonical_order if c in df_pivot.columns]
+    remaining = [c for c in df_pivot.columns if c not in ordered]
+    return df_pivot.select(ordered + remaining)
+
+
+def _detect_sample_groups(samples: list[str], df_metrics: pl.DataFrame) -> dict | None:
     """Detect paired-end sample groups (base, _1, _2)."""
     sample_set = set(samples)
     base_samples = []
@@ -126,29 +148,23 @@ def _detect_sample_groups(samples: list[str], df_metrics: pd.DataFrame) -> dict
     if not base_samples:
         return None
 
-    sample_level_metrics: list[str] = []
-    read_level_metrics: list[str] = []
-
-    for metric in df_metrics["metric"].unique():
-        metric_samples = df_metrics[df_metrics["metric"] == metric]["sample"].tolist()
-        has_bare = any(s in base_samples for s in metric_samples)
-        has_suffixed = any(s.endswith("_1") or s.endswith("_2") for s in metric_samples)
-
-        if has_bare and not has_suffixed:
-            sample_level_metrics.append(metric)
-        else:
-            read_level_metrics.append(metric)
+    sample = pl.col("sample")
+    per_metric = df_metrics.group_by("metric", maintain_order=True).agg(
+        sample.is_in(base_samples).any().alias("has_bare"),
+        (sample.str.ends_with("_1") | sample.str.ends_with("_2")).any().alias("has_suffixed"),
+    )
+    is_sample_level = pl.col("has_bare") & ~pl.col("has_suffixed")
 
     return {
         "base_to_r1": {s: f"{s}_1" for s in base_samples},
         "base_to_r2": {s: f"{s}_2" for s in base_samples},
         "base_samples": sorted(base_samples),
-        "sample_level_metrics": sample_level_metrics,
-        "read_level_metrics": read_level_metrics,
+        "sample_level_metrics": per_metric.filter(is_sample_level)["metric"].to_list(),
+        "read_level_metrics": per_metric.filter(~is_sample_level)["metric"].to_list(),
     }
 
 
-def _harmonize_samples(df_metrics: pd.DataFrame, groups: dict, read_mode: str) -> pd.DataFrame:
+def _harmonize_samples(df_metrics: pl.DataFrame, groups: dict, read_mode: str) -> pl.DataFrame:
     """Build a pivoted DataFrame with harmonized samples."""
     base_samples = groups["base_samples"]
     sample_level_metrics = sorted(groups["sample_level_metrics"])
@@ -156,70 +172,57 @@ def _harmonize_samples(df_metrics: pd.DataFrame, groups: dict, read_mode: str) -
     canonical_order = ["sample"] + sample_level_metrics + read_level_metrics
 
     if read_mode == "all":
-        df_pivot = df_metrics.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        ).reset_index()
-        ordered = [c for c in canonical_order if c in df_pivot.columns]
-        remaining = [c for c in df_pivot.columns if c not in ordered]
-        return df_pivot[ordered + remaining]
-
-    base_to_r1 = groups["base_to_r1"]
-    base_to_r2 = groups["base_to_r2"]
-
-    df_sample = df_metrics[
-        df_metrics["metric"].isin(sample_level_metrics) & df_metrics["sample"].isin(base_samples)
-    ]
-    if not df_sample.empty:
-        df_sample_pivot = df_sample.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        ).reset_index()
+        return _in_canonical_order(_pivot(df_metrics), canonical_order)
+    if read_mode not in ("mean", "r1", "r2"):
+        msg = f"Unknown read_mode: {read_mode}"
+        raise ValueError(msg)
+
+    df_sample = df_metrics.filter(
+        pl.col("metric").is_in(sample_level_metrics) & pl.col("sample").is_in(base_samples)
+    )
+    if not df_sample.is_empty():
+        df_sample_pivot = _pivot(df_sample)
     else:
-        df_sample_pivot = pd.DataFrame({"sample": base_samples})
+        df_sample_pivot = pl.DataFrame({"sample": base_samples}, schema={"sample": pl.Utf8})
+
+    df_read = df_metrics.filter(pl.col("metric").is_in(read_level_metrics))
 
-    r1_names = list(base_to_r1.values())
-    r2_names = list(base_to_r2.values())
-    r1_to_base = {v: k for k, v in base_to_r1.items()}
-    r2_to_base = {v: k for k, v in base_to_r2.items()}
-    df_read = df_metrics[df_metrics["metric"].isin(read_level_metrics)]
+    def _mate_pivot(base_to_mate: dict[str, str]) -> pl.DataFrame:
+        mate_to_base = {v: k for k, v in base_to_mate.items()}
+        df_mate = df_read.filter(pl.col("sample").is_in(list(mate_to_base)))
+        return _pivot(df_mate.with_columns(pl.col("sample").replace(mate_to_base)))
 
     if read_mode == "mean":
-        df_r1 = df_read[df_read["sample"].isin(r1_names)].copy()
-        df_r1["sample"] = df_r1["sample"].map(r1_to_base)
-        df_r1_pivot = df_r1.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        )
-        df_r2 = df_read[df_read["sample"].isin(r2_names)].copy()
-        df_r2["sample"] = df_r2["sample"].map(r2_to_base)
-        df_r2_pivot = df_r2.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        )
-        df_read_pivot = ((df_r1_pivot + df_r2_pivot) / 2).reset_index()
+        df_r1_pivot = _mate_pivot(groups["base_to_r1"])
+        df_r2_pivot = _mate_pivot(groups["base_to_r2"])
+        # Mean of the two mates per base sample and metric; missing on either
+        # side stays missing.
+        metrics = sorted((set(df_r1_pivot.columns) | set(df_r2_pivot.columns)) - {"sample"})
+        df_r2_pivot = df_r2_pivot.rename({c: f"{c}\x00r2" for c in df_r2_pivot.columns[1:]})
+        both = df_r1_pivot.join(df_r2_pivot, on="sample", how="full", coalesce=True)
+        missing = pl.lit(None, dtype=pl.Float64)
+
+        def _mate(name: str) -> pl.Expr:
+            return pl.col(name) if name in both.columns else missing
+
+        df_read_pivot = both.select(
+            "sample", *[((_mate(m) + _mate(f"{m}\x00r2")) / 2).alias(m) for m in metrics]
+        ).sort("sample")
     elif read_mode == "r1":
-        df_r1 = df_read[df_read["sample"].isin(r1_names)].copy()
-        df_r1["sample"] = df_r1["sample"].map(r1_to_base)
-        df_read_pivot = df_r1.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        ).reset_index()
-    elif read_mode == "r2":
-        df_r2 = df_read[df_read["sample"].isin(r2_names)].copy()
-        df_r2["sample"] = df_r2["sample"].map(r2_to_base)
-        df_read_pivot = df_r2.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        ).reset_index()
+        df_read_pivot = _mate_pivot(groups["base_to_r1"])
     else:
-        msg = f"Unknown read_mode: {read_mode}"
-        raise ValueError(msg)
+        df_read_pivot = _mate_pivot(groups["base_to_r2"])
 
-    if not df_sample.empty and not df_read_pivot.empty:
-        df_pivot = df_sample_pivot.merge(df_read_pivot, on="sample", how="outer")
-    elif not df_read_pivot.empty:
+    if not df_sample.is_empty() and not df_read_pivot.is_empty():
+        df_pivot = df_sample_pivot.join(df_read_pivot, on="sample", how="full", coalesce=True).sort(
+            "sample"
+        )
+    elif not df_read_pivot.is_empty():
         df_pivot = df_read_pivot
     else:
         df_pivot = df_sample_pivot
 
-    ordered = [c for c in canonical_order if c in df_pivot.columns]
-    remaining = [c for c in df_pivot.columns if c not in ordered]
-    return df_pivot[ordered + remaining]
+    return _in_canonical_order(df_pivot, canonical_order)
 
 
 # ---------------------------------------------------------------------------
@@ -227,10 +230,10 @@ def _harmonize_samples(df_metrics: pd.DataFrame, groups: dict, read_mode: str) -
 # ---------------------------------------------------------------------------
 
 
-def _process_multiqc_data(
-    parquet_path: str | list[str], show_hidden: bool = False, read_mode: str = "mean"
-) -> tuple:
-    """Process MultiQC parquet data and return formatted DataFrames.
+def _load_general_stats(
+    parquet_path: str | list[str], show_hidden: bool = False
+) -> tuple[pl.DataFrame, dict[str, dict[str, Any]]]:
+    """The general-stats metric rows of the report(s) and their per-metric metadata.
 
     ``parquet_path`` can be a single path (legacy single-report behaviour)
     or a list of paths — when given a list, every parquet is read and
@@ -248,6 +251,7 @@ def _process_multiqc_data(
         # dtypes don't crash the concat — they just contribute nulls / get
         # cast to a common dtype, mirroring the CLI aggregator's behaviour.
         df_raw = pl.concat([pl.read_parquet(p) for p in parquet_path], how="diagonal_relaxed")
+
     df_general_stats = df_raw.filter(pl.col("anchor") == "general_stats_table")
     df_metrics_pl = df_general_stats.filter(pl.col("type") == "plot_input_row")
 
@@ -282,18 +286,37 @@ def _process_multiqc_data(
         if hidden_metrics:
             df_metrics_pl = df_metrics_pl.filter(~pl.col("metric").is_in(list(hidden_metrics)))
 
-    df_explore = df_metrics_pl.to_pandas()
-    samples = df_explore["sample"].unique().tolist()
-    sample_groups = _detect_sample_groups(samples, df_explore)
+    if df_metrics_pl.schema["val_mod"].is_float():
+        # NaN counts as missing, as it did for pandas.
+        df_metrics_pl = df_metrics_pl.with_columns(pl.col("val_mod").fill_nan(None))
+    return df_metrics_pl, column_metadata
+
+
+def _sample_groups(df_metrics: pl.DataFrame) -> dict | None:
+    samples = df_metrics["sample"].unique(maintain_order=True).to_list()
+    return _detect_sample_groups(samples, df_metrics)
+
+
+def _process_multiqc_data(
+    parquet_path: str | list[str],
+    show_hidden: bool = False,
+    read_mode: str = "mean",
+    loaded: tuple[pl.DataFrame, dict[str, dict[str, Any]]] | None = None,
+) -> tuple:
+    """Process MultiQC parquet data and return formatted DataFrames.
+
+    ``loaded`` is :func:`_load_general_stats`'s result for the same path and
+    ``show_hidden``, so the read modes of one payload share a single read.
+    """
+    df_metrics_pl, column_metadata = loaded or _load_general_stats(parquet_path, show_hidden)
+    sample_groups = _sample_groups(df_metrics_pl)
 
     if sample_groups:
-        df_pivot = _harmonize_samples(df_explore, sample_groups, read_mode)
+        df_pivot = _harmonize_samples(df_metrics_pl, sample_groups, read_mode)
     else:
-        df_pivot = df_explore.pivot_table(
-            index="sample", columns="metric", values="val_mod", aggfunc="first"
-        ).reset_index()
+        df_pivot = _pivot(df_metrics_pl)
 
-    tools = df_explore["section_key"].unique()
+    tools = df_metrics_pl["section_key"].unique(maintain_order=True).to_list()
 
     column_mapping: dict[str, str] = {}
     percentage_columns: list[str] = []
@@ -328,27 +351,26 @@ def _process_multiqc_data(
         elif display_name.endswith(" (%)"):
             percentage_columns.append(display_name)
 
-    df_multiqc_real = df_pivot.rename(columns=column_mapping)
-
-    sanitized_columns: dict[str, str] = {}
-    display_to_internal: dict[str, str] = {}
-    for col in df_multiqc_real.columns:
-        if col == "Sample Name":
-            sanitized_columns[col] = col
-            display_to_internal[col] = col
+    # Display names are not unique (two tools can title a column alike), so
+    # sanitized names are assigned per source column, not per display name.
+    internal_names: dict[str, str] = {}
+    internal_to_display: dict[str, str] = {}
+    for col in df_pivot.columns:
+        display_name = column_mapping[col]
+        if display_name == "Sample Name":
+            sanitized = display_name
         else:
-            sanitized = _sanitize_column_name(col)
+            sanitized = _sanitize_column_name(display_name)
             counter = 1
             original_sanitized = sanitized
-            while sanitized in sanitized_columns.values():
+            while sanitized in internal_to_display:
                 sanitized = f"{original_sanitized}_{counter}"
                 counter += 1
-            sanitized_columns[col] = sanitized
-            display_to_internal[col] = sanitized
+        internal_names[col] = sanitized
+        internal_to_display[sanitized] = display_name
 
-    internal_to_display = {v: k for k, v in display_to_internal.items()}
-    df_multiqc_real = df_multiqc_real.rename(columns=sanitized_columns)
-    df_for_display = df_multiqc_real.copy()
+    df_multiqc_real = df_pivot.rename(internal_names)
+    df_for_display = df_multiqc_real
 
     return (
         df_multiqc_real,
@@ -366,8 +388,12 @@ def _process_multiqc_data(
 # ---------------------------------------------------------------------------
 
 
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
 def _multiqc_data_bars_colormap(
-    df: pd.DataFrame,
+    df: pl.DataFrame,
     column: str,
     cmap_name: str = "RdYlGn",
     opacity: float = 0.4,
@@ -377,7 +403,7 @@ def _multiqc_data_bars_colormap(
     """Create data bars coloured with a plotly colorscale."""
     n_bins = 100
     bounds = [i * (1.0 / n_bins) for i in range(n_bins + 1)]
-    col_data = pd.to_numeric(df[column], errors="coerce")
+    col_data = df[column].cast(pl.Float64, strict=False).fill_nan(None)
 
     if fixed_scale:
         col_min, col_max = fixed_scale
@@ -385,7 +411,7 @@ def _multiqc_data_bars_colormap(
         col_max = col_data.max()
         col_min = col_data.min()
 
-    if pd.isna(col_max) or pd.isna(col_min):
+    if _is_missing(col_max) or _is_missing(col_min):
         return []
 
     ranges = [((col_max - col_min) * i) + col_min for i in bounds]
@@ -443,7 +469,7 @@ def _multiqc_data_bars_colormap(
 
 
 def _create_violin_plot(
-    df_general_stats: pd.DataFrame,
+    df_general_stats: pl.DataFrame,
     reformatted_column_metadata: dict,
     display_to_original_mapping: dict | None = None,
 ) -> go.Figure:
@@ -485,7 +511,7 @@ def _create_violin_plot(
             }
         )
 
-    num_samples = len(df_general_stats)
+    num_samples = df_general_stats.height
     layout = go.Layout(
         title={
             "text": f"General Statistics<br><span style='font-size: 12px;'>{num_samples} samples</span>",
@@ -520,14 +546,12 @@ def _create_violin_plot(
 
     for metric_idx, metric_data in enumerate(metric_info):
         metric = metric_data["display_name"]
-        values = []
-        samples = []
-        for _, row in df_general_stats.iterrows():
-            val = row[metric]
-            if pd.isna(val):
-                continue
-            values.append(val)
-            samples.append(row["Sample Name"])
+        present = df_general_stats.select("Sample Name", metric)
+        if present.schema[metric].is_float():
+            present = present.with_columns(pl.col(metric).fill_nan(None))
+        present = present.drop_nulls(metric)
+        values = present[metric].to_list()
+        samples = present["Sample Name"].to_list()
 
         axis_key = "" if metric_idx == 0 else str(metric_idx + 1)
         x_axis_config: dict[str, Any] = {
@@ -628,7 +652,7 @@ def _resolve_scale_name(scale_name: str) -> tuple[str, bool]:
 
 
 def _generate_data_bar_styles(
-    df_for_display: pd.DataFrame,
+    df_for_display: pl.DataFrame,
     tools,
     column_metadata: dict,
     internal_to_display: dict,
@@ -742,13 +766,16 @@ def _build_mode_payload(
     show_hidden: bool,
     read_mode: str,
     selected_samples: list[str] | None = None,
+    loaded: tuple[pl.DataFrame, dict[str, dict[str, Any]]] | None = None,
 ) -> dict:
     """Build a fully JSON-safe payload for one read mode (table + violin).
 
     When ``selected_samples`` is provided, the dataframe is filtered before
     style + violin generation so data bars span the filtered range only.
     """
-    result = _process_multiqc_data(parquet_path, show_hidden=show_hidden, read_mode=read_mode)
+    result = _process_multiqc_data(
+        parquet_path, show_hidden=show_hidden, read_mode=read_mode, loaded=loaded
+    )
     (
         _df_multiqc_real,
         df_for_display,
@@ -760,9 +787,9 @@ def _build_mode_payload(
     ) = result
 
     if selected_samples:
-        df_for_display = df_for_display[
-            df_for_display["Sample Name"].astype(str).isin([str(s) for s in selected_samples])
-        ].reset_index(drop=True)
+        df_for_display = df_for_display.filter(
+            pl.col("Sample Name").cast(pl.Utf8).is_in([str(s) for s in selected_samples])
+        )
 
     all_styles, column_formats = _generate_data_bar_styles(
         df_for_display, tools, column_metadata, internal_to_display, percentage_columns
@@ -787,7 +814,7 @@ def _build_mode_payload(
     )
 
     return {
-        "table_data": df_for_display.to_dict("records"),
+        "table_data": df_for_display.to_dicts(),
         "table_columns": columns,
         "table_styles": all_styles,
         "violin_figure": violin_fig.to_dict(),
@@ -825,12 +852,12 @@ def build_general_stats_payload(
     and ``all_samples`` are still derived from the *unfiltered* probe so the
     React-side toggle remains coherent across filter changes.
     """
-    probe = _process_multiqc_data(parquet_path, show_hidden=show_hidden, read_mode="mean")
-    is_paired_end = probe[6] is not None
+    loaded = _load_general_stats(parquet_path, show_hidden)
+    is_paired_end = _sample_groups(loaded[0]) is not None
 
     read_modes = ["mean", "r1", "r2", "all"] if is_paired_end else ["mean"]
     modes = {
-        mode: _build_mode_payload(parquet_path, show_hidden, mode, selected_samples)
+        mode: _build_mode_payload(parquet_path, show_hidden, mode, selected_samples, loaded)
         for mode in read_modes
     }
 
@@ -3,10 +3,23 @@
 Extracted from depictio.dash.modules.multiqc_component.callbacks.core so the
 celery prerender tasks (and any future API endpoint) can patch figures
 without dragging in Dash callback machinery.
+
+Filtering is done with index arrays: each trace's sample axis is turned into a
+``sample -> positions`` map once, the selection becomes a boolean mask through
+that map, and the mask is applied to every attribute that runs along the axis
+(values, ``text``, ``hovertext``, ``customdata``, per-point marker arrays)
+rather than to ``x``/``y`` alone, which left hover text pointing at the wrong
+bars. The maps are cached by the axis's content, so a filter change on an
+already-seen figure only costs the lookups of the selected samples.
 """
 
-import copy
+import base64
 import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
 
 # Strip read-pair / lane / replicate suffixes (HG001_R1 -> HG001) so a base
 # sample name selected in an interactive component still matches MultiQC's
@@ -56,101 +69,222 @@ def expand_canonical_samples_to_variants(
     return expanded_samples
 
 
+# Trace attributes that, when as long as the sample axis, hold one entry per
+# point and are filtered with it. Marker attributes are nested one level down.
+_POINT_ATTRS = ("text", "hovertext", "customdata", "ids", "width", "base", "offset")
+_MARKER_ATTRS = ("color", "size", "opacity", "symbol")
+
+_INDEX_CACHE_SIZE = 512
+_index_cache: OrderedDict[tuple[int, int], dict[str, np.ndarray]] = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def _as_sequence(values: Any) -> Any:
+    """A trace array as something indexable: lists and arrays as-is, typed arrays decoded.
+
+    Figures that went through Plotly JSON carry numeric arrays as
+    ``{"dtype": "f8", "bdata": <base64>}``.
+    """
+    if isinstance(values, dict) and "bdata" in values and "dtype" in values:
+        array = np.frombuffer(base64.b64decode(values["bdata"]), dtype=values["dtype"])
+        shape = values.get("shape")
+        if shape:
+            array = array.reshape([int(n) for n in str(shape).split(",")])
+        return array
+    if values is None:
+        return []
+    if isinstance(values, (list, np.ndarray)):
+        return values
+    return list(values)
+
+
+def _is_array(values: Any) -> bool:
+    """Whether a trace attribute holds one entry per point.
+
+    Plotly also accepts scalars for ``width``/``offset``/``base`` and a single
+    string for ``text``/``hovertext``; those apply to every point and are left
+    as they are.
+    """
+    if isinstance(values, dict):
+        return "bdata" in values and "dtype" in values
+    return isinstance(values, (list, tuple, np.ndarray))
+
+
+def _sample_index(labels: Any) -> dict[str, np.ndarray]:
+    """``str(label) -> positions`` along one sample axis, cached by the axis's content."""
+    keys = [str(v) for v in labels]
+    fingerprint = (len(keys), hash(tuple(keys)))
+    with _index_lock:
+        index = _index_cache.get(fingerprint)
+        if index is not None:
+            _index_cache.move_to_end(fingerprint)
+            return index
+
+    codes, inverse = np.unique(np.asarray(keys, dtype=object), return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(codes)))[:-1]
+    index = dict(zip(codes.tolist(), np.split(order, bounds))) if keys else {}
+
+    with _index_lock:
+        _index_cache[fingerprint] = index
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def _mask(labels: Any, selected: set[str]) -> np.ndarray:
+    """Boolean mask over ``labels``: True where ``str(label)`` is selected."""
+    index = _sample_index(labels)
+    mask = np.zeros(len(labels), dtype=bool)
+    if len(selected) < len(index):
+        hits = [index[s] for s in selected if s in index]
+    else:
+        hits = [positions for name, positions in index.items() if name in selected]
+    if hits:
+        mask[np.concatenate(hits)] = True
+    return mask
+
+
+def _take(values: Any, keep: np.ndarray, axis: int = 0) -> Any:
+    """``values`` at positions ``keep`` (ascending); positions past its end are dropped."""
+    seq = _as_sequence(values)
+    if axis == 0:
+        keep = keep[keep < len(seq)]
+        if isinstance(seq, np.ndarray):
+            return seq[keep].tolist()
+        return [seq[i] for i in keep.tolist()]
+    # Columns of a row-major 2-D array; ragged rows keep what they have.
+    if isinstance(seq, np.ndarray) and seq.ndim == 2:
+        return seq[:, keep[keep < seq.shape[1]]].tolist()
+    positions = keep.tolist()
+    return [[row[i] for i in positions if i < len(row)] for row in seq]
+
+
+def _filter_aligned(trace: dict, n: int, keep: np.ndarray) -> None:
+    """Apply ``keep`` to every per-point attribute of ``trace`` that is ``n`` long."""
+    for attr in _POINT_ATTRS:
+        if not _is_array(trace.get(attr)):
+            continue
+        values = _as_sequence(trace[attr])
+        if len(values) == n:
+            trace[attr] = _take(values, keep)
+    marker = trace.get("marker")
+    if isinstance(marker, dict):
+        patched = None
+        for attr in _MARKER_ATTRS:
+            values = marker.get(attr)
+            if isinstance(values, (list, tuple, np.ndarray)) and len(values) == n:
+                patched = patched if patched is not None else dict(marker)
+                patched[attr] = _take(values, keep)
+        if patched is not None:
+            trace["marker"] = patched
+
+
+def _filter_categorical(trace: dict, x: Any, y: Any, orientation: str, selected: set) -> None:
+    """Bar / box / violin: keep the selected samples along the category axis."""
+    if orientation == "h":
+        sample_key, value_key, samples, values = "y", "x", y, x
+    else:
+        sample_key, value_key, samples, values = "x", "y", x, y
+    keep = np.flatnonzero(_mask(samples, selected))
+    trace[sample_key] = _take(samples, keep)
+    trace[value_key] = _take(values, keep)
+    _filter_aligned(trace, len(samples), keep)
+
+
+def _filter_heatmap(trace: dict, x: Any, y: Any, z: Any, selected: set) -> None:
+    """Heatmap: keep the selected rows, or columns, whichever axis matches more."""
+    if not (len(x) and len(z)):
+        return
+    x_keep = np.flatnonzero(_mask(x, selected))
+    y_keep = np.flatnonzero(_mask(y, selected)) if len(y) else x_keep[:0]
+
+    if len(y_keep) and len(y_keep) >= len(x_keep):
+        trace["y"] = _take(y, y_keep)
+        trace["z"] = _take(z, y_keep)
+        axis, keep = 0, y_keep
+    elif len(x_keep):
+        trace["x"] = _take(x, x_keep)
+        trace["z"] = _take(z, x_keep, axis=1)
+        axis, keep = 1, x_keep
+    else:
+        return
+    # Per-cell text/customdata are shaped like z.
+    for attr in ("text", "hovertext", "customdata"):
+        if not _is_array(trace.get(attr)):
+            continue
+        values = _as_sequence(trace[attr])
+        if len(values) != len(_as_sequence(z)):
+            continue
+        trace[attr] = _take(values, keep, axis=axis)
+
+
+def _filter_scatter(trace: dict, x: Any, y: Any, selected: set) -> None:
+    """Unnamed scatter: keep points whose x or y is a selected sample, if any is."""
+    mask = _mask(x, selected)
+    if len(y):
+        y_mask = _mask(y, selected)
+        mask[: len(y_mask)] |= y_mask[: len(mask)]
+    keep = np.flatnonzero(mask)
+    if not len(keep):
+        return
+    trace["x"] = _take(x, keep)
+    trace["y"] = _take(y, keep)
+    _filter_aligned(trace, len(x), keep)
+
+
 def patch_multiqc_figures(
     figures: list[dict],
     selected_samples: list[str],
     metadata: dict | None = None,
     trace_metadata: dict | None = None,
 ) -> list[dict]:
-    """Apply sample filtering to MultiQC figures based on interactive selections."""
+    """Apply sample filtering to MultiQC figures based on interactive selections.
+
+    The input figures are left untouched. Only what filtering replaces is
+    copied: the figure and trace dicts and the layout's top level, not the
+    arrays, which are rebuilt rather than edited.
+    """
     if not figures or not selected_samples:
         return figures
 
-    patched_figures = []
+    selected = {str(s) for s in selected_samples}
+    original_traces = []
+    if trace_metadata and "original_data" in trace_metadata:
+        original_traces = trace_metadata["original_data"]
 
+    patched_figures = []
     for fig in figures:
-        patched_fig = copy.deepcopy(fig)
-
-        original_traces = []
-        if trace_metadata and "original_data" in trace_metadata:
-            original_traces = trace_metadata["original_data"]
+        patched_fig = dict(fig)
+        if isinstance(fig.get("layout"), dict):
+            patched_fig["layout"] = dict(fig["layout"])
+        patched_fig["data"] = [dict(t) for t in fig.get("data", [])]
 
-        for i, trace in enumerate(patched_fig.get("data", [])):
+        for i, trace in enumerate(patched_fig["data"]):
             trace_type = trace.get("type", "").lower()
             trace_name = trace.get("name", "")
 
             if i < len(original_traces):
                 trace_info = original_traces[i]
-                original_x = trace_info.get("original_x", [])
-                original_y = trace_info.get("original_y", [])
-                original_z = trace_info.get("original_z", [])
+                x = _as_sequence(trace_info.get("original_x", []))
+                y = _as_sequence(trace_info.get("original_y", []))
+                z = _as_sequence(trace_info.get("original_z", []))
                 orientation = trace_info.get("orientation", "v")
             else:
-                original_x = list(trace.get("x", []))
-                original_y = list(trace.get("y", []))
-                original_z = list(trace.get("z", []))
+                x = _as_sequence(trace.get("x", []))
+                y = _as_sequence(trace.get("y", []))
+                z = _as_sequence(trace.get("z", []))
                 orientation = trace.get("orientation", "v")
 
             if trace_type in ["bar", "box", "violin"]:
-                if orientation == "h":
-                    sample_axis = original_y
-                    value_axis = original_x
-                    sample_key = "y"
-                    value_key = "x"
-                else:
-                    sample_axis = original_x
-                    value_axis = original_y
-                    sample_key = "x"
-                    value_key = "y"
-
-                filtered_samples = []
-                filtered_values = []
-                for j, sample in enumerate(sample_axis):
-                    if sample in selected_samples:
-                        filtered_samples.append(sample)
-                        if j < len(value_axis):
-                            filtered_values.append(value_axis[j])
-
-                trace[sample_key] = filtered_samples
-                trace[value_key] = filtered_values
-
+                _filter_categorical(trace, x, y, orientation, selected)
             elif trace_type == "heatmap":
-                if original_x and original_z:
-                    x_indices = [j for j, x in enumerate(original_x) if str(x) in selected_samples]
-                    y_indices = (
-                        [j for j, y in enumerate(original_y) if str(y) in selected_samples]
-                        if original_y
-                        else []
-                    )
-
-                    if y_indices and len(y_indices) >= len(x_indices):
-                        trace["y"] = [original_y[j] for j in y_indices]
-                        if isinstance(original_z, list) and original_z:
-                            trace["z"] = [original_z[j] for j in y_indices if j < len(original_z)]
-                    elif x_indices:
-                        trace["x"] = [original_x[j] for j in x_indices]
-                        if isinstance(original_z, list) and original_z:
-                            trace["z"] = [
-                                [row[j] for j in x_indices if j < len(row)] for row in original_z
-                            ]
-
+                _filter_heatmap(trace, x, y, z, selected)
             elif trace_type in ["scatter", "scattergl"]:
                 if trace_name:
-                    trace["visible"] = trace_name in selected_samples
+                    trace["visible"] = trace_name in selected
                 else:
-                    filtered_x = []
-                    filtered_y = []
-                    for j, x_val in enumerate(original_x):
-                        if (
-                            str(x_val) in selected_samples
-                            or str(original_y[j] if j < len(original_y) else "") in selected_samples
-                        ):
-                            filtered_x.append(x_val)
-                            if j < len(original_y):
-                                filtered_y.append(original_y[j])
-                    if filtered_x:
-                        trace["x"] = filtered_x
-                        trace["y"] = filtered_y
+                    _filter_scatter(trace, x, y, selected)
 
         patched_figures.append(patched_fig)
 
@@ -0,0 +1,331 @@
+"""Parsed MultiQC reports, kept per plot and parsed in a bounded process pool.
+
+MultiQC holds exactly one parsed report, in module-global state
+(``multiqc.report``). A process could therefore only ever have one report
+resident, and every render of another DC re-established it under
+``_multiqc_lock`` — so two dashboards with different reports took turns. The
+shared-cache copy that was meant to make the switch cheap never restored
+anything: ``multiqc.report`` is a module, cloudpickle pickles modules by
+reference, and the blob it stored was the ~70-byte name of the module. That is
+the "modules silently empty" failure ``create_multiqc_plot`` used to retry on.
+
+A figure needs one ``Plot`` object, and Plot objects pickle on their own (a few
+KB to ~100 KB each). So a parse now leaves, per report::
+
+    multiqc:plots:dc=<dc_id>:<report>                 the module/section index
+    multiqc:plot:dc=<dc_id>:<report>:<plot_anchor>    one pickled Plot
+
+in the shared cache (``dc=`` so the DC invalidation on append/replace drops
+them with the figures), and each process keeps the Plot objects it has used
+unpickled, least recently used evicted first, within
+``multiqc_resident_plots_mb``. Any number of reports can be resident at once,
+and a process that never parsed a report serves it from the cache.
+
+Parses run in ``multiqc_report_pool_workers`` spawned processes, each with its
+own MultiQC globals, so different reports parse in parallel. Concurrent
+requests for one report wait for the single parse in flight instead of each
+starting their own. With no workers, or where a process pool cannot start (a
+daemonic Celery prefork child), parses run here under ``_multiqc_lock``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any
+
+from depictio.api.v1.configs.logging_init import logger
+
+_lru_lock = threading.Lock()
+_resident: OrderedDict[tuple[str, str], tuple[str, Any, int]] = OrderedDict()
+_resident_bytes = 0
+
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+_executor: Any = None
+_executor_lock = threading.Lock()
+_pool_unavailable = False
+
+
+def report_key(s3_locations: list[str], dc_id: str | None = None) -> str:
+    """Identity of one parsed report set; the DC id is spelled out for invalidation."""
+    digest = hashlib.sha256("|".join(sorted(s3_locations)).encode()).hexdigest()[:16]
+    return f"dc={dc_id or 'none'}:{digest}"
+
+
+def _index_key(report: str) -> str:
+    return f"multiqc:plots:{report}"
+
+
+def _plot_key(report: str, anchor: str) -> str:
+    return f"multiqc:plot:{report}:{anchor}"
+
+
+def _parse_report(local_paths: list[str]) -> dict[str, Any]:
+    """Parse ``local_paths`` as one report; return its index and pickled plots.
+
+    Module-level so a spawned worker can run it. The caller must own MultiQC's
+    globals: a pool worker does, this process does under ``_multiqc_lock``.
+    """
+    import multiqc
+
+    multiqc.reset()
+    parsed = 0
+    for path in local_paths:
+        try:
+            multiqc.parse_logs(path)
+            parsed += 1
+        except Exception as e:
+            logger.warning(f"Error parsing {path}: {e}")
+    if parsed == 0:
+        raise ValueError("Failed to parse any MultiQC data files")
+
+    report = multiqc.report
+    modules = [
+        {
+            "name": str(m.name),
+            "anchor": str(m.anchor),
+            "sections": [
+                {
+                    "name": str(s.name) if s.name else "",
+                    "anchor": str(s.anchor),
+                    "plot": str(s.plot_anchor) if s.plot_anchor is not None else None,
+                }
+                for s in m.sections
+            ],
+        }
+        for m in report.modules
+    ]
+    plots: dict[str, bytes] = {}
+    for anchor, plot in report.plot_by_id.items():
+        try:
+            plots[str(anchor)] = pickle.dumps(plot, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"MultiQC plot {anchor} cannot be pickled, skipped: {e}")
+    # Release the parsed report: a pool worker lives on between parses.
+    multiqc.reset()
+    return {"modules": modules, "plots": plots}
+
+
+def _resolve(index: dict[str, Any], module: str, section: str) -> str:
+    """The plot anchor ``multiqc.get_plot(module, section)`` would return, same errors."""
+    mod = next(
+        (
+            m
+            for m in index["modules"]
+            if m["name"].lower() == module.lower() or m["anchor"] == module
+        ),
+        None,
+    )
+    if not mod:
+        raise ValueError(
+            f'Module "{module}" is not found. Use multiqc.list_modules() to list available modules'
+        )
+    sec = next(
+        (
+            s
+            for s in mod["sections"]
+            if (s["name"] and s["name"].lower() == section.lower()) or s["anchor"] == section
+        ),
+        None,
+    )
+    if not sec:
+        raise ValueError(f'Section "{section}" is not found in module "{module}"')
+    if sec["plot"] is None:
+        raise ValueError(f"Section {section} doesn't contain a Plot object")
+    return sec["plot"]
+
+
+def parses_in_process() -> bool:
+    """Whether parses run in this process, under ``_multiqc_lock``."""
+    from depictio.api.v1.configs.config import settings
+
+    return settings.performance.multiqc_report_pool_workers <= 0 or _pool_unavailable
+
+
+def _pool():
+    """The shared parse pool, or ``None`` to parse in this process."""
+    global _executor
+    from depictio.api.v1.configs.config import settings
+
+    if parses_in_process():
+        return None
+    workers = settings.performance.multiqc_report_pool_workers
+    with _executor_lock:
+        if _executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Spawned, not forked: a fork would copy this process's MultiQC
+            # globals and locks mid-use. Recycle workers so a heavy report's
+            # high-water memory is returned.
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=20,
+            )
+        return _executor
+
+
+def _run_parse(local_paths: list[str]) -> dict[str, Any]:
+    global _pool_unavailable, _executor
+
+    executor = _pool()
+    if executor is not None:
+        try:
+            return executor.submit(_parse_report, local_paths).result()
+        except ValueError:
+            raise
+        except Exception as e:
+            # BrokenProcessPool, or a daemonic process that may not have
+            # children: parse here from now on rather than fail renders.
+            logger.warning(f"MultiQC report pool unavailable ({e!r}); parsing in-process")
+            with _executor_lock:
+                _pool_unavailable = True
+                _executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    from depictio.api.v1.services.multiqc.figures import _multiqc_lock
+
+    with _multiqc_lock:
+        return _parse_report(local_paths)
+
+
+def _publish(report: str, parsed: dict[str, Any]) -> dict[str, Any]:
+    """Store a fresh parse in the shared cache; the index goes last, once its plots exist."""
+    from depictio.api.cache import get_cache
+    from depictio.api.v1.services.multiqc.figures import MULTIQC_CACHE_TTL_SECONDS
+
+    cache = get_cache()
+    index = {"generation": uuid.uuid4().hex, "modules": parsed["modules"]}
+    for anchor, blob in parsed["plots"].items():
+        cache.set(_plot_key(report, anchor), blob, ttl=MULTIQC_CACHE_TTL_SECONDS)
+    cache.set(_index_key(report), index, ttl=MULTIQC_CACHE_TTL_SECONDS)
+    _evict_report(report)
+    return index
+
+
+def _parse(report: str, s3_locations: list[str], use_s3_cache: bool) -> dict[str, Any]:
+    """Parse the report once however many threads ask; returns the index and plots."""
+    with _inflight_lock:
+        future = _inflight.get(report)
+        leader = future is None
+        if leader:
+            future = _inflight[report] = Future()
+    if not leader:
+        return future.result()
+
+    from depictio.api.v1.services.multiqc.figures import _get_local_path_for_s3
+
+    try:
+        local_paths = []
+        for location in s3_locations:
+            try:
+                local_paths.append(_get_local_path_for_s3(location, use_cache=use_s3_cache))
+            except Exception as e:
+                logger.warning(f"Error fetching {location}: {e}")
+        parsed = _run_parse(local_paths)
+        result = {"index": _publish(report, parsed), "plots": parsed["plots"]}
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(report, None)
+
+
+def _evict_report(report: str) -> None:
+    global _resident_bytes
+    with _lru_lock:
+        for key in [k for k in _resident if k[0] == report]:
+            _resident_bytes -= _resident.pop(key)[2]
+
+
+def _admit(report: str, anchor: str, generation: str, plot: Any, size: int) -> None:
+    global _resident_bytes
+    from depictio.api.v1.configs.config import settings
+
+    budget = settings.performance.multiqc_resident_plots_mb * 1024 * 1024
+    if size > budget:
+        return
+    with _lru_lock:
+        previous = _resident.pop((report, anchor), None)
+        if previous is not None:
+            _resident_bytes -= previous[2]
+        _resident[(report, anchor)] = (generation, plot, size)
+        _resident_bytes += size
+        while _resident_bytes > budget:
+            _resident_bytes -= _resident.popitem(last=False)[1][2]
+
+
+def _lookup(report: str, anchor: str, generation: str) -> Any:
+    with _lru_lock:
+        entry = _resident.get((report, anchor))
+        if entry is None or entry[0] != generation:
+            return None
+        _resident.move_to_end((report, anchor))
+        return entry[1]
+
+
+def resident_plot(
+    s3_locations: list[str],
+    module: str,
+    section: str,
+    use_s3_cache: bool = True,
+    dc_id: str | None = None,
+) -> Any:
+    """The MultiQC ``Plot`` for ``module``/``section`` of the report at ``s3_locations``.
+
+    Served from this process's resident plots, else the shared cache, else a
+    parse. Raises ``ValueError`` as ``multiqc.get_plot`` would when the report
+    has no such plot — after one re-parse, in case the cached index is stale.
+    """
+    from depictio.api.cache import get_cache
+
+    cache = get_cache()
+    report = report_key(s3_locations, dc_id)
+    # The index is read on every call, even for a resident plot: it is how an
+    # invalidation or a re-parse elsewhere reaches this process's residents.
+    index = cache.get(_index_key(report))
+    fresh = None
+    if index is None:
+        fresh = _parse(report, s3_locations, use_s3_cache)
+        index = fresh["index"]
+    try:
+        anchor = _resolve(index, module, section)
+    except ValueError:
+        if fresh is not None:
+            raise
+        fresh = _parse(report, s3_locations, use_s3_cache)
+        index = fresh["index"]
+        anchor = _resolve(index, module, section)
+
+    plot = _lookup(report, anchor, index["generation"])
+    if plot is not None:
+        return plot
+    blob = fresh["plots"].get(anchor) if fresh else cache.get(_plot_key(report, anchor))
+    if blob is None and fresh is None:
+        # The plot expired or was evicted while its index lived on.
+        fresh = _parse(report, s3_locations, use_s3_cache)
+        index = fresh["index"]
+        blob = fresh["plots"].get(anchor)
+    if blob is None:
+        raise ValueError(f"Failed to get plot object for {module}/{section}")
+    plot = pickle.loads(blob)
+    _admit(report, anchor, index["generation"], plot, len(blob))
+    return plot
+
+
+def resident_modules(s3_locations: list[str], dc_id: str | None = None) -> list[str]:
+    """Module names of the report's cached index, empty if it is not cached."""
+    from depictio.api.cache import get_cache
+
+    index = get_cache().get(_index_key(report_key(s3_locations, dc_id)))
+    return [m["name"] for m in index["modules"]] if index else []
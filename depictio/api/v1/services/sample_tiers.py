@@ -0,0 +1,197 @@
+"""Ingest-time sample tiers: fixed stratified subsets for the views that sample.
+
+Advanced visualisations, code-mode figures and violin/ECDF subsamples all need
+"about ``cap`` rows, uniformly drawn from the filtered table". Each used to get
+them by hashing every row of the full table on every render, so a 12M-row DC
+paid a full scan of the projected columns to keep 20k of them.
+
+This module draws those rows once per ingest instead. For each configured size
+(``sample_tier_rows``, e.g. 10k / 100k / 1M) smaller than the table, a tier
+holds exactly that many rows: the table, in its natural scan order, is cut into
+that many runs of consecutive rows and one row is picked from each run by a
+seeded hash of the run number. The largest tier is drawn from the table and
+every smaller one from the tier above it, so tiers are nested and only one
+full scan is paid. Every tier carries ``__depictio_row``, the row's position in
+the table. Files live next to the table::
+
+    <delta_table_location>/_depictio/sample_tiers/<hash>-<rows>.parquet
+
+and are recorded on the DC's ``deltatables`` document as
+``flexible_metadata.sample_tiers`` = ``{aggregation_hash, total_rows, tiers}``.
+
+:func:`tier_sample` serves a request from the smallest tier that still holds
+``cap`` rows *after* the request's filters, then keeps ``cap`` of them evenly
+spaced, which preserves the stratification. A tier whose hash is not the DC's
+latest, a filter too selective for the largest tier, or a column the tier
+lacks all return ``None``, and the caller samples the full table as before.
+"""
+
+from __future__ import annotations
+
+import os
+
+import polars as pl
+from bson import ObjectId
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.configs.logging_init import logger
+from depictio.api.v1.db import deltatables_collection
+from depictio.api.v1.services.sidecars import set_record
+from depictio.api.v1.services.sort_index import ROW_COLUMN
+
+SAMPLE_TIER_DIR = "_depictio/sample_tiers"
+_POSITION = "__depictio_tier_position"
+
+
+def _latest_hash(deltatable_doc: dict) -> str | None:
+    aggregations = deltatable_doc.get("aggregation") or []
+    return aggregations[-1].get("aggregation_hash") if aggregations else None
+
+
+def sample_tier_path(delta_table_location: str, aggregation_hash: str, rows: int) -> str:
+    """Where the ``rows``-row tier of one aggregation lives."""
+    return (
+        f"{delta_table_location.rstrip('/')}/{SAMPLE_TIER_DIR}/"
+        f"{aggregation_hash[:16]}-{int(rows)}.parquet"
+    )
+
+
+def _one_per_stratum(position: str, total: int, rows: int) -> pl.Expr:
+    """Keep one row from each of ``rows`` runs of consecutive positions in ``[0, total)``.
+
+    Run ``k`` spans ``[ceil(k * total / rows), ceil((k + 1) * total / rows))``,
+    so the runs differ in length by at most one row and every row belongs to
+    exactly one. The kept offset within a run is the run number's hash, seeded
+    by the tier size so nested tiers do not all pick the same offsets.
+    """
+    pos = pl.col(position).cast(pl.UInt64)
+    stratum = pos * rows // total
+    start = (stratum * total + rows - 1) // rows
+    end = ((stratum + 1) * total + rows - 1) // rows
+    return pos - start == stratum.hash(seed=rows) % (end - start)
+
+
+def _write(frame: pl.DataFrame, path: str, storage_options: dict | None) -> None:
+    if "://" not in path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    frame.write_parquet(path, storage_options=storage_options)
+
+
+def refresh_sample_tiers(dc_id: str) -> int:
+    """(Re)build the sample tiers of ``dc_id``'s current data.
+
+    Runs after an ingest has recorded its aggregation. Returns the number of
+    tiers built — zero for a table no larger than the smallest tier, which
+    needs none. Never raises: without tiers, readers sample the table.
+    """
+    if not settings.performance.sample_tiers_enabled:
+        return 0
+
+    from depictio.api.v1.s3 import remove_paths, storage_options_for
+
+    try:
+        doc = deltatables_collection.find_one({"data_collection_id": ObjectId(dc_id)})
+        if not doc or not doc.get("delta_table_location"):
+            return 0
+        aggregation_hash = _latest_hash(doc)
+        if not aggregation_hash:
+            return 0
+        location = doc["delta_table_location"]
+        options = storage_options_for(location)
+
+        scan = pl.scan_delta(location, storage_options=options)
+        total = int(scan.select(pl.len()).collect().item())
+        sizes = sorted(
+            {int(r) for r in settings.performance.sample_tier_rows if 0 < int(r) < total},
+            reverse=True,
+        )
+
+        tiers: list[dict] = []
+        tier: pl.DataFrame | None = None
+        for rows in sizes:
+            if tier is None:
+                source = scan.with_row_index(ROW_COLUMN)
+                keep = _one_per_stratum(ROW_COLUMN, total, rows)
+            else:
+                source = tier.lazy().with_row_index(_POSITION)
+                keep = _one_per_stratum(_POSITION, tier.height, rows)
+            tier = source.filter(keep).drop(_POSITION, strict=False).collect()
+            path = sample_tier_path(location, aggregation_hash, rows)
+            _write(tier, path, options)
+            tiers.append({"rows": tier.height, "path": path})
+        tiers.reverse()
+
+        previous = ((doc.get("flexible_metadata") or {}).get("sample_tiers") or {}).get("tiers")
+        set_record(
+            doc["_id"],
+            "sample_tiers",
+            {"aggregation_hash": aggregation_hash, "total_rows": total, "tiers": tiers},
+        )
+        current = {t["path"] for t in tiers}
+        stale = [t["path"] for t in previous or [] if t.get("path") not in current]
+        if stale:
+            remove_paths(stale)
+        logger.info(f"Sample tiers for DC {dc_id}: {[t['rows'] for t in tiers]} of {total} rows")
+        return len(tiers)
+    except Exception as e:
+        logger.warning(f"Sample tier refresh failed for DC {dc_id}: {e}")
+        return 0
+
+
+def _current_tiers(dc_id: str) -> list[dict]:
+    """The DC's tiers, smallest first, if they were built from its latest data."""
+    doc = deltatables_collection.find_one(
+        {"data_collection_id": ObjectId(str(dc_id))},
+        {"flexible_metadata.sample_tiers": 1, "aggregation.aggregation_hash": 1},
+    )
+    record = ((doc or {}).get("flexible_metadata") or {}).get("sample_tiers") or {}
+    if not record.get("tiers") or record.get("aggregation_hash") != _latest_hash(doc or {}):
+        return []
+    return sorted(record["tiers"], key=lambda t: t["rows"])
+
+
+def tier_sample(
+    dc_id: str,
+    metadata: list[dict] | None,
+    columns: list[str] | None,
+    cap: int,
+) -> pl.DataFrame | None:
+    """``cap`` rows of the filtered table drawn from a sample tier, or ``None``.
+
+    ``columns=None`` returns every column of the table. Filters go through the
+    same ``_apply_scan_filters`` as the full scan, so they mean the same thing.
+    """
+    if not settings.performance.sample_tiers_enabled or cap <= 0:
+        return None
+
+    from depictio.api.v1.deltatables_utils import _apply_scan_filters
+    from depictio.api.v1.s3 import storage_options_for
+
+    try:
+        for tier in _current_tiers(dc_id):
+            if tier["rows"] < cap:
+                continue
+            lf = pl.scan_parquet(tier["path"], storage_options=storage_options_for(tier["path"]))
+            names = lf.collect_schema().names()
+            wanted = [c for c in columns or names if c != ROW_COLUMN]
+            if any(c not in names for c in wanted):
+                return None
+            lf = _apply_scan_filters(lf, metadata, str(dc_id))
+            n = int(lf.select(pl.len()).collect().item())
+            if n < cap:
+                # Too few of this tier's rows pass the filters; a larger tier
+                # keeps proportionally more.
+                continue
+            # ``cap`` rows evenly spaced through the tier: row ``i`` is kept when
+            # ``i * cap / n`` crosses an integer, which happens exactly ``cap`` times.
+            position = pl.col(_POSITION).cast(pl.UInt64)
+            return (
+                lf.with_row_index(_POSITION)
+                .filter(position * cap % n < cap)
+                .select(wanted)
+                .collect()
+            )
+        return None
+    except Exception as e:
+        logger.debug(f"Sample tiers unavailable for DC {dc_id}: {e}")
+        return None
@@ -0,0 +1,128 @@
+"""Bookkeeping shared by the sidecar files kept next to Delta tables.
+
+Several services derive files from a table version and store them under
+``<table>/_depictio/<kind>/``: sort indexes, figure sketches and embeddings
+(``services/sort_index.py``, ``services/figure/sketch.py``,
+``services/embedding_cache.py``), the column catalog, sample tiers and link
+translation indexes (``services/column_stats.py``, ``services/sample_tiers.py``,
+``links_endpoints/translation_index.py``). Each one is recorded on the DC's
+``deltatables`` document under ``flexible_metadata.<field>``, so readers find
+it without listing the bucket, and recording a new version is what deletes the
+old version's files.
+
+What they share lives here:
+
+* :class:`SidecarRegistry` — per process and per kind, the paths known to
+  exist (files are immutable once written, so a hit never goes stale) and one
+  build lock per path, so concurrent requests wait for one build instead of
+  each starting their own;
+* :func:`set_record` / :func:`replace_entries` — the two document updates:
+  one record per DC, or a list of entries one of which is swapped. Documents
+  written before ``flexible_metadata`` existed hold ``None`` there, which
+  Mongo cannot ``$set`` a sub-field of, so both give it an empty mapping first;
+* :func:`record_version` — register one file of a Delta version and delete
+  the files of every other version.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import polars as pl
+from bson import ObjectId
+
+
+class SidecarRegistry:
+    """Paths of one sidecar kind this process knows exist, and their build locks."""
+
+    def __init__(self) -> None:
+        self._known: set[str] = set()
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._known
+
+    def add(self, path: str) -> None:
+        self._known.add(path)
+
+    def forget(self, paths: list[str]) -> None:
+        self._known.difference_update(paths)
+
+    def clear(self) -> None:
+        self._known.clear()
+
+    def exists(self, path: str) -> bool:
+        """Whether the parquet file at ``path`` is readable; remembered once it is."""
+        from depictio.api.v1.s3 import storage_options_for
+
+        if path in self._known:
+            return True
+        try:
+            pl.scan_parquet(path, storage_options=storage_options_for(path)).collect_schema()
+        except Exception:
+            return False
+        self._known.add(path)
+        return True
+
+    def lock(self, path: str) -> threading.Lock:
+        """The lock serialising builds of ``path`` in this process."""
+        with self._guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+
+def _ensure_metadata(doc_id: Any) -> None:
+    from depictio.api.v1.db import deltatables_collection
+
+    deltatables_collection.update_one(
+        {"_id": doc_id, "flexible_metadata": None}, {"$set": {"flexible_metadata": {}}}
+    )
+
+
+def set_record(doc_id: Any, field: str, value: Any) -> None:
+    """Set ``flexible_metadata.<field>`` of the ``deltatables`` document ``doc_id``."""
+    from depictio.api.v1.db import deltatables_collection
+
+    _ensure_metadata(doc_id)
+    deltatables_collection.update_one(
+        {"_id": doc_id}, {"$set": {f"flexible_metadata.{field}": value}}
+    )
+
+
+def replace_entries(doc_id: Any, field: str, superseded: dict, entry: dict) -> None:
+    """Drop the entries of ``flexible_metadata.<field>`` matching ``superseded``; add ``entry``."""
+    from depictio.api.v1.db import deltatables_collection
+
+    _ensure_metadata(doc_id)
+    deltatables_collection.update_one(
+        {"_id": doc_id}, {"$pull": {f"flexible_metadata.{field}": superseded}}
+    )
+    deltatables_collection.update_one(
+        {"_id": doc_id}, {"$addToSet": {f"flexible_metadata.{field}": entry}}
+    )
+
+
+def record_version(
+    dc_id: str, field: str, path: str, delta_version: int, registry: SidecarRegistry
+) -> None:
+    """Register ``path`` under ``field``; delete the files recorded for other versions."""
+    from depictio.api.v1.db import deltatables_collection
+    from depictio.api.v1.s3 import remove_paths
+
+    doc = deltatables_collection.find_one(
+        {"data_collection_id": ObjectId(dc_id)}, {"flexible_metadata": 1}
+    )
+    if not doc:
+        return
+    recorded = (doc.get("flexible_metadata") or {}).get(field) or []
+    stale = [e["path"] for e in recorded if e.get("delta_version") != delta_version]
+    replace_entries(
+        doc["_id"],
+        field,
+        {"delta_version": {"$ne": delta_version}},
+        {"path": path, "delta_version": delta_version},
+    )
+    if stale:
+        remove_paths(stale)
+        registry.forget(stale)
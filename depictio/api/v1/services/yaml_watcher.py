@@ -244,6 +244,7 @@ def sync_yaml_to_mongodb(filepath: str, event_type: str) -> dict[str, Any]:
     from bson import ObjectId
 
     from depictio.api.v1.db import dashboards_collection
+    from depictio.api.v1.services.events.dashboard_index import refresh_dashboard_index
     from depictio.models.models.dashboards import DashboardData
     from depictio.models.yaml_serialization import import_dashboard_from_file
 
@@ -310,6 +311,7 @@ def sync_yaml_to_mongodb(filepath: str, event_type: str) -> dict[str, Any]:
             {"dashboard_id": ObjectId(dashboard_id)},
             {"$set": dashboard.mongo()},
         )
+        refresh_dashboard_index(dashboard_id)
 
         result["success"] = True
         result["action"] = "updated"
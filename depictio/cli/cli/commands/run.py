@@ -301,6 +301,16 @@ def register_run_command(app: typer.Typer):
                 "to the standard write on any failure."
             ),
         ),
+        incremental: bool = typer.Option(
+            False,
+            "--incremental",
+            help=(
+                "Only read new or changed files and append them; rows of changed or "
+                "deleted files are removed. The first run rewrites the table once to "
+                "record which file each row came from. Joined tables are refreshed the "
+                "same way: only rows appended to one source are joined and appended."
+            ),
+        ),
         # General options
         continue_on_error: bool = typer.Option(
             False, "--continue-on-error", help="Continue execution even if a step fails"
@@ -769,6 +779,7 @@ def register_run_command(app: typer.Typer):
                                 "rich_tables": rich_tables,
                                 "preview_recipes": preview_recipes,
                                 "streaming": streaming,
+                                "incremental": incremental,
                             }
 
                             process_result = process_project_helper(
@@ -833,6 +844,7 @@ def register_run_command(app: typer.Typer):
                             preview_only=False,
                             overwrite=overwrite,
                             auto_process_dependencies=True,
+                            incremental=incremental,
                         )
 
                         if join_result.get("result") not in ["success", "partial"]:
@@ -539,6 +539,7 @@ def api_upsert_deltatable(
     CLI_config: CLIConfig,
     update: bool = False,
     deltatable_size_bytes: int | None = None,
+    ingest: dict | None = None,
 ) -> httpx.Response:
     """
     Create or update a Delta Table on the server using a bulk upsert.
@@ -547,6 +548,7 @@ def api_upsert_deltatable(
         deltaTable (UpsertDeltaTableAggregated): Delta Table to send.
         CLI_config (CLIConfig): Configuration object containing API base URL and credentials.
         deltatable_size_bytes (int, optional): Size of the deltatable in bytes to store in flexible_metadata.
+        ingest (dict, optional): What this write changed (``IngestDelta`` fields).
 
     Returns:
         httpx.Response: The response from the server.
@@ -562,6 +564,8 @@ def api_upsert_deltatable(
     # Add deltatable size to payload if provided
     if deltatable_size_bytes is not None:
         payload["deltatable_size_bytes"] = deltatable_size_bytes
+    if ingest is not None:
+        payload["ingest"] = ingest
 
     url = f"{CLI_config.api_base_url}/depictio/api/v1/deltatables/upsert"
 
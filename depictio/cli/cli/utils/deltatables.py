@@ -1,6 +1,7 @@
 import os
 from collections.abc import Iterable
 from datetime import datetime
+from typing import Literal
 
 import polars as pl
 from deltalake.exceptions import TableNotFoundError
@@ -14,9 +15,11 @@ from depictio.cli.cli.utils.ingest_timing import record, timed
 from depictio.cli.cli.utils.multiqc_processor import process_multiqc_data_collection
 from depictio.cli.cli.utils.rich_utils import rich_print_checked_statement
 from depictio.cli.cli_logging import logger
+from depictio.models.column_stats import write_column_stats
 from depictio.models.models.base import convert_objectid_to_str
 from depictio.models.models.cli import CLIConfig
 from depictio.models.models.data_collections import DataCollection
+from depictio.models.models.deltatables import SOURCE_HASH_COLUMN
 from depictio.models.models.files import File
 from depictio.models.models.s3 import PolarsStorageOptions
 from depictio.models.s3_utils import turn_S3_config_into_polars_storage_options
@@ -324,6 +327,137 @@ def streaming_write_enabled(command_parameters: dict | None = None) -> bool:
     )
 
 
+def incremental_ingest_enabled(command_parameters: dict | None = None) -> bool:
+    """Whether to ingest only the files that changed since the table was written.
+
+    Enabled by ``depictio run --incremental`` or ``DEPICTIO_INGEST_INCREMENTAL=true``.
+    Opt-in because it adds a ``depictio_source_hash`` column to the table, and the
+    first incremental run of an existing table is a full rewrite to add it.
+    """
+    if command_parameters and command_parameters.get("incremental"):
+        return True
+    return os.getenv("DEPICTIO_INGEST_INCREMENTAL", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+
+def tag_source_files(files: list[File], lazy_frames: list) -> list:
+    """Stamp each file's rows with its ``file_hash`` (see :data:`SOURCE_HASH_COLUMN`)."""
+    return [
+        lf.with_columns(pl.lit(f.file_hash).alias(SOURCE_HASH_COLUMN))
+        for f, lf in zip(files, lazy_frames)
+    ]
+
+
+def existing_source_hashes(
+    destination_file: str, storage_options: PolarsStorageOptions
+) -> set[str] | None:
+    """The ``file_hash`` of every file the table holds rows of.
+
+    ``None`` when there is nothing to diff against — no table yet, or one written
+    before incremental mode (no source column) — and the caller rewrites it whole.
+    Reads the one column, so this costs a fraction of the table.
+    """
+    opts = storage_options.model_dump()
+    try:
+        lf = pl.scan_delta(destination_file, storage_options=opts)
+        if SOURCE_HASH_COLUMN not in lf.collect_schema().names():
+            return None
+        hashes = lf.select(pl.col(SOURCE_HASH_COLUMN).unique()).collect()
+    except TableNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read source hashes of {destination_file}: {e}")
+        return None
+    return {h for h in hashes[SOURCE_HASH_COLUMN].to_list() if h is not None}
+
+
+def plan_incremental_ingest(files: list[File], existing: set[str]) -> tuple[list[File], list[str]]:
+    """``(files to append, source hashes to delete)`` to bring the table up to ``files``.
+
+    ``file_hash`` covers name, size and timestamps, so a modified file shows up
+    as its old hash removed and its new hash added — a changed file is replaced,
+    never duplicated. A file deleted from disk has dropped out of ``files``
+    (``fetch_file_data`` skips records whose path is gone) and its rows go too.
+    """
+    current = {f.file_hash: f for f in files}
+    added = [f for h, f in current.items() if h not in existing]
+    removed = sorted(existing - current.keys())
+    return added, removed
+
+
+def _conform_to_table(lf: pl.LazyFrame, table_schema: pl.Schema) -> pl.LazyFrame | None:
+    """Cast ``lf``'s shared columns to the table's dtypes; ``None`` if they disagree.
+
+    Mirrors :func:`align_lazy_schemas`, which a full rewrite would have applied:
+    where types differ, a String column absorbs the other type. Any other
+    disagreement would change a column's type, which only a rewrite can do.
+    """
+    exprs = []
+    for name, dtype in lf.collect_schema().items():
+        target = table_schema.get(name)
+        if target is None or target == dtype:
+            exprs.append(pl.col(name))
+        elif target == pl.String or dtype == pl.Null:
+            exprs.append(pl.col(name).cast(target))
+        else:
+            logger.info(f"Incremental ingest: {name!r} is {dtype} here, {target} in the table")
+            return None
+    return lf.select(exprs)
+
+
+def apply_incremental_ingest(
+    added_frames: list,
+    removed: list[str],
+    destination_file: str,
+    storage_options: PolarsStorageOptions,
+    sort_cols: list[str] | None = None,
+) -> dict[str, int] | None:
+    """Delete the rows of ``removed`` source files, then append ``added_frames``.
+
+    Returns ``{"rows_added", "rows_removed"}``, or ``None`` — before touching the
+    table — when the new rows can't be appended without changing a column's
+    type. Two Delta commits rather than one: a reader between them sees the
+    changed files' rows missing, never twice. If the append fails after the
+    delete, the next run finds those files absent and adds them again.
+    """
+    from deltalake import DeltaTable
+
+    opts = storage_options.model_dump()
+    new_rows: pl.DataFrame | None = None
+    if added_frames:
+        table_schema = pl.scan_delta(destination_file, storage_options=opts).collect_schema()
+        conformed = _conform_to_table(build_aggregated_lazyframe(added_frames), table_schema)
+        if conformed is None:
+            return None
+        new_rows = conformed.collect()
+        if sort_cols:
+            # Sorted within the append only: the new files land as their own
+            # row groups, clustered among themselves.
+            new_rows = new_rows.sort([c for c in sort_cols if c in new_rows.columns])
+
+    rows_removed = 0
+    if removed:
+        quoted = ", ".join(f"'{h}'" for h in removed)
+        metrics = DeltaTable(destination_file, storage_options=opts).delete(
+            f"{SOURCE_HASH_COLUMN} IN ({quoted})"
+        )
+        rows_removed = int((metrics or {}).get("num_deleted_rows") or 0)
+
+    if new_rows is not None and new_rows.height:
+        new_rows.write_delta(
+            destination_file,
+            storage_options=opts,
+            delta_write_options={"schema_mode": "merge"},
+            mode="append",
+        )
+    rows_added = new_rows.height if new_rows is not None else 0
+    return {"rows_added": rows_added, "rows_removed": rows_removed}
+
+
 def link_columns_by_dc(project_config) -> dict[str, list[str]]:
     """Per-DC join-key columns implied by the project's cross-DC links.
 
@@ -433,11 +567,13 @@ def sink_delta_table(
     concatenated_lf: pl.LazyFrame,
     destination_file: str,
     storage_options: PolarsStorageOptions,
+    mode: Literal["overwrite", "append"] = "overwrite",
 ) -> dict:
     """Stream a LazyFrame straight to Delta, never materializing the full frame.
 
     This is the memory fix for large ingests: the default path collects the whole
     concatenated dataset into RAM before writing, which is what OOMs at scale.
+    ``mode="append"`` adds the rows under the table's existing schema.
     """
     logger.debug(f"Streaming (sink_delta) aggregated LazyFrame to {destination_file}.")
     # Looked up dynamically: sink_delta is absent on older polars builds, and the
@@ -448,8 +584,8 @@ def sink_delta_table(
     sink_delta(
         destination_file,
         storage_options=storage_options.model_dump(),
-        delta_write_options={"schema_mode": "overwrite"},
-        mode="overwrite",
+        delta_write_options={"schema_mode": "overwrite"} if mode == "overwrite" else None,
+        mode=mode,
     )
     logger.info(f"Aggregated Delta table streamed to {destination_file}.")
     return {
@@ -462,6 +598,7 @@ def write_delta_table(
     aggregated_df: pl.DataFrame,
     destination_file: str,
     storage_options: PolarsStorageOptions,
+    mode: Literal["overwrite", "append"] = "overwrite",
 ) -> dict:
     """
     Write the aggregated DataFrame as a Delta Lake table.
@@ -469,6 +606,8 @@ def write_delta_table(
     Args:
         aggregated_df (pl.DataFrame): The aggregated DataFrame.
         destination_file (str): The destination path for the Delta table.
+        mode (str): ``"overwrite"`` (default) replaces the table and its schema;
+            ``"append"`` adds rows under the existing schema.
 
     Raises:
         Exception: If writing the Delta table fails.
@@ -482,8 +621,8 @@ def write_delta_table(
     aggregated_df.write_delta(
         destination_file,
         storage_options=storage_options.model_dump(),
-        delta_write_options={"schema_mode": "overwrite"},
-        mode="overwrite",
+        delta_write_options={"schema_mode": "overwrite"} if mode == "overwrite" else None,
+        mode=mode,
     )
 
     logger.info(f"Aggregated Delta table written to {destination_file}.")
@@ -635,6 +774,18 @@ def client_aggregate_data(
     if not destination_prefix.startswith("s3://"):
         raise ValueError("Invalid destination prefix. It should be an S3 path.")
 
+    incremental = incremental_ingest_enabled(command_parameters)
+    if incremental:
+        outcome = _client_ingest_incremental(
+            data_collection, CLI_config, destination_prefix, storage_options, command_parameters
+        )
+        if outcome is not None:
+            return outcome
+        # No table to diff against yet (or a type change): write it whole, with
+        # the source column, so the next run can be incremental. That replaces
+        # the table, which is what --incremental asks for, so no --overwrite.
+        overwrite = True
+
     destination_exists = False
     logger.info("Checking if destination Delta table exists.")
     # logger.info(f"Destination prefix: {destination_prefix}")
@@ -694,6 +845,8 @@ def client_aggregate_data(
     polars_kwargs = dict(dc_props.get("polars_kwargs", {}))
     with timed("parse"):
         lazy_frames = read_files_lazy(files, file_format, polars_kwargs)
+        if incremental:
+            lazy_frames = tag_source_files(files, lazy_frames)
     record("n_files", len(files) if files else 0)
 
     # 4/5. Aggregate + write to Delta Lake.
@@ -708,7 +861,6 @@ def client_aggregate_data(
 
     use_streaming = streaming_write_enabled(command_parameters)
     aggregated_df: pl.DataFrame | None = None
-    result: dict = {}
     deltatable_size_bytes = 0
 
     if use_streaming:
@@ -723,7 +875,7 @@ def client_aggregate_data(
         # this path stays opt-in.
         try:
             with timed("write"):
-                result = sink_delta_table(
+                sink_delta_table(
                     build_aggregated_lazyframe(lazy_frames),
                     destination_file=destination_prefix,
                     storage_options=storage_options,
@@ -786,13 +938,14 @@ def client_aggregate_data(
             )
 
         with timed("write"):
-            result = write_delta_table(
+            write_delta_table(
                 aggregated_df=aggregated_df,
                 destination_file=destination_prefix,
                 storage_options=storage_options,
             )
 
     record("delta_bytes", deltatable_size_bytes)
+
     logger.info(f"🔍 DEBUG: Calculated deltatable_size_bytes = {deltatable_size_bytes}")
     logger.info(f"🔍 DEBUG: Size in MB = {deltatable_size_bytes / (1024 * 1024):.2f} MB")
 
@@ -810,17 +963,62 @@ def client_aggregate_data(
 
         aggregated_df.rich_info(bool(rich_tables))  # type: ignore[unresolved-attribute]
 
+    ingest = None
+    if incremental:
+        ingest = {
+            "mode": "full",
+            "files_added": len(files),
+            "rows_added": aggregated_df.height if aggregated_df is not None else 0,
+        }
+    return _register_delta_table(
+        str(dc_id),
+        CLI_config,
+        destination_prefix,
+        storage_options,
+        deltatable_size_bytes,
+        update=overwrite,
+        frame=aggregated_df,
+        ingest=ingest,
+    )
+
+
+def _register_delta_table(
+    dc_id: str,
+    CLI_config: CLIConfig,
+    destination_prefix: str,
+    storage_options: PolarsStorageOptions,
+    deltatable_size_bytes: int,
+    update: bool,
+    frame: pl.DataFrame | None = None,
+    ingest: dict | None = None,
+) -> dict[str, str]:
+    """Write the column catalog of the version just written, then upsert the table's record."""
+    # Column statistics sidecar for the version just written, so the server can
+    # answer option lists, slider bounds and unfiltered cards without scanning.
+    # From the frame still in memory when there is one; the streaming and
+    # incremental paths have none and re-read the table. Never fails the ingest:
+    # the server builds the sidecar itself when it finds none.
+    try:
+        with timed("stats"):
+            stats_path = write_column_stats(
+                destination_prefix, storage_options.model_dump(), frame=frame
+            )
+        logger.info(f"Column statistics written to {stats_path}")
+    except Exception as e:
+        logger.warning(f"Could not write column statistics ({e}); the server will compute them.")
+
     # 6. Upsert object in the remote DB with size information
     logger.info(
         f"🔍 DEBUG: About to call api_upsert_deltatable with deltatable_size_bytes={deltatable_size_bytes}"
     )
     with timed("upsert"):
         api_upsert_result = api_upsert_deltatable(
-            data_collection_id=str(dc_id),
+            data_collection_id=dc_id,
             CLI_config=CLI_config,
             delta_table_location=destination_prefix,
-            update=overwrite,
+            update=update,
             deltatable_size_bytes=deltatable_size_bytes,
+            ingest=ingest,
         )
     logger.info(f"🔍 DEBUG: API upsert response status: {api_upsert_result.status_code}")
     if api_upsert_result.status_code != 200:
@@ -839,6 +1037,85 @@ def client_aggregate_data(
     }
 
 
+def _client_ingest_incremental(
+    data_collection: DataCollection,
+    CLI_config: CLIConfig,
+    destination_prefix: str,
+    storage_options: PolarsStorageOptions,
+    command_parameters: dict | None,
+) -> dict[str, str] | None:
+    """Bring an existing table up to date with the DC's files without rewriting it.
+
+    Only new or changed files are read; rows of changed or deleted files are
+    removed by a predicate delete on :data:`SOURCE_HASH_COLUMN`. Returns
+    ``None`` when the caller must write the table whole instead: there is no
+    table yet, it predates incremental mode, or a new file changes a column type.
+    """
+    existing = existing_source_hashes(destination_prefix, storage_options)
+    if existing is None:
+        logger.info("Incremental ingest: no source-tagged table yet, writing it whole")
+        return None
+
+    dc_id = str(data_collection.id)
+    files = fetch_file_data(dc_id, CLI_config)
+    added, removed = plan_incremental_ingest(files, existing)
+    record("n_files", len(added))
+    record("incremental", True)
+    if not added and not removed:
+        # Nothing to write means nothing to upsert either: no new aggregation
+        # version, so every server-side cache of this DC stays valid.
+        rich_print_checked_statement("Delta table already up to date", "info")
+        return {
+            "result": "success",
+            "message": f"{destination_prefix} already up to date ({len(files)} file(s)).",
+        }
+
+    config = convert_objectid_to_str(data_collection.config.model_dump())
+    dc_props = config.get("dc_specific_properties", {})
+    file_format = dc_props.get("format", "csv").lower()
+    polars_kwargs = dict(dc_props.get("polars_kwargs", {}))
+    frames: list = []
+    if added:
+        # A run that only removes files has nothing to parse, and
+        # read_files_lazy refuses an empty file list.
+        with timed("parse"):
+            frames = tag_source_files(added, read_files_lazy(added, file_format, polars_kwargs))
+    sort_cols = clustering_columns(
+        config,
+        frames[0].collect_schema().names() if frames else [],
+        (command_parameters or {}).get("link_columns_by_dc", {}).get(dc_id),
+    )
+    with timed("write"):
+        outcome = apply_incremental_ingest(
+            frames, removed, destination_prefix, storage_options, sort_cols
+        )
+    if outcome is None:
+        return None
+    record("n_rows", outcome["rows_added"])
+    rich_print_checked_statement(
+        f"Incremental ingest: {len(added)} file(s) / {outcome['rows_added']} row(s) added, "
+        f"{len(removed)} file(s) / {outcome['rows_removed']} row(s) removed",
+        "info",
+    )
+
+    deltatable_size_bytes, _ = delta_table_stats(destination_prefix, storage_options)
+    record("delta_bytes", deltatable_size_bytes)
+    return _register_delta_table(
+        dc_id,
+        CLI_config,
+        destination_prefix,
+        storage_options,
+        deltatable_size_bytes,
+        update=True,
+        ingest={
+            "mode": "incremental",
+            "files_added": len(added),
+            "files_removed": len(removed),
+            **outcome,
+        },
+    )
+
+
 def process_geojson_data_collection(
     data_collection: DataCollection,
     CLI_config: CLIConfig,
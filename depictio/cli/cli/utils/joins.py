@@ -7,15 +7,21 @@ This module provides functionality for:
 - Previewing join results before committing
 - Handling granularity mismatches with aggregation
 - Persisting joined tables to S3 as Delta tables
+- Refreshing persisted joins from the source Delta versions they were built from
 """
 
+import hashlib
+import json
 from datetime import datetime
+from typing import TypeVar
 
 import polars as pl
 
 from depictio.cli.cli.utils.deltatables import (
-    calculate_dataframe_size_bytes,
+    delta_table_stats,
+    incremental_ingest_enabled,
     read_delta_table,
+    sink_delta_table,
     write_delta_table,
 )
 from depictio.cli.cli.utils.rich_utils import (
@@ -23,6 +29,7 @@ from depictio.cli.cli.utils.rich_utils import (
     rich_print_checked_statement,
 )
 from depictio.cli.cli_logging import logger
+from depictio.models.delta_appends import appended_files
 from depictio.models.models.cli import CLIConfig
 from depictio.models.models.data_collections import DataCollection, DataCollectionSource
 from depictio.models.models.joins import (
@@ -33,8 +40,21 @@ from depictio.models.models.joins import (
     JoinValidationResult,
 )
 from depictio.models.models.projects import Project
+from depictio.models.models.s3 import PolarsStorageOptions
 from depictio.models.s3_utils import turn_S3_config_into_polars_storage_options
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+JOIN_LINEAGE_DIR = "_depictio/join_lineage"
+# What a joined table version was built from; see ``write_join_lineage``.
+_LINEAGE_FIELDS = {
+    "spec": pl.String,
+    "left_dc_id": pl.String,
+    "left_version": pl.Int64,
+    "right_dc_id": pl.String,
+    "right_version": pl.Int64,
+}
+
 
 def find_data_collection_by_tag(
     project: Project,
@@ -104,6 +124,19 @@ def find_data_collection_by_tag(
         return None, None
 
 
+def _delta_columns(path: str, storage_options: PolarsStorageOptions) -> list[str] | None:
+    """Column names of the Delta table at ``path`` (read from its log), ``None`` if absent."""
+    try:
+        return (
+            pl.scan_delta(path, storage_options=storage_options.model_dump())
+            .collect_schema()
+            .names()
+        )
+    except Exception as e:
+        logger.debug(f"No readable Delta table at {path}: {e}")
+        return None
+
+
 def validate_join_definition(
     join_def: JoinDefinition,
     project: Project,
@@ -151,17 +184,13 @@ def validate_join_definition(
     # Check if Delta tables exist
     if result.left_dc_exists and left_dc and left_dc.id:
         left_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(left_dc.id)}"
-        left_read_result = read_delta_table(left_delta_path, storage_options)
-        if left_read_result["result"] == "success":
+        left_columns = _delta_columns(left_delta_path, storage_options)
+        if left_columns is not None:
             result.left_dc_processed = True
             # Check join columns
-            if "data" in left_read_result:
-                left_df = left_read_result["data"]
-                assert isinstance(left_df, pl.DataFrame)
-                left_columns = left_df.columns
-                for col in join_def.on_columns:
-                    if col not in left_columns:
-                        result.missing_join_columns_left.append(col)
+            for col in join_def.on_columns:
+                if col not in left_columns:
+                    result.missing_join_columns_left.append(col)
         else:
             result.warnings.append(
                 f"Left data collection '{join_def.left_dc}' has not been processed yet"
@@ -169,17 +198,13 @@ def validate_join_definition(
 
     if result.right_dc_exists and right_dc and right_dc.id:
         right_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(right_dc.id)}"
-        right_read_result = read_delta_table(right_delta_path, storage_options)
-        if right_read_result["result"] == "success":
+        right_columns = _delta_columns(right_delta_path, storage_options)
+        if right_columns is not None:
             result.right_dc_processed = True
             # Check join columns
-            if "data" in right_read_result:
-                right_df = right_read_result["data"]
-                assert isinstance(right_df, pl.DataFrame)
-                right_columns = right_df.columns
-                for col in join_def.on_columns:
-                    if col not in right_columns:
-                        result.missing_join_columns_right.append(col)
+            for col in join_def.on_columns:
+                if col not in right_columns:
+                    result.missing_join_columns_right.append(col)
         else:
             result.warnings.append(
                 f"Right data collection '{join_def.right_dc}' has not been processed yet"
@@ -202,17 +227,18 @@ def validate_join_definition(
 
 
 def apply_aggregation(
-    df: pl.DataFrame,
+    df: FrameT,
     group_by_columns: list[str],
     granularity_config: GranularityConfig,
-) -> pl.DataFrame:
+) -> FrameT:
     """
     Apply aggregation to a DataFrame based on granularity configuration.
 
     Handles granularity mismatches by aggregating data to the target level.
+    Works on a LazyFrame too, in which case the aggregation stays lazy.
 
     Args:
-        df: The DataFrame to aggregate
+        df: The DataFrame (or LazyFrame) to aggregate
         group_by_columns: Columns to group by (typically the join columns)
         granularity_config: Configuration specifying aggregation functions
 
@@ -230,12 +256,10 @@ def apply_aggregation(
         for override in granularity_config.column_overrides:
             overrides[override.column] = override.function
 
-    for col in df.columns:
+    for col, col_dtype in df.collect_schema().items():
         if col in group_by_columns:
             continue  # Skip group-by columns
 
-        col_dtype = df[col].dtype
-
         # Determine aggregation function
         if col in overrides:
             agg_func = overrides[col]
@@ -256,7 +280,8 @@ def apply_aggregation(
     # Apply aggregation
     aggregated_df = df.group_by(group_by_columns).agg(agg_exprs)
 
-    logger.info(f"Aggregation complete: {df.shape[0]} rows -> {aggregated_df.shape[0]} rows")
+    if isinstance(df, pl.DataFrame):
+        logger.info(f"Aggregation complete: {df.shape[0]} rows -> {aggregated_df.shape[0]} rows")
     return aggregated_df
 
 
@@ -282,12 +307,13 @@ def _build_agg_expression(col: str, agg_func: str) -> pl.Expr | None:
 
 
 def normalize_join_column_types(
-    df1: pl.DataFrame, df2: pl.DataFrame, join_columns: list[str]
-) -> tuple[pl.DataFrame, pl.DataFrame]:
+    df1: FrameT, df2: FrameT, join_columns: list[str]
+) -> tuple[FrameT, FrameT]:
     """
     Normalize the data types of join columns between two DataFrames.
 
-    If types differ, cast both to String for compatibility.
+    If types differ, cast both to String for compatibility. LazyFrames are
+    compared on their schemas and cast lazily.
 
     Args:
         df1: First DataFrame
@@ -297,10 +323,11 @@ def normalize_join_column_types(
     Returns:
         Tuple of normalized DataFrames
     """
+    schema1, schema2 = df1.collect_schema(), df2.collect_schema()
     for col in join_columns:
-        if col in df1.columns and col in df2.columns:
-            dtype1 = df1[col].dtype
-            dtype2 = df2[col].dtype
+        if col in schema1 and col in schema2:
+            dtype1 = schema1[col]
+            dtype2 = schema2[col]
 
             if dtype1 != dtype2:
                 logger.debug(
@@ -313,27 +340,10 @@ def normalize_join_column_types(
     return df1, df2
 
 
-def execute_join(
-    join_def: JoinDefinition,
-    project: Project,
-    CLI_config: CLIConfig,
-    apply_granularity: bool = True,
-) -> tuple[pl.DataFrame, dict]:
-    """
-    Execute a join operation between two data collections.
-
-    Args:
-        join_def: The join definition to execute
-        project: The project configuration
-        CLI_config: CLI configuration for API/S3 access
-        apply_granularity: Whether to apply granularity aggregation
-
-    Returns:
-        Tuple of (joined DataFrame, metadata dict)
-    """
-    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage)
-
-    # Find data collections
+def _join_side_paths(
+    join_def: JoinDefinition, project: Project, CLI_config: CLIConfig
+) -> tuple[DataCollection, DataCollection, str, str]:
+    """Resolve both sides of ``join_def`` and the Delta paths they were ingested to."""
     left_dc, _ = find_data_collection_by_tag(project, join_def.left_dc, join_def.workflow_name)
     right_dc, _ = find_data_collection_by_tag(project, join_def.right_dc, join_def.workflow_name)
 
@@ -342,30 +352,45 @@ def execute_join(
     if not right_dc or not right_dc.id:
         raise ValueError(f"Right data collection '{join_def.right_dc}' not found or has no ID")
 
-    # Load DataFrames
-    left_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(left_dc.id)}"
-    right_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(right_dc.id)}"
+    bucket = CLI_config.s3_storage.bucket
+    left_path = f"s3://{bucket}/{str(left_dc.id)}"
+    right_path = f"s3://{bucket}/{str(right_dc.id)}"
+    return left_dc, right_dc, left_path, right_path
 
-    logger.info(f"Loading left DataFrame from: {left_delta_path}")
-    left_result = read_delta_table(left_delta_path, storage_options)
-    if left_result["result"] != "success" or "data" not in left_result:
-        raise ValueError(
-            f"Failed to load left data collection: {left_result.get('message', 'Unknown error')}"
-        )
-    left_df = left_result["data"]
-    assert isinstance(left_df, pl.DataFrame)
 
-    logger.info(f"Loading right DataFrame from: {right_delta_path}")
-    right_result = read_delta_table(right_delta_path, storage_options)
-    if right_result["result"] != "success" or "data" not in right_result:
-        raise ValueError(
-            f"Failed to load right data collection: {right_result.get('message', 'Unknown error')}"
-        )
-    right_df = right_result["data"]
-    assert isinstance(right_df, pl.DataFrame)
+def _key_stats(frame: pl.DataFrame | pl.LazyFrame, keys: list[str]) -> tuple[int, float]:
+    """``(distinct keys, average rows per key)`` of ``frame``, without materializing it."""
+    stats = (
+        frame.lazy()
+        .group_by(keys)
+        .len()
+        .select(pl.len().alias("keys"), pl.col("len").mean().alias("avg"))
+        .collect()
+    )
+    n_keys, avg = stats.row(0)
+    return int(n_keys), avg if n_keys else 1
 
-    logger.info(f"Left DataFrame shape: {left_df.shape}")
-    logger.info(f"Right DataFrame shape: {right_df.shape}")
+
+def _build_join(
+    join_def: JoinDefinition,
+    left_dc: DataCollection,
+    right_dc: DataCollection,
+    left: pl.LazyFrame,
+    right: pl.LazyFrame,
+    left_rows: int,
+    right_rows: int,
+    apply_granularity: bool,
+) -> tuple[pl.LazyFrame, dict, tuple[int, int]]:
+    """The join of ``left`` and ``right`` as a LazyFrame, with its metadata.
+
+    Everything that decides the shape of the result — join keys, granularity,
+    key casts, which right-hand columns survive — is read from schemas and
+    small key aggregations, so neither side is materialized here. Also returns
+    the row counts of both sides as joined (after any aggregation), which the
+    fan-out check compares the result against.
+    """
+    left_columns = left.collect_schema().names()
+    right_columns = right.collect_schema().names()
 
     # Auto-add depictio_run_id if present in both DataFrames
     # BUT skip if either table is a Metadata table (not aggregated data)
@@ -374,7 +399,7 @@ def execute_join(
     left_metatype = left_dc.config.metatype if left_dc.config else None
     right_metatype = right_dc.config.metatype if right_dc.config else None
 
-    if "depictio_run_id" in left_df.columns and "depictio_run_id" in right_df.columns:
+    if "depictio_run_id" in left_columns and "depictio_run_id" in right_columns:
         # Skip auto-add if either side is a Metadata table
         if left_metatype == "Metadata" or right_metatype == "Metadata":
             logger.info(
@@ -395,8 +420,8 @@ def execute_join(
         "right_dc_id": str(right_dc.id),
         "left_dc_tag": join_def.left_dc,
         "right_dc_tag": join_def.right_dc,
-        "left_rows": left_df.shape[0],
-        "right_rows": right_df.shape[0],
+        "left_rows": left_rows,
+        "right_rows": right_rows,
         "join_columns": join_columns,  # Use updated join_columns
         "join_type": join_def.how,  # Already a string with use_enum_values=True
         "aggregation_applied": False,
@@ -406,49 +431,48 @@ def execute_join(
     if apply_granularity and join_def.granularity:
         # Determine which DataFrame needs aggregation
         # The DataFrame with finer granularity (more rows per key) should be aggregated
-        left_key_counts = left_df.group_by(join_columns).len()
-        right_key_counts = right_df.group_by(join_columns).len()
-
-        left_avg_per_key = left_key_counts["len"].mean() if left_key_counts.height > 0 else 1
-        right_avg_per_key = right_key_counts["len"].mean() if right_key_counts.height > 0 else 1
+        left_keys, left_avg_per_key = _key_stats(left, join_columns)
+        right_keys, right_avg_per_key = _key_stats(right, join_columns)
 
         logger.info(f"Average rows per key - Left: {left_avg_per_key}, Right: {right_avg_per_key}")
 
-        # Aggregate the finer-grained DataFrame
-        if right_avg_per_key is not None and left_avg_per_key is not None:
-            if right_avg_per_key > left_avg_per_key:
-                logger.info("Aggregating right DataFrame to match left granularity")
-                right_df = apply_aggregation(right_df, join_columns, join_def.granularity)
-                metadata["aggregation_applied"] = True
-                metadata["aggregated_side"] = "right"
-            elif left_avg_per_key > right_avg_per_key:
-                logger.info("Aggregating left DataFrame to match right granularity")
-                left_df = apply_aggregation(left_df, join_columns, join_def.granularity)
-                metadata["aggregation_applied"] = True
-                metadata["aggregated_side"] = "left"
+        # Aggregate the finer-grained DataFrame; it then has one row per key.
+        if right_avg_per_key > left_avg_per_key:
+            logger.info("Aggregating right DataFrame to match left granularity")
+            right = apply_aggregation(right, join_columns, join_def.granularity)
+            right_rows = right_keys
+            metadata["aggregation_applied"] = True
+            metadata["aggregated_side"] = "right"
+        elif left_avg_per_key > right_avg_per_key:
+            logger.info("Aggregating left DataFrame to match right granularity")
+            left = apply_aggregation(left, join_columns, join_def.granularity)
+            left_rows = left_keys
+            metadata["aggregation_applied"] = True
+            metadata["aggregated_side"] = "left"
 
     # Normalize join column types
-    left_df, right_df = normalize_join_column_types(left_df, right_df, join_columns)
+    left, right = normalize_join_column_types(left, right, join_columns)
 
     # Remove duplicated columns (except join columns) from right DataFrame
     # to avoid suffix issues
     right_cols_to_keep = [
-        col for col in right_df.columns if col not in left_df.columns or col in join_columns
+        col for col in right_columns if col not in left_columns or col in join_columns
     ]
-    right_df = right_df.select(right_cols_to_keep)
+    right = right.select(right_cols_to_keep)
 
-    # Execute the join
     logger.info(f"Executing {join_def.how} join on columns: {join_columns}")
-    joined_df = left_df.join(
-        right_df,
+    joined = left.join(
+        right,
         on=join_columns,
         how=join_def.how,  # Already a string with use_enum_values=True
     )
+    return joined, metadata, (left_rows, right_rows)
 
-    logger.info(f"Joined DataFrame shape: {joined_df.shape}")
-    metadata["joined_rows"] = joined_df.shape[0]
-    metadata["joined_columns"] = joined_df.columns
 
+def _check_fanout(
+    join_def: JoinDefinition, metadata: dict, joined_rows: int, input_rows: tuple[int, int]
+) -> None:
+    """Attach a ``fanout_warning`` to ``metadata`` when the join multiplied rows."""
     # Fan-out sanity check: an inner/left join over input frames of N×M rows
     # should never produce more than max(N, M) rows unless one of the join
     # keys has duplicates on the *other* side. When that happens, the result
@@ -458,28 +482,301 @@ def execute_join(
     # distinguishes the duplicates (run id, timestamp, replicate id, …) or
     # to dedup the offending side before joining.
     fanout_thresholds = {"inner", "left", "right"}
-    if join_def.how in fanout_thresholds:
-        expected_max = max(left_df.height, right_df.height)
-        if expected_max > 0 and joined_df.height > expected_max:
-            ratio = joined_df.height / expected_max
-            warning_msg = (
-                f"Join produced {joined_df.height} rows from inputs of "
-                f"{left_df.height} (left) × {right_df.height} (right) on "
-                f"{join_columns} — {ratio:.2f}× fan-out vs the larger input. "
-                "Likely a non-unique join key: widen the key set or dedup before joining."
-            )
-            logger.warning(warning_msg)
-            console.print(f"  [yellow]⚠ {warning_msg}[/yellow]")
-            metadata["fanout_warning"] = {
-                "ratio": ratio,
-                "expected_max": expected_max,
-                "actual_rows": joined_df.height,
-                "message": warning_msg,
-            }
+    if join_def.how not in fanout_thresholds:
+        return
+    left_rows, right_rows = input_rows
+    expected_max = max(left_rows, right_rows)
+    if expected_max > 0 and joined_rows > expected_max:
+        ratio = joined_rows / expected_max
+        warning_msg = (
+            f"Join produced {joined_rows} rows from inputs of "
+            f"{left_rows} (left) × {right_rows} (right) on "
+            f"{metadata['join_columns']} — {ratio:.2f}× fan-out vs the larger input. "
+            "Likely a non-unique join key: widen the key set or dedup before joining."
+        )
+        logger.warning(warning_msg)
+        console.print(f"  [yellow]⚠ {warning_msg}[/yellow]")
+        metadata["fanout_warning"] = {
+            "ratio": ratio,
+            "expected_max": expected_max,
+            "actual_rows": joined_rows,
+            "message": warning_msg,
+        }
+
+
+def execute_join(
+    join_def: JoinDefinition,
+    project: Project,
+    CLI_config: CLIConfig,
+    apply_granularity: bool = True,
+) -> tuple[pl.DataFrame, dict]:
+    """
+    Execute a join operation between two data collections.
+
+    Reads both tables into memory; :func:`execute_join_lazy` is the variant
+    that persisting uses, which never holds either table.
+
+    Args:
+        join_def: The join definition to execute
+        project: The project configuration
+        CLI_config: CLI configuration for API/S3 access
+        apply_granularity: Whether to apply granularity aggregation
+
+    Returns:
+        Tuple of (joined DataFrame, metadata dict)
+    """
+    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage)
+
+    left_dc, right_dc, left_delta_path, right_delta_path = _join_side_paths(
+        join_def, project, CLI_config
+    )
+
+    logger.info(f"Loading left DataFrame from: {left_delta_path}")
+    left_result = read_delta_table(left_delta_path, storage_options)
+    if left_result["result"] != "success" or "data" not in left_result:
+        raise ValueError(
+            f"Failed to load left data collection: {left_result.get('message', 'Unknown error')}"
+        )
+    left_df = left_result["data"]
+    assert isinstance(left_df, pl.DataFrame)
+
+    logger.info(f"Loading right DataFrame from: {right_delta_path}")
+    right_result = read_delta_table(right_delta_path, storage_options)
+    if right_result["result"] != "success" or "data" not in right_result:
+        raise ValueError(
+            f"Failed to load right data collection: {right_result.get('message', 'Unknown error')}"
+        )
+    right_df = right_result["data"]
+    assert isinstance(right_df, pl.DataFrame)
+
+    logger.info(f"Left DataFrame shape: {left_df.shape}")
+    logger.info(f"Right DataFrame shape: {right_df.shape}")
+
+    joined, metadata, input_rows = _build_join(
+        join_def,
+        left_dc,
+        right_dc,
+        left_df.lazy(),
+        right_df.lazy(),
+        left_df.height,
+        right_df.height,
+        apply_granularity,
+    )
+    joined_df = joined.collect()
+
+    logger.info(f"Joined DataFrame shape: {joined_df.shape}")
+    metadata["joined_rows"] = joined_df.shape[0]
+    metadata["joined_columns"] = joined_df.columns
+    _check_fanout(join_def, metadata, joined_df.height, input_rows)
 
     return joined_df, metadata
 
 
+# ---------------------------------------------------------------------------
+# Lazy joins and incremental refresh
+# ---------------------------------------------------------------------------
+
+
+def _delta_version(path: str, storage_options: dict) -> int | None:
+    """Current version of the Delta table at ``path``, or ``None`` if there is none."""
+    from deltalake import DeltaTable
+
+    try:
+        return DeltaTable(path, storage_options=storage_options).version()
+    except Exception:
+        return None
+
+
+def _join_spec(join_def: JoinDefinition, metadata: dict, apply_granularity: bool) -> str:
+    """Digest of everything that shapes the joined rows besides the source data.
+
+    A joined table may only be extended by a slice when it was built under the
+    same spec; any edit to the join definition means a full recompute.
+    """
+    granularity = join_def.granularity if apply_granularity else None
+    spec = {
+        "left": metadata["left_dc_id"],
+        "right": metadata["right_dc_id"],
+        "on": metadata["join_columns"],
+        "how": join_def.how,
+        "granularity": granularity.model_dump(mode="json") if granularity else None,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def join_lineage_path(delta_table_location: str, delta_version: int) -> str:
+    """Where the lineage of ``delta_table_location`` at ``delta_version`` lives."""
+    return (
+        f"{delta_table_location.rstrip('/')}/{JOIN_LINEAGE_DIR}/v{int(delta_version):020d}.parquet"
+    )
+
+
+def write_join_lineage(
+    delta_table_location: str, storage_options: dict, metadata: dict
+) -> str | None:
+    """Record which source versions the table's current version was joined from.
+
+    One row next to the table, keyed by the joined table's own version: a
+    version written by anything else has no lineage and is rebuilt in full.
+    Never fails the join; the next run just recomputes.
+    """
+    import os
+
+    version = _delta_version(delta_table_location, storage_options)
+    if version is None:
+        return None
+    path = join_lineage_path(delta_table_location, version)
+    try:
+        if "://" not in path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        pl.DataFrame(
+            [{field: metadata[field] for field in _LINEAGE_FIELDS}],
+            schema=_LINEAGE_FIELDS,
+        ).write_parquet(path, storage_options=storage_options)
+    except Exception as e:
+        logger.warning(f"Could not write join lineage for {delta_table_location}: {e}")
+        return None
+    return path
+
+
+def read_join_lineage(delta_table_location: str, storage_options: dict) -> dict | None:
+    """Lineage of the table's current version, or ``None`` if it has none."""
+    version = _delta_version(delta_table_location, storage_options)
+    if version is None:
+        return None
+    try:
+        lineage = pl.read_parquet(
+            join_lineage_path(delta_table_location, version), storage_options=storage_options
+        ).row(0, named=True)
+    except Exception:
+        return None
+    return {**lineage, "joined_version": version}
+
+
+def _appended_rows(
+    path: str, since: int, version: int, storage_options: dict
+) -> pl.LazyFrame | None:
+    """The rows appended to ``path`` between ``since`` and ``version``, or ``None``."""
+    try:
+        added = appended_files(path, since, version, storage_options)
+        if added is None:
+            return None
+        schema = pl.scan_delta(
+            path, version=version, storage_options=storage_options
+        ).collect_schema()
+        old_schema = pl.scan_delta(
+            path, version=since, storage_options=storage_options
+        ).collect_schema()
+        if schema != old_schema:
+            return None
+    except Exception as e:
+        logger.debug(f"Cannot diff {path} between v{since} and v{version}: {e}")
+        return None
+    if not added:
+        return pl.LazyFrame(schema=schema)
+    return pl.scan_parquet(added, storage_options=storage_options).select(list(schema))
+
+
+def execute_join_lazy(
+    join_def: JoinDefinition,
+    project: Project,
+    CLI_config: CLIConfig,
+    apply_granularity: bool = True,
+    lineage: dict | None = None,
+) -> tuple[pl.LazyFrame, dict]:
+    """
+    Build a join from ``pl.scan_delta`` of both sources, ready to be sunk.
+
+    Both scans are pinned to the source versions current when the join is
+    planned, and those versions go into the metadata so the persisted table
+    records what it was built from. Nothing is collected beyond row counts and
+    key statistics.
+
+    With ``lineage`` (see :func:`read_join_lineage`) the result may be less
+    than the whole join. ``metadata["refresh"]`` says what it is:
+
+    - ``"unchanged"``: neither source moved; there is nothing to write.
+    - ``"append"``: one source only had rows appended, and the join is one
+      whose existing rows those cannot change (inner, or the outer side of a
+      left/right join, without granularity aggregation). The LazyFrame is the
+      join of the appended rows against the other source, to be appended.
+    - ``"full"``: the whole join, to replace the table.
+
+    Args:
+        join_def: The join definition to execute
+        project: The project configuration
+        CLI_config: CLI configuration for API/S3 access
+        apply_granularity: Whether to apply granularity aggregation
+        lineage: Lineage of the existing joined table, if any
+
+    Returns:
+        Tuple of (joined LazyFrame, metadata dict)
+    """
+    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage).model_dump()
+
+    left_dc, right_dc, left_path, right_path = _join_side_paths(join_def, project, CLI_config)
+
+    versions: dict[str, int] = {}
+    for side, path in (("left", left_path), ("right", right_path)):
+        version = _delta_version(path, storage_options)
+        if version is None:
+            raise ValueError(f"Failed to load {side} data collection: no Delta table at {path}")
+        versions[side] = version
+
+    left = pl.scan_delta(left_path, version=versions["left"], storage_options=storage_options)
+    right = pl.scan_delta(right_path, version=versions["right"], storage_options=storage_options)
+    left_rows = left.select(pl.len()).collect().item()
+    right_rows = right.select(pl.len()).collect().item()
+    logger.info(f"Left table v{versions['left']}: {left_rows} rows ({left_path})")
+    logger.info(f"Right table v{versions['right']}: {right_rows} rows ({right_path})")
+
+    joined, metadata, input_rows = _build_join(
+        join_def, left_dc, right_dc, left, right, left_rows, right_rows, apply_granularity
+    )
+    metadata.update(
+        input_rows=input_rows,
+        left_version=versions["left"],
+        right_version=versions["right"],
+        spec=_join_spec(join_def, metadata, apply_granularity),
+        refresh="full",
+    )
+
+    if not lineage or lineage.get("spec") != metadata["spec"]:
+        return joined, metadata
+
+    moved = [side for side in ("left", "right") if lineage[f"{side}_version"] != versions[side]]
+    if not moved:
+        metadata["refresh"] = "unchanged"
+        return joined, metadata
+
+    # Appended rows on one side only add result rows when nothing already
+    # joined can change: every new result row pairs a new row with an
+    # existing row of the other side, and no old row gains or loses a match.
+    side = moved[0]
+    appendable = {"left": ("inner", "left"), "right": ("inner", "right")}[side]
+    if len(moved) > 1 or join_def.how not in appendable or metadata["aggregation_applied"]:
+        return joined, metadata
+
+    path = left_path if side == "left" else right_path
+    appended = _appended_rows(path, lineage[f"{side}_version"], versions[side], storage_options)
+    if appended is None:
+        return joined, metadata
+
+    if side == "left":
+        left = appended
+    else:
+        right = appended
+    # Granularity is never applied here: an aggregated join never takes this path.
+    sliced, _, _ = _build_join(join_def, left_dc, right_dc, left, right, 0, 0, False)
+    logger.info(
+        f"Joining only the rows appended to the {side} table "
+        f"(v{lineage[f'{side}_version']} -> v{versions[side]})"
+    )
+    metadata["refresh"] = "append"
+    metadata["appended_side"] = side
+    return sliced, metadata
+
+
 def preview_join(
     join_def: JoinDefinition,
     project: Project,
@@ -489,6 +786,9 @@ def preview_join(
     """
     Generate a preview of a join operation without persisting the result.
 
+    Statistics come from lazy aggregations over the scanned tables, so a
+    preview costs a streaming pass, not both tables in memory.
+
     Args:
         join_def: The join definition to preview
         project: The project configuration
@@ -498,45 +798,34 @@ def preview_join(
     Returns:
         JoinPreviewResult with statistics and sample data
     """
-    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage)
-
-    # Find data collections
-    left_dc, _ = find_data_collection_by_tag(project, join_def.left_dc, join_def.workflow_name)
-    right_dc, _ = find_data_collection_by_tag(project, join_def.right_dc, join_def.workflow_name)
+    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage).model_dump()
 
-    if not left_dc or not left_dc.id:
-        raise ValueError(f"Left data collection '{join_def.left_dc}' not found")
-    if not right_dc or not right_dc.id:
-        raise ValueError(f"Right data collection '{join_def.right_dc}' not found")
-
-    # Load DataFrames
-    left_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(left_dc.id)}"
-    right_delta_path = f"s3://{CLI_config.s3_storage.bucket}/{str(right_dc.id)}"
-
-    left_result = read_delta_table(left_delta_path, storage_options)
-    right_result = read_delta_table(right_delta_path, storage_options)
-
-    if left_result["result"] != "success" or "data" not in left_result:
-        raise ValueError("Failed to load left data collection")
-    if right_result["result"] != "success" or "data" not in right_result:
-        raise ValueError("Failed to load right data collection")
-
-    left_df = left_result["data"]
-    right_df = right_result["data"]
-    assert isinstance(left_df, pl.DataFrame)
-    assert isinstance(right_df, pl.DataFrame)
+    _, _, left_delta_path, right_delta_path = _join_side_paths(join_def, project, CLI_config)
+    joined, metadata = execute_join_lazy(join_def, project, CLI_config)
+    left = pl.scan_delta(
+        left_delta_path, version=metadata["left_version"], storage_options=storage_options
+    )
+    right = pl.scan_delta(
+        right_delta_path, version=metadata["right_version"], storage_options=storage_options
+    )
 
     # Calculate key statistics
-    left_unique_keys = left_df.select(join_def.on_columns).unique().height
-    right_unique_keys = right_df.select(join_def.on_columns).unique().height
-
-    # Find matching keys
-    left_keys = set(left_df.select(join_def.on_columns).unique().iter_rows())
-    right_keys = set(right_df.select(join_def.on_columns).unique().iter_rows())
-    matched_keys = len(left_keys.intersection(right_keys))
+    left_keys = left.select(join_def.on_columns).unique()
+    right_keys = right.select(join_def.on_columns).unique()
+    left_unique_keys = left_keys.select(pl.len()).collect().item()
+    right_unique_keys = right_keys.select(pl.len()).collect().item()
+
+    # Find matching keys (null keys match each other, as in a set intersection)
+    left_keys, right_keys = normalize_join_column_types(left_keys, right_keys, join_def.on_columns)
+    matched_keys = (
+        left_keys.join(right_keys, on=join_def.on_columns, how="inner", nulls_equal=True)
+        .select(pl.len())
+        .collect()
+        .item()
+    )
 
-    # Execute join
-    joined_df, metadata = execute_join(join_def, project, CLI_config)
+    joined_rows = joined.select(pl.len()).collect().item()
+    _check_fanout(join_def, metadata, joined_rows, metadata["input_rows"])
 
     # Generate warnings
     warnings = []
@@ -549,7 +838,7 @@ def preview_join(
         )
 
     # Prepare sample rows
-    sample_data = joined_df.head(sample_rows).to_dicts()
+    sample_data = joined.head(sample_rows).collect().to_dicts()
 
     # Build aggregation summary
     aggregation_summary = None
@@ -558,12 +847,12 @@ def preview_join(
         aggregation_summary = f"Aggregation applied to {side} DataFrame"
 
     return JoinPreviewResult(
-        left_dc_rows=left_df.height,
-        right_dc_rows=right_df.height,
-        joined_rows=joined_df.height,
-        left_dc_columns=left_df.columns,
-        right_dc_columns=right_df.columns,
-        joined_columns=joined_df.columns,
+        left_dc_rows=metadata["left_rows"],
+        right_dc_rows=metadata["right_rows"],
+        joined_rows=joined_rows,
+        left_dc_columns=left.collect_schema().names(),
+        right_dc_columns=right.collect_schema().names(),
+        joined_columns=joined.collect_schema().names(),
         left_unique_keys=left_unique_keys,
         right_unique_keys=right_unique_keys,
         matched_keys=matched_keys,
@@ -576,7 +865,7 @@ def preview_join(
 
 def persist_joined_table(
     join_def: JoinDefinition,
-    joined_df: pl.DataFrame,
+    joined_df: pl.DataFrame | pl.LazyFrame,
     project: Project,
     CLI_config: CLIConfig,
     metadata: dict,
@@ -587,17 +876,18 @@ def persist_joined_table(
 
     This function:
     1. Generates a DataCollection ID for the joined table
-    2. Writes the Delta table to S3
+    2. Streams the Delta table to S3 (or appends the joined slice, see
+       :func:`execute_join_lazy`) and records the source versions it came from
     3. Updates the join_def with result metadata
     4. Syncs the updated project to MongoDB
     5. Registers the Delta table location in MongoDB
 
     Args:
         join_def: The join definition (modified in-place with results)
-        joined_df: The joined DataFrame to persist
+        joined_df: The joined DataFrame, or LazyFrame from execute_join_lazy
         project: The project configuration
         CLI_config: CLI configuration
-        metadata: Join metadata from execute_join
+        metadata: Join metadata from execute_join / execute_join_lazy
         overwrite: Whether to overwrite existing table
 
     Returns:
@@ -637,42 +927,82 @@ def persist_joined_table(
 
     logger.info(f"Persisting joined table to: {destination_prefix}")
 
-    # Step 2: Check if exists
-    existing_result = read_delta_table(destination_prefix, storage_options)
-    if existing_result["result"] == "success" and not overwrite:
+    refresh = metadata.get("refresh", "full")
+    opts = storage_options.model_dump()
+
+    # Step 2: Check if exists (from the log; the table itself is not read)
+    existing_version = _delta_version(destination_prefix, opts)
+    if existing_version is None and refresh != "full":
+        # The frame is a slice of a table that has gone since it was planned.
+        return {
+            "result": "error",
+            "message": f"Joined table at {destination_prefix} disappeared; rerun to rebuild it.",
+        }
+    if refresh == "unchanged":
+        size_bytes, row_count = delta_table_stats(destination_prefix, storage_options)
+        console.print("  [green]✓ Joined table is up to date with its sources[/green]")
+        return {
+            "result": "success",
+            "message": f"Joined table at {destination_prefix} is up to date",
+            "location": destination_prefix,
+            "rows": row_count,
+            "size_bytes": size_bytes,
+            "dc_tag": dc_tag,
+            "dc_id": str(dc_id),
+            "refresh": refresh,
+        }
+    if existing_version is not None and refresh == "full" and not overwrite:
         return {
             "result": "error",
             "message": f"Joined table already exists at {destination_prefix}. Use --overwrite to replace.",
         }
+    rows_before = 0
+    if refresh == "append":
+        rows_before = delta_table_stats(destination_prefix, storage_options)[1]
 
     # Step 3: Add join timestamp
     execution_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    joined_df = joined_df.with_columns(pl.lit(execution_timestamp).alias("join_timestamp"))
-
-    # Step 4: Calculate size
-    size_bytes = calculate_dataframe_size_bytes(joined_df)
+    joined = joined_df.lazy().with_columns(pl.lit(execution_timestamp).alias("join_timestamp"))
+    joined_columns = joined.collect_schema().names()
 
-    # Step 5: Write Delta table to ID-based path
-    console.print(f"  [cyan]→ Writing Delta table to: {destination_prefix}[/cyan]")
-    write_result = write_delta_table(
-        aggregated_df=joined_df,
-        destination_file=destination_prefix,
-        storage_options=storage_options,
-    )
+    # Step 4: Stream the Delta table to the ID-based path. An append adds the
+    # slice under the existing schema; a failed write commits nothing.
+    mode = "append" if refresh == "append" else "overwrite"
+    console.print(f"  [cyan]→ Writing Delta table to: {destination_prefix} ({mode})[/cyan]")
+    try:
+        write_result = sink_delta_table(joined, destination_prefix, storage_options, mode=mode)
+    except Exception as e:
+        # Same fallback as the ingest's streaming path: sink_delta is unstable
+        # in polars 1.41.x, so collect and write rather than fail the join.
+        logger.warning(f"Streaming join write failed ({e}); falling back to collect+write.")
+        write_result = write_delta_table(
+            aggregated_df=joined.collect(),
+            destination_file=destination_prefix,
+            storage_options=storage_options,
+            mode=mode,
+        )
 
     if write_result["result"] != "success":
         return write_result
 
-    logger.info(f"Successfully persisted joined table with {joined_df.height} rows")
+    # Step 5: Size and rows from the log of the version just written, and the
+    # source versions it was built from, for the next incremental refresh.
+    size_bytes, row_count = delta_table_stats(destination_prefix, storage_options)
+    if "spec" in metadata:
+        write_join_lineage(destination_prefix, opts, metadata)
+
+    logger.info(f"Successfully persisted joined table with {row_count} rows ({refresh})")
 
     # Step 6: Update join_def with result metadata
     join_def.result_dc_id = dc_id
     join_def.result_dc_tag = dc_tag
     join_def.delta_location = destination_prefix
     join_def.executed_at = execution_timestamp
-    join_def.row_count = joined_df.height
-    join_def.column_count = len(joined_df.columns)
+    join_def.row_count = row_count
+    join_def.column_count = len(joined_columns)
     join_def.size_bytes = size_bytes
+    join_def.left_dc_version = metadata.get("left_version")
+    join_def.right_dc_version = metadata.get("right_version")
 
     console.print("  [green]✓ Updated join definition with execution results[/green]")
     logger.info(f"Updated join '{join_def.name}' with result metadata")
@@ -712,7 +1042,7 @@ def persist_joined_table(
                     format="parquet",  # Delta tables use Parquet format
                     polars_kwargs={},
                     columns_description={
-                        col: f"From join: {join_def.name}" for col in joined_df.columns
+                        col: f"From join: {join_def.name}" for col in joined_columns
                     },
                 ),
             ),
@@ -746,6 +1076,11 @@ def persist_joined_table(
             CLI_config=CLI_config,
             update=True,
             deltatable_size_bytes=size_bytes,
+            ingest=(
+                {"mode": "incremental", "rows_added": max(row_count - rows_before, 0)}
+                if refresh == "append"
+                else None
+            ),
         )
         console.print("  [green]✓ Delta table location registered in MongoDB[/green]")
         logger.info(f"Successfully registered Delta location for join '{join_def.name}'")
@@ -757,14 +1092,26 @@ def persist_joined_table(
         "result": "success",
         "message": f"Joined table persisted to {destination_prefix}",
         "location": destination_prefix,
-        "rows": joined_df.height,
-        "columns": len(joined_df.columns),
+        "rows": row_count,
+        "columns": len(joined_columns),
         "size_bytes": size_bytes,
+        "refresh": refresh,
         "dc_tag": dc_tag,
         "dc_id": str(dc_id),
     }
 
 
+def _existing_lineage(join_def: JoinDefinition, CLI_config: CLIConfig) -> dict | None:
+    """Lineage of the table this join persisted before, if it has one."""
+    dc_id = join_def.id or join_def.result_dc_id
+    if not dc_id:
+        return None
+    storage_options = turn_S3_config_into_polars_storage_options(CLI_config.s3_storage)
+    return read_join_lineage(
+        f"s3://{CLI_config.s3_storage.bucket}/{str(dc_id)}", storage_options.model_dump()
+    )
+
+
 def process_project_joins(
     project: Project,
     CLI_config: CLIConfig,
@@ -772,6 +1119,7 @@ def process_project_joins(
     preview_only: bool = False,
     overwrite: bool = False,
     auto_process_dependencies: bool = True,
+    incremental: bool | None = None,
 ) -> dict:
     """
     Process all joins defined in a project configuration.
@@ -783,12 +1131,16 @@ def process_project_joins(
         preview_only: If True, only generate previews without persisting
         overwrite: Whether to overwrite existing joined tables
         auto_process_dependencies: Whether to auto-process missing source DCs
+        incremental: Refresh joined tables from their lineage (append the
+            joined slice of appended rows, skip unchanged joins) instead of
+            recomputing them. Defaults to ``DEPICTIO_INGEST_INCREMENTAL``.
 
     Returns:
         Result dict with processing summary
     """
     from depictio.cli.cli.utils.deltatables import client_aggregate_data
 
+    refresh_incrementally = incremental_ingest_enabled({"incremental": incremental})
     results = {
         "processed": [],
         "skipped": [],
@@ -896,15 +1248,30 @@ def process_project_joins(
                 )
         else:
             try:
-                # First show preview
-                preview = preview_join(join_def, project, CLI_config)
-                display_join_preview(join_def.name, preview)
+                # A joined table this join already built is refreshed from its
+                # lineage; that table is the join's own output, so replacing it
+                # when a slice will not do needs no --overwrite.
+                lineage = None
+                if join_def.persist and refresh_incrementally:
+                    lineage = _existing_lineage(join_def, CLI_config)
+
+                # First show preview (already seen when the table was built)
+                if lineage is None:
+                    preview = preview_join(join_def, project, CLI_config)
+                    display_join_preview(join_def.name, preview)
 
                 # Then persist if configured
                 if join_def.persist:
-                    joined_df, metadata = execute_join(join_def, project, CLI_config)
+                    joined, metadata = execute_join_lazy(
+                        join_def, project, CLI_config, lineage=lineage
+                    )
                     persist_result = persist_joined_table(
-                        join_def, joined_df, project, CLI_config, metadata, overwrite
+                        join_def,
+                        joined,
+                        project,
+                        CLI_config,
+                        metadata,
+                        overwrite or lineage is not None,
                     )
 
                     if persist_result["result"] == "success":
@@ -918,6 +1285,7 @@ def process_project_joins(
                                 "mode": "persisted",
                                 "rows": persist_result.get("rows", 0),
                                 "location": persist_result.get("location", ""),
+                                "refresh": persist_result.get("refresh"),
                             }
                         )
                     else:
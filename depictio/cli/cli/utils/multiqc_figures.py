@@ -11,7 +11,8 @@ resolve the exact same key to serve it.
 No Redis / settings / S3 dependencies here — callers own parsing (``multiqc``
 global state), caching, locking and I/O. This module only:
   - hashes the figure cache key (pure ``hashlib``),
-  - builds one ``go.Figure`` from an already-resident ``multiqc.report``.
+  - builds one ``go.Figure`` from an already-resident ``multiqc.report``, or
+    from a ``Plot`` object the caller already holds.
 """
 
 from __future__ import annotations
@@ -19,6 +20,7 @@ from __future__ import annotations
 import contextlib
 import hashlib
 import re
+import threading
 from typing import List, Optional
 
 import plotly.graph_objects as go
@@ -56,6 +58,10 @@ def _sanitize_colorscale(value: object) -> object:
     return out
 
 
+_colorscale_patch_lock = threading.Lock()
+_colorscale_patch_depth = 0
+
+
 @contextlib.contextmanager
 def _patch_colorscale_alpha():
     """Temporarily tolerate 8-digit-hex colorscales during figure construction.
@@ -65,24 +71,38 @@ def _patch_colorscale_alpha():
     validator so that, *only* when the original validation fails, the colorscale
     is retried with its alpha-hex colors converted to rgba(). Valid colorscales
     are untouched, and the original validator is always restored.
+
+    Reference-counted: figures for different reports are built on concurrent
+    threads, and the class attribute must only be swapped by the first entrant
+    and restored by the last one out — otherwise an overlapping exit could
+    restore another thread's wrapper, or pull the patch from under a build.
     """
+    global _colorscale_patch_depth
     from _plotly_utils.basevalidators import ColorscaleValidator
 
-    original = ColorscaleValidator.validate_coerce
-
-    def patched(self, v):
-        try:
-            return original(self, v)
-        except ValueError:
-            return original(self, _sanitize_colorscale(v))
-
-    # setattr (not direct assignment) so the temporary method swap on this
-    # third-party validator class doesn't trip static method-type checks.
-    setattr(ColorscaleValidator, "validate_coerce", patched)
+    with _colorscale_patch_lock:
+        if _colorscale_patch_depth == 0:
+            original = ColorscaleValidator.validate_coerce
+
+            def patched(self, v):
+                try:
+                    return original(self, v)
+                except ValueError:
+                    return original(self, _sanitize_colorscale(v))
+
+            patched.__wrapped__ = original  # type: ignore[attr-defined]
+            # setattr (not direct assignment) so the temporary method swap on this
+            # third-party validator class doesn't trip static method-type checks.
+            setattr(ColorscaleValidator, "validate_coerce", patched)
+        _colorscale_patch_depth += 1
     try:
         yield
     finally:
-        setattr(ColorscaleValidator, "validate_coerce", original)
+        with _colorscale_patch_lock:
+            _colorscale_patch_depth -= 1
+            if _colorscale_patch_depth == 0:
+                current = ColorscaleValidator.validate_coerce
+                setattr(ColorscaleValidator, "validate_coerce", current.__wrapped__)
 
 
 def multiqc_figure_cache_key(
@@ -147,9 +167,26 @@ def build_multiqc_figure(
     """
     import multiqc
 
+    plot_obj = multiqc.get_plot(module, plot)
+    return build_figure_from_plot(plot_obj, module, plot, dataset_id, theme)
+
+
+def build_figure_from_plot(
+    plot_obj: object,
+    module: str,
+    plot: str,
+    dataset_id: Optional[str] = None,
+    theme: str = "light",
+) -> go.Figure:
+    """Build the figure for an already-resolved MultiQC ``Plot`` object.
+
+    The half of :func:`build_multiqc_figure` after ``multiqc.get_plot``, for
+    callers that hold ``Plot`` objects themselves (the API's report pool keeps
+    them unpickled per plot) rather than a resident ``multiqc.report``. Reads
+    nothing from the report, only from ``plot_obj``.
+    """
     ensure_mantine_templates()
 
-    plot_obj = multiqc.get_plot(module, plot)
     if not plot_obj or not hasattr(plot_obj, "get_figure"):
         raise ValueError(f"Failed to get plot object for {module}/{plot}")
 
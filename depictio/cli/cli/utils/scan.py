@@ -19,9 +19,15 @@ from depictio.cli.cli.utils.rich_utils import (
     rich_print_data_collection_light,
     rich_print_summary_scan_table_enhanced,
 )
+from depictio.cli.cli.utils.scan_engine import (
+    FileStat,
+    ScanManifest,
+    manifest_enabled,
+    stat_file,
+    walk_files,
+)
 from depictio.cli.cli.utils.scan_utils import (
     construct_full_regex,
-    generate_file_hash,
     generate_run_hash,
     regex_match,
 )
@@ -116,6 +122,7 @@ def scan_single_file(
     update_files: bool,
     full_regex: str | None = None,
     skip_regex: bool = False,
+    file_stat: FileStat | None = None,
 ) -> FileScanResult | None:
     """
     Process a single file.
@@ -133,6 +140,8 @@ def scan_single_file(
         update_files (bool): Whether to update existing file entries.
         full_regex (str): The regex pattern to match the filename.
         skip_regex (bool): Whether to skip the regex check.
+        file_stat (FileStat): The file as already resolved and stat-ed by
+            ``scan_engine.walk_files``; saves re-resolving and re-stat-ing it.
 
     Returns:
         Optional[File]: A File instance if the file is valid; otherwise, None.
@@ -144,7 +153,9 @@ def scan_single_file(
     # should be the original target, not the transient symlink. file_hash is
     # derived from basename + size + mtime (not the path), so this does not affect
     # change detection or hash-based dedup.
-    file_location = os.path.realpath(file_location)
+    if file_stat is None:
+        file_stat = stat_file(os.path.realpath(file_location))
+    file_location = file_stat.path
 
     file_name = os.path.basename(file_location)
     if not skip_regex:
@@ -155,24 +166,18 @@ def scan_single_file(
             # logger.debug(f"File {file_name} does not match regex, skipping.")
             return None
 
-    # Get file details.
-    creation_time_float = os.path.getctime(file_location)
-    modification_time_float = os.path.getmtime(file_location)
-    creation_time_iso = format_timestamp(creation_time_float)
-    modification_time_iso = format_timestamp(modification_time_float)
-    filesize = os.path.getsize(file_location)
-    file_hash = generate_file_hash(file_name, filesize, creation_time_iso, modification_time_iso)
-    logger.debug(f"File Hash for {file_name}: {file_hash}")
+    # Get file details — one stat, taken by the caller's walk or just above.
+    creation_time_iso = file_stat.creation_time
+    modification_time_iso = file_stat.modification_time
+    filesize = file_stat.size
+    file_hash = file_stat.file_hash
 
     scan_result = None
     file_id = None
 
-    logger.debug(f"Existing Files: {existing_files}")
-
     # Check if the file already exists in the database.
     if existing_files:
-        # logger.debug(f"Nb of Existing Files: {len(existing_files)}")
-        if any(existing == file_location for existing in list(existing_files.keys())):
+        if file_location in existing_files:
             logger.debug(f"File {file_name} already exists in the database.")
 
             # compare hashes to check if the file has changed
@@ -233,7 +238,7 @@ def process_files(
     """
     Scan files from a given directory or a single file path.
 
-    If 'path' is a directory, scan using os.walk.
+    If 'path' is a directory, scan it with ``scan_engine.walk_files``.
     If it's a file, process that file directly.
 
     Args:
@@ -271,21 +276,20 @@ def process_files(
 
     if os.path.isdir(path):
         logger.debug(f"Scanning directory: {path}")
-        for root, _, files in os.walk(path):
-            for file in files:
-                file_location = os.path.join(root, file)
-                file_instance = scan_single_file(
-                    file_location=file_location,
-                    run=run,
-                    data_collection=data_collection,
-                    permissions=permissions,
-                    existing_files=existing_files,
-                    update_files=update_files,
-                    full_regex=full_regex,
-                    skip_regex=skip_regex,
-                )
-                if file_instance:
-                    file_list.append(file_instance)
+        for entry in walk_files(path):
+            file_instance = scan_single_file(
+                file_location=entry.path,
+                run=run,
+                data_collection=data_collection,
+                permissions=permissions,
+                existing_files=existing_files,
+                update_files=update_files,
+                full_regex=full_regex,
+                skip_regex=skip_regex,
+                file_stat=entry,
+            )
+            if file_instance:
+                file_list.append(file_instance)
     elif os.path.isfile(path):
         logger.debug(f"Scanning single file: {path}")
         file_instance = scan_single_file(
@@ -352,13 +356,17 @@ def scan_run_for_multiple_data_collections(
             permissions=permissions,
         )
 
-    # Scan all files in the run directory
-    all_files_in_run: list[str] = []
-    if os.path.isdir(run_location):
-        for root, _, files in os.walk(run_location):
-            for file in files:
-                file_location = os.path.join(root, file)
-                all_files_in_run.append(file_location)
+    # Scan all files in the run directory — once, stat included, for every DC
+    # below. With the manifest on, unchanged directories are not re-listed;
+    # --sync-files re-stats their files anyway, since it exists to pick up
+    # files modified in place (which leave the directory's mtime alone).
+    manifest = ScanManifest.load(run_location) if manifest_enabled() else None
+    all_files_in_run = walk_files(run_location, manifest=manifest, trust_manifest=not update_files)
+    if manifest is not None:
+        try:
+            manifest.save()
+        except OSError as e:
+            logger.warning(f"Could not save scan manifest for {run_location}: {e}")
 
     # Process files for each data collection
     all_processed_files = []
@@ -411,8 +419,10 @@ def scan_run_for_multiple_data_collections(
 
         # Process files that match this data collection's regex
         dc_file_scan_results = []
-        for file_location in all_files_in_run:
-            file_name = os.path.basename(file_location)
+        for entry in all_files_in_run:
+            # Matched on the name as found in the run, a symlink's own name
+            # rather than its target's (``entry.path`` is resolved).
+            file_name = os.path.basename(entry.relpath)
 
             # Check regex match against basename first
             match, _ = regex_match(file_name, full_regex)
@@ -420,8 +430,7 @@ def scan_run_for_multiple_data_collections(
                 # If the pattern contains path separators (e.g., "variants/bowtie2/..."),
                 # try matching against the relative path from the run directory
                 if "/" in full_regex:
-                    rel_path = os.path.relpath(file_location, run_location)
-                    match, _ = regex_match(rel_path, full_regex)
+                    match, _ = regex_match(entry.relpath, full_regex)
                 if not match:
                     continue
 
@@ -429,7 +438,7 @@ def scan_run_for_multiple_data_collections(
 
             # skip_regex=True because we already matched in the loop above
             file_scan_result = scan_single_file(
-                file_location=file_location,
+                file_location=entry.path,
                 run=temp_run,
                 data_collection=dc,
                 permissions=permissions,
@@ -437,6 +446,7 @@ def scan_run_for_multiple_data_collections(
                 update_files=update_files,
                 full_regex=full_regex,
                 skip_regex=True,
+                file_stat=entry,
             )
 
             if file_scan_result:
@@ -0,0 +1,265 @@
+"""Per-column statistics catalog stored next to a Delta table.
+
+Several read paths need facts about a whole column rather than its rows: the
+options of a MultiSelect (its distinct values), the bounds of a RangeSlider
+(min/max), an unfiltered card (count, nunique, min, max) and the builder's
+breakdown preview (value counts). Each of them used to scan the column to find
+out, on the first request after every ingest.
+
+The catalog answers them from one small parquet file written at ingest, one row
+per column:
+
+* ``rows``, ``count`` (non-null), ``null_count``;
+* ``n_unique`` — distinct non-null values, exact when ``n_unique_exact``, else
+  a HyperLogLog estimate;
+* ``min`` / ``max`` as strings, and ``min_numeric`` / ``max_numeric`` for
+  numeric columns;
+* ``dictionary`` — every distinct value with its row count, most frequent
+  first, for columns with at most ``DICTIONARY_MAX_VALUES`` values;
+* ``top_k`` — the ``TOP_K`` most frequent values, whenever they were counted;
+* ``histogram`` — ``HISTOGRAM_BINS`` equal-width bins over a numeric column.
+
+Values are stored as strings — :func:`value_string`, the form every consumer
+ships to the browser anyway and the one the scan paths produce too.
+
+The file is versioned by the Delta table version it describes
+(``_depictio/stats/v<version>.parquet`` under the table), so a reader holding
+a version can never pick up another version's numbers. The CLI writes it right
+after the Delta write; the API computes it itself when it is missing (see
+``depictio.api.v1.services.column_stats``). This module is shared by both and
+depends on nothing but Polars and the models. Bookkeeping columns
+(``HIDDEN_COLUMNS``) get no entry.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import polars as pl
+
+from depictio.models.models.deltatables import HIDDEN_COLUMNS
+
+STATS_DIR = "_depictio/stats"
+DICTIONARY_MAX_VALUES = 1_000
+TOP_K = 10
+HISTOGRAM_BINS = 20
+
+_COUNTS = pl.List(pl.Struct({"value": pl.String, "count": pl.Int64}))
+
+CATALOG_SCHEMA = pl.Schema(
+    {
+        "column": pl.String,
+        "dtype": pl.String,
+        "rows": pl.Int64,
+        "count": pl.Int64,
+        "null_count": pl.Int64,
+        "n_unique": pl.Int64,
+        "n_unique_exact": pl.Boolean,
+        "min": pl.String,
+        "max": pl.String,
+        "min_numeric": pl.Float64,
+        "max_numeric": pl.Float64,
+        "top_k": _COUNTS,
+        "dictionary": _COUNTS,
+        "histogram": pl.List(
+            pl.Struct({"lower": pl.Float64, "upper": pl.Float64, "count": pl.Int64})
+        ),
+    }
+)
+
+
+def stats_sidecar_path(delta_table_location: str, delta_version: int) -> str:
+    """Where the catalog of ``delta_table_location`` at ``delta_version`` lives."""
+    return f"{delta_table_location.rstrip('/')}/{STATS_DIR}/v{int(delta_version):020d}.parquet"
+
+
+def _orderable(dtype: pl.DataType) -> bool:
+    return dtype.is_numeric() or dtype.is_temporal() or dtype == pl.String
+
+
+def _countable(dtype: pl.DataType) -> bool:
+    return not dtype.is_nested() and dtype not in (pl.Binary, pl.Null, pl.Object)
+
+
+def _histogrammable(dtype: pl.DataType) -> bool:
+    return dtype.is_numeric() and dtype != pl.Boolean
+
+
+def _base(name: str, dtype: pl.DataType) -> pl.Expr:
+    # NaN counts as missing, as it does in the aggregation specs the cards
+    # otherwise read — a catalog that disagreed with them would change a card's
+    # number depending on which one answered.
+    return pl.col(name).fill_nan(None) if dtype.is_float() else pl.col(name)
+
+
+def value_string(value: Any) -> str:
+    """A column value as listed to the browser: Python's ``str`` of the scanned value.
+
+    Shared by the catalog and every path that scans instead (``/unique_values``,
+    the facets), so an option reads the same whichever one answered. Polars'
+    own ``cast(pl.String)`` would not do: it writes ``true`` for ``True`` and
+    pads datetimes to microseconds.
+    """
+    return str(value)
+
+
+def _counts(frame: pl.DataFrame) -> list[dict[str, Any]]:
+    return [{"value": value_string(v), "count": int(c)} for v, c in frame.iter_rows()]
+
+
+def _string_or_none(value: Any) -> str | None:
+    return None if value is None else value_string(value)
+
+
+def compute_column_stats(
+    lf: pl.LazyFrame,
+    *,
+    dictionary_max_values: int = DICTIONARY_MAX_VALUES,
+    top_k: int = TOP_K,
+    bins: int = HISTOGRAM_BINS,
+) -> pl.DataFrame:
+    """The catalog of ``lf``, one row per column, in ``CATALOG_SCHEMA``.
+
+    Three passes at most, each a single ``collect_all`` so Polars can share the
+    scan: a summary select over every column, value counts for the columns the
+    summary found to be low-cardinality, then histograms for numeric columns.
+    High-cardinality columns are never grouped — that is the cost this catalog
+    exists to avoid, and nobody lists a million options.
+    """
+    schema = lf.collect_schema()
+    columns = [
+        (name, dtype)
+        for name, dtype in schema.items()
+        if _countable(dtype) and name not in HIDDEN_COLUMNS
+    ]
+
+    summary_exprs: list[pl.Expr] = [pl.len().alias("__rows")]
+    for i, (name, dtype) in enumerate(columns):
+        col = _base(name, dtype)
+        summary_exprs.append(col.null_count().alias(f"{i}__nulls"))
+        summary_exprs.append(col.approx_n_unique().alias(f"{i}__approx"))
+        if _orderable(dtype):
+            summary_exprs.append(col.min().alias(f"{i}__min"))
+            summary_exprs.append(col.max().alias(f"{i}__max"))
+        if _histogrammable(dtype):
+            summary_exprs.append(col.cast(pl.Float64).min().alias(f"{i}__nmin"))
+            summary_exprs.append(col.cast(pl.Float64).max().alias(f"{i}__nmax"))
+    summary = lf.select(summary_exprs).collect().row(0, named=True)
+    rows = int(summary["__rows"])
+
+    # HyperLogLog is within a few percent; the exact count comes with the value
+    # counts, so overshooting the gate a little only costs a discarded group-by.
+    counted = [
+        i
+        for i, _ in enumerate(columns)
+        if summary[f"{i}__approx"] <= dictionary_max_values * 1.1 + 10
+    ]
+    value_counts = pl.collect_all(
+        [
+            # Grouped on the values themselves; they become strings afterwards,
+            # through ``value_string``, like every other value listing.
+            lf.select(_base(*columns[i]).alias("value"))
+            .drop_nulls()
+            .group_by("value")
+            .agg(pl.len().cast(pl.Int64).alias("count"))
+            .sort(["count", "value"], descending=[True, False])
+            for i in counted
+        ]
+    )
+    counts_by_column = dict(zip(counted, value_counts))
+
+    edges: dict[int, tuple[float, float]] = {}
+    for i, (_, dtype) in enumerate(columns):
+        lo, hi = summary.get(f"{i}__nmin"), summary.get(f"{i}__nmax")
+        if _histogrammable(dtype) and lo is not None and hi is not None:
+            if math.isfinite(lo) and math.isfinite(hi) and hi > lo:
+                edges[i] = (lo, hi)
+    histogram_frames = pl.collect_all(
+        [
+            lf.select(_base(*columns[i]).cast(pl.Float64).alias("x"))
+            .filter(pl.col("x").is_finite())
+            .select(
+                ((pl.col("x") - edges[i][0]) / (edges[i][1] - edges[i][0]) * bins)
+                .floor()
+                .clip(0, bins - 1)
+                .cast(pl.Int64)
+                .alias("bin")
+            )
+            .group_by("bin")
+            .agg(pl.len().cast(pl.Int64).alias("count"))
+            for i in edges
+        ]
+    )
+    histograms = dict(zip(edges, histogram_frames))
+
+    records = []
+    for i, (name, dtype) in enumerate(columns):
+        nulls = int(summary[f"{i}__nulls"])
+        counts = counts_by_column.get(i)
+        complete = counts is not None and counts.height <= dictionary_max_values
+        histogram = None
+        if i in histograms:
+            lo, hi = edges[i]
+            width = (hi - lo) / bins
+            per_bin = dict(histograms[i].iter_rows())
+            histogram = [
+                {
+                    "lower": lo + b * width,
+                    "upper": lo + (b + 1) * width,
+                    "count": per_bin.get(b, 0),
+                }
+                for b in range(bins)
+            ]
+        records.append(
+            {
+                "column": name,
+                "dtype": str(dtype),
+                "rows": rows,
+                "count": rows - nulls,
+                "null_count": nulls,
+                "n_unique": counts.height if counts is not None else int(summary[f"{i}__approx"]),
+                "n_unique_exact": counts is not None,
+                "min": _string_or_none(summary.get(f"{i}__min")),
+                "max": _string_or_none(summary.get(f"{i}__max")),
+                "min_numeric": summary.get(f"{i}__nmin"),
+                "max_numeric": summary.get(f"{i}__nmax"),
+                "top_k": _counts(counts.head(top_k)) if counts is not None else None,
+                "dictionary": _counts(counts) if complete else None,
+                "histogram": histogram,
+            }
+        )
+    return pl.DataFrame(records, schema=CATALOG_SCHEMA)
+
+
+def read_column_stats(path: str, storage_options: dict | None = None) -> dict[str, dict[str, Any]]:
+    """``{column: stats}`` from a catalog file."""
+    frame = pl.read_parquet(path, storage_options=storage_options)
+    return {row["column"]: row for row in frame.iter_rows(named=True)}
+
+
+def write_column_stats(
+    delta_table_location: str,
+    storage_options: dict | None = None,
+    frame: pl.DataFrame | pl.LazyFrame | None = None,
+) -> str:
+    """Compute and write the catalog of the table's current version; returns its path.
+
+    ``frame`` is the data just written, when the caller still holds it — the
+    stats then come from memory instead of a re-read of the table.
+    """
+    import os
+
+    from deltalake import DeltaTable
+
+    version = DeltaTable(delta_table_location, storage_options=storage_options).version()
+    source = (
+        frame.lazy()
+        if frame is not None
+        else pl.scan_delta(delta_table_location, storage_options=storage_options)
+    )
+    path = stats_sidecar_path(delta_table_location, version)
+    if "://" not in path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    compute_column_stats(source).write_parquet(path, storage_options=storage_options)
+    return path
@@ -0,0 +1,52 @@
+"""Which rows a Delta table gained between two versions, when it only gained rows.
+
+Incremental work over a Delta table — re-joining only the rows appended to a
+join's sources (``depictio.cli.cli.utils.joins``), placing appended samples on
+a persisted embedding (``depictio.api.v1.services.embedding_cache``) — holds
+only while every commit in between was a plain append: then the table at the
+later version is the table at the earlier one plus the files those commits
+added. This module answers both halves of that from the Delta log, and is
+shared by the CLI and the API.
+"""
+
+from __future__ import annotations
+
+
+def only_appended(path: str, since: int, version: int, storage_options: dict) -> bool:
+    """Whether every commit after ``since`` up to ``version`` was a plain append.
+
+    Then the table at ``version`` is the table at ``since`` plus the rows of the
+    files those commits added. A delete, overwrite, merge or OPTIMIZE (which
+    rewrites existing rows into new files) breaks that.
+    """
+    from deltalake import DeltaTable
+
+    try:
+        history = DeltaTable(path, storage_options=storage_options).history(limit=version - since)
+    except Exception:
+        return False
+    commits = [c for c in history if since < c.get("version", since + 1) <= version]
+    return len(commits) == version - since and all(
+        c.get("operation") == "WRITE"
+        and str((c.get("operationParameters") or {}).get("mode", "")).lower() == "append"
+        for c in commits
+    )
+
+
+def appended_files(
+    path: str, since: int, version: int, storage_options: dict
+) -> list[str] | None:
+    """The data files added between ``since`` and ``version``, if only appends happened.
+
+    ``None`` when a commit in between was anything but an append, or when a
+    file of ``since`` is gone by ``version``.
+    """
+    from deltalake import DeltaTable
+
+    if not only_appended(path, since, version, storage_options):
+        return None
+    before = set(DeltaTable(path, version=since, storage_options=storage_options).file_uris())
+    after = set(DeltaTable(path, version=version, storage_options=storage_options).file_uris())
+    if not before <= after:
+        return None
+    return sorted(after - before)
@@ -1,10 +1,20 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
 from depictio.models.models.base import MongoModel, PyObjectId
 from depictio.models.models.users import UserBase
 
+# Column recording which registered file (its ``file_hash``) each row came
+# from, written by the CLI in incremental mode only. It is what lets a re-ingest
+# delete one file's rows instead of rewriting the table.
+SOURCE_HASH_COLUMN = "depictio_source_hash"
+
+# Bookkeeping columns a Delta table may carry that are not data: loaders drop
+# them, and column specs, the column catalog and sort indexes leave them out.
+HIDDEN_COLUMNS = ("depictio_aggregation_time", SOURCE_HASH_COLUMN)
+
 
 class DeltaTableColumn(BaseModel):
     name: str
@@ -81,8 +91,65 @@ class DeltaTableAggregated(MongoModel):
     aggregation: list[Aggregation] = []
 
 
+class IngestDelta(BaseModel):
+    """What one CLI write changed in a Delta table (sent with the upsert)."""
+
+    class Config:
+        extra = "forbid"
+
+    mode: Literal["full", "incremental"] = "full"
+    files_added: int = Field(default=0, ge=0)
+    files_removed: int = Field(default=0, ge=0)
+    rows_added: int = Field(default=0, ge=0)
+    rows_removed: int = Field(default=0, ge=0)
+
+
 class UpsertDeltaTableAggregated(BaseModel):
     data_collection_id: PyObjectId
     delta_table_location: str
     update: bool = False
     deltatable_size_bytes: int | None = None
+    ingest: IngestDelta | None = None
+
+
+class FacetTarget(BaseModel):
+    """One (data collection, column) whose remaining values a facets request asks for."""
+
+    class Config:
+        extra = "forbid"
+
+    dc_id: str = Field(..., description="Data collection to read the column from")
+    column: str = Field(..., description="Column whose values and counts to return")
+    exclude_dc_id: str | None = Field(
+        default=None,
+        description=(
+            "The facet's own filter is the one on `column` of this DC (default: "
+            "`dc_id`). It is left out, so a facet lists what *else* could be "
+            "selected rather than echoing the current selection."
+        ),
+    )
+
+
+class FacetsRequest(BaseModel):
+    """Body of ``POST /deltatables/facets``."""
+
+    class Config:
+        extra = "forbid"
+
+    project_id: str = Field(..., description="Project owning every facet DC and its links")
+    filters: list[dict] = Field(
+        default_factory=list,
+        description="Current interactive filter state, in the shape the render endpoints take",
+    )
+    facets: list[FacetTarget] = Field(..., min_length=1, max_length=64)
+    limit: int = Field(
+        default=1000,
+        ge=0,
+        le=10_000,
+        description="Values returned per facet; 0 returns only the facet totals",
+    )
+    intersect: bool = Field(
+        default=False,
+        description="Also return the values present in every facet that has any",
+    )
+    intersection_limit: int = Field(default=10_000, ge=1, le=100_000)
@@ -215,6 +215,14 @@ class JoinDefinition(BaseModel):
         default=None,
         description="Size of the Delta table in bytes",
     )
+    left_dc_version: int | None = Field(
+        default=None,
+        description="Delta version of the left data collection the table was joined from",
+    )
+    right_dc_version: int | None = Field(
+        default=None,
+        description="Delta version of the right data collection the table was joined from",
+    )
 
     model_config = ConfigDict(extra="allow", use_enum_values=True)
 
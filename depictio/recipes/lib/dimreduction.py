@@ -13,24 +13,43 @@ sample id) OR a precomputed distance matrix for PCoA. Recipes typically
 load the count/abundance table, pivot if needed, then call one of these.
 
 These are pure functions — safe to import from a Celery task body later
-without rewiring.
+without rewiring. ``fit_pca`` also returns the fitted model, whose
+``transform`` places samples that arrive later onto the same axes (see
+:func:`transform_embedding`).
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 import polars as pl
 
+# sklearn's PCA switches to a randomized solver past this many samples or
+# features; below it a full SVD is already fast.
+_RANDOMIZED_SVD_MIN_DIM = 500
+
+
+def _split_sample_ids(
+    matrix: pl.DataFrame, dtype: type = np.float64
+) -> tuple[list[str], np.ndarray]:
+    """Split a wide matrix into (sample_ids, numeric ndarray).
 
-def _split_sample_ids(matrix: pl.DataFrame) -> tuple[list[str], np.ndarray]:
-    """Split a wide matrix into (sample_ids, numeric ndarray)."""
+    The features are cast by Polars and exported once, column-major as LAPACK
+    wants them, instead of exported and then copied. float32 is what UMAP works
+    in anyway and halves the footprint of a wide matrix, so UMAP and
+    :func:`fit_pca` ask for it; everything else keeps float64. The array is
+    writable, so callers may centre and scale it in place.
+    """
     if matrix.is_empty():
         raise ValueError("dim-reduction: input matrix is empty")
     sample_col = matrix.columns[0]
     sample_ids = matrix[sample_col].cast(pl.Utf8).to_list()
-    numeric = matrix.drop(sample_col).to_numpy().astype(np.float64, copy=False)
+    target = pl.Float32 if dtype == np.float32 else pl.Float64
+    features = matrix.drop(sample_col)
+    numeric = features.select(pl.all().cast(target)).to_numpy(writable=True)
     if np.isnan(numeric).any():
-        numeric = np.nan_to_num(numeric, nan=0.0)
+        np.nan_to_num(numeric, copy=False, nan=0.0)
     return sample_ids, numeric
 
 
@@ -46,23 +65,86 @@ def _to_dataframe(sample_ids: list[str], coords: np.ndarray) -> pl.DataFrame:
     )
 
 
+@dataclass(frozen=True)
+class PCAModel:
+    """The centring, scaling and axes of a fitted PCA."""
+
+    mean: np.ndarray
+    scale: np.ndarray
+    components: np.ndarray  # (n_components, n_features)
+
+    def transform(self, x: np.ndarray) -> np.ndarray:
+        return ((x - self.mean) / self.scale) @ self.components.T
+
+
+def _top_components(
+    x: np.ndarray, n_components: int, random_state: int, exact: bool = False
+) -> np.ndarray:
+    """The leading right singular vectors of the centred matrix ``x``.
+
+    A full SVD of an n×p matrix costs O(n·p·min(n, p)) and computes every
+    component only to keep two or three. Past a few hundred samples or features
+    the randomized range finder (Halko et al.) gets the leading ones in
+    O(n·p·k), which is what sklearn's PCA does under ``svd_solver="auto"``.
+    ``exact`` keeps the full SVD regardless.
+    """
+    n, p = x.shape
+    if not exact and max(n, p) > _RANDOMIZED_SVD_MIN_DIM and n_components < 0.8 * min(n, p):
+        from sklearn.utils.extmath import randomized_svd
+
+        _, _, vt = randomized_svd(x, n_components, random_state=random_state)
+        return vt
+    _, _, vt = np.linalg.svd(x, full_matrices=False)
+    return vt[:n_components]
+
+
+def _pca(
+    sample_ids: list[str],
+    x: np.ndarray,
+    n_components: int,
+    scale: bool,
+    random_state: int,
+    exact: bool,
+) -> tuple[pl.DataFrame, PCAModel]:
+    mean = x.mean(axis=0)
+    std = x.std(axis=0, ddof=0) if scale else np.ones_like(mean)
+    std[std == 0.0] = 1.0
+    x -= mean
+    x /= std
+    vt = _top_components(x, n_components, random_state, exact=exact)
+    coords = x @ vt.T
+    return _to_dataframe(sample_ids, coords), PCAModel(mean, std, vt)
+
+
+def fit_pca(
+    matrix: pl.DataFrame,
+    n_components: int = 2,
+    scale: bool = True,
+    random_state: int = 42,
+) -> tuple[pl.DataFrame, PCAModel]:
+    """PCA for large matrices, also returning the fitted :class:`PCAModel`.
+
+    Unlike :func:`run_pca` it works in float32 and takes the randomized solver
+    past ``_RANDOMIZED_SVD_MIN_DIM`` samples or features, so its coordinates
+    agree with :func:`run_pca`'s to float32 precision and up to the sign of
+    each axis, not bit for bit.
+    """
+    sample_ids, x = _split_sample_ids(matrix, dtype=np.float32)
+    return _pca(sample_ids, x, n_components, scale, random_state, exact=False)
+
+
 def run_pca(
     matrix: pl.DataFrame,
     n_components: int = 2,
     scale: bool = True,
 ) -> pl.DataFrame:
-    """Principal Component Analysis on a wide sample×feature matrix."""
+    """Principal Component Analysis on a wide sample×feature matrix.
+
+    float64 and a full SVD, whatever the matrix size; see :func:`fit_pca` for
+    the faster approximation.
+    """
     sample_ids, x = _split_sample_ids(matrix)
-    if scale:
-        std = x.std(axis=0, ddof=0)
-        std[std == 0.0] = 1.0
-        x = (x - x.mean(axis=0)) / std
-    else:
-        x = x - x.mean(axis=0)
-    # Use SVD directly to avoid pinning a sklearn version.
-    _, _, vt = np.linalg.svd(x, full_matrices=False)
-    coords = x @ vt[:n_components].T
-    return _to_dataframe(sample_ids, coords)
+    return _pca(sample_ids, x, n_components, scale, random_state=0, exact=True)[0]
 
 
 def run_umap(
@@ -76,7 +158,7 @@ def run_umap(
     """UMAP via the umap-learn library (already a project dependency)."""
     import umap
 
-    sample_ids, x = _split_sample_ids(matrix)
+    sample_ids, x = _split_sample_ids(matrix, dtype=np.float32)
     # Cap n_neighbors at n_samples - 1 to avoid UMAP errors on tiny matrices.
     n_neighbors = max(2, min(n_neighbors, x.shape[0] - 1))
     reducer = umap.UMAP(
@@ -90,6 +172,17 @@ def run_umap(
     return _to_dataframe(sample_ids, coords)
 
 
+def transform_embedding(model: PCAModel, matrix: pl.DataFrame) -> pl.DataFrame:
+    """Place new samples onto an existing PCA fit.
+
+    The samples already fitted keep their coordinates; the new ones land where
+    the fit would put them, without re-running it. UMAP, t-SNE and PCoA are
+    refitted instead.
+    """
+    sample_ids, x = _split_sample_ids(matrix, dtype=np.float32)
+    return _to_dataframe(sample_ids, np.asarray(model.transform(x)))
+
+
 def run_tsne(
     matrix: pl.DataFrame,
     perplexity: float = 30.0,
@@ -8,6 +8,15 @@ from depictio.models.models.base import PyObjectId
 from depictio.models.models.users import User
 
 
+@pytest.fixture(autouse=True)
+def backup_dir(tmp_path, monkeypatch):
+    """Write backups under tmp_path, not into the package's default backups/ dir."""
+    from depictio.api.v1.configs.config import settings
+
+    monkeypatch.setattr(settings.backup, "base_dir", tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def client():
     """Create test client for backup endpoints."""
@@ -0,0 +1,80 @@
+"""Tests for RegexResolver / WildcardResolver — the sorted prefix index.
+
+Both resolvers used to loop over every source value and test it against every
+target value. They now answer from targets sorted once (``_TargetIndex``). The
+output contract is what the loops produced, so these tests compare against a
+copy of the loops on random data: same resolved values in the same order, same
+unmapped values.
+"""
+
+import fnmatch
+import random
+import re
+
+import pytest
+
+from depictio.api.v1.endpoints.links_endpoints.resolvers import RegexResolver, WildcardResolver
+from depictio.models.models.links import LinkConfig
+
+
+def _loop_regex(source, targets, case_sensitive):
+    flags = 0 if case_sensitive else re.IGNORECASE
+    resolved, unmapped = [], []
+    for val in source:
+        compiled = re.compile(f"^{re.escape(str(val))}.*$", flags)
+        matches = [tv for tv in targets if compiled.match(tv)]
+        if matches:
+            resolved.extend(matches)
+        else:
+            unmapped.append(str(val))
+    return list(dict.fromkeys(resolved)), unmapped
+
+
+def _loop_wildcard(source, targets):
+    resolved, unmapped = [], []
+    for val in source:
+        matches = fnmatch.filter(targets, f"{val}*")
+        if matches:
+            resolved.extend(matches)
+        else:
+            unmapped.append(str(val))
+    return list(dict.fromkeys(resolved)), unmapped
+
+
+def _data(seed):
+    rng = random.Random(seed)
+    stems = [f"{rng.choice(['S', 's', 'HG', 'hg'])}{rng.randint(1, 60)}" for _ in range(40)]
+    targets = [f"{rng.choice(stems)}_{rng.choice(['R1', 'r2', 'L001'])}.bam" for _ in range(500)]
+    targets += stems[:5]  # exact matches and duplicates
+    source = stems[::3] + ["missing", "S1", "S1"]
+    return source, targets
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_regex_matches_the_per_value_loop(seed, case_sensitive):
+    source, targets = _data(seed)
+    config = LinkConfig(resolver="regex", case_sensitive=case_sensitive)
+    assert RegexResolver().resolve(source, config, targets) == _loop_regex(
+        source, targets, case_sensitive
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_wildcard_matches_the_per_value_loop(seed):
+    source, targets = _data(seed)
+    config = LinkConfig(resolver="wildcard")
+    assert WildcardResolver().resolve(source, config, targets) == _loop_wildcard(source, targets)
+
+
+def test_wildcard_values_that_are_globs_still_glob():
+    targets = ["S1_R1.bam", "S1_R2.bam", "S12_R1.bam", "S2_R1.bam", "[x]"]
+    source = ["S1_R?", "S*_R1", "[x", "S2"]
+    config = LinkConfig(resolver="wildcard")
+    assert WildcardResolver().resolve(source, config, targets) == _loop_wildcard(source, targets)
+
+
+def test_regex_metacharacters_are_literal():
+    targets = ["a.b_1", "axb_1", "a+b"]
+    config = LinkConfig(resolver="regex", case_sensitive=True)
+    assert RegexResolver().resolve(["a.b", "a+"], config, targets) == (["a.b_1", "a+b"], [])
@@ -0,0 +1,153 @@
+"""Tag-indexed invalidation in ``depictio.api.cache.SimpleCache``.
+
+The Redis client is a small in-memory fake that records which commands ran.
+What is pinned: a write indexes its key under the ObjectIds in it (and any
+explicit tags), invalidating a DC reads that one set instead of walking the
+keyspace, the substring contract of ``delete_pattern`` still holds, and
+``KEYS`` is never issued.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from unittest.mock import patch
+
+import pytest
+
+from depictio.api import cache as cache_module
+from depictio.api.cache import SimpleCache, key_tags
+
+pytestmark = pytest.mark.no_db
+
+DC = "64b7f0c2a1b2c3d4e5f60718"
+OTHER_DC = "64b7f0c2a1b2c3d4e5f60799"
+DASHBOARD = "650000000000000000000001"
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.commands: list[str] = []
+
+    def _log(self, name: str) -> None:
+        self.commands.append(name)
+
+    def setex(self, key, ttl, value):
+        self._log("setex")
+        self.values[key], self.ttls[key] = value, ttl
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def sadd(self, key, *members):
+        self._log("sadd")
+        self.sets.setdefault(key, set()).update(members)
+
+    def srem(self, key, *members):
+        self._log("srem")
+        self.sets.get(key, set()).difference_update(members)
+
+    def smembers(self, key):
+        self._log("smembers")
+        return set(self.sets.get(key, set()))
+
+    def expire(self, key, ttl, nx=False, gt=False):
+        current = self.ttls.get(key)
+        if (nx and current is None) or (gt and current is not None and ttl > current):
+            self.ttls[key] = ttl
+
+    def unlink(self, *keys):
+        self._log("unlink")
+        removed = 0
+        for key in keys:
+            removed += int(self.values.pop(key, None) is not None)
+            removed += int(self.sets.pop(key, None) is not None)
+        return removed
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def scan_iter(self, match=None, count=None):
+        self._log("scan")
+        return [k for k in list(self.values) if fnmatch.fnmatchcase(k, match)]
+
+    def keys(self, pattern):  # pragma: no cover - must never be reached
+        raise AssertionError("KEYS issued")
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis, self.calls = redis, []
+
+    def __getattr__(self, name):
+        return lambda *a, **kw: self.calls.append((name, a, kw))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*a, **kw) for name, a, kw in self.calls]
+
+
+@pytest.fixture
+def cache() -> SimpleCache:
+    with patch.object(SimpleCache, "_init_redis", lambda self: None):
+        instance = SimpleCache()
+    instance._redis = _FakeRedis()
+    instance._redis_available = True
+    # Pre-index keys already backfilled: indexed invalidation need not scan.
+    instance._redis.values[cache_module._TAG_INDEX_READY_KEY] = b"1"
+    return instance
+
+
+def test_object_ids_in_a_key_become_its_tags() -> None:
+    key = f"wf_{DC}_filters_0123456789abcdef0123456789abcdef"
+    # The 32-hex digest is not an ObjectId and must not be split into one.
+    assert key_tags(key) == {DC}
+
+
+def test_dc_invalidation_reads_the_tag_set_not_the_keyspace(cache: SimpleCache) -> None:
+    cache.set(f"multiqc:figure:dc={DC}:aaa", {"fig": 1})
+    cache.set(f"wf_{DC}_base", {"rows": 1})
+    cache.set(f"multiqc:figure:dc={OTHER_DC}:bbb", {"fig": 2})
+    redis = cache._redis
+    redis.commands.clear()
+
+    # Substring contract: only keys containing the literal ``dc=<id>``.
+    assert cache.delete_pattern(f"dc={DC}") == 1
+    assert "scan" not in redis.commands
+    assert cache.get(f"wf_{DC}_base") == {"rows": 1}
+
+    assert cache.delete_pattern(DC) == 1
+    assert cache.get(f"multiqc:figure:dc={OTHER_DC}:bbb") == {"fig": 2}
+    assert "scan" not in redis.commands
+
+
+def test_explicit_tags_reach_keys_that_do_not_name_them(cache: SimpleCache) -> None:
+    cache.set("layout_preview_x", {"v": 1}, tags=[DASHBOARD])
+    assert cache.invalidate_tags(DASHBOARD) == 1
+    assert cache.get("layout_preview_x") is None
+
+
+def test_legacy_keys_are_scanned_until_the_index_is_ready(cache: SimpleCache) -> None:
+    prefix = cache.cache_config.cache_key_prefix
+    # Written by a process that predates the index: no tag set entry.
+    cache._redis.values[f"{prefix}multiqc:figure:dc={DC}:old"] = b"x"
+    del cache._redis.values[cache_module._TAG_INDEX_READY_KEY]
+
+    assert cache.delete_pattern(f"dc={DC}") == 1
+    assert "scan" in cache._redis.commands
+
+
+def test_project_invalidation_drops_its_link_resolutions(cache: SimpleCache) -> None:
+    from depictio.api.v1.filter_links import _LINK_CACHE_PREFIX
+
+    project = "650000000000000000000002"
+    cache.set(f"{_LINK_CACHE_PREFIX}{project}_{DC}_{OTHER_DC}_h1_h2_col_digest", {"v": 1})
+    cache.set(f"facets_{project}_digest", {"facets": []}, tags=[DC])
+    with patch.object(cache_module, "get_cache", lambda: cache):
+        # What the link and project write paths call.
+        assert cache_module.invalidate_cache_tags(project) == 2
+    assert cache.get(f"facets_{project}_digest") is None
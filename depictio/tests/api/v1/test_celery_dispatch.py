@@ -0,0 +1,233 @@
+"""Contract for ``celery_dispatch.offload_or_run`` on the offload path.
+
+The worker and the broker are replaced by fakes: a task whose result becomes
+ready after a delay, and a completion listener whose notice the test fires by
+hand. What is pinned is the waiting behaviour — a notice wakes the request at
+once, a lost notice is still caught by the fallback check, and the timeout
+still revokes — and the admission and supersession rules in front of it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from depictio.api.v1 import celery_dispatch, celery_notify
+
+pytestmark = pytest.mark.no_db
+
+
+class _AsyncResult:
+    def __init__(self, ready_at: float):
+        self.ready_at = ready_at
+        self.ready_calls = 0
+        self.revoked = False
+
+    def ready(self) -> bool:
+        self.ready_calls += 1
+        return time.monotonic() >= self.ready_at
+
+    @property
+    def state(self) -> str:
+        return "REVOKED" if self.revoked else "SUCCESS"
+
+    def failed(self) -> bool:
+        return False
+
+    def get(self, timeout=None):
+        return {"ok": True}
+
+    def revoke(self, terminate=False):
+        self.revoked = True
+
+
+class _Task:
+    name = "depictio.test"
+
+    def __init__(self, runtime: float):
+        self.runtime = runtime
+        self.result: _AsyncResult | None = None
+        self.task_id: str | None = None
+
+    def apply_async(self, args, task_id=None, queue=None):
+        self.task_id = task_id
+        self.queue = queue
+        self.result = _AsyncResult(time.monotonic() + self.runtime)
+        return self.result
+
+
+class _Listener:
+    """Hands out real futures; ``deliver`` plays the worker's PUBLISH."""
+
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.futures: dict[str, asyncio.Future] = {}
+
+    async def register(self, task_id):
+        if not self.available:
+            return None
+        self.futures[task_id] = asyncio.get_running_loop().create_future()
+        return self.futures[task_id]
+
+    def discard(self, task_id):
+        self.futures.pop(task_id, None)
+
+    def deliver(self, task_id):
+        self.futures[task_id].set_result(None)
+
+
+def _run(task, listener, *, timeout=5.0, fallback=10.0, deliver_after: float | None = None):
+    async def _main():
+        call = asyncio.ensure_future(
+            celery_dispatch.offload_or_run(task, (), offload=True, timeout=timeout)
+        )
+        if deliver_after is not None:
+            await asyncio.sleep(deliver_after)
+            listener.deliver(task.task_id)
+        return await call
+
+    with (
+        patch.object(celery_notify, "completion_listener", listener),
+        patch.object(celery_dispatch, "_queue_depth", lambda queue: 0),
+        patch.object(celery_dispatch.settings.celery, "result_fallback_poll_seconds", fallback),
+    ):
+        return asyncio.run(_main())
+
+
+def test_notice_wakes_the_request_without_polling() -> None:
+    task, listener = _Task(runtime=0.05), _Listener()
+    started = time.monotonic()
+    assert _run(task, listener, deliver_after=0.06) == {"ok": True}
+
+    # Far below the 10 s fallback: the notice, not a timer, ended the wait.
+    assert time.monotonic() - started < 1.0
+    # Once before waiting, once after the notice — no polling in between.
+    assert task.result.ready_calls == 2
+    # The waiter is dropped once the request is done with it.
+    assert listener.futures == {}
+
+
+def test_a_lost_notice_is_caught_by_the_fallback_check() -> None:
+    task, listener = _Task(runtime=0.05), _Listener()
+    assert _run(task, listener, fallback=0.1) == {"ok": True}
+
+
+def test_without_a_listener_it_polls() -> None:
+    task = _Task(runtime=0.05)
+    assert _run(task, _Listener(available=False)) == {"ok": True}
+    assert task.result.ready_calls > 1
+
+
+def test_timeout_still_revokes() -> None:
+    task, listener = _Task(runtime=60.0), _Listener()
+    with pytest.raises(HTTPException) as exc:
+        _run(task, listener, timeout=0.2, fallback=0.05)
+    assert exc.value.status_code == 504
+    assert task.result.revoked
+
+
+@pytest.mark.parametrize(
+    ("depth", "admitted"),
+    [
+        (0, True),
+        # 2 slots at the 3 s points prior: 18 queued is 10 waves, 30 s — at the limit.
+        (18, True),
+        (20, False),
+    ],
+)
+def test_admission_prices_the_backlog(depth: int, admitted: bool) -> None:
+    with (
+        patch.object(celery_dispatch, "_queue_depth", lambda queue: depth),
+        patch.object(celery_dispatch, "_runtime_ms", {}),
+        patch.object(celery_dispatch.settings.celery, "cost_class_queues", True),
+    ):
+        if admitted:
+            assert celery_dispatch.admit("points", 30.0) == depth
+            return
+        with pytest.raises(HTTPException) as exc:
+            celery_dispatch.admit("points", 30.0)
+    assert exc.value.status_code == 503
+    assert int(exc.value.headers["Retry-After"]) >= 1
+
+
+def test_unknown_depth_is_admitted() -> None:
+    with patch.object(celery_dispatch, "_queue_depth", lambda queue: None):
+        assert celery_dispatch.admit("code", 0.001) is None
+
+
+def test_tasks_go_to_their_cost_class_queue() -> None:
+    task = _Task(runtime=0.0)
+    with patch.object(celery_dispatch.settings.celery, "cost_class_queues", True):
+
+        async def _main():
+            with patch.object(celery_notify, "completion_listener", _Listener(available=False)):
+                return await celery_dispatch.offload_or_run(
+                    task, (), offload=True, cost_class="code"
+                )
+
+        with patch.object(celery_dispatch, "_queue_depth", lambda queue: 0):
+            asyncio.run(_main())
+    assert task.queue == "render.code"
+
+
+class _Cache(dict):
+    def set(self, key, value, ttl=None):
+        self[key] = value
+
+
+def test_a_newer_generation_revokes_the_older_task() -> None:
+    cache, revoked = _Cache(), []
+
+    class _Result:
+        def __init__(self, task_id):
+            self.task_id = task_id
+
+        def revoke(self, terminate=False):
+            revoked.append(self.task_id)
+
+    with (
+        patch("depictio.api.cache.get_cache", return_value=cache),
+        patch("celery.result.AsyncResult", _Result),
+    ):
+        celery_dispatch.supersede("tab:cid", 1, "task-1")
+        celery_dispatch.supersede("tab:cid", 1, "task-1")  # same generation: no-op
+        assert revoked == []
+        celery_dispatch.supersede("tab:cid", 2, "task-2")
+        assert revoked == ["task-1"]
+        # A request older than the recorded generation is refused outright.
+        with pytest.raises(HTTPException) as exc:
+            celery_dispatch.supersede("tab:cid", 1, "task-3")
+    assert exc.value.status_code == 409
+
+
+def test_admission_and_supersede_run_off_the_event_loop() -> None:
+    """Both talk to Redis; on the loop they would stall every other request."""
+    import threading
+
+    threads: dict[str, int] = {}
+
+    def admit(cost_class, timeout):
+        threads["admit"] = threading.get_ident()
+        return 0
+
+    def supersede(key, generation, task_id):
+        threads["supersede"] = threading.get_ident()
+
+    async def _main():
+        with patch.object(celery_notify, "completion_listener", _Listener(available=False)):
+            await celery_dispatch.offload_or_run(
+                _Task(runtime=0.0), (), offload=True, supersede_key=("tab:cid", 1)
+            )
+        return threading.get_ident()
+
+    with (
+        patch.object(celery_dispatch, "admit", admit),
+        patch.object(celery_dispatch, "supersede", supersede),
+    ):
+        loop_thread = asyncio.run(_main())
+    assert set(threads) == {"admit", "supersede"}
+    assert loop_thread not in threads.values()
@@ -0,0 +1,200 @@
+"""Tests for ``services.facets`` — the ``POST /deltatables/facets`` computation.
+
+A facet is the values (and row counts) of one column of one DC under every
+active filter except its own. These pin the exclusion rule, the counting, the
+one-scan-per-DC planning and the intersection the viewer greys options from —
+including that an unanswerable facet never vetoes values and an answered empty
+one does.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from depictio.api.v1 import deltatables_utils
+from depictio.api.v1.endpoints.dashboards_endpoints import routes as dashboard_routes
+from depictio.api.v1.services import facets
+from depictio.models.models.deltatables import FacetsRequest, FacetTarget
+
+pytestmark = pytest.mark.no_db
+
+PROJECT = "507f1f77bcf86cd799439011"
+WF = "507f1f77bcf86cd799439013"
+META = "507f1f77bcf86cd799439014"
+DATA = "507f1f77bcf86cd799439015"
+
+FRAMES = {
+    META: pl.DataFrame(
+        {
+            "sample": ["s1", "s2", "s3", "s4"],
+            "habitat": ["river", "river", "lake", "sea"],
+        }
+    ),
+    DATA: pl.DataFrame({"sample": ["s1", "s1", "s2", "s3", "s9"], "reads": [1, 2, 3, 4, 5]}),
+}
+DCS = {
+    META: {"workflow_id": WF, "type": "table"},
+    DATA: {"workflow_id": WF, "type": "table"},
+}
+
+
+def _filter(dc_id, column, value):
+    return {
+        "index": f"{dc_id}-{column}",
+        "value": value,
+        "metadata": {
+            "dc_id": dc_id,
+            "column_name": column,
+            "interactive_component_type": "MultiSelect",
+        },
+    }
+
+
+def _run(request: FacetsRequest) -> tuple[dict, list[dict]]:
+    scans: list[dict] = []
+
+    def open_scan(**kwargs):
+        scans.append(kwargs)
+        return FRAMES[kwargs["data_collection_id"]].lazy()
+
+    def init_entry(dc_id, dc_type):
+        return {"delta_location": f"s3://b/{dc_id}", "dc_type": dc_type, "aggregation_version": 1}
+
+    with (
+        patch.object(deltatables_utils, "open_deltatable_scan", open_scan),
+        patch.object(facets, "_init_entry", init_entry),
+        # No links in these fixtures: the resolved list is the input list.
+        patch.object(
+            dashboard_routes, "_resolve_link_filters_cached", lambda filters, **_: list(filters)
+        ),
+    ):
+        return facets.compute_facets(request, DCS, access_token=None), scans
+
+
+def test_own_filter_is_left_out():
+    request_filters = [_filter(META, "habitat", ["river"]), _filter(META, "sample", ["s1"])]
+    facet = FacetTarget(dc_id=META, column="habitat")
+    assert facets._other_filters(request_filters, facet) == [request_filters[1]]
+    # ``exclude_dc_id`` names the DC whose filter counts as the facet's own.
+    facet = FacetTarget(dc_id=DATA, column="sample", exclude_dc_id=META)
+    assert facets._other_filters(request_filters, facet) == [request_filters[0]]
+
+
+@pytest.mark.parametrize("value", [0, False, 0.0, ["river"], "s1"])
+def test_falsy_values_are_active_filters(value):
+    assert facets._is_active(_filter(META, "reads", value))
+
+
+@pytest.mark.parametrize("value", [None, [], "", [None, None]])
+def test_empty_values_are_not(value):
+    assert not facets._is_active(_filter(META, "reads", value))
+
+
+@pytest.mark.parametrize(
+    ("component_type", "value", "expected"),
+    [
+        ("Slider", 0, [0]),
+        ("Select", False, [False]),
+        ("SegmentedControl", 0, [0]),
+        ("Slider", None, [0, 1, 2]),
+        ("MultiSelect", [], [0, 1, 2]),
+        ("RangeSlider", [None, None], [0, 1, 2]),
+    ],
+)
+def test_render_filters_apply_exactly_the_active_values(component_type, value, expected):
+    # The facets endpoint reports values under the filters the render applies.
+    column = "flag" if component_type == "Select" else "reads"
+    df = pl.DataFrame({"reads": [0, 1, 2], "flag": [False, True, True]})
+    filter_list: list = []
+    deltatables_utils.add_filter(filter_list, component_type, column, value)
+    assert bool(filter_list) == facets._is_active(_filter(META, column, value))
+    out = df.filter(filter_list) if filter_list else df
+    assert out[column].to_list() == expected
+
+
+def test_values_read_like_unique_values():
+    payload, _ = _run(
+        FacetsRequest(project_id=PROJECT, facets=[FacetTarget(dc_id=DATA, column="reads")])
+    )
+    # ``str`` of the scanned value, as the catalog and ``/unique_values`` list it.
+    assert [v["value"] for v in payload["facets"][0]["values"]] == ["1", "2", "3", "4", "5"]
+    assert facets._listed(pl.DataFrame({"value": [True], "count": [1]}))["value"][0] == "True"
+
+
+def test_values_are_counted_under_the_other_filters():
+    payload, _ = _run(
+        FacetsRequest(
+            project_id=PROJECT,
+            filters=[_filter(META, "habitat", ["river"])],
+            facets=[
+                FacetTarget(dc_id=META, column="sample"),
+                FacetTarget(dc_id=META, column="habitat"),
+            ],
+        )
+    )
+    sample, habitat = payload["facets"]
+    assert [v["value"] for v in sample["values"]] == ["s1", "s2"]
+    # The habitat facet ignores the habitat filter, so every habitat is offered.
+    assert habitat["values"] == [
+        {"value": "river", "count": 2},
+        {"value": "lake", "count": 1},
+        {"value": "sea", "count": 1},
+    ]
+    assert payload["intersection"] is None
+
+
+def test_facets_on_one_dc_share_one_scan():
+    _, scans = _run(
+        FacetsRequest(
+            project_id=PROJECT,
+            facets=[
+                FacetTarget(dc_id=META, column="sample"),
+                FacetTarget(dc_id=META, column="habitat"),
+                FacetTarget(dc_id=DATA, column="sample"),
+            ],
+        )
+    )
+    assert sorted(s["data_collection_id"] for s in scans) == [META, DATA]
+
+
+def test_limit_truncates_but_reports_the_total():
+    payload, _ = _run(
+        FacetsRequest(
+            project_id=PROJECT, facets=[FacetTarget(dc_id=DATA, column="sample")], limit=1
+        )
+    )
+    facet = payload["facets"][0]
+    assert facet["values"] == [{"value": "s1", "count": 2}]
+    assert facet["total_values"] == 4 and facet["truncated"]
+
+
+def test_intersection_skips_unanswerable_facets():
+    payload, _ = _run(
+        FacetsRequest(
+            project_id=PROJECT,
+            facets=[
+                FacetTarget(dc_id=META, column="sample"),
+                FacetTarget(dc_id=DATA, column="sample"),
+                FacetTarget(dc_id=DATA, column="habitat"),  # not a column of DATA
+            ],
+            intersect=True,
+        )
+    )
+    assert payload["facets"][2]["available"] is False
+    assert payload["intersection"] == {
+        "values": ["s1", "s2", "s3"],
+        "total_values": 3,
+        "truncated": False,
+    }
+
+
+def test_an_emptied_facet_vetoes_every_value():
+    emptied = pl.DataFrame({"value": []}, schema={"value": pl.String})
+    assert facets._intersection([pl.DataFrame({"value": ["a", "b"]}), emptied], 10) == {
+        "values": [],
+        "total_values": 0,
+        "truncated": False,
+    }
@@ -0,0 +1,129 @@
+"""Tests for the single-pass figure encoder (``services/figure/encoding``).
+
+What matters is that the encoded figure is the *same figure*: every packed
+array must decode back to the values it replaced (exactly, or within the
+float32 allowance where that applies), and anything that isn't a numeric data
+array must come through untouched.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from depictio.api.v1.services.figure.encoding import (
+    encode_figure,
+    figure_response_bytes,
+    pack_typed_arrays,
+)
+
+pytestmark = pytest.mark.no_db
+
+_VIEWS = {
+    "i1": "<i1",
+    "u1": "<u1",
+    "i2": "<i2",
+    "u2": "<u2",
+    "i4": "<i4",
+    "u4": "<u4",
+    "f4": "<f4",
+    "f8": "<f8",
+}
+
+
+def _decode(spec: dict) -> np.ndarray:
+    arr = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=_VIEWS[spec["dtype"]])
+    if "shape" in spec:
+        arr = arr.reshape([int(n) for n in spec["shape"].split(",")])
+    return arr
+
+
+def _trace(**fields) -> dict:
+    return pack_typed_arrays({"data": [fields], "layout": {}})["data"][0]
+
+
+@pytest.mark.parametrize(
+    ("values", "dtype"),
+    [
+        (np.arange(200) % 100, "u1"),
+        (np.arange(200) - 100, "i1"),
+        (np.arange(200) * 1000, "i4"),
+        # Integral floats (a count column read as float) are integers on the wire.
+        (np.arange(200, dtype=float), "u1"),
+    ],
+)
+def test_integers_take_the_narrowest_dtype(values: np.ndarray, dtype: str) -> None:
+    spec = _trace(y=values)["y"]
+    assert spec["dtype"] == dtype
+    assert np.array_equal(_decode(spec), values)
+
+
+def test_floats_drop_to_float32_only_when_invisible() -> None:
+    rng = np.random.default_rng(0)
+    spread = rng.normal(size=500)
+    spec = _trace(x=spread)["x"]
+    assert spec["dtype"] == "f4"
+    assert np.allclose(_decode(spec), spread, rtol=1e-6)
+
+    # A narrow window far from zero: float32 would move points by whole units.
+    window = 1.2e8 + rng.uniform(0, 500, size=500)
+    assert _trace(x=window)["x"]["dtype"] == "f8"
+
+
+def test_identities_are_never_rounded() -> None:
+    ids = np.linspace(0.5, 1000.5, 300)
+    spec = _trace(customdata=ids)["customdata"]
+    assert spec["dtype"] == "f8"
+    assert np.array_equal(_decode(spec), ids)
+
+
+def test_two_dimensional_arrays_carry_their_shape() -> None:
+    z = np.arange(300, dtype=float).reshape(20, 15) / 7
+    spec = _trace(z=z)["z"]
+    assert spec["shape"] == "20, 15"
+    assert np.allclose(_decode(spec), z)
+
+
+def test_what_is_not_a_numeric_data_array_is_left_alone() -> None:
+    labels = [f"s{i}" for i in range(200)]
+    trace = _trace(
+        x=list(range(10)),  # too short to be worth packing
+        y=labels,
+        text=list(range(200)),  # not a data-array key
+        marker={"color": labels},
+        mode="markers",
+    )
+    assert trace["x"] == list(range(10))
+    assert trace["y"] == labels
+    assert trace["text"] == list(range(200))
+    assert trace["marker"]["color"] == labels
+
+
+def test_plain_lists_under_data_array_keys_are_packed() -> None:
+    """Aggregated figures build their traces from ``to_list()``."""
+    q1 = [float(i) / 3 for i in range(100)]
+    spec = _trace(q1=q1)["q1"]
+    assert "bdata" in spec
+    assert np.allclose(_decode(spec), q1, rtol=1e-6)
+
+
+def test_encode_figure_defaults_uirevision_without_overriding() -> None:
+    fig = {"data": [{"type": "scatter", "y": np.arange(100)}], "layout": {}}
+    encoded = json.loads(encode_figure(fig))
+    assert encoded["layout"]["uirevision"] == "persistent"
+    assert encoded["data"][0]["y"]["dtype"] == "u1"
+
+    fig["layout"] = {"uirevision": "mine"}
+    assert json.loads(encode_figure(fig))["layout"]["uirevision"] == "mine"
+
+
+def test_response_body_splices_the_encoded_figure() -> None:
+    body = figure_response_bytes({"figure_json": '{"data":[]}', "metadata": {"visu_type": "box"}})
+    assert json.loads(body) == {"figure": {"data": []}, "metadata": {"visu_type": "box"}}
+
+    # A cached result from before the encoded format still serves.
+    legacy = figure_response_bytes({"figure": {"data": [], "layout": {}}, "metadata": {}})
+    assert json.loads(legacy)["figure"] == {"data": [], "layout": {}}
@@ -0,0 +1,115 @@
+"""Tests for the rendered-figure result cache (``services/figure/result_cache``).
+
+The key is the whole contract: it has to change whenever the rendered figure
+could, and stay put when only incidental payload fields move. The tiering is
+checked with both backends replaced by dicts.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from depictio.api.v1.services.figure import result_cache
+
+pytestmark = pytest.mark.no_db
+
+DC_ID = "507f1f77bcf86cd799439014"
+
+
+def _payload(**overrides) -> dict:
+    payload = {
+        "metadata": {
+            "wf_id": "507f1f77bcf86cd799439013",
+            "dc_id": DC_ID,
+            "dc_config": {"delta_location": "s3://bucket/a"},
+            "visu_type": "scatter",
+            "dict_kwargs": {"x": "a", "y": "b"},
+            "mode": "ui",
+        },
+        "filter_metadata": [],
+        "theme": "light",
+        "full_load": False,
+        "init_data": {DC_ID: {"delta_location": "s3://bucket/a", "aggregation_hash": "h1"}},
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_key_is_stable_and_ignores_incidental_fields() -> None:
+    a = result_cache.figure_cache_key(_payload())
+    moved = _payload()
+    moved["metadata"]["dc_config"] = {"delta_location": "s3://elsewhere", "size_bytes": 5}
+    assert a is not None
+    assert result_cache.figure_cache_key(_payload()) == a
+    assert result_cache.figure_cache_key(moved) == a
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"theme": "dark"},
+        {"full_load": True},
+        {"filter_metadata": [{"metadata": {"column_name": "a"}, "value": [1]}]},
+        {"init_data": {DC_ID: {"aggregation_hash": "h2"}}},
+    ],
+)
+def test_key_changes_with_render_inputs(change: dict) -> None:
+    assert result_cache.figure_cache_key(_payload(**change)) != result_cache.figure_cache_key(
+        _payload()
+    )
+
+
+def test_key_changes_with_figure_spec() -> None:
+    other = _payload()
+    other["metadata"]["dict_kwargs"] = {"x": "a", "y": "c"}
+    assert result_cache.figure_cache_key(other) != result_cache.figure_cache_key(_payload())
+
+
+def test_unknown_data_version_is_uncacheable() -> None:
+    """Nothing would retire the entry after an ingest."""
+    with patch("depictio.api.v1.deltatables_utils._get_aggregation_hash", return_value=None):
+        assert result_cache.figure_cache_key(_payload(init_data={})) is None
+
+
+def test_etag_matching() -> None:
+    etag = result_cache.etag_for("figure_result_dc_abc123")
+    assert etag == 'W/"abc123"'
+    assert result_cache.etag_matches('W/"abc123"', etag)
+    assert result_cache.etag_matches('"abc123"', etag)
+    assert result_cache.etag_matches('W/"zzz", W/"abc123"', etag)
+    assert result_cache.etag_matches("*", etag)
+    assert not result_cache.etag_matches('W/"zzz"', etag)
+    assert not result_cache.etag_matches(None, etag)
+
+
+class _DictCache(dict):
+    def set(self, key, value, ttl=None, expire=None):
+        self[key] = value
+        return True
+
+
+def test_disk_hit_is_promoted_to_redis() -> None:
+    redis_tier, disk_tier = _DictCache(), _DictCache()
+    disk_tier["k"] = {"figure": {}, "metadata": {}}
+    with (
+        patch("depictio.api.cache.get_cache", return_value=redis_tier),
+        patch.object(result_cache, "_get_disk_cache", return_value=disk_tier),
+    ):
+        result, tier = result_cache.get_figure_result("k")
+        assert tier == "disk"
+        assert "k" in redis_tier
+        assert result_cache.get_figure_result("k")[1] == "redis"
+
+
+def test_errored_renders_are_not_stored() -> None:
+    redis_tier, disk_tier = _DictCache(), _DictCache()
+    with (
+        patch("depictio.api.cache.get_cache", return_value=redis_tier),
+        patch.object(result_cache, "_get_disk_cache", return_value=disk_tier),
+    ):
+        result_cache.set_figure_result("bad", {"figure": {}, "metadata": {"error": "boom"}})
+        result_cache.set_figure_result("ok", {"figure": {}, "metadata": {}})
+    assert "bad" not in redis_tier and "bad" not in disk_tier
+    assert "ok" in redis_tier and "ok" in disk_tier
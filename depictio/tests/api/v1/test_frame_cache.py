@@ -0,0 +1,110 @@
+"""Tests for the in-process DataFrame cache (``api/v1/frame_cache``).
+
+The cache is what keeps an API worker's RSS inside a fixed budget, so what is
+pinned here is the accounting: frames are charged their real
+``estimated_size``, the least recently *used* frame goes first, an oversize
+frame is served but not kept, and concurrent misses on one key collect once.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from depictio.api.v1.frame_cache import FrameCache, frame_bytes
+
+pytestmark = pytest.mark.no_db
+
+
+def _frame(rows: int) -> pl.DataFrame:
+    return pl.DataFrame({"v": list(range(rows))}, schema={"v": pl.Int64})
+
+
+def test_frames_are_charged_their_estimated_size() -> None:
+    strings = pl.DataFrame({"s": ["x" * 200] * 1000})
+    cache = FrameCache(max_bytes=10 * 1024 * 1024, item_max_bytes=10 * 1024 * 1024)
+    cache.put("k", strings)
+    assert cache.total_bytes == strings.estimated_size() == frame_bytes(strings)
+    # The old rows × cols × 8 guess would have undercounted by ~25x.
+    assert cache.total_bytes > strings.height * strings.width * 8 * 20
+
+
+def test_least_recently_used_is_evicted_first() -> None:
+    size = frame_bytes(_frame(1000))
+    cache = FrameCache(max_bytes=3 * size, item_max_bytes=3 * size)
+    for key in ("a", "b", "c"):
+        cache.put(key, _frame(1000))
+    assert cache.get("a") is not None  # "b" is now the oldest use
+
+    cache.put("d", _frame(1000))
+    assert "b" not in cache
+    assert all(key in cache for key in ("a", "c", "d"))
+    assert cache.total_bytes == 3 * size
+    assert cache.evictions == 1
+
+
+def test_oversize_frames_are_served_but_not_kept() -> None:
+    small = frame_bytes(_frame(10))
+    cache = FrameCache(max_bytes=100 * small, item_max_bytes=small)
+    cache.put("keep", _frame(10))
+
+    df = cache.get_or_load("big", lambda: _frame(10_000))
+    assert df.height == 10_000
+    assert "big" not in cache and "keep" in cache
+    assert cache.rejected == 1
+
+
+def test_concurrent_misses_load_once() -> None:
+    cache = FrameCache(max_bytes=1 << 30, item_max_bytes=1 << 30)
+    calls = []
+    gate = threading.Event()
+
+    def _load() -> pl.DataFrame:
+        calls.append(1)
+        gate.wait(timeout=5)
+        return _frame(100)
+
+    results: list[pl.DataFrame] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", _load)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(r is results[0] for r in results)
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] + stats["coalesced_loads"] == 7
+
+
+def test_a_failed_load_is_not_cached() -> None:
+    cache = FrameCache(max_bytes=1 << 30, item_max_bytes=1 << 30)
+
+    def _boom() -> pl.DataFrame:
+        raise RuntimeError("delta read failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", _boom)
+    assert "k" not in cache
+    # The next caller retries rather than inheriting the failure.
+    assert cache.get_or_load("k", lambda: _frame(5)).height == 5
+
+
+def test_invalidation_by_data_collection_releases_the_bytes() -> None:
+    cache = FrameCache(max_bytes=1 << 30, item_max_bytes=1 << 30)
+    cache.put("wf_dc1_base", _frame(100))
+    cache.put("wf_dc1_filtered_abc", _frame(50))
+    cache.put("wf_dc2_base", _frame(100))
+
+    assert cache.discard_matching("dc1") == 2
+    assert len(cache) == 1
+    assert cache.total_bytes == frame_bytes(_frame(100))
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import re
 
-import pandas as pd
+import polars as pl
 import pytest
 
 from depictio.api.v1.services.multiqc.general_stats_payload import (
@@ -46,7 +46,7 @@ class TestColormapHelpers:
 
 class TestDataBarsColormap:
     def test_produces_valid_hex_styles(self):
-        df = pd.DataFrame({"metric": [0, 25, 50, 75, 100]})
+        df = pl.DataFrame({"metric": [0, 25, 50, 75, 100]})
         styles = _multiqc_data_bars_colormap(df, "metric", cmap_name="RdYlGn")
 
         assert styles, "expected per-bin styles for a non-empty numeric column"
@@ -58,5 +58,5 @@ class TestDataBarsColormap:
                 assert _HEX_RE.match(hex_color.lower())
 
     def test_all_nan_column_returns_empty(self):
-        df = pd.DataFrame({"metric": [None, None, None]})
+        df = pl.DataFrame({"metric": [None, None, None]})
         assert _multiqc_data_bars_colormap(df, "metric") == []
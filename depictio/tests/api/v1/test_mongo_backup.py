@@ -0,0 +1,177 @@
+"""Streaming (BSON) MongoDB backups restore exactly what was dumped.
+
+``services.mongo_backup`` writes one gzipped BSON stream per collection from
+the cursor and restores it in ``insert_many`` batches, so neither side holds a
+collection in memory. These pin the round trip (types included: ObjectIds,
+DBRefs and datetimes are not stringified as in the JSON format), the backup
+exclusions, and that a corrupt stream is refused before any collection is
+emptied.
+
+mongomock stands in for MongoDB; no running stack required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import mongomock
+import pytest
+from bson import DBRef, ObjectId
+from fastapi import HTTPException
+
+from depictio.api.v1.endpoints.backup_endpoints import routes
+from depictio.api.v1.services import mongo_backup
+from depictio.models.models.base import PyObjectId
+from depictio.models.models.users import User
+
+pytestmark = pytest.mark.no_db
+
+NAMES = ["users", "projects", "dashboards", "data_collections", "workflows", "files"]
+NAMES += ["deltatables", "runs", "groups"]
+
+
+def _seed(db) -> dict[str, list[dict]]:
+    owner, temp = ObjectId(), ObjectId()
+    users = [
+        {"_id": owner, "email": "a@example.com", "is_temporary": False},
+        {"_id": temp, "email": "t@example.com", "is_temporary": True},
+    ]
+    dashboards = [
+        {
+            "_id": ObjectId(),
+            "title": f"d{i}",
+            "permissions": {"owners": [{"_id": temp if i == 4 else owner}]},
+            "project": DBRef("projects", ObjectId()),
+            "created": datetime(2026, 1, 1 + i),
+            "stored_metadata": [{"index": j, "values": list(range(j))} for j in range(i)],
+        }
+        for i in range(5)
+    ]
+    db["users"].insert_many(users)
+    db["dashboards"].insert_many(dashboards)
+    db["runs"].insert_many([{"_id": ObjectId(), "n": i} for i in range(7)])
+    return {"users": users, "dashboards": dashboards}
+
+
+@pytest.fixture
+def source():
+    return mongomock.MongoClient()["source"]
+
+
+@pytest.fixture
+def target():
+    return mongomock.MongoClient()["target"]
+
+
+@pytest.fixture
+def admin():
+    return User(
+        id=PyObjectId("507f1f77bcf86cd799439011"),
+        email="admin@example.com",
+        password="$2b$12$example.hashed.password.string",
+        is_admin=True,
+        is_active=True,
+        is_verified=True,
+    )
+
+
+def _routes_on(db, backup_dir: str):
+    """``routes`` reading and writing ``db`` with backups under ``backup_dir``."""
+    mock_settings = MagicMock()
+    mock_settings.backup.backup_path = backup_dir
+    mock_settings.backup.mongodb_backup_format = "bson"
+    mock_settings.backup.mongodb_backup_batch_size = 2
+    mock_settings.backup.mongodb_backup_workers = 3
+    return (
+        patch.object(routes, "settings", mock_settings),
+        patch.object(routes, "users_collection", db["users"]),
+        patch.object(routes, "_collection_map", lambda: {name: db[name] for name in NAMES}),
+    )
+
+
+def _backup(db, backup_dir, admin) -> str:
+    settings_patch, users_patch, map_patch = _routes_on(db, backup_dir)
+    with settings_patch, users_patch, map_patch:
+        response = asyncio.run(routes.create_backup(routes.BackupRequest(), admin))
+    assert response.format == "bson"
+    return response.backup_id
+
+
+def _restore(db, backup_dir, admin, backup_id, **kwargs):
+    settings_patch, users_patch, map_patch = _routes_on(db, backup_dir)
+    request = routes.BackupRestoreRequest(backup_id=backup_id, dry_run=False, **kwargs)
+    with settings_patch, users_patch, map_patch:
+        return asyncio.run(routes.restore_backup(request, admin))
+
+
+def test_round_trip_keeps_documents_and_types(source, target, tmp_path, admin):
+    seeded = _seed(source)
+    backup_id = _backup(source, str(tmp_path), admin)
+
+    target["runs"].insert_one({"_id": ObjectId(), "stale": True})
+    result = _restore(target, str(tmp_path), admin, backup_id)
+
+    assert result.success, result.errors
+    # The temporary user and the dashboard it owns are not backed up.
+    assert list(target["users"].find()) == seeded["users"][:1]
+    assert list(target["dashboards"].find().sort("created")) == seeded["dashboards"][:4]
+    assert sorted(d["n"] for d in target["runs"].find()) == list(range(7))
+    assert result.total_restored == 1 + 4 + 7
+
+
+def test_manifest_records_counts_and_digests(source, tmp_path, admin):
+    _seed(source)
+    backup_id = _backup(source, str(tmp_path), admin)
+    backup_dir = tmp_path / f"depictio_backup_{backup_id}"
+    manifest = mongo_backup.read_manifest(str(backup_dir))
+
+    assert manifest["collections"]["runs"]["count"] == 7
+    assert manifest["backup_metadata"]["total_documents"] == 12
+    assert os.path.exists(backup_dir / "manifest.json.sha256")
+    assert not os.path.exists(f"{backup_dir}.partial")
+    for entry in manifest["collections"].values():
+        assert mongo_backup.file_sha256(str(backup_dir / entry["file"])) == entry["sha256"]
+
+    listed = routes._stream_backup_info(str(tmp_path), backup_dir.name)
+    assert listed is not None and listed["format"] == "bson"
+    assert listed["total_documents"] == 12
+
+
+def test_corrupt_stream_is_refused_before_anything_is_deleted(source, target, tmp_path, admin):
+    _seed(source)
+    backup_id = _backup(source, str(tmp_path), admin)
+    stream = tmp_path / f"depictio_backup_{backup_id}" / "runs.bson.gz"
+    data = bytearray(stream.read_bytes())
+    data[len(data) // 2] ^= 0xFF
+    stream.write_bytes(bytes(data))
+
+    target["runs"].insert_one({"_id": ObjectId(), "keep": True})
+    with pytest.raises(HTTPException) as excinfo:
+        _restore(target, str(tmp_path), admin, backup_id)
+    assert excinfo.value.status_code == 400
+    assert target["runs"].count_documents({"keep": True}) == 1
+
+
+def test_restore_batches_stay_bounded(source, tmp_path):
+    source["runs"].insert_many([{"_id": ObjectId(), "n": i} for i in range(7)])
+    path = str(tmp_path / "runs.bson.gz")
+    entry = mongo_backup.dump_collection(source["runs"], {}, path, batch_size=3)
+    assert entry["count"] == 7
+    assert [len(b) for b in mongo_backup.iter_batches(path, batch_size=3)] == [3, 3, 1]
+
+
+def test_truncated_stream_is_an_error(source, tmp_path):
+    import gzip
+
+    source["runs"].insert_many([{"_id": ObjectId(), "n": i} for i in range(3)])
+    path = str(tmp_path / "runs.bson.gz")
+    mongo_backup.dump_collection(source["runs"], {}, path, batch_size=10)
+    with gzip.open(path, "rb") as fh:
+        raw = fh.read()
+    with gzip.open(path, "wb") as fh:
+        fh.write(raw[:-5])
+    with pytest.raises(ValueError):
+        mongo_backup.count_documents(path)
@@ -265,6 +265,13 @@ def test_type_policy_new_column_gets_true_polars_type() -> None:
     assert specs == {"i": "int64", "b": "bool"}
 
 
+def test_bookkeeping_columns_get_no_spec() -> None:
+    """The CLI's per-file source hash is not data: no card, filter or picker offers it."""
+    df = pl.DataFrame({"i": [1, 2], "depictio_source_hash": ["h1", "h2"]})
+    specs = precompute_columns_specs(df, REAL_AGG_FUNCTIONS, _dc_data())
+    assert [s["name"] for s in specs] == ["i"]
+
+
 def test_type_policy_known_column_keeps_recorded_type() -> None:
     """A column already recorded keeps its type, so saved components don't desync."""
     df = pl.DataFrame({"i": [1, None, 3], "b": [True, None, False]})
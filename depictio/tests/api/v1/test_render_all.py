@@ -0,0 +1,317 @@
+"""Contract for ``POST /dashboards/render_all/{dashboard_id}``.
+
+The endpoint exists to do per-data-collection setup once per dashboard render
+instead of once per component, so the properties worth pinning are:
+
+* the DC access check, link resolution and the ``init_data`` lookup run once
+  per DC, however many components read it, and a DC the caller may not read
+  is never served;
+* every component gets exactly one frame, and a failing component becomes an
+  ``error`` frame rather than ending the stream;
+* component types the stream can't serve are reported, not dropped;
+* the reductions components would each run on one filtered table — a table's
+  row count, the advanced-viz sampling count, an inline figure's first
+  aggregation pass — are answered by one fused scan and handed to them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from fastapi import HTTPException
+
+from depictio.api.v1.endpoints.dashboards_endpoints import routes
+
+pytestmark = pytest.mark.no_db
+
+DASHBOARD_ID = "507f1f77bcf86cd799439011"
+PROJECT_ID = "507f1f77bcf86cd799439012"
+WF_ID = "507f1f77bcf86cd799439013"
+DC_A = "507f1f77bcf86cd799439014"
+DC_B = "507f1f77bcf86cd799439015"
+
+
+_USER = SimpleNamespace(id="507f1f77bcf86cd799439016", is_admin=False)
+
+
+def _component(index: str, component_type: str, dc_id: str = DC_A) -> dict:
+    return {
+        "index": index,
+        "component_type": component_type,
+        "wf_id": WF_ID,
+        "dc_id": dc_id,
+        "dc_config": {"delta_location": f"s3://bucket/{dc_id}", "type": "table"},
+    }
+
+
+def _scope(components: list[dict]) -> routes._DashboardRenderScope:
+    dashboard = {
+        "dashboard_id": DASHBOARD_ID,
+        "project_id": PROJECT_ID,
+        "stored_metadata": components,
+    }
+    return routes._DashboardRenderScope(dashboard, PROJECT_ID, [], None, _USER)
+
+
+def _frames(jobs, concurrency: int = 4) -> list[dict]:
+    async def _collect():
+        return [json.loads(line) async for line in routes._render_all_frames(jobs, concurrency)]
+
+    return asyncio.run(_collect())
+
+
+class _Calls:
+    """Patches the collaborators a render reaches for and counts the shared ones."""
+
+    def __init__(self):
+        self.access_calls: list[str] = []
+        self.denied: set[str] = set()
+        self.link_calls: list[str] = []
+        self.version_calls: list[str] = []
+        self.offload_args: list[tuple] = []
+
+    def __enter__(self):
+        async def _fake_offload(task, args, *, offload, label="", **_kw):
+            self.offload_args.append(tuple(args))
+            payload = args[0]
+            return {"figure": {}, "metadata": {"dc": payload["metadata"]["dc_id"]}}
+
+        def _fake_links(**kw):
+            self.link_calls.append(kw["target_dc_id"])
+            return kw["filters"]
+
+        def _fake_access(dc_oid, current_user):
+            self.access_calls.append(str(dc_oid))
+            if str(dc_oid) in self.denied:
+                raise HTTPException(status_code=404, detail="denied")
+
+        def _fake_salts(dc_id):
+            self.version_calls.append(dc_id)
+            return "v1", "h1"
+
+        self._patches = [
+            patch(
+                "depictio.api.v1.endpoints.advanced_viz_endpoints.routes._assert_dc_access",
+                _fake_access,
+            ),
+            patch.object(routes, "_resolve_link_filters_cached", _fake_links),
+            patch.object(routes, "offload_or_run", _fake_offload),
+            patch.object(routes, "_figure_should_offload", lambda component: False),
+            patch(
+                "depictio.api.v1.services.figure.result_cache.get_figure_result",
+                lambda key: (None, None),
+            ),
+            patch.object(
+                routes,
+                "_render_table_page",
+                lambda component, fm, init_data, page, **kw: ({"rows": [], "page": page}, {}),
+            ),
+            patch.object(
+                routes, "_compute_cards", lambda scope, ids: {"values": dict.fromkeys(ids)}
+            ),
+            patch(
+                "depictio.api.v1.deltatables_utils._get_aggregation_salts",
+                _fake_salts,
+            ),
+        ]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc):
+        for p in self._patches:
+            p.stop()
+        return False
+
+
+def test_per_dc_setup_runs_once_for_many_components() -> None:
+    components = [
+        _component("fig-1", "figure"),
+        _component("fig-2", "figure"),
+        _component("tbl-1", "table"),
+        _component("fig-3", "figure", dc_id=DC_B),
+    ]
+    scope = _scope(components)
+    with _Calls() as calls:
+        frames = _frames(routes._render_all_jobs(scope, {"filters": []}))
+
+    assert sorted(f["component_id"] for f in frames) == ["fig-1", "fig-2", "fig-3", "tbl-1"]
+    assert all(f["status"] == "ok" for f in frames)
+    assert sorted(calls.access_calls) == [DC_A, DC_B]
+    assert sorted(calls.link_calls) == [DC_A, DC_B]
+    assert sorted(calls.version_calls) == [DC_A, DC_B]
+    # The version travels in init_data, so loaders downstream skip their lookup.
+    assert scope.all_init_data()[DC_A]["aggregation_version"] == "v1"
+
+
+def test_unreadable_dc_is_not_served() -> None:
+    """A component bound to another project's DC gets the 404 its endpoint would."""
+    request = {"filters": [], "advanced_viz": {"viz-1": {"columns": ["g"], "viz_kind": "volcano"}}}
+    scope = _scope(
+        [
+            _component("fig-1", "figure"),
+            _component("viz-1", "advanced_viz", dc_id=DC_B),
+            _component("tbl-1", "table", dc_id=DC_B),
+        ]
+    )
+    viz_calls: list[dict] = []
+    with (
+        _Calls() as calls,
+        patch(
+            "depictio.api.v1.endpoints.advanced_viz_endpoints.routes.advanced_viz_rows",
+            lambda payload, *a, **kw: viz_calls.append(payload) or ({}, {}),
+        ),
+    ):
+        calls.denied.add(DC_B)
+        routes._authorize_render_round(scope, request)
+        jobs = routes._render_all_jobs(scope, request)
+        routes._plan_render_round(scope, request)
+        frames = _frames(jobs)
+
+    by_id = {f["component_id"]: f for f in frames}
+    assert by_id["fig-1"]["status"] == "ok"
+    for cid in ("viz-1", "tbl-1"):
+        assert (by_id[cid]["status"], by_id[cid]["status_code"]) == ("error", 404)
+    assert viz_calls == []
+    # Checked once per DC, before any job ran; the denied DC was never resolved.
+    assert sorted(calls.access_calls) == [DC_A, DC_B]
+    assert DC_B not in calls.link_calls
+
+
+def test_cards_collapse_into_one_frame() -> None:
+    scope = _scope([_component("c-1", "card"), _component("c-2", "card")])
+    with _Calls():
+        frames = _frames(routes._render_all_jobs(scope, {"filters": []}))
+
+    assert len(frames) == 1
+    assert frames[0]["component_id"] == "cards"
+    assert set(frames[0]["data"]["values"]) == {"c-1", "c-2"}
+
+
+def test_table_page_request_is_forwarded() -> None:
+    scope = _scope([_component("tbl-1", "table")])
+    page = {"start": 200, "limit": 100, "sort_by": "x", "sort_dir": "asc"}
+    with _Calls():
+        frames = _frames(routes._render_all_jobs(scope, {"tables": {"tbl-1": page}}))
+
+    assert frames[0]["data"]["page"] == page
+
+
+def test_unsupported_components_are_reported() -> None:
+    """The client falls back to per-component endpoints for these."""
+    scope = _scope(
+        [
+            _component("img-1", "image"),
+            # No column spec in the request: the projection is the renderer's.
+            _component("viz-1", "advanced_viz"),
+        ]
+    )
+    with _Calls():
+        frames = _frames(routes._render_all_jobs(scope, {"filters": []}))
+
+    assert {f["component_id"]: f["status"] for f in frames} == {
+        "img-1": "unsupported",
+        "viz-1": "unsupported",
+    }
+
+
+def test_failing_component_does_not_end_the_stream() -> None:
+    async def _ok():
+        return {"fine": True}
+
+    async def _denied():
+        raise HTTPException(status_code=403, detail="nope")
+
+    async def _broken():
+        raise RuntimeError("boom")
+
+    frames = _frames([("a", "figure", _ok), ("b", "figure", _denied), ("c", "table", _broken)])
+    by_id = {f["component_id"]: f for f in frames}
+
+    assert by_id["a"]["status"] == "ok"
+    assert (by_id["b"]["status"], by_id["b"]["status_code"]) == ("error", 403)
+    assert (by_id["c"]["status"], by_id["c"]["status_code"]) == ("error", 500)
+
+
+def test_pre_encoded_figure_is_spliced_into_its_frame() -> None:
+    async def _figure():
+        return {"figure_json": '{"data":[],"layout":{"uirevision":"persistent"}}', "metadata": {}}
+
+    (frame,) = _frames([("fig-1", "figure", _figure)])
+    assert frame["status"] == "ok"
+    assert frame["data"] == {
+        "figure": {"data": [], "layout": {"uirevision": "persistent"}},
+        "metadata": {},
+    }
+
+
+def test_frames_arrive_in_completion_order() -> None:
+    """A slow component must not hold back the ones that finished before it."""
+
+    async def _slow():
+        await asyncio.sleep(0.05)
+        return {}
+
+    async def _fast():
+        return {}
+
+    frames = _frames([("slow", "table", _slow), ("fast", "figure", _fast)])
+    assert [f["component_id"] for f in frames] == ["fast", "slow"]
+
+
+def test_client_order_is_respected() -> None:
+    scope = _scope([_component("tbl-1", "table"), _component("fig-1", "figure")])
+    jobs = routes._render_all_jobs(scope, {"component_ids": ["tbl-1", "fig-1"]})
+    assert [cid for cid, _type, _run in jobs] == ["tbl-1", "fig-1"]
+
+    # Without one, cheap components are scheduled first.
+    jobs = routes._render_all_jobs(scope, {})
+    assert [cid for cid, _type, _run in jobs] == ["fig-1", "tbl-1"]
+
+
+def test_the_round_fuses_what_its_components_would_scan() -> None:
+    frame = pl.DataFrame({"g": ["a", "a", "b"], "v": [1.0, 2.0, 3.0]})
+    figure = {
+        **_component("fig-1", "figure"),
+        "visu_type": "box",
+        "dict_kwargs": {"x": "g", "y": "v"},
+    }
+    request = {
+        "filters": [],
+        "advanced_viz": {"viz-1": {"columns": ["g", "v"], "viz_kind": "volcano"}},
+    }
+    scope = _scope([figure, _component("tbl-1", "table"), _component("viz-1", "advanced_viz")])
+    scans: list[dict] = []
+    viz_counts: list[int | None] = []
+
+    def _scan(**kwargs):
+        scans.append(kwargs)
+        return frame.lazy()
+
+    def _viz_rows(payload, filter_metadata, init_data, row_count=None):
+        viz_counts.append(row_count)
+        return {"rows": {}}, {}
+
+    with (
+        _Calls() as calls,
+        patch("depictio.api.v1.deltatables_utils.open_deltatable_scan", _scan),
+        patch(
+            "depictio.api.v1.endpoints.advanced_viz_endpoints.routes.advanced_viz_rows",
+            _viz_rows,
+        ),
+    ):
+        jobs = routes._render_all_jobs(scope, request)
+        routes._plan_render_round(scope, request)
+        frames = _frames(jobs)
+
+    assert all(f["status"] == "ok" for f in frames)
+    assert len(scans) == 1
+    assert viz_counts == [3]
+    ((_payload, planned),) = calls.offload_args
+    assert planned["row_count"] == 3
+    assert planned["first_pass"].sort("g")["_n"].to_list() == [2, 1]
@@ -0,0 +1,140 @@
+"""Tests for ``deltatables_utils.ScanPlanner``.
+
+The planner is an optimisation over reductions that each caller could run on
+its own, so the contract is mostly about not getting in the way: members on one
+table share a single scan, a failing member does not take its group down, and
+anything the planner could not answer reads back as ``None`` so the caller falls
+back to its own path.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from depictio.api.v1 import deltatables_utils
+from depictio.api.v1.deltatables_utils import ScanPlanner
+
+pytestmark = pytest.mark.no_db
+
+WF_ID = "507f1f77bcf86cd799439013"
+DC_A = "507f1f77bcf86cd799439014"
+DC_B = "507f1f77bcf86cd799439015"
+INIT = {
+    DC_A: {"delta_location": "s3://b/a", "aggregation_version": "v1"},
+    DC_B: {"delta_location": "s3://b/b", "aggregation_version": "v1"},
+}
+
+FRAME = pl.DataFrame({"x": [1, 2, 3, 4], "y": [10.0, 20.0, 30.0, 40.0], "g": list("aabb")})
+
+
+class _Scans:
+    """Stands in for ``open_deltatable_scan`` and records what each group asked for."""
+
+    def __init__(self, frame: pl.DataFrame | None = FRAME):
+        self.frame = frame
+        self.calls: list[dict] = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return None if self.frame is None else self.frame.lazy()
+
+
+def test_members_on_one_table_share_one_scan() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    planner.add("sum", WF_ID, DC_A, lambda s: s.select(pl.col("x").sum()), {"x"}, None, INIT)
+    planner.add("mean", WF_ID, DC_A, lambda s: s.select(pl.col("y").mean()), {"y"}, None, INIT)
+    planner.add("len", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+
+    assert len(scans.calls) == 1
+    # The shared scan is projected to the union of the members' columns.
+    assert scans.calls[0]["select_columns"] == ["x", "y"]
+    assert planner.result("sum").item() == 10
+    assert planner.result("mean").item() == 25.0
+    assert planner.result("len").item() == 4
+
+
+def test_different_filter_states_are_different_groups() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    filtered = [{"metadata": {"column_name": "g"}, "value": ["a"]}]
+    planner.add("all", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+    planner.add("some", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), filtered, INIT)
+    planner.add("other", WF_ID, DC_B, lambda s: s.select(pl.len()), set(), None, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+
+    assert len(scans.calls) == 3
+
+
+def test_a_failing_member_does_not_fail_its_group() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    planner.add("ok", WF_ID, DC_A, lambda s: s.select(pl.col("x").max()), {"x"}, None, INIT)
+    planner.add("bad", WF_ID, DC_A, lambda s: s.select(pl.col("missing").max()), None, None, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+
+    assert planner.result("ok").item() == 4
+    assert planner.result("bad") is None
+
+
+def test_unbuildable_scan_and_unknown_names_read_as_none() -> None:
+    planner = ScanPlanner()
+    planner.add("len", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", _Scans(frame=None)):
+        planner.run()
+
+    assert planner.result("len") is None
+    assert planner.result("never-planned") is None
+
+
+def test_run_only_evaluates_what_is_pending() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    planner.add("len", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+        # Re-registering an answered name is a no-op, so nothing runs again.
+        planner.add("len", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+        planner.run()
+
+    assert len(scans.calls) == 1
+
+
+def test_a_count_only_group_reads_only_its_filter_columns() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    filtered = [{"metadata": {"column_name": "g"}, "value": ["a"]}]
+    planner.add("all", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+    planner.add("some", WF_ID, DC_B, lambda s: s.select(pl.len()), set(), filtered, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+
+    # Never an empty projection: a zero-column select would count zero rows.
+    by_dc = {call["data_collection_id"]: call["select_columns"] for call in scans.calls}
+    assert by_dc == {DC_A: None, DC_B: ["g"]}
+    assert planner.result("all").item() == 4
+
+
+def test_a_member_that_plans_nothing_reads_as_none() -> None:
+    scans = _Scans()
+    planner = ScanPlanner()
+    planner.add("len", WF_ID, DC_A, lambda s: s.select(pl.len()), set(), None, INIT)
+    planner.add("nothing", WF_ID, DC_A, lambda s: None, set(), None, INIT)
+
+    with patch.object(deltatables_utils, "open_deltatable_scan", scans):
+        planner.run()
+
+    assert planner.result("len").item() == 4
+    assert planner.result("nothing") is None
@@ -0,0 +1,176 @@
+"""Tests for ``services.sort_index`` — sorted pages served from a sorted copy.
+
+A page read from the sort index must be the page ``load_sorted_deltatable_lite``
+would have produced by sorting the table: same rows, same tie order
+(``maintain_order`` on the natural scan order), same null placement. Filtered
+deep pages continue from a keyset cursor; these pin that the cursor path and
+the offset path agree, in both directions and with nulls at either end. The
+build itself never runs in the request: a missing index is enqueued once and
+the page falls back to the lazy sort until the worker has written it.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from depictio.api.v1.services import sort_index
+
+pytestmark = pytest.mark.no_db
+
+DC = "507f1f77bcf86cd799439015"
+
+FRAME = pl.DataFrame(
+    {
+        "sample": [f"s{i:02d}" for i in range(40)],
+        "score": [float(i % 7) if i % 9 else None for i in range(40)],
+        "habitat": ["river", "lake", "sea", "river"] * 10,
+    }
+)
+
+
+class _Cache:
+    def __init__(self):
+        self.store: dict = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None, tags=None):
+        self.store[key] = value
+
+
+def _filter(column, values):
+    return {
+        "metadata": {"column_name": column, "interactive_component_type": "MultiSelect"},
+        "value": values,
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    """``sorted_page`` against a local table, without Delta, Mongo or Celery.
+
+    Enqueued builds are collected; ``page`` runs them the way the worker would
+    whenever a request comes back empty-handed, then asks again.
+    """
+    cache = _Cache()
+    enqueued: list[tuple] = []
+    sort_index._registry.clear()
+    with (
+        patch.object(pl, "scan_delta", lambda *a, **k: FRAME.lazy()),
+        patch.object(sort_index, "_delta_version", lambda loc, salt: 3),
+        patch.object(sort_index, "record_version", lambda *a: None),
+        patch.object(sort_index, "_cache", lambda: cache),
+        patch.object(sort_index, "_schedule_build", lambda *a: enqueued.append(a)),
+    ):
+
+        def page(sort_by, descending, nulls_last, metadata, start, limit, columns=None):
+            def ask():
+                return sort_index.sorted_page(
+                    DC,
+                    str(tmp_path),
+                    "salt",
+                    sort_by,
+                    descending,
+                    nulls_last,
+                    metadata,
+                    columns,
+                    start,
+                    limit,
+                )
+
+            got = ask()
+            if got is None:
+                dc_id, location, version, _path, *sort = enqueued[-1]
+                sort_index.build_sort_index(dc_id, location, version, *sort)
+                got = ask()
+            return got
+
+        yield page, cache, enqueued
+
+
+def _expected(sort_by, descending, nulls_last, metadata, start, limit):
+    frame = FRAME
+    for m in metadata or []:
+        frame = frame.filter(pl.col(m["metadata"]["column_name"]).is_in(m["value"]))
+    return frame.sort(
+        sort_by, descending=descending, nulls_last=nulls_last, maintain_order=True
+    ).slice(start, limit)
+
+
+def test_path_is_per_version_and_direction():
+    asc = sort_index.sort_index_path("s3://b/dc", 3, "score", False, True)
+    assert asc.startswith("s3://b/dc/_depictio/sort_index/v00000000000000000003-")
+    assert asc != sort_index.sort_index_path("s3://b/dc", 3, "score", True, True)
+    assert asc != sort_index.sort_index_path("s3://b/dc", 4, "score", False, True)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("nulls_last", [False, True])
+def test_unfiltered_pages_match_the_lazy_sort(index, descending, nulls_last):
+    page, _, _ = index
+    for start in (0, 7, 35):
+        got = page("score", descending, nulls_last, None, start, 7)
+        assert got.equals(_expected("score", descending, nulls_last, None, start, 7))
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("nulls_last", [False, True])
+def test_cursor_pages_match_offset_pages(index, descending, nulls_last):
+    page, cache, _ = index
+    metadata = [_filter("habitat", ["river", "sea"])]
+    for start in range(0, 30, 4):
+        got = page("score", descending, nulls_last, metadata, start, 4)
+        assert got.equals(_expected("score", descending, nulls_last, metadata, start, 4))
+    # Every page after the first was continued from the previous page's cursor.
+    assert len(cache.store) >= 7
+
+
+def test_projection_hides_the_row_column(index):
+    page, _, _ = index
+    got = page("score", False, True, None, 0, 5, columns=["sample"])
+    assert got.columns == ["sample"]
+
+
+def test_build_failure_returns_none(tmp_path):
+    with patch.object(sort_index, "_delta_version", side_effect=OSError("no log")):
+        assert (
+            sort_index.sorted_page(
+                DC, str(tmp_path), "salt", "score", False, True, None, None, 0, 5
+            )
+            is None
+        )
+
+
+def test_first_request_enqueues_instead_of_building(index, tmp_path):
+    _, _, enqueued = index
+    args = (DC, str(tmp_path), "salt", "score", False, True, None, None, 0, 5)
+    assert sort_index.sorted_page(*args) is None
+    assert len(enqueued) == 1
+    assert not list(tmp_path.rglob("*.parquet"))
+
+    dc_id, location, version, path, *sort = enqueued[0]
+    assert sort_index.build_sort_index(dc_id, location, version, *sort) == path
+    assert sort_index.sorted_page(*args).height == 5
+    assert len(enqueued) == 1
+
+
+def test_enqueue_is_once_per_path(monkeypatch):
+    class _Task:
+        calls: list[tuple] = []
+
+        @classmethod
+        def delay(cls, *args):
+            cls.calls.append(args)
+
+    from depictio.api.v1 import celery_tasks
+
+    monkeypatch.setattr(celery_tasks, "build_sort_index", _Task)
+    monkeypatch.setattr(sort_index, "_scheduled", {})
+    for _ in range(3):
+        sort_index._schedule_build(DC, "/t", 3, "/t/p.parquet", "score", False, True)
+    sort_index._schedule_build(DC, "/t", 3, "/t/q.parquet", "score", True, True)
+    assert [c[4] for c in _Task.calls] == [False, True]
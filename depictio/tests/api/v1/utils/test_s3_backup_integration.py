@@ -79,6 +79,9 @@ class TestS3BackupIntegration:
             mock_settings.backup.backup_s3_config = backup_config
             mock_settings.backup.s3_backup_strategy = "s3_to_s3"
             mock_settings.backup.backup_s3_bucket = "backup-bucket"
+            mock_settings.backup.s3_backup_max_concurrency = 4
+            mock_settings.backup.s3_backup_multipart_chunk_mb = 8
+            mock_settings.backup.s3_backup_incremental = False
 
             # Add bucket to source config for the manager
             source_config = s3_config.copy()
@@ -110,8 +113,10 @@ class TestS3BackupIntegration:
             Bucket="backup-bucket", Prefix="test_backup/"
         )
 
+        # The snapshot's two files, plus the state the next snapshot starts from.
         backup_files = backup_response.get("Contents", [])
-        assert len(backup_files) == 2
+        assert len(backup_files) == 3
+        assert sum("/_state/" in f["Key"] for f in backup_files) == 1
 
         # Check that the actual file content matches
         for backup_file in backup_files:
@@ -178,6 +183,9 @@ class TestS3BackupIntegration:
             mock_settings.backup.backup_s3_config = backup_config
             mock_settings.backup.s3_backup_strategy = "s3_to_s3"
             mock_settings.backup.backup_s3_bucket = "backup-bucket"
+            mock_settings.backup.s3_backup_max_concurrency = 4
+            mock_settings.backup.s3_backup_multipart_chunk_mb = 8
+            mock_settings.backup.s3_backup_incremental = False
 
             # Create backup bucket
             backup_client = boto3.client(
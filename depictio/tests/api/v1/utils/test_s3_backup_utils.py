@@ -5,8 +5,11 @@ Tests the S3BackupStrategyManager and related functions for backing up
 S3 deltatable data using different strategies.
 """
 
+import hashlib
+import json
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
+from urllib.parse import quote
 
 import pytest
 
@@ -55,6 +58,9 @@ class TestS3BackupStrategyManager:
                 mock_settings.backup.backup_s3_config = mock_s3_config
                 mock_settings.backup.s3_backup_strategy = "s3_to_s3"
                 mock_settings.backup.backup_s3_bucket = "test-backup-bucket"
+                mock_settings.backup.s3_backup_max_concurrency = 4
+                mock_settings.backup.s3_backup_multipart_chunk_mb = 8
+                mock_settings.backup.s3_backup_incremental = False
 
                 manager = S3BackupStrategyManager(source_s3_config=mock_s3_config)
                 manager.source_client = mock_source_client
@@ -93,8 +99,41 @@ class TestS3BackupStrategyManager:
         assert result["total_bytes"] == 1280
         assert len(result["backup_locations"]) == 1
 
-        # Verify put_object was called for each file (cross-service copy)
-        assert s3_manager.backup_s3_client.put_object.call_count == 2
+        # Same endpoint and credentials: both files are copied server-side, and
+        # the only upload is the snapshot state.
+        assert s3_manager.server_side_copy is True
+        assert s3_manager.backup_s3_client.copy.call_count == 2
+        assert [c.kwargs["Key"] for c in s3_manager.backup_s3_client.put_object.call_args_list] == [
+            "test_backup/_state/data/project_123/deltatable_456.json"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backup_across_endpoints_streams_objects(self, s3_manager):
+        """A backup store on another endpoint gets the bytes through the API."""
+        s3_manager.server_side_copy = False
+        s3_manager.source_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": "data/project_123/deltatable_456/part-00000.parquet", "Size": 1024},
+                {"Key": "data/project_123/deltatable_456/_delta_log/00000.json", "Size": 256},
+            ]
+        }
+        mock_body = Mock()
+        mock_body.read.return_value = b"fake file content"
+        s3_manager.source_client.get_object.return_value = {
+            "Body": mock_body,
+            "ContentType": "application/octet-stream",
+        }
+
+        result = await s3_manager.backup_deltatable_data(
+            deltatable_locations=["data/project_123/deltatable_456/"],
+            backup_prefix="test_backup",
+            dry_run=False,
+        )
+
+        assert result["success"] is True
+        # Two small objects (below the multipart threshold) plus the state.
+        assert s3_manager.backup_s3_client.put_object.call_count == 3
+        s3_manager.backup_s3_client.copy.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_backup_deltatable_data_dry_run(self, s3_manager):
@@ -232,3 +271,171 @@ class TestCreateBackupWithStrategy:
         assert result["locations_processed"] == 1
         assert result["total_files"] == 2
         assert result["strategy"] == "s3_to_s3"
+
+
+class _Body:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+    def iter_lines(self):
+        return iter(self._data.splitlines())
+
+
+class _FakeS3:
+    """In-memory S3 with the calls the backup makes; lists two keys per page.
+
+    One instance serves as both source and backup client (same store), and
+    records which bucket every object read came from.
+    """
+
+    def __init__(self, buckets: tuple[str, ...]):
+        self.buckets = buckets
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.reads: list[tuple[str, str]] = []
+
+    @staticmethod
+    def _missing(operation: str):
+        from botocore.exceptions import ClientError
+
+        return ClientError({"Error": {"Code": "NoSuchKey", "Message": "missing"}}, operation)
+
+    def _etag(self, bucket: str, key: str) -> str:
+        return '"' + hashlib.md5(self.objects[(bucket, key)]).hexdigest() + '"'
+
+    def list_buckets(self):
+        return {"Buckets": [{"Name": b} for b in self.buckets]}
+
+    def list_objects_v2(self, Bucket, Prefix, StartAfter=None, ContinuationToken=None):
+        after = StartAfter or ""
+        keys = sorted(
+            k for b, k in self.objects if b == Bucket and k.startswith(Prefix) and k > after
+        )
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + 2]
+        response: dict = {
+            "Contents": [
+                {"Key": k, "Size": len(self.objects[(Bucket, k)]), "ETag": self._etag(Bucket, k)}
+                for k in page
+            ],
+            "IsTruncated": start + 2 < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + 2)
+        return response
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise self._missing("HeadObject")
+        return {"ETag": self._etag(Bucket, Key), "ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise self._missing("GetObject")
+        self.reads.append((Bucket, Key))
+        return {"Body": _Body(self.objects[(Bucket, Key)]), "ContentType": "application/x"}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[(Bucket, Key)] = Body
+
+    def copy(self, CopySource, Bucket, Key, Config=None):
+        source = (CopySource["Bucket"], CopySource["Key"])
+        if source not in self.objects:
+            raise self._missing("CopyObject")
+        self.reads.append(source)
+        self.objects[(Bucket, Key)] = self.objects[source]
+
+
+class TestSnapshotEngine:
+    """Pagination, reuse of unchanged objects and Delta-log-driven snapshots."""
+
+    TABLE = "dc1"
+
+    @pytest.fixture
+    def store(self):
+        store = _FakeS3(("src", "bak"))
+        self._commit(store, 0, ["part-0.parquet", "part-1.parquet", "part 2.parquet"])
+        store.objects[("src", f"{self.TABLE}/_depictio/column_stats/v0.parquet")] = b"stats"
+        return store
+
+    @pytest.fixture
+    def manager(self, store):
+        config = {"endpoint_url": "http://minio:9000", "aws_access_key_id": "k"}
+        with (
+            patch("depictio.api.v1.backup_strategy_manager.boto3.client", return_value=store),
+            patch("depictio.api.v1.backup_strategy_manager.settings") as mock_settings,
+        ):
+            mock_settings.backup.backup_s3_config = config
+            mock_settings.backup.backup_s3_bucket = "bak"
+            mock_settings.backup.s3_backup_max_concurrency = 3
+            mock_settings.backup.s3_backup_multipart_chunk_mb = 8
+            mock_settings.backup.s3_backup_incremental = False
+            return S3BackupStrategyManager(
+                source_s3_config={**config, "aws_secret_access_key": "s", "bucket": "src"}
+            )
+
+    def _commit(self, store, version: int, adds: list[str], removes=()) -> None:
+        actions = [{"add": {"path": quote(p), "size": 4}} for p in adds]
+        actions += [{"remove": {"path": quote(p)}} for p in removes]
+        log = "\n".join(json.dumps(a) for a in actions).encode()
+        store.objects[("src", f"{self.TABLE}/_delta_log/{version:020d}.json")] = log
+        for path in adds:
+            store.objects[("src", f"{self.TABLE}/{path}")] = f"data:{path}".encode()
+
+    async def _snapshot(self, manager, timestamp: str, incremental: bool) -> dict:
+        results = {"backup_locations": {}, "success": True, "errors": []}
+        await manager._backup_s3_to_s3([self.TABLE], "bk", timestamp, False, results, incremental)
+        assert results["success"], results["errors"]
+        return results
+
+    def _snapshot_keys(self, store, timestamp: str) -> set[str]:
+        prefix = f"bk/{timestamp}/{self.TABLE}/"
+        return {k[len(prefix) :] for b, k in store.objects if b == "bak" and k.startswith(prefix)}
+
+    def _source_keys(self, store) -> set[str]:
+        prefix = f"{self.TABLE}/"
+        return {k[len(prefix) :] for b, k in store.objects if b == "src"}
+
+    @pytest.mark.asyncio
+    async def test_listing_follows_pages_and_reuses_unchanged_objects(self, manager, store):
+        first = await self._snapshot(manager, "20260101_000000", incremental=False)
+        assert first["total_files"] == 5  # more than one listing page
+        assert self._snapshot_keys(store, "20260101_000000") == self._source_keys(store)
+
+        store.reads.clear()
+        second = await self._snapshot(manager, "20260102_000000", incremental=False)
+        assert second["files_reused"] == 5 and second["files_transferred"] == 0
+        assert all(bucket == "bak" for bucket, _ in store.reads)
+        assert self._snapshot_keys(store, "20260102_000000") == self._source_keys(store)
+
+    @pytest.mark.asyncio
+    async def test_incremental_reads_only_what_the_log_added(self, manager, store):
+        await self._snapshot(manager, "20260101_000000", incremental=True)
+
+        self._commit(store, 1, ["part-3.parquet"], removes=["part-0.parquet"])
+        self._commit(store, 2, ["part-4.parquet"])
+        store.reads.clear()
+        result = await self._snapshot(manager, "20260102_000000", incremental=True)
+
+        assert result["incremental_locations"] == 1
+        source_reads = {key for bucket, key in store.reads if bucket == "src"}
+        assert source_reads == {
+            f"{self.TABLE}/_delta_log/{1:020d}.json",
+            f"{self.TABLE}/_delta_log/{2:020d}.json",
+            f"{self.TABLE}/part-3.parquet",
+            f"{self.TABLE}/part-4.parquet",
+        }
+        # The removed file is no longer part of the table's snapshot.
+        assert self._snapshot_keys(store, "20260102_000000") == self._source_keys(store) - {
+            "part-0.parquet"
+        }
+
+    @pytest.mark.asyncio
+    async def test_recreated_table_falls_back_to_a_listing(self, manager, store):
+        await self._snapshot(manager, "20260101_000000", incremental=True)
+        self._commit(store, 0, ["part-9.parquet"])  # same version, different commit
+        result = await self._snapshot(manager, "20260102_000000", incremental=True)
+        assert "incremental_locations" not in result
+        assert "part-9.parquet" in self._snapshot_keys(store, "20260102_000000")
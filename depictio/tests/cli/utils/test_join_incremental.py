@@ -0,0 +1,152 @@
+"""Lazy joins and their incremental refresh leave the table a full join would have.
+
+``execute_join_lazy`` builds the join from pinned ``scan_delta`` inputs and
+records the source versions; with the lineage of the table it persisted, a
+refresh after rows were only appended to one side joins just those rows. These
+tests pin that the lazy join matches the in-memory one, that an appended slice
+completes the table to exactly the full join, and that anything else — a
+delete, a join that appended rows can change, an edited definition — falls
+back to a full recompute.
+
+Local Delta paths are used throughout: no S3/MinIO or running stack required.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from depictio.cli.cli.utils.joins import (
+    execute_join,
+    execute_join_lazy,
+    read_join_lineage,
+    write_join_lineage,
+)
+from depictio.models.models.joins import JoinDefinition
+from depictio.models.models.s3 import PolarsStorageOptions
+from depictio.tests.cli.utils.test_joins import (
+    delta_success,
+    make_dc,
+    make_project,
+    make_workflow,
+)
+
+# Only ``s3_storage`` is read, and only to build storage options (patched below).
+CLI_CONFIG = SimpleNamespace(s3_storage=None)
+
+
+@pytest.fixture
+def project():
+    return make_project(workflows=[make_workflow("wf", [make_dc("left"), make_dc("right")])])
+
+
+@pytest.fixture
+def join_def() -> JoinDefinition:
+    return JoinDefinition(name="j", left_dc="left", right_dc="right", on_columns=["id"])
+
+
+@pytest.fixture
+def tables(tmp_path, project):
+    """Local left/right Delta tables standing in for the project's two DCs."""
+    left, right = str(tmp_path / "left"), str(tmp_path / "right")
+    pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}).write_delta(left)
+    pl.DataFrame({"id": [2, 3, 4], "score": [20, 30, 40]}).write_delta(right)
+    dcs = project.workflows[0].data_collections
+    # Dummy credentials — local Delta paths ignore them, but the model requires them.
+    options = PolarsStorageOptions(
+        endpoint_url="http://localhost:9000",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with (
+        patch(
+            "depictio.cli.cli.utils.joins._join_side_paths",
+            return_value=(dcs[0], dcs[1], left, right),
+        ),
+        patch(
+            "depictio.cli.cli.utils.joins.turn_S3_config_into_polars_storage_options",
+            return_value=options,
+        ),
+    ):
+        yield left, right
+
+
+def _persist(joined: pl.LazyFrame, metadata: dict, dest: str, mode: str = "overwrite") -> dict:
+    """What ``persist_joined_table`` does to the table, minus the API calls."""
+    joined.collect().write_delta(dest, mode=mode)
+    write_join_lineage(dest, {}, metadata)
+    return read_join_lineage(dest, {})
+
+
+def _rows(frame: pl.DataFrame) -> pl.DataFrame:
+    return frame.select(sorted(frame.columns)).sort("id")
+
+
+def test_lazy_join_matches_the_in_memory_join(tables, join_def, project):
+    left, right = tables
+    with patch(
+        "depictio.cli.cli.utils.joins.read_delta_table",
+        side_effect=[delta_success(pl.read_delta(left)), delta_success(pl.read_delta(right))],
+    ):
+        eager, _ = execute_join(join_def, project, CLI_CONFIG, apply_granularity=False)
+    lazy, metadata = execute_join_lazy(join_def, project, CLI_CONFIG)
+
+    assert _rows(lazy.collect()).equals(_rows(eager))
+    assert (metadata["left_version"], metadata["right_version"]) == (0, 0)
+    assert metadata["refresh"] == "full"
+
+
+def test_appended_rows_complete_the_table(tables, tmp_path, join_def, project):
+    left, right = tables
+    dest = str(tmp_path / "joined")
+    lineage = _persist(*execute_join_lazy(join_def, project, CLI_CONFIG), dest)
+    assert (lineage["left_version"], lineage["right_version"]) == (0, 0)
+
+    pl.DataFrame({"id": [4, 5], "name": ["d", "e"]}).write_delta(left, mode="append")
+    sliced, metadata = execute_join_lazy(join_def, project, CLI_CONFIG, lineage=lineage)
+    assert metadata["refresh"] == "append" and metadata["appended_side"] == "left"
+    assert sliced.collect()["id"].to_list() == [4]
+
+    lineage = _persist(sliced, metadata, dest, mode="append")
+    full, _ = execute_join_lazy(join_def, project, CLI_CONFIG)
+    assert _rows(pl.read_delta(dest)).equals(_rows(full.collect()))
+    assert lineage["left_version"] == 1
+
+    _, metadata = execute_join_lazy(join_def, project, CLI_CONFIG, lineage=lineage)
+    assert metadata["refresh"] == "unchanged"
+
+
+@pytest.mark.parametrize("how, moved", [("inner", "delete"), ("left", "right"), ("right", "left")])
+def test_recomputes_when_a_slice_would_be_wrong(tables, tmp_path, join_def, project, how, moved):
+    left, right = tables
+    join_def.how = how
+    lineage = _persist(*execute_join_lazy(join_def, project, CLI_CONFIG), str(tmp_path / "j"))
+
+    if moved == "delete":
+        from deltalake import DeltaTable
+
+        DeltaTable(left).delete("id = 1")
+    else:
+        path, frame = {
+            "left": (left, pl.DataFrame({"id": [4], "name": ["d"]})),
+            "right": (right, pl.DataFrame({"id": [1], "score": [10]})),
+        }[moved]
+        frame.write_delta(path, mode="append")
+
+    _, metadata = execute_join_lazy(join_def, project, CLI_CONFIG, lineage=lineage)
+    assert metadata["refresh"] == "full"
+
+
+def test_edited_definition_recomputes(tables, tmp_path, join_def, project):
+    lineage = _persist(*execute_join_lazy(join_def, project, CLI_CONFIG), str(tmp_path / "j"))
+    join_def.how = "left"
+    _, metadata = execute_join_lazy(join_def, project, CLI_CONFIG, lineage=lineage)
+    assert metadata["refresh"] == "full"
+
+
+def test_table_without_lineage(tmp_path):
+    dest = str(tmp_path / "joined")
+    assert read_join_lineage(dest, {}) is None
+    pl.DataFrame({"id": [1]}).write_delta(dest)
+    assert read_join_lineage(dest, {}) is None
@@ -369,14 +369,14 @@ class TestApplyAggregation:
 class TestValidateJoinDefinition:
     """Test join validation logic."""
 
-    @patch("depictio.cli.cli.utils.joins.read_delta_table")
+    @patch("depictio.cli.cli.utils.joins._delta_columns")
     def test_valid_configuration(
-        self, mock_read_delta, join_definition, mock_project, mock_cli_config
+        self, mock_delta_columns, join_definition, mock_project, mock_cli_config
     ):
         """Valid join configuration passes all checks."""
-        mock_read_delta.side_effect = [
-            delta_success(pl.DataFrame({"id": [1, 2], "name": ["A", "B"]})),
-            delta_success(pl.DataFrame({"id": [2, 3], "age": [25, 30]})),
+        mock_delta_columns.side_effect = [
+            ["id", "name"],
+            ["id", "age"],
         ]
 
         result = validate_join_definition(join_definition, mock_project, mock_cli_config)
@@ -388,14 +388,14 @@ class TestValidateJoinDefinition:
         assert result.right_dc_processed is True
         assert len(result.errors) == 0
 
-    @patch("depictio.cli.cli.utils.joins.read_delta_table")
+    @patch("depictio.cli.cli.utils.joins._delta_columns")
     def test_missing_join_column_in_left(
-        self, mock_read_delta, join_definition, mock_project, mock_cli_config
+        self, mock_delta_columns, join_definition, mock_project, mock_cli_config
     ):
         """Validation fails when join column is missing in left DC."""
-        mock_read_delta.side_effect = [
-            delta_success(pl.DataFrame({"other_id": [1, 2], "name": ["A", "B"]})),
-            delta_success(pl.DataFrame({"id": [2, 3], "age": [25, 30]})),
+        mock_delta_columns.side_effect = [
+            ["other_id", "name"],
+            ["id", "age"],
         ]
 
         result = validate_join_definition(join_definition, mock_project, mock_cli_config)
@@ -404,14 +404,14 @@ class TestValidateJoinDefinition:
         assert "id" in result.missing_join_columns_left
         assert len(result.errors) > 0
 
-    @patch("depictio.cli.cli.utils.joins.read_delta_table")
+    @patch("depictio.cli.cli.utils.joins._delta_columns")
     def test_dc_not_processed(
-        self, mock_read_delta, join_definition, mock_project, mock_cli_config
+        self, mock_delta_columns, join_definition, mock_project, mock_cli_config
     ):
         """Validation warns when DC exists but Delta table is not created."""
-        mock_read_delta.side_effect = [
-            delta_error(),
-            delta_success(pl.DataFrame({"id": [2, 3], "age": [25, 30]})),
+        mock_delta_columns.side_effect = [
+            None,
+            ["id", "age"],
         ]
 
         result = validate_join_definition(join_definition, mock_project, mock_cli_config)
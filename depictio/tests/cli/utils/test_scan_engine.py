@@ -0,0 +1,149 @@
+"""The scandir walk finds what ``os.walk`` + per-file stats found, however it runs.
+
+``scan_engine.walk_files`` replaced an ``os.walk`` followed by a ``realpath``
+and three stat calls per file. What must not change is the result: the same
+files, the same resolved paths and the same ``file_hash`` (a different hash
+would mark every registered file as changed). These tests pin that against a
+small tree with a symlinked file, a symlinked directory and a dangling link,
+sequentially and on threads, and pin the manifest's contract: an unchanged
+directory is served from it, a changed one is listed again.
+"""
+
+import os
+
+import pytest
+
+from depictio.cli.cli.utils.common import format_timestamp
+from depictio.cli.cli.utils.scan_engine import (
+    ScanManifest,
+    manifest_enabled,
+    scan_workers,
+    stat_file,
+    walk_files,
+)
+from depictio.cli.cli.utils.scan_utils import generate_file_hash
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "run"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "c").mkdir()
+    for rel in ("top.tsv", "a/one.tsv", "a/b/two.tsv", "c/three.csv"):
+        (root / rel).write_text(rel)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "target.tsv").write_text("target")
+    (root / "c" / "link.tsv").symlink_to(outside / "target.tsv")
+    (root / "linked_dir").symlink_to(outside, target_is_directory=True)
+    (root / "dangling.tsv").symlink_to(tmp_path / "missing")
+    return root
+
+
+def _reference(root) -> dict[str, str]:
+    """``{resolved path: hash}`` the way the scan computed it before."""
+    out = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            location = os.path.realpath(os.path.join(dirpath, name))
+            if not os.path.exists(location):
+                continue
+            out[location] = generate_file_hash(
+                os.path.basename(location),
+                os.path.getsize(location),
+                format_timestamp(os.path.getctime(location)),
+                format_timestamp(os.path.getmtime(location)),
+            )
+    return out
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_walk_matches_os_walk(tree, workers):
+    found = walk_files(str(tree), workers=workers)
+    assert {f.path: f.file_hash for f in found} == _reference(tree)
+    # Symlinked files keep the name they have in the run, for regex matching.
+    assert "c/link.tsv" in {f.relpath for f in found}
+    assert [f.path for f in found] == sorted(f.path for f in found)
+
+
+def test_stat_file_matches_the_walk(tree):
+    walked = {f.path: f for f in walk_files(str(tree))}
+    path = os.path.realpath(tree / "a" / "one.tsv")
+    assert stat_file(path).file_hash == walked[path].file_hash
+
+
+def test_unchanged_directories_come_from_the_manifest(tree, tmp_path, monkeypatch):
+    manifest_path = str(tmp_path / "manifest.json")
+    manifest = ScanManifest.load(str(tree), manifest_path)
+    first = walk_files(str(tree), manifest=manifest)
+    manifest.save()
+
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        listed.append(os.path.relpath(path, os.path.realpath(tree)))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    before = os.stat(tree / "a" / "b").st_mtime_ns
+    (tree / "a" / "b" / "new.tsv").write_text("new")
+    # Coarse filesystem clocks can leave the mtime where it was; make the change visible.
+    os.utime(tree / "a" / "b", ns=(before, before + 1_000_000_000))
+    again = walk_files(str(tree), manifest=ScanManifest.load(str(tree), manifest_path))
+
+    assert listed == ["a/b"]
+    assert {f.path for f in again} == {f.path for f in first} | {
+        os.path.realpath(tree / "a" / "b" / "new.tsv")
+    }
+
+
+def test_untrusted_manifest_restats_files(tree, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    manifest = ScanManifest(str(tree), manifest_path)
+    walk_files(str(tree), manifest=manifest)
+    manifest.save()
+
+    target = tree / "a" / "one.tsv"
+    stat = os.stat(target.parent)
+    target.write_text("rewritten in place, longer than before")
+    os.utime(target.parent, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # directory untouched
+
+    def size(trust):
+        found = walk_files(
+            str(tree),
+            manifest=ScanManifest.load(str(tree), manifest_path),
+            trust_manifest=trust,
+        )
+        return {f.path: f.size for f in found}[os.path.realpath(target)]
+
+    assert size(trust=True) == len("a/one.tsv")
+    assert size(trust=False) == target.stat().st_size
+
+
+def test_a_directory_gone_mid_walk_is_skipped_with_a_manifest(tree, tmp_path, monkeypatch):
+    gone = os.path.realpath(tree / "c")
+    real_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        if os.path.realpath(path) == gone:
+            raise FileNotFoundError(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", stat)
+    manifest = ScanManifest(str(tree), str(tmp_path / "manifest.json"))
+    found = walk_files(str(tree), manifest=manifest)
+    assert "a/b/two.tsv" in {f.relpath for f in found}
+    assert not any(f.relpath.startswith("c/") for f in found)
+
+
+def test_accelerators_are_opt_in(monkeypatch):
+    monkeypatch.delenv("DEPICTIO_SCAN_WORKERS", raising=False)
+    monkeypatch.delenv("DEPICTIO_SCAN_MANIFEST", raising=False)
+    assert scan_workers() == 1 and not manifest_enabled()
+    monkeypatch.setenv("DEPICTIO_SCAN_WORKERS", "garbage")
+    assert scan_workers() == 1
+    monkeypatch.setenv("DEPICTIO_SCAN_WORKERS", "1000")
+    assert scan_workers() == 64
+    monkeypatch.setenv("DEPICTIO_SCAN_MANIFEST", "true")
+    assert manifest_enabled()
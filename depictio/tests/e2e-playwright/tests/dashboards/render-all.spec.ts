@@ -0,0 +1,46 @@
+/**
+ * A filter round renders the whole dashboard through one `render_all` request.
+ *
+ * The figures, the table's first block and the cards of the seeded Iris
+ * dashboard each used to POST to their own endpoint on every filter change.
+ * They now share one NDJSON stream (`renderBatch.ts`), and only fall back to
+ * their own endpoints when the stream can't answer them — which, for this
+ * dashboard, should never happen.
+ */
+
+import type { Request } from "@playwright/test";
+import { test, expect } from "@fixtures/auth";
+
+// Static ID of the Iris dashboard (depictio/projects/init/iris/.db_seeds).
+const IRIS_DASHBOARD_ID = "6824cb3b89d2b72169309737";
+
+const RENDER_ALL = /\/dashboards\/render_all\//;
+const PER_COMPONENT = /\/dashboards\/(render_figure|render_table|bulk_compute_cards)\//;
+
+test.describe("Dashboard render round", () => {
+  test("one filter change issues one render_all request", async ({ loginAsAdmin, page }) => {
+    await loginAsAdmin();
+    await page.goto(`/dashboard/${IRIS_DASHBOARD_ID}`);
+    const multiSelect = page.getByPlaceholder("Select variety…").first();
+    await expect(multiSelect).toBeVisible({ timeout: 30_000 });
+    await page.waitForLoadState("networkidle");
+
+    const renders: Request[] = [];
+    page.on("request", (req) => {
+      if (req.method() === "POST" && (RENDER_ALL.test(req.url()) || PER_COMPONENT.test(req.url()))) {
+        renders.push(req);
+      }
+    });
+
+    await multiSelect.click();
+    await page.getByRole("option", { name: /setosa/i }).first().click();
+    await page.keyboard.press("Escape");
+    // Past the filter debounce, then until the round's stream has drained.
+    await page.waitForTimeout(1_000);
+    await page.waitForLoadState("networkidle");
+
+    const urls = renders.map((r) => r.url());
+    expect(urls.filter((u) => RENDER_ALL.test(u)), urls.join("\n")).toHaveLength(1);
+    expect(urls.filter((u) => PER_COMPONENT.test(u)), urls.join("\n")).toHaveLength(0);
+  });
+});
@@ -103,6 +103,17 @@ def test_total_rows_is_the_pre_sample_count(patched_scan):
     assert frame.height < n
 
 
+def test_a_count_the_caller_already_has_is_not_taken_again(patched_scan):
+    """``render_all`` hands over the row count its fused scan produced."""
+    patched_scan(pl.DataFrame({"row_id": range(250_000)}))
+
+    frame, total, sampling = _reduce(["row_id"], cap=1_000, total=240_000)
+
+    assert total == 240_000
+    assert sampling["sampled"] is True
+    assert frame.height < 250_000
+
+
 def test_small_frames_are_returned_whole(patched_scan):
     """Below the cap there is nothing to reduce — and nothing to flag."""
     patched_scan(pl.DataFrame({"row_id": range(300)}))
@@ -0,0 +1,143 @@
+"""The ingest-time column catalog agrees with the scans it stands in for.
+
+``depictio.models.column_stats`` summarises every column of a Delta version once
+(counts, distinct values, bounds, value counts, histogram) so MultiSelect
+options, card specs and the builder's breakdown preview stop scanning. What is
+pinned here: each number matches what the scan would have produced, NaN is a
+missing value exactly as in the aggregation specs, high-cardinality columns get
+no dictionary, and a catalog written for older data is never served.
+"""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from depictio.api.v1.services import column_stats as service
+from depictio.api.v1.services.card_breakdown import breakdown_from_stats, compute_breakdown
+from depictio.models.column_stats import (
+    compute_column_stats,
+    read_column_stats,
+    stats_sidecar_path,
+    value_string,
+)
+
+pytestmark = pytest.mark.no_db
+
+_FRAME = pl.DataFrame(
+    {
+        "variety": ["Setosa"] * 5 + ["Versicolor"] * 3 + ["Virginica"] * 2 + [None],
+        "petal": [1.0, 2.0, float("nan"), 4.0, 5.0, 6.0, None, 8.0, 9.0, 10.0, 11.0],
+        "sample": [f"s{i}" for i in range(11)],
+    }
+)
+
+
+def _by_column(frame: pl.DataFrame) -> dict:
+    return {row["column"]: row for row in frame.iter_rows(named=True)}
+
+
+@pytest.fixture
+def catalog() -> dict:
+    return _by_column(compute_column_stats(_FRAME.lazy()))
+
+
+def test_counts_treat_nan_as_missing(catalog):
+    petal = catalog["petal"]
+    assert petal["rows"] == 11
+    assert petal["null_count"] == 2
+    assert petal["count"] == 9
+    assert (petal["min_numeric"], petal["max_numeric"]) == (1.0, 11.0)
+
+
+def test_dictionary_is_the_full_value_count(catalog):
+    variety = catalog["variety"]
+    assert variety["n_unique"] == 3 and variety["n_unique_exact"]
+    assert variety["dictionary"] == [
+        {"value": "Setosa", "count": 5},
+        {"value": "Versicolor", "count": 3},
+        {"value": "Virginica", "count": 2},
+    ]
+    assert variety["min"] == "Setosa" and variety["max"] == "Virginica"
+
+
+def test_histogram_covers_every_finite_value(catalog):
+    histogram = catalog["petal"]["histogram"]
+    assert len(histogram) == 20
+    assert sum(b["count"] for b in histogram) == 9
+    assert histogram[0]["lower"] == 1.0 and histogram[-1]["upper"] == pytest.approx(11.0)
+
+
+def test_high_cardinality_columns_have_no_dictionary():
+    rows = compute_column_stats(_FRAME.lazy(), dictionary_max_values=4, top_k=2)
+    sample = {row["column"]: row for row in rows.iter_rows(named=True)}["sample"]
+    assert sample["dictionary"] is None
+    assert service.catalog_unique_values(sample, 100) is None
+
+
+def test_unique_values_are_sorted_and_limited(catalog):
+    assert service.catalog_unique_values(catalog["variety"], 2) == ["Setosa", "Versicolor"]
+
+
+def test_catalog_specs_match_the_precomputed_spec_keys(catalog):
+    specs = service.catalog_specs(catalog)
+    assert specs["variety"] == {"count": 10, "nunique": 3}
+    assert specs["petal"]["count"] == 9 and specs["petal"]["max"] == 11.0
+
+
+def test_catalog_specs_keep_the_stored_names_and_types():
+    frame = pl.DataFrame({"n": [3, 1, 2**60], "flag": [True, False, True]})
+    catalog = _by_column(compute_column_stats(frame.lazy()))
+    specs = service.catalog_specs(catalog)
+    # Numeric columns record ``unique``, and an Int64 bound stays an exact int.
+    assert specs["n"] == {"count": 3, "unique": 3, "min": 1, "max": 2**60}
+    assert isinstance(specs["n"]["min"], int)
+    # ``bool`` has neither a distinct count nor catalog-backed bounds.
+    assert specs["flag"] == {"count": 3}
+
+
+def test_bookkeeping_columns_get_no_entry():
+    frame = _FRAME.with_columns(pl.lit("h").alias("depictio_source_hash"))
+    assert "depictio_source_hash" not in _by_column(compute_column_stats(frame.lazy()))
+
+
+def test_catalog_values_read_like_the_scan():
+    frame = pl.DataFrame(
+        {"flag": [True, False, None], "day": [datetime(2024, 1, 1), datetime(2024, 1, 2), None]}
+    )
+    catalog = _by_column(compute_column_stats(frame.lazy()))
+    for column in frame.columns:
+        scanned = sorted(value_string(v) for v in frame[column].drop_nulls().unique())
+        assert service.catalog_unique_values(catalog[column], 10) == scanned
+    assert scanned == ["2024-01-01 00:00:00", "2024-01-02 00:00:00"]
+    assert catalog["day"]["min"] == "2024-01-01 00:00:00"
+
+
+@pytest.mark.parametrize("top_n", [1, 3, 9])
+def test_breakdown_from_stats_matches_the_scan(catalog, top_n):
+    scanned = compute_breakdown(_FRAME, "sample", "variety", "count", top_n)
+    assert breakdown_from_stats(catalog["variety"], "sample", "variety", "count", top_n) == scanned
+
+
+def test_breakdown_from_stats_declines_per_group_reductions(catalog):
+    assert breakdown_from_stats(catalog["variety"], "petal", "variety", "sum", 3) is None
+    assert breakdown_from_stats(catalog["petal"], "petal", "petal", "count", 3) is None
+
+
+def test_sidecar_round_trip(tmp_path):
+    path = stats_sidecar_path(str(tmp_path), 7)
+    assert path.endswith("/_depictio/stats/v00000000000000000007.parquet")
+    compute_column_stats(_FRAME.lazy()).write_parquet(str(tmp_path / "c.parquet"))
+    assert read_column_stats(str(tmp_path / "c.parquet"))["variety"]["count"] == 10
+
+
+def test_stale_catalog_is_not_served(tmp_path):
+    path = str(tmp_path / "c.parquet")
+    compute_column_stats(_FRAME.lazy()).write_parquet(path)
+    doc = {
+        "aggregation": [{"aggregation_hash": "old"}, {"aggregation_hash": "new"}],
+        "flexible_metadata": {"column_stats": {"path": path, "aggregation_hash": "old"}},
+    }
+    assert service.column_catalog("dc", doc) is None
+    doc["flexible_metadata"]["column_stats"]["aggregation_hash"] = "new"
+    assert service.column_catalog("dc", doc)["variety"]["n_unique"] == 3
@@ -0,0 +1,182 @@
+"""Persisted embeddings: one fit per version, filters subset it, appends extend it.
+
+``services.embedding_cache`` replaces a per-request refit with an artifact keyed
+by the Delta version and the fit's parameters. What is pinned here: a filtered
+request returns exactly the full fit's coordinates for the filtered samples; a
+second request reuses the artifact rather than refitting; an append-only
+version keeps every earlier coordinate and places the new samples with the
+stored model, while an overwrite refits. The randomized PCA solver the cache
+fits with must agree with the full SVD, which ``run_pca`` keeps for recipes.
+"""
+
+from unittest.mock import patch
+
+import mongomock
+import numpy as np
+import polars as pl
+import pytest
+from bson import ObjectId
+
+from depictio.api.v1.services import embedding_cache
+from depictio.recipes.lib import dimreduction
+
+pytestmark = pytest.mark.no_db
+
+DC = "507f1f77bcf86cd799439017"
+PCA = {"n_components": 2, "scale": True}
+
+
+def _matrix(n: int, start: int = 0, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    latent = rng.normal(size=(n, 3))
+    values = latent @ rng.normal(size=(3, 12)) + 0.05 * rng.normal(size=(n, 12))
+    frame = pl.DataFrame(values, schema=[f"f{i}" for i in range(12)])
+    return frame.with_columns(
+        pl.Series("sample_id", [f"s{i}" for i in range(start, start + n)]),
+        pl.Series("group", ["a", "b"] * (n // 2)),
+    ).select("sample_id", "group", pl.col("^f.*$"))
+
+
+@pytest.fixture
+def table(tmp_path):
+    location = str(tmp_path / "matrix")
+    _matrix(200).write_delta(location)
+    collection = mongomock.MongoClient().db.deltatables
+    collection.insert_one({"data_collection_id": ObjectId(DC), "delta_table_location": location})
+    with patch("depictio.api.v1.db.deltatables_collection", collection):
+        yield location, collection
+
+
+def _embed(method="pca", kwargs=PCA, filters=None, extra_cols=("group",)):
+    stats: dict = {}
+    frame = embedding_cache.cached_embedding(
+        DC, method, kwargs, "sample_id", filters, list(extra_cols), stats
+    )
+    return frame, stats
+
+
+def _group(value):
+    return {
+        "metadata": {"column_name": "group", "interactive_component_type": "MultiSelect"},
+        "value": [value],
+    }
+
+
+def test_filtered_views_subset_the_full_fit(table):
+    full, stats = _embed()
+    assert stats["source"] == "fitted"
+    assert full.columns == ["sample_id", "group", "dim_1", "dim_2"]
+    assert full.height == 200
+
+    with patch.object(embedding_cache, "_fit", side_effect=AssertionError("refit")):
+        subset, stats = _embed(filters=[_group("b")])
+    assert stats["source"] == "artifact"
+    assert subset["group"].unique().to_list() == ["b"]
+    expected = full.filter(pl.col("group") == "b")
+    assert subset.equals(expected)
+
+
+def test_appended_samples_are_transformed_onto_the_fit(table):
+    location, collection = table
+    before, _ = _embed()
+    first = collection.find_one()["flexible_metadata"]["embeddings"][0]
+    assert first["model"].endswith(".npz")
+    model = embedding_cache._load_model(embedding_cache._get(first["model"]))
+
+    added = _matrix(20, start=200, seed=1)
+    added.write_delta(location, mode="append")
+    with patch.object(embedding_cache, "_fit", side_effect=AssertionError("refit")):
+        after, stats = _embed()
+    assert stats["source"] == "appended"
+    assert after.height == 220
+
+    # Earlier samples keep their coordinates exactly.
+    kept = after.join(before, on="sample_id", suffix="_before")
+    assert kept.height == 200
+    assert (kept["dim_1"] == kept["dim_1_before"]).all()
+
+    # New samples land where the stored model puts them.
+    placed = dimreduction.transform_embedding(model, added.drop("group"))
+    new = after.filter(pl.col("sample_id").is_in(placed["sample_id"].implode()))
+    assert np.allclose(new.sort("sample_id")["dim_1"], placed.sort("sample_id")["dim_1"])
+
+    # Only the new version is recorded; the old artifact is gone.
+    recorded = collection.find_one()["flexible_metadata"]["embeddings"]
+    assert [e["delta_version"] for e in recorded] == [1]
+    assert embedding_cache._read_coords(first["path"]) is None
+
+
+def test_stored_models_never_unpickle():
+    import io
+
+    buffer = io.BytesIO()
+    np.savez(buffer, mean=np.array([object()]), scale=np.ones(1), components=np.ones((1, 1)))
+    with pytest.raises(ValueError):
+        embedding_cache._load_model(buffer.getvalue())
+
+
+def test_an_overwrite_refits(table):
+    location, _ = table
+    _embed()
+    _matrix(200, seed=2).write_delta(location, mode="overwrite")
+    _, stats = _embed()
+    assert stats["source"] == "fitted"
+
+
+def test_duplicate_ids_are_not_cached(tmp_path):
+    location = str(tmp_path / "dup")
+    frame = _matrix(10)
+    pl.concat([frame, frame]).write_delta(location)
+    collection = mongomock.MongoClient().db.deltatables
+    collection.insert_one({"data_collection_id": ObjectId(DC), "delta_table_location": location})
+    with patch("depictio.api.v1.db.deltatables_collection", collection):
+        assert _embed()[0] is None
+
+
+def test_parameters_key_separate_artifacts(table):
+    _embed()
+    _, stats = _embed(kwargs={"n_components": 3, "scale": True})
+    assert stats["source"] == "fitted"
+
+
+# --------------------------------------------------------------------------- #
+# dimreduction
+# --------------------------------------------------------------------------- #
+
+
+def test_randomized_pca_matches_the_full_svd():
+    rng = np.random.default_rng(3)
+    x = (rng.normal(size=(300, 4)) * [5, 3, 2, 1]) @ rng.normal(size=(4, 900))
+    x += 0.01 * rng.normal(size=x.shape)
+    x -= x.mean(axis=0)
+    fast = dimreduction._top_components(x, 2, random_state=0)
+    _, _, vt = np.linalg.svd(x, full_matrices=False)
+    # Singular vectors are defined up to sign.
+    assert np.allclose(np.abs(fast @ vt[:2].T), np.eye(2), atol=1e-3)
+
+
+def test_matrix_is_writable_in_the_requested_dtype():
+    _, x = dimreduction._split_sample_ids(_matrix(10).drop("group"), dtype=np.float32)
+    assert x.dtype == np.float32 and x.flags.writeable
+    _, x = dimreduction._split_sample_ids(_matrix(10).drop("group"))
+    assert x.dtype == np.float64 and x.flags.writeable
+
+
+def test_run_pca_stays_exact_on_wide_matrices():
+    """Recipe callers keep float64 and the full SVD, past the randomized threshold too."""
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=(20, 600))
+    matrix = pl.DataFrame(values, schema=[f"f{i}" for i in range(600)]).insert_column(
+        0, pl.Series("sample_id", [f"s{i}" for i in range(20)])
+    )
+    x = (values - values.mean(axis=0)) / values.std(axis=0)
+    _, _, vt = np.linalg.svd(x, full_matrices=False)
+    coords = dimreduction.run_pca(matrix)
+    assert np.array_equal(coords["dim_1"].to_numpy(), (x @ vt[:2].T)[:, 0])
+
+
+def test_pca_model_reproduces_the_fit():
+    matrix = _matrix(50).drop("group")
+    coords, model = dimreduction.fit_pca(matrix)
+    again = dimreduction.transform_embedding(model, matrix)
+    assert np.allclose(coords["dim_1"], again["dim_1"], atol=1e-4)
@@ -14,6 +14,7 @@ import pytest
 
 from depictio.api.v1.services.figure.aggregate import (
     build_aggregated_figure,
+    first_pass,
     plan_aggregation,
 )
 from depictio.api.v1.services.figure.figure_builder import (
@@ -116,6 +117,40 @@ def test_bar_is_no_longer_randomly_sampled():
     assert "bar" not in _SAMPLABLE_PLOT_TYPES
 
 
+@pytest.mark.parametrize(
+    "visu,kwargs",
+    [
+        ("box", {"x": "g", "y": "v"}),
+        ("histogram", {"x": "v", "color": "sex"}),
+        ("density_heatmap", {"x": "v", "y": "w"}),
+        ("bar", {"x": "g", "y": "v"}),
+        ("ecdf", {"x": "v"}),
+    ],
+)
+def test_a_prefetched_first_pass_draws_the_same_figure(frame, visu, kwargs):
+    """What ``render_all`` fuses on its planner is exactly the builder's own pass."""
+    plan = plan_aggregation(visu, kwargs)
+    prefetched = first_pass(frame.lazy(), plan).collect()
+    direct = build_aggregated_figure(frame.lazy(), plan, "light", {})
+    reused = build_aggregated_figure(frame.lazy(), plan, "light", {}, prefetched=prefetched)
+    assert reused.to_json() == direct.to_json()
+
+
+def test_a_prefetched_first_pass_is_not_read_again(frame):
+    plan = plan_aggregation("bar", {"x": "g", "y": "v"})
+    prefetched = pl.DataFrame({"g": ["a"], "v": [-1.0]})
+    fig = build_aggregated_figure(frame.lazy(), plan, "light", {}, prefetched=prefetched)
+    assert list(fig.data[0].y) == [-1.0]
+
+
+def test_sketched_paths_have_no_first_pass_to_plan(frame, monkeypatch):
+    from depictio.api.v1.configs.config import settings
+
+    monkeypatch.setattr(settings.performance, "figure_sketch_accuracy", 0.01)
+    for visu in ("box", "violin"):
+        assert first_pass(frame.lazy(), plan_aggregation(visu, {"x": "g", "y": "v"})) is None
+
+
 # --------------------------------------------------------------------------- #
 # Approximate paths declare themselves
 # --------------------------------------------------------------------------- #
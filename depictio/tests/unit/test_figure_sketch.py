@@ -0,0 +1,267 @@
+"""Quantile sketches: bounded error, exact moments, and merging instead of rescanning.
+
+``services.figure.sketch`` buckets values on a log grid of ratio ``1 + alpha``,
+so every quantile it reports must land within ``alpha`` of numpy's, relative to
+its magnitude — that is the whole contract, and it is checked against numpy
+rather than against stored numbers. The per-bucket extremes and moments must
+keep the minimum, maximum, count and mean exact. Sketches of disjoint rows must
+merge into the sketch of their union, which is what lets a persisted
+per-partition sketch answer a filtered figure without reading the table.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+import pytest
+
+from depictio.api.v1.services import sort_index
+from depictio.api.v1.services.figure import sketch
+from depictio.api.v1.services.figure.aggregate import build_aggregated_figure, plan_aggregation
+
+ALPHA = 0.01
+DC = "507f1f77bcf86cd799439015"
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    """Heavy-tailed, both signs, some zeros and nulls: the awkward cases for a log grid."""
+    rng = np.random.default_rng(0)
+    n = 60_000
+    values = rng.lognormal(0, 2, n) * np.where(rng.random(n) < 0.3, -1, 1)
+    values[::97] = 0.0
+    return pl.DataFrame(
+        {
+            "g": rng.choice(["a", "b", "c"], n),
+            "habitat": rng.choice(["river", "lake", "sea"], n),
+            "v": pl.Series(values).scatter(list(range(5, n, 1001)), None),
+            "k": rng.integers(0, 40, n),
+        }
+    )
+
+
+@pytest.fixture
+def sketch_on(monkeypatch):
+    from depictio.api.v1.configs.config import settings
+
+    monkeypatch.setattr(settings.performance, "figure_sketch_accuracy", ALPHA)
+
+
+def _within(got: float, exact: float, alpha: float = ALPHA) -> bool:
+    return abs(got - exact) <= alpha * abs(exact) + 1e-12
+
+
+def test_quantiles_are_within_the_accuracy(frame):
+    sk = sketch.sketch(frame.lazy(), "v", ["g"], ALPHA).collect()
+    probs = [0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0]
+    got = sketch.quantiles(sk, ["g"], probs)
+    for (g,), values in got.items():
+        exact = frame.filter(pl.col("g") == g)["v"].drop_nulls().to_numpy()
+        for p, value in zip(probs, values):
+            assert _within(value, np.quantile(exact, p)), (g, p)
+
+
+def test_group_stats_are_exact(frame):
+    sk = sketch.sketch(frame.lazy(), "v", ["g"], ALPHA).collect()
+    stats = sketch.group_stats(sk, ["g"])
+    for row in stats.iter_rows(named=True):
+        exact = frame.filter(pl.col("g") == row["g"])["v"].drop_nulls().to_numpy()
+        assert row["_n"] == len(exact)
+        assert (row["_min"], row["_max"]) == (exact.min(), exact.max())
+        assert row["_mean"] == pytest.approx(exact.mean())
+        assert row["_std"] == pytest.approx(exact.std(ddof=1))
+
+
+def test_integer_data_comes_out_exact(frame):
+    """Each bucket of a small-integer column holds one value, so nothing is estimated."""
+    sk = sketch.sketch(frame.lazy(), "k", [], ALPHA).collect()
+    got = sketch.quantiles(sk, [], [0.25, 0.5, 0.75])[()]
+    assert got.tolist() == np.quantile(frame["k"].to_numpy(), [0.25, 0.5, 0.75]).tolist()
+
+
+def test_partition_sketches_merge_into_the_whole(frame):
+    whole = sketch.sketch(frame.lazy(), "v", ["g"], ALPHA).collect()
+    by_habitat = sketch.sketch(frame.lazy(), "v", ["g", "habitat"], ALPHA)
+    merged = sketch.merge(by_habitat, ["g"]).collect()
+
+    order = ["g", sketch.BUCKET]
+    assert merged.sort(order)["_n"].to_list() == whole.sort(order)["_n"].to_list()
+    for name in ("_min", "_max", "_mean", "_m2"):
+        assert np.allclose(merged.sort(order)[name], whole.sort(order)[name])
+
+
+def test_box_quartiles_come_from_the_sketch(sketch_on, frame):
+    stats: dict = {}
+    fig = build_aggregated_figure(
+        frame.lazy(), plan_aggregation("box", {"x": "g", "y": "v"}), "light", stats
+    )
+    assert fig is not None and stats["sampled"] is True
+    trace = fig.data[0]
+    for i, g in enumerate(trace.x):
+        exact = frame.filter(pl.col("g") == g)["v"].drop_nulls().to_numpy()
+        assert _within(trace.q1[i], np.percentile(exact, 25))
+        assert _within(trace.median[i], np.percentile(exact, 50))
+        assert _within(trace.q3[i], np.percentile(exact, 75))
+        assert trace.lowerfence[i] >= exact.min() and trace.upperfence[i] <= exact.max()
+
+
+def test_violin_ships_sketch_quantiles_per_group(sketch_on, frame):
+    stats: dict = {}
+    plan = plan_aggregation("violin", {"x": "g", "y": "v", "color": "habitat"})
+    fig = build_aggregated_figure(frame.lazy(), plan, "light", stats)
+    assert fig is not None and stats["sampled"] is True
+    assert stats["total_rows"] == frame["v"].drop_nulls().len()
+    assert len(fig.data) == 9
+    # One legend entry per colour, however many groups it spans.
+    assert sorted(t.name for t in fig.data if t.showlegend) == ["lake", "river", "sea"]
+
+    trace = next(t for t in fig.data if t.name == "sea" and t.x[0] == "b")
+    exact = frame.filter((pl.col("g") == "b") & (pl.col("habitat") == "sea"))["v"]
+    exact = exact.drop_nulls().to_numpy()
+    assert (min(trace.y), max(trace.y)) == (exact.min(), exact.max())
+    # The bandwidth is the full group's, narrower than 1024 points would give.
+    points_rule = 1.059 * min(
+        exact.std(ddof=1), np.subtract(*np.percentile(exact, [75, 25])) / 1.349
+    )
+    assert trace.bandwidth < max(points_rule * len(trace.y) ** -0.2, np.ptp(exact) / 100) + 1e-9
+
+
+def test_faceted_violin_keeps_the_subsample(sketch_on, frame):
+    plan = plan_aggregation("violin", {"y": "v", "facet_col": "g"})
+    fig = build_aggregated_figure(frame.lazy(), plan, "light", {})
+    assert fig is not None
+    assert all(t.bandwidth is None for t in fig.data)
+
+
+# --------------------------------------------------------------------------- #
+# Persisted per-partition sketches
+# --------------------------------------------------------------------------- #
+
+
+def _filter(column, values):
+    return {
+        "metadata": {"column_name": column, "interactive_component_type": "MultiSelect"},
+        "value": values,
+    }
+
+
+@pytest.fixture
+def table(frame, tmp_path):
+    """A "Delta table" at ``tmp_path`` served from ``frame``, without Delta, Mongo or Celery.
+
+    Enqueued builds are collected; ``worker`` runs them the way the Celery
+    worker would.
+    """
+    sketch._registry.clear()
+    sketch._refused.clear()
+    built: list[str] = []
+    enqueued: list[tuple] = []
+    real_build = sketch._build
+
+    def build(*args):
+        built.append(args[1])
+        return real_build(*args)
+
+    def worker():
+        while enqueued:
+            dc_id, location, version, _path, *spec = enqueued.pop(0)
+            sketch.build_sketch(dc_id, location, version, *spec)
+
+    with (
+        patch.object(pl, "scan_delta", lambda *a, **k: frame.lazy()),
+        patch.object(sort_index, "_delta_version", lambda loc, salt: 3),
+        patch.object(sketch, "record_version", lambda *a: None),
+        patch.object(sketch, "_build", build),
+        patch.object(sketch, "_schedule_build", lambda *a: enqueued.append(a)),
+    ):
+        yield str(tmp_path), built, enqueued, worker
+
+
+def test_first_render_enqueues_instead_of_building(table, tmp_path):
+    location, built, enqueued, worker = table
+    source = sketch.SketchSource(DC, location, "salt", [_filter("habitat", ["river"])])
+    assert sketch.persisted_sketch(source, "v", ["g"], ALPHA) is None
+    assert len(enqueued) == 1
+    assert built == []
+    assert not list(tmp_path.rglob("*.parquet"))
+
+    worker()
+    assert sketch.persisted_sketch(source, "v", ["g"], ALPHA) is not None
+    assert len(built) == 1
+    assert enqueued == []
+
+
+def test_enqueue_is_once_per_path(monkeypatch):
+    class _Task:
+        calls: list[tuple] = []
+
+        @classmethod
+        def delay(cls, *args):
+            cls.calls.append(args)
+
+    from depictio.api.v1 import celery_tasks
+
+    monkeypatch.setattr(celery_tasks, "build_sketch", _Task)
+    monkeypatch.setattr(sketch, "_scheduled", {})
+    for _ in range(3):
+        sketch._schedule_build(DC, "/t", 3, "/t/p.parquet", "v", ["g"], ["habitat"], ALPHA)
+    sketch._schedule_build(DC, "/t", 3, "/t/q.parquet", "v", ["g"], [], ALPHA)
+    assert [c[5] for c in _Task.calls] == [["habitat"], []]
+
+
+def test_filtered_figures_merge_the_persisted_sketch(table, frame):
+    location, built, _, worker = table
+    first = sketch.SketchSource(DC, location, "salt", [_filter("habitat", ["river"])])
+    assert sketch.persisted_sketch(first, "v", ["g"], ALPHA) is None
+    worker()
+    for habitats in (["river"], ["lake", "sea"], ["sea"]):
+        source = sketch.SketchSource(DC, location, "salt", [_filter("habitat", habitats)])
+        got = sketch.persisted_sketch(source, "v", ["g"], ALPHA)
+        filtered = frame.lazy().filter(pl.col("habitat").is_in(habitats))
+        live = sketch.sketch(filtered, "v", ["g"], ALPHA).collect()
+
+        order = ["g", sketch.BUCKET]
+        assert got is not None
+        assert got.sort(order)["_n"].to_list() == live.sort(order)["_n"].to_list()
+        assert got.sort(order)["_min"].to_list() == live.sort(order)["_min"].to_list()
+
+    # Built once, by the habitat partition, and reused for every filter after.
+    assert len(built) == 1
+    assert built[0].startswith(f"{location}/_depictio/sketches/v00000000000000000003-")
+
+
+def test_filter_on_the_plotted_column_scans_instead(table):
+    location, built, enqueued, _ = table
+    source = sketch.SketchSource(DC, location, "salt", [_filter("v", [1.0])])
+    assert sketch.persisted_sketch(source, "v", ["g"], ALPHA) is None
+    assert built == []
+    assert enqueued == []
+
+
+def test_large_partitions_are_not_persisted(table, monkeypatch):
+    location, built, enqueued, worker = table
+    monkeypatch.setattr(sketch, "_MAX_PERSISTED_GROUPS", 5)
+    source = sketch.SketchSource(DC, location, "salt", [_filter("habitat", ["sea"])])
+    assert sketch.persisted_sketch(source, "v", ["g"], ALPHA) is None
+    worker()
+    assert sketch.persisted_sketch(source, "v", ["g"], ALPHA) is None
+    assert len(built) == 1  # refused once, not retried
+    assert enqueued == []
+
+
+def test_box_served_from_the_persisted_sketch(sketch_on, table, frame):
+    location, _, _, worker = table
+    source = sketch.SketchSource(DC, location, "salt", [_filter("habitat", ["lake"])])
+    sketch.persisted_sketch(source, "v", ["g"], ALPHA)
+    worker()
+    filtered = frame.filter(pl.col("habitat") == "lake")
+    plan = plan_aggregation("box", {"x": "g", "y": "v"})
+    # An empty scan: a figure can only come from the persisted sketch.
+    scan = pl.LazyFrame(schema=filtered.schema)
+    fig = build_aggregated_figure(scan, plan, "light", {}, sketch_source=source)
+    assert fig is not None
+    trace = fig.data[0]
+    for i, g in enumerate(trace.x):
+        exact = filtered.filter(pl.col("g") == g)["v"].drop_nulls().to_numpy()
+        assert trace.customdata[i] == len(exact)
+        assert _within(trace.median[i], np.percentile(exact, 50))
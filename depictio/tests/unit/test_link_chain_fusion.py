@@ -0,0 +1,127 @@
+"""A multi-hop link path resolves as one lazy plan when it can.
+
+With metadata(habitat, sample) -> runs(sample, run) -> features(run), a habitat
+filter has to be translated twice: habitat -> sample on the first DC, then
+sample -> run on the second. Hop by hop that is two collects with the sample
+list shipped back in between; fused it is one semi-join plan. The answer must
+be the same either way, and paths the fusion can't express must still go hop by
+hop.
+"""
+
+import polars as pl
+import pytest
+
+from depictio.api.v1 import filter_links
+from depictio.api.v1.endpoints.links_endpoints import resolution
+
+pytestmark = pytest.mark.no_db
+
+_FRAMES = {
+    "meta": pl.DataFrame(
+        {
+            "habitat": ["river", "river", "lake", "sea"],
+            "sample": ["s1", "s2", "s3", "s4"],
+        }
+    ),
+    "runs": pl.DataFrame(
+        {
+            "sample": ["s1", "s1", "s2", "s3", "s9"],
+            "run": [101, 102, 201, 301, 901],
+        }
+    ),
+}
+
+
+def _link(link_id, source, target, source_column, resolver="direct"):
+    return {
+        "id": link_id,
+        "source_dc_id": source,
+        "target_dc_id": target,
+        "source_column": source_column,
+        "enabled": True,
+        "link_config": {"resolver": resolver},
+    }
+
+
+_PATH = [_link("l1", "meta", "runs", "sample"), _link("l2", "runs", "features", "run")]
+
+
+@pytest.fixture(autouse=True)
+def _frames(monkeypatch):
+    monkeypatch.setattr(resolution, "_scan_dc", lambda dc_id: _FRAMES[dc_id].lazy())
+
+
+def test_two_translating_hops_resolve_in_one_plan():
+    values = resolution.resolve_link_chain(_PATH, "habitat", ["river"])
+    # river -> s1, s2 -> runs 101, 102, 201, as strings like DirectResolver.
+    assert sorted(values) == ["101", "102", "201"]
+
+
+def test_a_chain_matching_nothing_is_empty_not_none():
+    assert resolution.resolve_link_chain(_PATH, "habitat", ["desert"]) == []
+
+
+def test_pass_through_hops_are_not_scanned():
+    # Filtering on the join column already: hop 0 passes the values through,
+    # so only hop 1 translates and there is nothing to fuse.
+    assert resolution.fusable_hops(_PATH, "sample") is None
+
+
+def test_non_direct_resolvers_go_hop_by_hop():
+    path = [_PATH[0], _link("l2", "runs", "features", "run", resolver="wildcard")]
+    assert resolution.resolve_link_chain(path, "habitat", ["river"]) is None
+
+
+def test_walk_uses_the_fused_plan(monkeypatch):
+    def _no_hops(**_kw):
+        raise AssertionError("fused path should not resolve hop by hop")
+
+    monkeypatch.setattr(filter_links, "resolve_link_values", _no_hops)
+    monkeypatch.setattr(filter_links, "_agg_hash", lambda dc_id: "h")
+    monkeypatch.setattr(filter_links, "_cache_get", lambda key: None)
+    monkeypatch.setattr(filter_links, "_cache_set", lambda key, value: None)
+
+    column, values = filter_links._walk_link_path(
+        path=_PATH,
+        project_id="p1",
+        origin_column="habitat",
+        origin_values=["lake"],
+        access_token="tok",
+        component_type="figure",
+    )
+    assert (column, values) == ("run", ["301"])
+
+
+def test_walk_without_a_token_resolves_nothing(monkeypatch):
+    """The fused plan must not skip the rule the hop-by-hop path applies."""
+
+    def _no_chain(*_a):
+        raise AssertionError("tokenless walk should not resolve the chain")
+
+    monkeypatch.setattr(filter_links, "_resolve_chain_cached", _no_chain)
+    column, values = filter_links._walk_link_path(
+        path=_PATH,
+        project_id="p1",
+        origin_column="habitat",
+        origin_values=["lake"],
+        access_token="",
+        component_type="figure",
+    )
+    assert (column, values) == (None, [])
+
+
+def test_resolve_endpoint_delegates_to_the_resolution_module(monkeypatch):
+    """The route shares its name with ``resolution.resolve_link``; it must call that."""
+    import asyncio
+
+    from depictio.api.v1.endpoints.links_endpoints import routes
+
+    project = {"_id": "p"}
+    calls = []
+    monkeypatch.setattr(routes, "_get_project_or_404", lambda project_id, user: project)
+    monkeypatch.setattr(
+        resolution, "resolve_link", lambda proj, request: calls.append((proj, request)) or "ok"
+    )
+    request = object()
+    assert asyncio.run(routes.resolve_link(request, "p", None)) == "ok"  # type: ignore[arg-type]
+    assert calls == [(project, request)]
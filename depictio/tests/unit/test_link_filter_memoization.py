@@ -186,18 +186,22 @@ def test_link_resolution_cache_key_is_salted_by_hash(monkeypatch):
 
     posted = []
 
-    class _Resp:
-        status_code = 200
+    def fake_resolve(project_id, payload):
+        posted.append(agg["hash"])
+        return {"resolved_values": [f"s{agg['hash']}"]}
 
-        def json(self):
-            return {"resolved_values": [f"s{agg['hash']}"]}
+    # Resolution runs in process now; the cache it shares is Redis.
+    monkeypatch.setattr(filter_links, "_resolve_in_process", fake_resolve)
+    store: dict = {}
 
-    def fake_post(url, **kwargs):
-        posted.append(agg["hash"])
-        return _Resp()
+    class _Cache:
+        def get(self, key):
+            return store.get(key)
+
+        def set(self, key, value, ttl=None):
+            store[key] = value
 
-    monkeypatch.setattr(filter_links.httpx, "post", fake_post)
-    filter_links.clear_link_resolution_cache()
+    monkeypatch.setattr("depictio.api.cache.get_cache", lambda: _Cache())
 
     def call():
         return filter_links.resolve_link_values(
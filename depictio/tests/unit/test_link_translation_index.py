@@ -0,0 +1,87 @@
+"""The ingest-time link translation index answers like the scan it replaces.
+
+``translate_filter_values`` turns a filter on one column of the source DC into
+the link keys of the matching rows. The index precomputes that per filter
+value; what is pinned here is that a lookup returns exactly the scan's key set,
+and that it declines — so the caller scans — whenever it was built from other
+data or doesn't cover the column.
+"""
+
+import polars as pl
+import pytest
+
+from depictio.api.v1.endpoints.links_endpoints import resolution, translation_index
+
+pytestmark = pytest.mark.no_db
+
+_SOURCE = pl.DataFrame(
+    {
+        "sample": [101, 101, 102, 103, 104, None],
+        "habitat": ["river", "lake", "river", "sea", None, "river"],
+        "depth": [1.5, 2.0, 3.5, 4.0, 5.0, 6.0],
+        "site": ["a", "a", "b", "b", "c", "c"],
+    }
+)
+
+
+def _doc(tmp_path, aggregation_hash="h1"):
+    keys, postings, filter_columns = translation_index.build_index_frames(
+        _SOURCE.lazy(), "sample", max_values=10
+    )
+    keys_path = str(tmp_path / "keys.parquet")
+    postings_path = str(tmp_path / "postings.parquet")
+    keys.write_parquet(keys_path)
+    postings.write_parquet(postings_path)
+    return {
+        "delta_table_location": str(tmp_path / "delta"),
+        "aggregation": [{"aggregation_hash": "h1"}],
+        "flexible_metadata": {
+            "link_index": [
+                {
+                    "link_column": "sample",
+                    "aggregation_hash": aggregation_hash,
+                    "filter_columns": filter_columns,
+                    "keys": keys_path,
+                    "postings": postings_path,
+                }
+            ]
+        },
+    }
+
+
+def _scan(column, values):
+    return set(_SOURCE.filter(pl.col(column).is_in(values))["sample"].drop_nulls().to_list())
+
+
+@pytest.mark.parametrize(
+    "column, values",
+    [("habitat", ["river"]), ("habitat", ["river", "sea"]), ("site", ["c"]), ("habitat", ["x"])],
+)
+def test_lookup_matches_the_scan(tmp_path, column, values):
+    found = translation_index.lookup(_doc(tmp_path), column, values, "sample")
+    assert found is not None
+    assert sorted(found) == sorted(_scan(column, values))
+    # Keys come back in the link column's own dtype, as the scan returns them.
+    assert all(isinstance(v, int) for v in found)
+
+
+def test_float_columns_are_not_indexed(tmp_path):
+    assert translation_index.lookup(_doc(tmp_path), "depth", [1.5], "sample") is None
+
+
+def test_an_index_from_an_older_aggregation_is_ignored(tmp_path):
+    doc = _doc(tmp_path, aggregation_hash="h0")
+    assert translation_index.lookup(doc, "habitat", ["river"], "sample") is None
+
+
+def test_translation_uses_the_index_without_scanning(tmp_path, monkeypatch):
+    doc = _doc(tmp_path)
+
+    def _no_scan(location):
+        raise AssertionError("indexed translation should not scan the source DC")
+
+    monkeypatch.setattr(resolution, "_deltatable_doc", lambda dc_id: doc)
+    monkeypatch.setattr(resolution, "_scan_location", _no_scan)
+
+    values = resolution.translate_filter_values("dc", "habitat", ["lake", "sea"], "sample")
+    assert sorted(values) == [101, 103]
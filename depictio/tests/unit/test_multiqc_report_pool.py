@@ -0,0 +1,170 @@
+"""MultiQC reports are served per plot, and several stay resident at once.
+
+``services.multiqc.report_pool`` replaces the resident ``multiqc.report`` (and
+its cloudpickle blob, which pickled the module by reference) with one pickled
+``Plot`` per figure. What is pinned here: a figure built from the pool is the
+one ``build_multiqc_figure`` builds from the parsed report; alternating between
+two reports parses each once; a process that never parsed a report serves it
+from the shared cache; concurrent requests for one report share one parse; an
+invalidated index is re-parsed; and plot lookup matches ``multiqc.get_plot``.
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.services.multiqc import figures, report_pool
+
+pytestmark = pytest.mark.no_db
+
+multiqc = pytest.importorskip("multiqc")
+
+PARQUET = str(
+    Path(__file__).parents[2]
+    / "projects/nf-core/ampliseq/2.16.0/multiqc/multiqc_data/multiqc.parquet"
+)
+PLOTS = [
+    ("cutadapt", "Filtered Reads", None),
+    ("fastqc", "Per Sequence GC Content", "Counts"),
+    ("fastqc", "Status Checks", None),
+]
+
+
+class _Cache:
+    """The slice of the shared cache the pool and figure path use."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = _Cache()
+    monkeypatch.setattr("depictio.api.cache.get_cache", lambda: fake)
+    monkeypatch.setattr(figures, "get_cache", lambda: fake)
+    monkeypatch.setattr(settings.performance, "multiqc_report_pool_workers", 0)
+    with report_pool._lru_lock:
+        report_pool._resident.clear()
+        report_pool._resident_bytes = 0
+    return fake
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls: list[list[str]] = []
+    real = report_pool._run_parse
+
+    def counting(local_paths):
+        calls.append(local_paths)
+        return real(local_paths)
+
+    monkeypatch.setattr(report_pool, "_run_parse", counting)
+    return calls
+
+
+def _render(module, plot, dataset=None, dc_id="a"):
+    return figures.create_multiqc_plot([PARQUET], module, plot, dataset, dc_id=dc_id)
+
+
+def test_pool_figures_match_the_parsed_report(cache):
+    from depictio.cli.cli.utils.multiqc_figures import build_multiqc_figure
+
+    pooled = [_render(*p).to_dict() for p in PLOTS]
+    with figures._multiqc_lock:
+        multiqc.reset()
+        multiqc.parse_logs(PARQUET)
+        direct = [build_multiqc_figure(*p).to_dict() for p in PLOTS]
+    assert pooled == direct
+
+
+def test_switching_reports_parses_each_once(cache, parses):
+    for dc_id in ("a", "b", "a", "b"):
+        cache.data = {k: v for k, v in cache.data.items() if not k.startswith("multiqc:figure")}
+        _render("fastqc", "Sequence Counts", dc_id=dc_id)
+    assert len(parses) == 2
+
+
+def test_plots_are_served_from_the_cache_without_a_parse(cache, parses):
+    _render("fastqc", "Sequence Counts")
+    with report_pool._lru_lock:
+        report_pool._resident.clear()
+        report_pool._resident_bytes = 0
+    fig = _render("fastqc", "Adapter Content")
+    assert len(parses) == 1
+    assert fig.data
+
+
+def test_concurrent_requests_share_one_parse(cache, parses):
+    barrier = threading.Barrier(4)
+    errors = []
+
+    def render(plot):
+        barrier.wait()
+        try:
+            report_pool.resident_plot([PARQUET], "fastqc", plot, dc_id="a")
+        except Exception as e:
+            errors.append(e)
+
+    names = ["Sequence Counts", "Adapter Content", "Status Checks", "Per Base N Content"]
+    threads = [threading.Thread(target=render, args=(n,)) for n in names]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(parses) == 1
+
+
+def test_an_invalidated_index_is_reparsed(cache, parses):
+    first = report_pool.resident_plot([PARQUET], "fastqc", "Sequence Counts", dc_id="a")
+    cache.data.clear()
+    again = report_pool.resident_plot([PARQUET], "fastqc", "Sequence Counts", dc_id="a")
+    assert len(parses) == 2
+    # The resident plot of the old parse is not served for the new one.
+    assert again is not first
+
+
+def test_unknown_module_lists_what_the_report_has(cache, parses):
+    missing = "available_modules=\\['Cutadapt', 'FastQC'\\]"
+    with pytest.raises(ValueError, match=missing):
+        _render("samtools", "Stats")
+    assert len(parses) == 1  # a fresh parse is not retried
+    with pytest.raises(ValueError, match=missing):
+        _render("samtools", "Stats")
+    assert len(parses) == 2  # a cached index might be stale: re-parsed once
+
+
+def test_lookup_matches_get_plot(cache):
+    report = report_pool.report_key([PARQUET], "a")
+    index = report_pool._parse(report, [PARQUET], True)["index"]
+    with figures._multiqc_lock:
+        multiqc.reset()
+        multiqc.parse_logs(PARQUET)
+        for module, entries in multiqc.list_plots().items():
+            for entry in entries:
+                for section in [entry] if isinstance(entry, str) else list(entry):
+                    expected = multiqc.get_plot(module.upper(), section.lower())
+                    anchor = report_pool._resolve(index, module.upper(), section.lower())
+                    assert anchor == str(expected.anchor)
+
+
+def test_resident_plots_stay_within_budget(cache, monkeypatch):
+    monkeypatch.setattr(settings.performance, "multiqc_resident_plots_mb", 1)
+    for module, plot, _ in PLOTS:
+        report_pool.resident_plot([PARQUET], module, plot, dc_id="a")
+    report_pool._admit("x", "big", "g", object(), 700 * 1024)
+    report_pool._admit("x", "bigger", "g", object(), 700 * 1024)
+    assert report_pool._resident_bytes <= 1024 * 1024
+    assert list(report_pool._resident)[-1] == ("x", "bigger")
@@ -0,0 +1,180 @@
+"""Sample filtering of MultiQC figures and of the general-stats table.
+
+``patching.patch_multiqc_figures`` filters with index arrays: what is pinned
+here is that every per-point attribute moves with the samples it belongs to,
+that heatmaps keep the axis with more matches, that the input figure is left
+alone, and that the per-axis ``sample -> positions`` maps are reused across
+filter changes. ``general_stats_payload`` now pivots with Polars; its
+paired-end read modes and sample filter are checked against a real report.
+"""
+
+import base64
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from depictio.api.v1.services.multiqc import general_stats_payload, patching
+
+pytestmark = pytest.mark.no_db
+
+PARQUET = str(
+    Path(__file__).parents[2]
+    / "projects/nf-core/ampliseq/2.16.0/multiqc/multiqc_data/multiqc.parquet"
+)
+
+
+def _bar():
+    return {
+        "type": "bar",
+        "orientation": "h",
+        "y": ["s1", "s2", "s3", "s4"],
+        "x": [1.0, 2.0, 3.0, 4.0],
+        "text": ["t1", "t2", "t3", "t4"],
+        "customdata": [[1, "a"], [2, "b"], [3, "c"], [4, "d"]],
+        "marker": {"color": ["r", "g", "b", "k"], "line": {"width": 1}},
+    }
+
+
+def test_bar_attributes_follow_their_samples():
+    fig = {"data": [_bar()], "layout": {"title": "t"}}
+    (patched,) = patching.patch_multiqc_figures([fig], ["s4", "s2", "missing"])
+    trace = patched["data"][0]
+    assert trace["y"] == ["s2", "s4"]
+    assert trace["x"] == [2.0, 4.0]
+    assert trace["text"] == ["t2", "t4"]
+    assert trace["customdata"] == [[2, "b"], [4, "d"]]
+    assert trace["marker"] == {"color": ["g", "k"], "line": {"width": 1}}
+
+
+def test_scalar_and_string_attributes_apply_to_every_point():
+    # Plotly allows one width/offset/base for every bar and one text for every
+    # point; even a string as long as the sample axis is not split up.
+    trace = dict(_bar(), width=0.8, offset=0.1, base=0.0, text="abcd", hovertext="abc")
+    (patched,) = patching.patch_multiqc_figures([{"data": [trace]}], ["s2"])
+    trace = patched["data"][0]
+    assert trace["y"] == ["s2"]
+    assert (trace["width"], trace["offset"], trace["base"]) == (0.8, 0.1, 0.0)
+    assert (trace["text"], trace["hovertext"]) == ("abcd", "abc")
+
+    heatmap = {"type": "heatmap", "y": ["s1", "s2", "s3"], "x": ["m1"], "z": [[1], [2], [3]]}
+    (patched,) = patching.patch_multiqc_figures([{"data": [dict(heatmap, text="abc")]}], ["s2"])
+    assert patched["data"][0]["z"] == [[2]]
+    assert patched["data"][0]["text"] == "abc"
+
+
+def test_input_figure_is_not_modified():
+    fig = {"data": [_bar()], "layout": {"title": "t"}}
+    (patched,) = patching.patch_multiqc_figures([fig], ["s1"])
+    patched["layout"]["_depictio_filter_applied"] = True
+    assert fig == {"data": [_bar()], "layout": {"title": "t"}}
+
+
+def test_heatmap_keeps_the_axis_with_more_matches():
+    z = [[10 * r + c for c in range(3)] for r in range(4)]
+    rows = {
+        "type": "heatmap",
+        "y": ["s1", "s2", "s3", "s4"],
+        "x": ["m1", "m2", "m3"],
+        "z": z,
+        "text": [[str(v) for v in row] for row in z],
+    }
+    (patched,) = patching.patch_multiqc_figures([{"data": [rows]}], ["s3", "s1"])
+    trace = patched["data"][0]
+    assert trace["y"] == ["s1", "s3"]
+    assert trace["z"] == [z[0], z[2]]
+    assert trace["text"] == [["0", "1", "2"], ["20", "21", "22"]]
+
+    columns = dict(rows, x=["s1", "s2", "s3"], y=["m1", "m2", "m3", "m4"])
+    (patched,) = patching.patch_multiqc_figures([{"data": [columns]}], ["s3", "s1"])
+    trace = patched["data"][0]
+    assert trace["x"] == ["s1", "s3"]
+    assert trace["z"] == [[row[0], row[2]] for row in z]
+
+
+def test_scatter_filters_by_name_or_point():
+    named = {"type": "scatter", "name": "s2", "x": [1, 2], "y": [3, 4]}
+    points = {"type": "scatter", "x": ["s1", "s2", "s3"], "y": [1, 2, 3], "text": ["a", "b", "c"]}
+    (patched,) = patching.patch_multiqc_figures([{"data": [named, points]}], ["s3"])
+    assert patched["data"][0]["visible"] is False
+    assert patched["data"][1]["x"] == ["s3"]
+    assert patched["data"][1]["text"] == ["c"]
+
+
+def test_typed_arrays_are_decoded():
+    values = np.array([1.5, 2.5, 3.5])
+    trace = {
+        "type": "bar",
+        "x": ["s1", "s2", "s3"],
+        "y": {"dtype": "f8", "bdata": base64.b64encode(values.tobytes()).decode()},
+    }
+    (patched,) = patching.patch_multiqc_figures([{"data": [trace]}], ["s3"])
+    assert patched["data"][0]["y"] == [3.5]
+
+
+def test_sample_index_is_reused_across_filter_changes(monkeypatch):
+    built = []
+    real_unique = np.unique
+
+    def counting(*args, **kwargs):
+        built.append(1)
+        return real_unique(*args, **kwargs)
+
+    monkeypatch.setattr(patching.np, "unique", counting)
+    trace = dict(_bar(), y=[f"sample-{i}" for i in range(4)])
+    for selection in (["sample-1"], ["sample-2", "sample-3"], ["sample-0"]):
+        patching.patch_multiqc_figures([{"data": [trace]}], selection)
+    assert len(built) == 1
+
+
+# --------------------------------------------------------------------------- #
+# general_stats_payload
+# --------------------------------------------------------------------------- #
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _templates():
+    # The violin figure uses the mantine templates, which the endpoint registers.
+    from depictio.cli.cli.utils.mantine_templates import ensure_mantine_templates
+
+    ensure_mantine_templates()
+
+
+@pytest.fixture(scope="module")
+def payload():
+    return general_stats_payload.build_general_stats_payload(PARQUET)
+
+
+def test_paired_end_report_has_every_read_mode(payload):
+    assert payload["is_paired_end"]
+    assert list(payload["modes"]) == ["mean", "r1", "r2", "all"]
+    mean = payload["modes"]["mean"]["table_data"]
+    names = [row["Sample Name"] for row in mean]
+    assert names == sorted(names)
+    assert not any(n.endswith(("_1", "_2")) for n in names)
+    # Payloads go out as JSON: missing cells must be null, never NaN.
+    json.dumps(payload, allow_nan=False)
+
+
+def test_mean_mode_averages_the_mates(payload):
+    def table(mode):
+        return {r["Sample Name"]: r for r in payload["modes"][mode]["table_data"]}
+
+    mean, r1, r2 = table("mean"), table("r1"), table("r2")
+    sample = next(iter(mean))
+    read_columns = [c for c in r1[sample] if c != "Sample Name" and r1[sample][c] is not None]
+    assert read_columns
+    for column in read_columns:
+        if r2[sample].get(column) is not None:
+            expected = (r1[sample][column] + r2[sample][column]) / 2
+            assert mean[sample][column] == pytest.approx(expected)
+
+
+def test_selected_samples_filter_the_table():
+    filtered = general_stats_payload.build_general_stats_payload(
+        PARQUET, selected_samples=["SRR10070131", "SRR10070130", "unknown"]
+    )
+    rows = filtered["modes"]["mean"]["table_data"]
+    assert [r["Sample Name"] for r in rows] == ["SRR10070130", "SRR10070131"]
+    assert "2 samples" in filtered["modes"]["mean"]["violin_figure"]["layout"]["title"]["text"]
@@ -0,0 +1,216 @@
+"""Real-time fan-out: the DC -> dashboard index and the per-client send queues.
+
+What is pinned here: a dashboard's entries cover every DC binding its
+components carry; saves, tab deletes and dashboard deletes keep the index in
+step with the stored documents; the change-stream watcher answers from the
+index; a stalled client neither delays the others nor grows without bound; and
+a burst of data-collection events, local or echoed back over pub/sub, reaches
+each subscriber as one refresh.
+"""
+
+import asyncio
+
+import pytest
+from bson import ObjectId
+from mongomock import MongoClient
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.services.events import dashboard_index
+from depictio.api.v1.services.events.connection_manager import ConnectionManager
+from depictio.api.v1.services.events.mongodb_watcher import MongoDBChangeWatcher
+from depictio.models.models.realtime import EventMessage, EventType
+
+pytestmark = pytest.mark.no_db
+
+DC_A, DC_B, DC_GEO = (str(ObjectId()) for _ in range(3))
+
+
+def _dashboard(dashboard_id, components, parent=None):
+    return {
+        "_id": dashboard_id,
+        "dashboard_id": dashboard_id,
+        "parent_dashboard_id": parent,
+        "stored_metadata": components,
+    }
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    db = MongoClient().db
+    monkeypatch.setattr(dashboard_index, "dashboards_collection", db.dashboards)
+    monkeypatch.setattr(dashboard_index, "dc_dashboard_index_collection", db.dc_dashboard_index)
+    monkeypatch.setattr(settings.events, "enabled", True)
+    return db
+
+
+def test_entries_cover_every_dc_binding():
+    dashboard = _dashboard(
+        ObjectId(),
+        [
+            {"index": "fig", "dc_id": DC_A, "dc_config": {"_id": ObjectId(DC_A)}},
+            {"index": "map", "dc_id": DC_B, "geojson_dc_id": DC_GEO},
+            {"index": "viz", "config": {"matrix_dc_id": DC_B, "tree_dc_id": None}},
+            {"index": "text", "dc_id": None},
+        ],
+    )
+    entries = {e["dc_id"]: e["component_ids"] for e in dashboard_index.dashboard_entries(dashboard)}
+    assert entries == {DC_A: ["fig"], DC_B: ["map", "viz"], DC_GEO: ["map"]}
+
+
+def test_index_follows_saves_and_deletes(collections):
+    main, tab = ObjectId(), ObjectId()
+    collections.dashboards.insert_many(
+        [
+            _dashboard(main, [{"index": "a", "dc_id": DC_A}]),
+            _dashboard(tab, [{"index": "b", "dc_id": DC_B}], parent=main),
+        ]
+    )
+    assert dashboard_index.rebuild_dashboard_index() == 2
+    assert dashboard_index.dashboards_for_dc(DC_B) == [str(tab)]
+
+    # A save that moves the main dashboard from DC A to DC B
+    collections.dashboards.update_one(
+        {"_id": main}, {"$set": {"stored_metadata": [{"index": "a", "dc_id": DC_B}]}}
+    )
+    dashboard_index.refresh_dashboard_index(str(main))
+    assert dashboard_index.dashboards_for_dc(DC_A) == []
+    assert sorted(dashboard_index.dashboards_for_dc(DC_B)) == sorted([str(main), str(tab)])
+
+    collections.dashboards.delete_one({"_id": tab})
+    dashboard_index.refresh_dashboard_index(tab)
+    assert dashboard_index.dashboards_for_dc(DC_B) == [str(main)]
+
+    collections.dashboards.delete_one({"_id": main})
+    dashboard_index.refresh_dashboard_index(main)
+    assert collections.dc_dashboard_index.count_documents({}) == 0
+
+
+def test_disabled_events_leave_the_index_alone(collections, monkeypatch):
+    monkeypatch.setattr(settings.events, "enabled", False)
+    collections.dashboards.insert_one(_dashboard(ObjectId(), [{"dc_id": DC_A}]))
+    assert dashboard_index.rebuild_dashboard_index() == 0
+    assert collections.dc_dashboard_index.count_documents({}) == 0
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _MotorCollection:
+    def __init__(self, sync_collection):
+        self._sync = sync_collection
+
+    def find(self, *args, **kwargs):
+        return _AsyncCursor(list(self._sync.find(*args, **kwargs)))
+
+
+@pytest.mark.asyncio
+async def test_watcher_reads_the_index(collections):
+    main = ObjectId()
+    collections.dashboards.insert_one(_dashboard(main, [{"dc_id": DC_A}, {"dc_id": DC_A}]))
+    dashboard_index.rebuild_dashboard_index()
+
+    async def ignore(event, dashboard_ids):
+        pass
+
+    watcher = MongoDBChangeWatcher(ignore)
+    name = settings.mongodb.collections.dc_dashboard_index_collection
+    watcher._db = {name: _MotorCollection(collections.dc_dashboard_index)}
+    assert await watcher._find_dashboards_using_dc(DC_A) == [str(main)]
+    assert await watcher._find_dashboards_using_dc(DC_B) == []
+
+
+class _Socket:
+    def __init__(self, stall: asyncio.Event | None = None):
+        self.sent: list[dict] = []
+        self._stall = stall
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        if self._stall is not None:
+            await self._stall.wait()
+        self.sent.append(data)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    # Events "disabled" keeps broadcast_to_dashboard off Redis: local delivery only.
+    monkeypatch.setattr(settings.events, "enabled", False)
+    monkeypatch.setattr(settings.events, "debounce_ms", 50)
+    monkeypatch.setattr(settings.events, "debounce_max_wait_ms", 1000)
+    monkeypatch.setattr(settings.events, "ws_send_queue_size", 4)
+    return ConnectionManager()
+
+
+def _event(dc_id=DC_A, event_type=EventType.DATA_COLLECTION_UPDATED, n=0):
+    return EventMessage(event_type=event_type, data_collection_id=dc_id, payload={"n": n})
+
+
+def _events(socket):
+    return [m for m in socket.sent if m.get("event_type") not in (None, "connection_established")]
+
+
+@pytest.mark.asyncio
+async def test_a_stalled_client_does_not_hold_up_the_others(manager):
+    stall = asyncio.Event()
+    slow, fast = _Socket(stall), _Socket()
+    slow_id = await manager.connect(slow, dashboard_id="d")
+    await manager.connect(fast, dashboard_id="d")
+
+    for n in range(10):
+        event = _event(event_type=EventType.DASHBOARD_UPDATED, n=n)
+        await manager.broadcast_to_dashboard("d", event)
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    assert [m["payload"]["n"] for m in _events(fast)] == list(range(10))
+    assert _events(slow) == []
+    assert manager._outboxes[slow_id].dropped > 0
+
+    stall.set()
+    await asyncio.sleep(0.01)
+    # The client stalled on its connection confirmation; of the events queued
+    # behind it only the newest that fit in its queue are left.
+    assert [m["payload"]["n"] for m in _events(slow)] == [6, 7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_a_burst_of_dc_events_is_one_refresh(manager):
+    socket = _Socket()
+    await manager.connect(socket, dashboard_id="d")
+
+    for n in range(50):
+        await manager.broadcast_to_dashboard("d", _event(n=n))
+    await manager.broadcast_to_dashboard("d", _event(dc_id=DC_B))
+    await asyncio.sleep(0.01)
+    assert _events(socket) == []
+
+    await asyncio.sleep(0.1)
+    refreshes = _events(socket)
+    assert len(refreshes) == 2
+    by_dc = {m["data_collection_id"]: m["payload"] for m in refreshes}
+    assert by_dc[DC_A] == {"n": 49, "coalesced_events": 50}
+    assert by_dc[DC_B] == {"n": 0}
+
+
+@pytest.mark.asyncio
+async def test_pubsub_echo_is_not_delivered_twice(manager):
+    socket = _Socket()
+    await manager.connect(socket, dashboard_id="d")
+    message = _event(event_type=EventType.DASHBOARD_UPDATED).model_copy(update={"message_id": "m1"})
+    await manager.broadcast_to_dashboard("d", message)
+    # What this instance's own pub/sub listener would hand back.
+    await manager._handle_pubsub_message("depictio:events:dashboard:d", message.model_dump_json())
+    await asyncio.sleep(0.01)
+    assert len(_events(socket)) == 1
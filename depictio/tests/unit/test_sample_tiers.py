@@ -0,0 +1,152 @@
+"""Sample tiers are nested stratified samples, and serve filters like the full scan.
+
+``refresh_sample_tiers`` draws exactly one row from each run of consecutive
+rows, so a tier covers the whole table evenly, and each tier is a subset of
+the one above it. ``tier_sample`` must return exactly ``cap`` rows that all pass
+the request's filters, step up to a larger tier when a filter leaves a small
+one short, and decline — so the caller samples the table — when the tiers
+describe other data or no tier holds enough.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+import pytest
+
+from depictio.api.v1.configs.config import settings
+from depictio.api.v1.services import sample_tiers
+from depictio.api.v1.services.sort_index import ROW_COLUMN
+
+pytestmark = pytest.mark.no_db
+
+DC = "507f1f77bcf86cd799439016"
+TOTAL = 5_000
+
+
+class _Collection:
+    """Just enough of a Mongo collection for one ``deltatables`` document."""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def find_one(self, query, projection=None):
+        return self.doc
+
+    def update_one(self, query, update):
+        if "flexible_metadata" in query and self.doc.get("flexible_metadata") is not None:
+            return
+        for key, value in update["$set"].items():
+            target = self.doc
+            *parents, leaf = key.split(".")
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = value
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    rng = np.random.default_rng(1)
+    return pl.DataFrame(
+        {
+            "habitat": rng.choice(["river", "lake", "sea"], TOTAL, p=[0.6, 0.35, 0.05]),
+            "v": rng.normal(size=TOTAL),
+        }
+    )
+
+
+@pytest.fixture
+def collection(frame, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.performance, "sample_tiers_enabled", True)
+    monkeypatch.setattr(settings.performance, "sample_tier_rows", [100, 1_000, 10_000])
+    doc = {
+        "_id": "doc",
+        "delta_table_location": str(tmp_path),
+        "aggregation": [{"aggregation_hash": "h1"}],
+        "flexible_metadata": None,
+    }
+    fake = _Collection(doc)
+    with (
+        patch.object(sample_tiers, "deltatables_collection", fake),
+        patch("depictio.api.v1.db.deltatables_collection", fake),
+        patch.object(pl, "scan_delta", lambda *a, **k: frame.lazy()),
+    ):
+        yield fake
+
+
+def _filter(column, values):
+    return {
+        "metadata": {"column_name": column, "interactive_component_type": "MultiSelect"},
+        "value": values,
+    }
+
+
+def _tiers(collection) -> dict[int, pl.DataFrame]:
+    record = collection.doc["flexible_metadata"]["sample_tiers"]
+    return {t["rows"]: pl.read_parquet(t["path"]) for t in record["tiers"]}
+
+
+def test_tiers_are_nested_stratified_samples(collection, frame):
+    assert sample_tiers.refresh_sample_tiers(DC) == 2
+    record = collection.doc["flexible_metadata"]["sample_tiers"]
+    assert (record["aggregation_hash"], record["total_rows"]) == ("h1", TOTAL)
+
+    tiers = _tiers(collection)
+    assert sorted(tiers) == [100, 1_000]  # no tier as large as the table
+    for rows, tier in tiers.items():
+        positions = tier[ROW_COLUMN].to_numpy()
+        # One row from each run of TOTAL / rows consecutive rows.
+        assert (positions * rows // TOTAL).tolist() == list(range(rows))
+        # Rows are the table's own, carried whole.
+        assert tier.drop(ROW_COLUMN).equals(frame[positions.tolist()])
+    assert set(tiers[100][ROW_COLUMN]) <= set(tiers[1_000][ROW_COLUMN])
+
+
+def test_rebuild_is_deterministic(collection):
+    sample_tiers.refresh_sample_tiers(DC)
+    first = _tiers(collection)
+    sample_tiers.refresh_sample_tiers(DC)
+    assert all(first[rows].equals(tier) for rows, tier in _tiers(collection).items())
+
+
+def test_tier_sample_takes_cap_filtered_rows(collection):
+    sample_tiers.refresh_sample_tiers(DC)
+    got = sample_tiers.tier_sample(DC, [_filter("habitat", ["river"])], ["v", "habitat"], 50)
+    assert got is not None
+    assert got.columns == ["v", "habitat"]
+    assert got.height == 50
+    assert got["habitat"].unique().to_list() == ["river"]
+
+
+def test_selective_filters_step_up_a_tier(collection):
+    sample_tiers.refresh_sample_tiers(DC)
+    scanned: list[str] = []
+    real_scan = pl.scan_parquet
+
+    def scan(path, **kwargs):
+        scanned.append(path)
+        return real_scan(path, **kwargs)
+
+    with patch.object(pl, "scan_parquet", scan):
+        got = sample_tiers.tier_sample(DC, [_filter("habitat", ["sea"])], None, 20)
+    # ~5 of the 100-row tier's rows are "sea"; the 1,000-row tier has ~50.
+    assert [p.rsplit("-", 1)[1] for p in scanned] == ["100.parquet", "1000.parquet"]
+    assert got is not None and got.height == 20
+    assert ROW_COLUMN not in got.columns
+
+
+def test_declines_when_no_tier_can_serve(collection):
+    sample_tiers.refresh_sample_tiers(DC)
+    # More rows than the largest tier holds after the filter.
+    assert sample_tiers.tier_sample(DC, [_filter("habitat", ["sea"])], ["v"], 500) is None
+    # A column the tier does not have.
+    assert sample_tiers.tier_sample(DC, None, ["missing"], 50) is None
+    # Tiers built from an older aggregation.
+    collection.doc["aggregation"].append({"aggregation_hash": "h2"})
+    assert sample_tiers.tier_sample(DC, None, ["v"], 50) is None
+
+
+def test_disabled_builds_nothing(collection, monkeypatch):
+    monkeypatch.setattr(settings.performance, "sample_tiers_enabled", False)
+    assert sample_tiers.refresh_sample_tiers(DC) == 0
+    assert collection.doc["flexible_metadata"] is None
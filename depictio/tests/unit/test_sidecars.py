@@ -0,0 +1,63 @@
+"""The sidecar bookkeeping every per-version derived file goes through.
+
+What is pinned here: a document whose ``flexible_metadata`` is still ``None``
+can be recorded on; recording a file of a new Delta version replaces the other
+versions' entries and deletes their files, while entries of the same version
+stay; and a registry only remembers a path once the file is readable.
+"""
+
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from bson import ObjectId
+from mongomock import MongoClient
+
+from depictio.api.v1.services import sidecars
+
+pytestmark = pytest.mark.no_db
+
+DC = ObjectId()
+
+
+@pytest.fixture
+def collection():
+    collection = MongoClient().db.deltatables
+    collection.insert_one({"_id": "doc", "data_collection_id": DC, "flexible_metadata": None})
+    with patch("depictio.api.v1.db.deltatables_collection", collection):
+        yield collection
+
+
+def _metadata(collection):
+    return collection.find_one({"_id": "doc"})["flexible_metadata"]
+
+
+def test_set_record_initialises_missing_metadata(collection):
+    sidecars.set_record("doc", "column_stats", {"path": "p", "delta_version": 1})
+    sidecars.set_record("doc", "link_index", [])
+    assert _metadata(collection) == {
+        "column_stats": {"path": "p", "delta_version": 1},
+        "link_index": [],
+    }
+
+
+def test_record_version_drops_other_versions(collection):
+    registry = sidecars.SidecarRegistry()
+    removed: list[list[str]] = []
+    with patch("depictio.api.v1.s3.remove_paths", removed.append):
+        sidecars.record_version(str(DC), "sketches", "v1-a", 1, registry)
+        sidecars.record_version(str(DC), "sketches", "v1-b", 1, registry)
+        registry.add("v1-a")
+        sidecars.record_version(str(DC), "sketches", "v2-a", 2, registry)
+    assert _metadata(collection)["sketches"] == [{"path": "v2-a", "delta_version": 2}]
+    assert removed == [["v1-a", "v1-b"]]
+    assert "v1-a" not in registry
+
+
+def test_registry_remembers_readable_files_only(tmp_path):
+    registry = sidecars.SidecarRegistry()
+    path = str(tmp_path / "v1.parquet")
+    assert not registry.exists(path)
+    pl.DataFrame({"a": [1]}).write_parquet(path)
+    assert registry.exists(path) and path in registry
+    assert registry.lock(path) is registry.lock(path)
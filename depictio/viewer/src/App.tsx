@@ -20,6 +20,8 @@ import {
   fetchDashboard,
   fetchAllDashboards,
   bulkComputeCards,
+  batchedRender,
+  isStaleFetch,
   AvailableFilterValuesProvider,
   DashboardGrid,
   FilterPanel,
@@ -46,6 +48,7 @@ import {
   countActiveFilters,
 } from 'depictio-react-core';
 import type {
+  BulkComputeResponse,
   DashboardData,
   DashboardPermissions,
   DashboardSummary,
@@ -292,13 +295,22 @@ const App: React.FC = () => {
     // snap every card back to ``…`` on every keystroke / drag step.
     if (bulkCtrl.current) bulkCtrl.current.abort();
     bulkCtrl.current = new AbortController();
-    bulkComputeCards(dashboardId, deferredFilters, cardIds)
+    // Cards ride the round's render_all stream with the figures and tables,
+    // falling back to bulk-compute when the stream can't answer them.
+    const signal = bulkCtrl.current.signal;
+    batchedRender<BulkComputeResponse>(
+      dashboardId,
+      deferredFilters,
+      { kind: 'cards', componentIds: cardIds },
+      () => bulkComputeCards(dashboardId, deferredFilters, cardIds),
+      signal,
+    )
       .then((res) => {
         setCardValues(res.values);
         setCardSecondaryValues(res.secondary_values || {});
       })
       .catch((err) => {
-        if (err?.name !== 'AbortError') console.warn('[App] bulk-compute failed:', err);
+        if (!isStaleFetch(err)) console.warn('[App] bulk-compute failed:', err);
       })
       .finally(() => setCardsLoading(false));
   }, [dashboard, dashboardId, deferredFilterKey, refreshTick]);
@@ -574,6 +586,7 @@ const App: React.FC = () => {
     <AvailableFilterValuesProvider
       dashboardMetadata={dashboard?.stored_metadata}
       projectId={dashboard?.project_id}
+      filters={deferredFilters}
     >
       <DashboardLoadingProvider>
       <InspectorProviders control={inspectorControl}>
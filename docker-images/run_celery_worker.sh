@@ -55,6 +55,68 @@ fi
 # directory set do. The two heaviest trees (depictio/cli/.venv, depictio/tests)
 # are masked out of the container in docker-compose.dev.yaml.
 DEV_MODE_LOWER=$(echo "${DEPICTIO_DEV_MODE:-false}" | tr '[:upper:]' '[:lower:]')
+
+# Cost-class queues (CeleryConfig.cost_class_queues). The API routes offloaded
+# work to one queue per class — render.aggregate, render.points, render.code,
+# render.multiqc, render.embedding — so each class needs a consumer, or its
+# tasks sit in Redis forever. Same variables the API reads, so the two sides
+# can't disagree about queue names or pool sizes.
+COST_CLASS_QUEUES=$(echo "${DEPICTIO_CELERY_COST_CLASS_QUEUES:-false}" | tr '[:upper:]' '[:lower:]')
+QUEUE_PREFIX=${DEPICTIO_CELERY_COST_CLASS_QUEUE_PREFIX:-render.}
+QUEUE_CONCURRENCY=${DEPICTIO_CELERY_QUEUE_CONCURRENCY:-aggregate=2,points=2,code=1,multiqc=1,embedding=1}
+
+if [ "$COST_CLASS_QUEUES" = "true" ]; then
+    if [ "$DEV_MODE_LOWER" = "true" ]; then
+        # One live-reloaded worker consuming every queue: dev wants reload, not
+        # isolation.
+        ALL_QUEUES="celery"
+        for entry in ${QUEUE_CONCURRENCY//,/ }; do
+            ALL_QUEUES="$ALL_QUEUES,${QUEUE_PREFIX}${entry%%=*}"
+        done
+        echo "🔁 CELERY WORKER: dev mode — one worker on queues $ALL_QUEUES"
+        exec watchmedo auto-restart \
+            --directory=/app/depictio \
+            --patterns='*.py' \
+            --ignore-patterns='*/__pycache__/*;*.pyc' \
+            --recursive \
+            --debug-force-polling \
+            --interval=5 \
+            -- celery -A depictio.api.celery_worker:celery_app worker \
+                --loglevel=info \
+                --max-tasks-per-child="$CELERY_MAX_TASKS_PER_CHILD" \
+                --concurrency="$CELERY_WORKERS" \
+                -Q "$ALL_QUEUES"
+    fi
+
+    # A worker per class, each with its own prefork pool, plus the default
+    # worker (keeps the celery@host name the healthcheck pings) for everything
+    # unclassed. If any of them exits the container exits, so the orchestrator
+    # restarts the whole set rather than leaving a class without consumers.
+    for entry in ${QUEUE_CONCURRENCY//,/ }; do
+        CLASS=${entry%%=*}
+        POOL=${entry#*=}
+        echo "🔧 CELERY WORKER: pool ${QUEUE_PREFIX}${CLASS} x ${POOL}"
+        celery -A depictio.api.celery_worker:celery_app worker \
+            --loglevel=info \
+            --max-tasks-per-child="$CELERY_MAX_TASKS_PER_CHILD" \
+            --concurrency="$POOL" \
+            -Q "${QUEUE_PREFIX}${CLASS}" \
+            -n "${CLASS}@%h" &
+    done
+    celery -A depictio.api.celery_worker:celery_app worker \
+        --loglevel=info \
+        --max-tasks-per-child="$CELERY_MAX_TASKS_PER_CHILD" \
+        --concurrency="$CELERY_WORKERS" \
+        -Q celery &
+    trap 'kill $(jobs -p) 2>/dev/null' TERM INT
+    set +e
+    wait -n
+    STATUS=$?
+    kill $(jobs -p) 2>/dev/null
+    wait
+    exit "$STATUS"
+fi
+
 if [ "$DEV_MODE_LOWER" = "true" ]; then
     echo "🔁 CELERY WORKER: dev mode — live reload via watchmedo (watching /app/depictio/**/*.py)"
     exec watchmedo auto-restart \
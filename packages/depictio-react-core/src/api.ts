@@ -7,7 +7,7 @@
  * recovery. Do not attach the bearer by hand — see its docstring for why.
  */
 
-import { enqueueFetch } from './fetchQueue';
+import { currentFetchGeneration, enqueueFetch, StaleFetchError } from './fetchQueue';
 
 const API_BASE = '/depictio/api/v1';
 
@@ -453,6 +453,56 @@ export async function fetchUniqueValues(
   return body.values || [];
 }
 
+/** One (data collection, column) a facets request asks about. The facet's own
+ *  filter — the one on `column` of `exclude_dc_id` (default `dc_id`) — is left
+ *  out, so it reports what else could be selected. */
+export interface FacetTargetDTO {
+  dc_id: string;
+  column: string;
+  exclude_dc_id?: string;
+}
+
+export interface FacetResultDTO {
+  dc_id: string;
+  column: string;
+  /** False when the facet could not be answered (column missing, no table). */
+  available: boolean;
+  /** Most frequent first; `count` is null for MultiQC sample lists. */
+  values: { value: string; count: number | null }[];
+  total_values: number;
+  truncated: boolean;
+}
+
+export interface FacetsResponseDTO {
+  facets: FacetResultDTO[];
+  /** Values present in every answered facet; null when fewer than two were. */
+  intersection: { values: string[]; total_values: number; truncated: boolean } | null;
+}
+
+/** Remaining values of several facets under the current filters, in one call.
+ *  Cross-DC filters are translated through the project's links server-side,
+ *  and all facets on one data collection share one scan. */
+export async function fetchFacets(
+  projectId: string,
+  filters: InteractiveFilter[],
+  facets: FacetTargetDTO[],
+  options: { limit?: number; intersect?: boolean } = {},
+): Promise<FacetsResponseDTO> {
+  const res = await authFetch(`${API_BASE}/deltatables/facets`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      project_id: projectId,
+      filters,
+      facets,
+      limit: options.limit ?? 1000,
+      intersect: options.intersect ?? false,
+    }),
+  });
+  if (!res.ok) throw new Error(`Failed to fetch facets: ${res.status}`);
+  return res.json();
+}
+
 /** The ``__breakdown__`` payload for a card's categorical strip, computed
  *  server-side against the real data.
  *
@@ -670,6 +720,44 @@ export interface FigureResponse {
   };
 }
 
+/** Last figure body per component with its ETag. The browser's HTTP cache
+ *  never stores POST responses, so revalidation is done by hand: the tag is
+ *  replayed as `If-None-Match` and a 304 reuses the body kept here. One entry
+ *  per component, bounded, oldest evicted first. */
+const figureEtagCache = new Map<string, { etag: string; body: FigureResponse }>();
+const FIGURE_ETAG_CACHE_MAX = 64;
+
+/** Identifies this tab to the render endpoint. Together with the fetch
+ *  generation it lets the server revoke the task a superseded render left
+ *  running on a worker — the queue can only drop requests that haven't left
+ *  the browser yet. */
+const RENDER_SESSION_ID =
+  typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function'
+    ? crypto.randomUUID()
+    : Math.random().toString(36).slice(2);
+
+/** Retries a saturated render gets before the error is surfaced. */
+const RENDER_503_RETRIES = 2;
+
+/** Sleep that an abort cuts short (rejecting with the abort's reason). */
+function abortableDelay(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(new DOMException('Aborted', 'AbortError'));
+      return;
+    }
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(new DOMException('Aborted', 'AbortError'));
+    };
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
+}
+
 export async function renderFigure(
   dashboardId: string,
   componentId: string,
@@ -678,16 +766,103 @@ export async function renderFigure(
   fullLoad = false,
   signal?: AbortSignal,
 ): Promise<FigureResponse> {
-  const res = await authFetch(
-    `${API_BASE}/dashboards/render_figure/${dashboardId}/${componentId}`,
-    {
+  const cacheKey = `${dashboardId}/${componentId}`;
+  const previous = figureEtagCache.get(cacheKey);
+  const headers: Record<string, string> = {
+    'X-Render-Session': RENDER_SESSION_ID,
+    'X-Fetch-Generation': String(currentFetchGeneration()),
+  };
+  if (previous) headers['If-None-Match'] = previous.etag;
+  const post = () =>
+    authFetch(`${API_BASE}/dashboards/render_figure/${dashboardId}/${componentId}`, {
       method: 'POST',
       body: JSON.stringify({ filters, theme, full_load: fullLoad }),
+      headers,
       signal,
-    },
-  );
+    });
+  let res = await post();
+  // 503 = the render queue can't get to it in time (admission control); come
+  // back when the server says the backlog will have drained.
+  for (let attempt = 0; res.status === 503 && attempt < RENDER_503_RETRIES; attempt += 1) {
+    const retryAfter = Number(res.headers.get('Retry-After'));
+    if (!Number.isFinite(retryAfter) || retryAfter <= 0) break;
+    await abortableDelay(Math.min(retryAfter, 30) * 1000, signal);
+    res = await post();
+  }
+  if (res.status === 304 && previous) return previous.body;
+  // 409 = a newer render of this component (same tab) superseded this one.
+  if (res.status === 409) throw new StaleFetchError();
   if (!res.ok) throw new Error(`Failed to render figure: ${res.status}`);
-  return res.json();
+  const body: FigureResponse = await res.json();
+  const etag = res.headers.get('ETag');
+  figureEtagCache.delete(cacheKey);
+  if (etag) {
+    figureEtagCache.set(cacheKey, { etag, body });
+    if (figureEtagCache.size > FIGURE_ETAG_CACHE_MAX) {
+      const oldest = figureEtagCache.keys().next().value;
+      if (oldest !== undefined) figureEtagCache.delete(oldest);
+    }
+  }
+  return body;
+}
+
+/** One line of the `render_all` NDJSON stream. `data` is the body the
+ *  component's own endpoint returns; all cards arrive in one
+ *  `BulkComputeResponse` under `component_id === 'cards'`. */
+export interface RenderAllFrame {
+  component_id: string;
+  component_type: string;
+  status: 'ok' | 'error' | 'unsupported';
+  data?: unknown;
+  status_code?: number;
+  detail?: unknown;
+  total_ms?: number;
+}
+
+export interface RenderAllRequest {
+  filters: InteractiveFilter[];
+  theme?: 'light' | 'dark';
+  component_ids?: string[];
+  full_load?: string[];
+  tables?: Record<
+    string,
+    { start?: number; limit?: number; sort_by?: string | null; sort_dir?: 'asc' | 'desc' }
+  >;
+  advanced_viz?: Record<string, Record<string, unknown>>;
+}
+
+/** Render a whole dashboard in one request, calling `onFrame` as each
+ *  component finishes (completion order). Components reported as
+ *  `unsupported` should be fetched through their per-component endpoint. */
+export async function renderAllStream(
+  dashboardId: string,
+  body: RenderAllRequest,
+  onFrame: (frame: RenderAllFrame) => void,
+  signal?: AbortSignal,
+): Promise<void> {
+  const res = await authFetch(`${API_BASE}/dashboards/render_all/${dashboardId}`, {
+    method: 'POST',
+    body: JSON.stringify(body),
+    signal,
+  });
+  if (!res.ok || !res.body) throw new Error(`Failed to render dashboard: ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (value) buffered += decoder.decode(value, { stream: !done });
+    let newline = buffered.indexOf('\n');
+    while (newline >= 0) {
+      const line = buffered.slice(0, newline).trim();
+      buffered = buffered.slice(newline + 1);
+      if (line) onFrame(JSON.parse(line) as RenderAllFrame);
+      newline = buffered.indexOf('\n');
+    }
+    if (done) break;
+  }
+  if (buffered.trim()) onFrame(JSON.parse(buffered) as RenderAllFrame);
 }
 
 /* -------------------------------------------------------------------------
@@ -1,33 +1,36 @@
 /**
- * Cross-DC "available values" intersection — supports greying out values in
- * interactive filter dropdowns that the metadata declares but that are not
- * present in any of the data collections actually loaded by the dashboard.
+ * Cross-DC "available values" — supports greying out values in interactive
+ * filter dropdowns that none of the data collections loaded by the dashboard
+ * can show under the current filters.
  *
  * Model
  * -----
  * The dashboard has N data collections used by figures / tables / multiqc.
  * If those DCs join on a shared column (typically sample_id), the set of
- * values "present in the loaded data" is the INTERSECTION of unique values of
+ * values "present in the loaded data" is the INTERSECTION of the values of
  * that column across all participating DCs. A filter's source DC might
  * declare more values than are actually represented — we use the intersection
  * to mark the unrepresented values as disabled.
  *
- * Heuristic (v1, intentionally simple)
- * ------------------------------------
- * For a filter on (dc_id_F, column_F):
- *   1. Walk dashboard.stored_metadata for distinct dc_ids referenced by
- *      figure / table / multiqc / map / image components.
- *   2. For each such dc_id (including the filter's own), call
- *      `fetchUniqueValues(dc_id, column_F)`. DCs that don't have a column
- *      with that name return an error → we skip them silently. A DC missing
- *      the column is treated as "no constraint from this DC" rather than
- *      "everything excluded".
- *   3. Intersect the successful results.
- *   4. Cache the resulting Set keyed by `${dc_id_F}|${column_F}`.
+ * Computation
+ * -----------
+ * For a filter on (dc_id_F, column_F), one `POST /deltatables/facets` asks
+ * for the facet (dc, column_F) of every DC referenced by figure / table /
+ * multiqc / map / image / card components, plus the filter's own DC, under
+ * the current filter state with the filter itself left out. The server
+ * translates the other filters through the project's links, scans each DC
+ * once, and returns the intersection directly. DCs without the column — and
+ * MultiQC DCs without sample mappings yet — have no opinion rather than
+ * excluding everything.
  *
- * When fewer than 2 DCs return data the intersection is meaningless (no
- * cross-DC narrowing possible) — we return `null` and the consumer skips
- * the greying-out behavior entirely.
+ * This used to be one full `fetchUniqueValues` scan per (filter, DC), every
+ * distinct value shipped to the browser and intersected here, and it ignored
+ * the other filters.
+ *
+ * When fewer than 2 DCs answer the intersection is meaningless (no cross-DC
+ * narrowing possible) — we return `null` and the consumer skips the
+ * greying-out behavior entirely. Same when the intersection is too large to
+ * return whole: greying from a partial list would be wrong.
  */
 import React, {
   createContext,
@@ -39,7 +42,8 @@ import React, {
   useState,
 } from 'react';
 
-import { fetchMultiQCSampleMappings, fetchUniqueValues, StoredMetadata } from './api';
+import { isFilterActive } from './activeFilters';
+import { fetchFacets, InteractiveFilter, StoredMetadata } from './api';
 
 interface AvailableValuesContextValue {
   /** Trigger a compute for this (dc_id, column) if not already done. */
@@ -58,9 +62,8 @@ function key(dcId: string, columnName: string): string {
 interface DataDcEntry {
   dcId: string;
   /** ``component_type`` of the first metadata entry referencing this dc_id —
-   *  used to pick the right "fetch unique values for this DC" path
-   *  (deltatables for table/figure/map/image/card, multiqc sample mappings
-   *  for multiqc DCs which don't expose row data via the delta endpoint). */
+   *  multiqc DCs only take part for sample-like columns (see
+   *  `isSampleColumn`); the server answers them from their sample mappings. */
   type: string;
 }
 
@@ -101,26 +104,6 @@ function deriveProjectId(metadataList: StoredMetadata[] | undefined): string | u
   return undefined;
 }
 
-/** Multiqc samples are routinely stored with a per-read / per-lane /
- *  per-replicate suffix like ``NA12878_R1`` / ``NA12878_R2``, while the
- *  metadata table they link to carries the bare canonical id ``NA12878``.
- *  Exact-string intersection would miss them all, so we expand each multiqc
- *  name with its suffix-stripped base form.
- *
- *  Mirrors ``SampleMappingResolver._SAMPLE_SUFFIX_RE`` in
- *  ``depictio/api/v1/endpoints/links_endpoints/resolvers.py``. The regex is
- *  deliberately restricted to explicit prefix letters (R/L/REP/TECH) so we
- *  don't over-strip IDs that legitimately end in ``_<digits>`` like
- *  ``Sample_2024`` or ``Patient_42`` — generic separator splitting would
- *  silently collapse unrelated samples into one base. */
-const SAMPLE_SUFFIX_RE = /_(?:R\d+|L\d+|REP\d+|TECH\d+)$/i;
-
-function expandWithPrefixes(name: string): string[] {
-  if (!name) return [];
-  const base = name.replace(SAMPLE_SUFFIX_RE, '');
-  return base !== name ? [name, base] : [name];
-}
-
 // MultiQC DCs don't expose row-level data — only a per-project sample-name
 // list (via sample_mappings). That list is column-agnostic, so including it
 // in the "available values" intersection is only meaningful when the
@@ -145,23 +128,26 @@ function isSampleColumn(columnName: string): boolean {
 
 export interface AvailableFilterValuesProviderProps {
   dashboardMetadata: StoredMetadata[] | undefined;
-  /** Project ID — required to resolve MultiQC sample mappings (the
-   *  `/links/{projectId}/multiqc/{dcId}/sample-mappings` endpoint is
-   *  scoped per project). Optional: when not provided, the provider
-   *  derives it from `dashboardMetadata[i].project_id` (the dashboards
-   *  endpoint doesn't expose project_id at the top level). When still
-   *  absent, multiqc DCs are skipped and the intersection falls back to
-   *  whatever delta-table DCs contribute. */
+  /** Project ID — the facets endpoint is scoped per project (permissions and
+   *  links). Optional: when not provided, the provider derives it from
+   *  `dashboardMetadata[i].project_id` (the dashboards endpoint doesn't expose
+   *  project_id at the top level). When still absent, nothing is greyed. */
   projectId?: string;
+  /** Current interactive filter state. Each facet is computed under every
+   *  filter but its own, so an option another filter has emptied greys out. */
+  filters?: InteractiveFilter[];
   children: React.ReactNode;
 }
 
 export const AvailableFilterValuesProvider: React.FC<
   AvailableFilterValuesProviderProps
-> = ({ dashboardMetadata, projectId, children }) => {
+> = ({ dashboardMetadata, projectId, filters, children }) => {
   const [cache, setCache] = useState<Record<string, Set<string> | null>>({});
   // Tracks which keys are currently being computed so we don't double-fetch.
   const inFlightRef = useRef<Set<string>>(new Set());
+  // Bumped on every reset, so an answer computed for the previous filter
+  // state can't land in the fresh cache.
+  const generationRef = useRef(0);
 
   const dcs = useMemo(
     () => collectDataDcs(dashboardMetadata),
@@ -176,12 +162,21 @@ export const AvailableFilterValuesProvider: React.FC<
     [projectId, dashboardMetadata],
   );
 
-  // Reset cache when the dashboard's set of DCs changes — the intersection
-  // becomes stale.
+  // Only filters that constrain anything; the signature changes exactly when
+  // the answer can.
+  const activeFilters = useMemo(
+    () => (filters || []).filter(isFilterActive),
+    [filters],
+  );
+  const filterSignature = useMemo(() => JSON.stringify(activeFilters), [activeFilters]);
+
+  // Reset cache when the dashboard's set of DCs or the filter state changes —
+  // the intersection becomes stale.
   useEffect(() => {
+    generationRef.current += 1;
     setCache({});
     inFlightRef.current = new Set();
-  }, [dcSignature]);
+  }, [dcSignature, filterSignature]);
 
   const request = useCallback(
     (dcId: string, columnName: string) => {
@@ -197,9 +192,9 @@ export const AvailableFilterValuesProvider: React.FC<
       // alongside a single multiqc report. Without adding the source DC
       // explicitly we'd intersect just the multiqc samples and the
       // narrowing would be backwards (everything in metadata vs nothing
-      // present). Treating the filter's source DC as a regular delta-table
-      // DC means `fetchUniqueValues(dc, column)` returns the full set of
-      // metadata-declared values; the data DCs then trim it.
+      // present). Treating the filter's source DC as a regular facet means
+      // it contributes the full set of metadata-declared values; the data
+      // DCs then trim it.
       const fetchTargets: DataDcEntry[] = dcs.filter(
         // MultiQC DCs contribute only when filtering by a sample-like
         // column — otherwise their sample-name list intersected against
@@ -212,71 +207,38 @@ export const AvailableFilterValuesProvider: React.FC<
       }
 
       // Nothing to narrow against — only the source DC contributes.
-      if (fetchTargets.length < 2) {
+      if (fetchTargets.length < 2 || !effectiveProjectId) {
         setCache((prev) => ({ ...prev, [k]: null }));
         return;
       }
       inFlightRef.current.add(k);
+      const generation = generationRef.current;
 
-      // Dispatch per DC type: delta-table DCs (table/figure/map/image/card/
-      // interactive_source) expose a per-column unique-values endpoint,
-      // multiqc DCs only expose their sample list via the per-project
-      // sample-mappings endpoint. Mapping returns `{canonical: [variants...]}`
-      // — flatten to a set of all known sample names so it matches whatever
-      // convention the metadata table uses (canonical or variant).
-      const fetchOne = (entry: DataDcEntry): Promise<Set<string>> => {
-        if (entry.type === 'multiqc') {
-          if (!effectiveProjectId) return Promise.reject(new Error('no projectId'));
-          return fetchMultiQCSampleMappings(effectiveProjectId, entry.dcId).then((mappings) => {
-            const out = new Set<string>();
-            for (const [canonical, variants] of Object.entries(mappings)) {
-              for (const v of expandWithPrefixes(canonical)) out.add(v);
-              if (Array.isArray(variants)) {
-                for (const variant of variants) {
-                  for (const v of expandWithPrefixes(variant)) out.add(v);
-                }
-              }
-            }
-            return out;
-          });
-        }
-        return fetchUniqueValues(entry.dcId, columnName).then((values) => new Set(values));
-      };
-
-      Promise.allSettled(fetchTargets.map(fetchOne))
-        .then((results) => {
-          const sets: Set<string>[] = [];
-          for (const r of results) {
-            // Skip both rejections AND empty fulfilled sets — an empty
-            // result means "this DC has no opinion on this column" (e.g.,
-            // column missing, multiqc with no sample_mappings yet), not
-            // "everything is unavailable". Treating empty as a constraint
-            // would grey out every option, which is never what we want.
-            if (r.status === 'fulfilled' && r.value.size > 0) sets.push(r.value);
-          }
-          let intersection: Set<string> | null = null;
-          if (sets.length >= 2) {
-            // Start from the smallest set to minimize work.
-            sets.sort((a, b) => a.size - b.size);
-            intersection = new Set(sets[0]);
-            for (let i = 1; i < sets.length; i++) {
-              const next = sets[i];
-              for (const v of intersection) {
-                if (!next.has(v)) intersection.delete(v);
-              }
-            }
-          }
+      // Only the intersection is needed, so no per-facet value lists
+      // (`limit: 0`). Every facet leaves out the filter on (dcId, columnName)
+      // — the one whose options are being greyed.
+      fetchFacets(
+        effectiveProjectId,
+        activeFilters,
+        fetchTargets.map((d) => ({ dc_id: d.dcId, column: columnName, exclude_dc_id: dcId })),
+        { limit: 0, intersect: true },
+      )
+        .then((res) => {
+          if (generation !== generationRef.current) return;
+          const inter = res.intersection;
+          const intersection = inter && !inter.truncated ? new Set(inter.values) : null;
           setCache((prev) => ({ ...prev, [k]: intersection }));
           inFlightRef.current.delete(k);
         })
         .catch(() => {
-          // All requests failed — cache `null` so consumer skips the
+          if (generation !== generationRef.current) return;
+          // The request failed — cache `null` so consumer skips the
           // greying behavior gracefully.
           setCache((prev) => ({ ...prev, [k]: null }));
           inFlightRef.current.delete(k);
         });
     },
-    [cache, dcs, effectiveProjectId],
+    [cache, dcs, effectiveProjectId, activeFilters],
   );
 
   const getSet = useCallback(
@@ -16,6 +16,7 @@ import Plotly from 'plotly.js';
 
 import { renderFigure, InteractiveFilter, StoredMetadata, FigureResponse } from '../api';
 import { enqueueFetch, isStaleFetch } from '../fetchQueue';
+import { batchedRender } from '../renderBatch';
 import { extractScatterSelection } from '../selection';
 import { useInView } from '../hooks/useInView';
 import { useNewItemIds } from '../hooks/useNewItemIds';
@@ -125,19 +126,27 @@ const FigureRenderer: React.FC<FigureRendererProps> = ({
     const ctrl = new AbortController();
     setLoading(true);
     setError(null);
-    // Queued so a dense dashboard doesn't fire every figure's render at once;
-    // the vertical position is the priority, so the top of the page paints first.
-    enqueueFetch(
+    // Joins the round's shared render_all stream. The fallback is queued so a
+    // dense dashboard doesn't fire every figure's render at once; the vertical
+    // position is the priority, so the top of the page paints first.
+    batchedRender<FigureResponse>(
+      dashboardId,
+      filtersForFetch,
+      { kind: 'figure', componentId: metadata.index, theme, fullLoad },
       () =>
-        renderFigure(
-          dashboardId,
-          metadata.index,
-          filtersForFetch,
-          theme,
-          fullLoad,
-          ctrl.signal,
+        enqueueFetch(
+          () =>
+            renderFigure(
+              dashboardId,
+              metadata.index,
+              filtersForFetch,
+              theme,
+              fullLoad,
+              ctrl.signal,
+            ),
+          metadata.layout?.y ?? 0,
         ),
-      metadata.layout?.y ?? 0,
+      ctrl.signal,
     )
       .then((res) => {
         if (cancelled) return;
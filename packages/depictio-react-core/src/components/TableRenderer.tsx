@@ -20,11 +20,12 @@ import type {
   SortChangedEvent,
 } from 'ag-grid-community';
 
-import { renderTable, InteractiveFilter, StoredMetadata } from '../api';
+import { renderTable, InteractiveFilter, StoredMetadata, TableResponse } from '../api';
 import { LoadAllState } from './chrome/LoadAllButton';
 import { extractRowSelection } from '../selection';
 import { useInView } from '../hooks/useInView';
 import { enqueueFetch, isStaleFetch } from '../fetchQueue';
+import { batchedRender } from '../renderBatch';
 import { useNewItemIds } from '../hooks/useNewItemIds';
 import { useTransientFlag } from '../hooks/useTransientFlag';
 import { ActiveHighlight } from '../highlight';
@@ -153,19 +154,26 @@ const TableRenderer: React.FC<TableRendererProps> = ({
     const ctrl = new AbortController();
     setLoading(true);
     setError(null);
-    enqueueFetch(
+    batchedRender<TableResponse>(
+      dashboardId,
+      filtersForFetch,
+      { kind: 'table', componentId: metadata.index, page: { start: 0, limit: 1, sort_dir: 'desc' } },
       () =>
-        renderTable(
-          dashboardId,
-          metadata.index,
-          filtersForFetch,
-          0,
-          1,
-          undefined,
-          'desc',
-          ctrl.signal,
+        enqueueFetch(
+          () =>
+            renderTable(
+              dashboardId,
+              metadata.index,
+              filtersForFetch,
+              0,
+              1,
+              undefined,
+              'desc',
+              ctrl.signal,
+            ),
+          metadata.layout?.y ?? 0,
         ),
-      metadata.layout?.y ?? 0,
+      ctrl.signal,
     )
       .then((res) => {
         if (cancelled) return;
@@ -484,19 +492,41 @@ const TableRenderer: React.FC<TableRendererProps> = ({
         // Queued: AG Grid's infinite row model fires several blocks at once on
         // first paint, and they'd otherwise contend with every other component's
         // render. Earlier blocks get priority so the visible rows arrive first.
-        enqueueFetch(
-          () =>
-            renderTable(
-              dashboardId,
-              metadata.index,
-              filtersRef.current,
-              start,
-              limit,
-              sortRef.current.sortBy,
-              sortRef.current.sortDir,
-            ),
-          start,
-        )
+        const fetchBlock = () =>
+          enqueueFetch(
+            () =>
+              renderTable(
+                dashboardId,
+                metadata.index,
+                filtersRef.current,
+                start,
+                limit,
+                sortRef.current.sortBy,
+                sortRef.current.sortDir,
+              ),
+            start,
+          );
+        // The first block of a filter round rides the round's render_all
+        // stream; deeper blocks are scrolling and page on their own.
+        const block =
+          start === 0
+            ? batchedRender<TableResponse>(
+                dashboardId,
+                filtersRef.current,
+                {
+                  kind: 'table',
+                  componentId: metadata.index,
+                  page: {
+                    start,
+                    limit,
+                    sort_by: sortRef.current.sortBy,
+                    sort_dir: sortRef.current.sortDir,
+                  },
+                },
+                fetchBlock,
+              )
+            : fetchBlock();
+        block
           .then((res) => {
             // An unsorted table is served in Delta scan order. That order is
             // stable while files are only appended, but a compaction (OPTIMIZE /
@@ -146,6 +146,7 @@ export {
   fetchFloatingComponents,
   fetchSpecs,
   fetchUniqueValues,
+  fetchFacets,
   fetchBreakdown,
   fetchCardMetric,
   fetchColumnRange,
@@ -153,6 +154,7 @@ export {
   bulkComputeCards,
   renderFigure,
   renderTable,
+  renderAllStream,
   fetchImagePaths,
   renderMap,
   fetchJBrowseSession,
@@ -299,6 +301,9 @@ export type {
   CatalogPreviewRender,
   CatalogPreviewPayload,
   BreakdownPayloadDTO,
+  FacetTargetDTO,
+  FacetResultDTO,
+  FacetsResponseDTO,
 } from './api';
 // Selection-as-filter helpers (Plotly/AG Grid → InteractiveFilter)
 export {
@@ -371,6 +376,11 @@ export {
   StaleFetchError,
 } from './fetchQueue';
 
+// One render_all stream per filter round; renderers and the app's card round
+// join it and fall back to their own endpoints for anything it can't answer.
+export { batchedRender } from './renderBatch';
+export type { RenderBatchItem } from './renderBatch';
+
 export type {
   StoredMetadata,
   DashboardData,
@@ -381,6 +391,8 @@ export type {
   BulkComputeResponse,
   FigureResponse,
   TableResponse,
+  RenderAllFrame,
+  RenderAllRequest,
   JBrowseSessionResponse,
   ServerStatusResponse,
   PublicConfigResponse,
@@ -0,0 +1,201 @@
+/**
+ * One `render_all` request per filter round.
+ *
+ * Every renderer owns its own fetch, so without this a filter change costs one
+ * POST per component — each redoing the dashboard lookup, permission check and
+ * link resolution server-side, and all of them queued four at a time behind
+ * `fetchQueue`. `POST /dashboards/render_all` answers a whole round in one
+ * streamed response instead.
+ *
+ * The renderers keep calling for their own data; `batchedRender` collects the
+ * calls a round makes within a short window into one stream and hands each
+ * caller its own frame as soon as the server finishes it. A round's calls come
+ * from one React commit, so they land in the same window.
+ *
+ * Anything the stream can't answer goes through the caller's `fallback` — the
+ * per-component fetcher it used before:
+ *
+ * - components the server reports as `unsupported`;
+ * - a 503 frame (admission control), so the fallback's `Retry-After` handling
+ *   applies;
+ * - every pending component when the stream itself fails or ends without
+ *   their frame.
+ *
+ * Calls only share a stream when they ask under the same filters: a figure
+ * that strips its own scatter selection asks a different question from its
+ * neighbours and gets its own stream.
+ */
+
+import {
+  InteractiveFilter,
+  RenderAllFrame,
+  RenderAllRequest,
+  renderAllStream,
+} from './api';
+import { currentFetchGeneration, isStaleFetch, StaleFetchError } from './fetchQueue';
+
+/** What one caller wants from the round. Tables are batched for their first
+ *  block only; further blocks page through `render_table` as before. */
+export type RenderBatchItem =
+  | { kind: 'figure'; componentId: string; theme: 'light' | 'dark'; fullLoad?: boolean }
+  | {
+      kind: 'table';
+      componentId: string;
+      page: { start: number; limit: number; sort_by?: string | null; sort_dir?: 'asc' | 'desc' };
+    }
+  | { kind: 'cards'; componentIds: string[] };
+
+/** How long a batch stays open for the rest of its round. Covers the effects
+ *  of one commit plus AG Grid's deferred first block load. */
+const RENDER_BATCH_WINDOW_MS = 10;
+
+interface Pending {
+  item: RenderBatchItem;
+  fallback: () => Promise<unknown>;
+  resolve: (value: unknown) => void;
+  reject: (err: unknown) => void;
+  settled: boolean;
+}
+
+interface Batch {
+  dashboardId: string;
+  filters: InteractiveFilter[];
+  generation: number;
+  /** Keyed by component id (`"cards"` for the card group). */
+  pending: Map<string, Pending>;
+  ctrl: AbortController;
+}
+
+const openBatches = new Map<string, Batch>();
+
+function frameKey(item: RenderBatchItem): string {
+  return item.kind === 'cards' ? 'cards' : item.componentId;
+}
+
+function settle(p: Pending, outcome: () => void): void {
+  if (p.settled) return;
+  p.settled = true;
+  outcome();
+}
+
+function runFallback(p: Pending): void {
+  settle(p, () => {
+    p.fallback().then(p.resolve, p.reject);
+  });
+}
+
+function handleFrame(batch: Batch, frame: RenderAllFrame): void {
+  const p = batch.pending.get(frame.component_id);
+  if (!p || p.settled) return;
+  if (frame.status === 'ok') {
+    settle(p, () => p.resolve(frame.data));
+  } else if (frame.status === 'unsupported' || frame.status_code === 503) {
+    runFallback(p);
+  } else if (frame.status_code === 409) {
+    settle(p, () => p.reject(new StaleFetchError()));
+  } else {
+    settle(p, () =>
+      p.reject(new Error(`Failed to render ${p.item.kind}: ${frame.status_code ?? 'error'}`)),
+    );
+  }
+}
+
+function flush(key: string): void {
+  const batch = openBatches.get(key);
+  if (!batch) return;
+  openBatches.delete(key);
+
+  const live = [...batch.pending.values()].filter((p) => !p.settled);
+  if (live.length === 0) return;
+  if (batch.generation !== currentFetchGeneration()) {
+    // The filters moved on while the batch was open.
+    for (const p of live) settle(p, () => p.reject(new StaleFetchError()));
+    return;
+  }
+
+  // Only figures read the theme, and one dashboard renders them all in one.
+  const figure = live.find((p) => p.item.kind === 'figure')?.item;
+  const body: RenderAllRequest = {
+    filters: batch.filters,
+    theme: figure?.kind === 'figure' ? figure.theme : undefined,
+    component_ids: [],
+    full_load: [],
+    tables: {},
+  };
+  for (const { item } of live) {
+    if (item.kind === 'cards') {
+      body.component_ids!.push(...item.componentIds);
+    } else {
+      body.component_ids!.push(item.componentId);
+      if (item.kind === 'figure' && item.fullLoad) body.full_load!.push(item.componentId);
+      if (item.kind === 'table') body.tables![item.componentId] = item.page;
+    }
+  }
+
+  renderAllStream(batch.dashboardId, body, (frame) => handleFrame(batch, frame), batch.ctrl.signal)
+    .catch((err) => {
+      if (!isStaleFetch(err)) console.warn('[renderBatch] render_all stream failed:', err);
+    })
+    .finally(() => {
+      // Whatever the stream didn't answer goes through its own endpoint. After
+      // an abort every caller has already been rejected, so this is a no-op.
+      for (const p of batch.pending.values()) runFallback(p);
+    });
+}
+
+/**
+ * Fetch one component's render through the round's shared `render_all`
+ * stream, or through `fallback` when the stream can't answer it.
+ *
+ * `signal` aborts this caller only; the stream is cancelled once every caller
+ * sharing it has gone. Resolves with the body the component's own endpoint
+ * returns (`FigureResponse`, `TableResponse`, `BulkComputeResponse`).
+ */
+export function batchedRender<T>(
+  dashboardId: string,
+  filters: InteractiveFilter[],
+  item: RenderBatchItem,
+  fallback: () => Promise<T>,
+  signal?: AbortSignal,
+): Promise<T> {
+  if (signal?.aborted) return Promise.reject(new DOMException('Aborted', 'AbortError'));
+
+  const generation = currentFetchGeneration();
+  const key = `${dashboardId}|${generation}|${JSON.stringify(filters)}`;
+  let batch = openBatches.get(key);
+  // One frame per component per stream: a second live request for the same
+  // component in the same round (another page, a snapshot) goes on its own. An
+  // aborted one (an effect re-run) is simply replaced.
+  if (batch?.pending.get(frameKey(item))?.settled === false) return fallback();
+  if (!batch) {
+    batch = {
+      dashboardId,
+      filters,
+      generation,
+      pending: new Map(),
+      ctrl: new AbortController(),
+    };
+    openBatches.set(key, batch);
+    setTimeout(() => flush(key), RENDER_BATCH_WINDOW_MS);
+  }
+  const owner = batch;
+
+  return new Promise<T>((resolve, reject) => {
+    const p: Pending = {
+      item,
+      fallback: fallback as () => Promise<unknown>,
+      resolve: resolve as (value: unknown) => void,
+      reject,
+      settled: false,
+    };
+    owner.pending.set(frameKey(item), p);
+    signal?.addEventListener(
+      'abort',
+      () => {
+        settle(p, () => reject(new DOMException('Aborted', 'AbortError')));
+        if ([...owner.pending.values()].every((q) => q.settled)) owner.ctrl.abort();
+      },
+      { once: true },
+    );
+  });
+}